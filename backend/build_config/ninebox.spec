@@ -85,6 +85,8 @@ a = Analysis(
         'ninebox.utils',
         'ninebox.utils.paths',
         'ninebox.utils.pure_statistics',
+        'ninebox.utils.numpy_statistics',
+        'ninebox.utils.stats_backend',
     ],
     hookspath=[],
     hooksconfig={},
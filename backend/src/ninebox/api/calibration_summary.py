@@ -8,7 +8,7 @@ import asyncio
 import logging
 from typing import Any, TypedDict
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 
 from ninebox.core.dependencies import (
     get_calibration_summary_service,
@@ -18,6 +18,7 @@ from ninebox.core.dependencies import (
 from ninebox.services.calibration_summary_service import CalibrationSummaryService
 from ninebox.services.llm_service import LLMService
 from ninebox.services.session_manager import SessionManager
+from ninebox.utils.etag import etag_matches, make_etag, not_modified_response, set_etag_headers
 
 router = APIRouter(prefix="/calibration-summary", tags=["calibration-summary"])
 logger = logging.getLogger(__name__)
@@ -117,6 +118,8 @@ class LLMAvailabilityResponse(TypedDict):
 
 @router.get("", response_model=None)
 async def get_calibration_summary(
+    request: Request,
+    response: Response,
     use_agent: bool = Query(
         default=True,
         description="Use AI agent for insights and summary generation. "
@@ -124,7 +127,7 @@ async def get_calibration_summary(
     ),
     session_mgr: SessionManager = Depends(get_session_manager),
     summary_service: CalibrationSummaryService = Depends(get_calibration_summary_service),
-) -> CalibrationSummaryResponse:
+) -> CalibrationSummaryResponse | Response:
     """Get calibration summary with optional AI-powered analysis.
 
     This endpoint provides comprehensive calibration meeting preparation data.
@@ -139,6 +142,9 @@ async def get_calibration_summary(
                    If False, use legacy insight generation (no summary).
                    Defaults to True for agent-first architecture.
 
+    Responses carry an ETag derived from the session revision and the query;
+    a matching If-None-Match returns 304 without recalculating.
+
     Returns:
         CalibrationSummaryResponse with all summary data, including optional AI summary
 
@@ -155,6 +161,11 @@ async def get_calibration_summary(
             detail="No active session found. Please upload an Excel file first.",
         )
 
+    revision = session_mgr.get_revision_tag(session)
+    etag = make_etag(revision, request)
+    if etag_matches(request, etag):
+        return not_modified_response(etag)
+
     try:
         if not session.current_employees:
             logger.error(
@@ -173,9 +184,19 @@ async def get_calibration_summary(
 
         # Run the potentially long-running LLM calculation in a background thread
         # to prevent blocking the event loop and keep the server responsive
+        frame = await asyncio.to_thread(session_mgr.get_analysis_frame, LOCAL_USER_ID)
         summary = await asyncio.to_thread(
-            summary_service.calculate_summary, session.current_employees, use_agent=use_agent
+            summary_service.calculate_summary,
+            session.current_employees,
+            use_agent=use_agent,
+            session_id=session.session_id,
+            revision=revision,
+            frame=frame,
         )
+        # Only agent responses with a summary are final; a failed LLM call
+        # falls back to legacy output that a retry may improve on
+        if not use_agent or summary.get("summary"):
+            set_etag_headers(response, etag)
         return CalibrationSummaryResponse(**summary)  # type: ignore[typeddict-item]
 
     except HTTPException:
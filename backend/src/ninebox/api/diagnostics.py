@@ -0,0 +1,78 @@
+"""Diagnostics API endpoints for analysis performance."""
+
+from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import PlainTextResponse
+
+from ninebox.core.config import settings
+from ninebox.services.analysis_metrics import ANALYSIS_METRICS
+from ninebox.services.analysis_registry import ANALYSIS_CACHE
+from ninebox.utils import stats_backend
+from ninebox.utils.profiling import available_profilers
+
+router = APIRouter(prefix="/diagnostics", tags=["diagnostics"])
+
+
+@router.get("/analyses")
+async def get_analysis_diagnostics() -> dict:
+    """
+    Get recent per-analysis timings, cache statistics and execution settings.
+
+    Timings cover a rolling window of recent runs per registered analysis
+    (see ANALYSIS_METRICS), with a latency histogram and percentiles.
+
+    Returns:
+        Dict with "analyses" (summary per analysis name), "cache" and "execution"
+    """
+    return {
+        "window": ANALYSIS_METRICS.window,
+        "analyses": ANALYSIS_METRICS.snapshot(),
+        "cache": {
+            "size": len(ANALYSIS_CACHE),
+            "maxsize": ANALYSIS_CACHE.maxsize,
+            "hits": ANALYSIS_CACHE.hits,
+            "misses": ANALYSIS_CACHE.misses,
+        },
+        "execution": {
+            "stats_backend": stats_backend.BACKEND,
+            "workers": settings.analysis_workers,
+            "executor": settings.analysis_executor,
+            "timeout_seconds": settings.analysis_timeout_seconds,
+            "exact_test_budget_seconds": settings.analysis_exact_test_budget_seconds,
+            "profilers": available_profilers(),
+        },
+    }
+
+
+@router.get("/profiles")
+async def list_profiles() -> dict:
+    """
+    List profiles captured with ?profile= on instrumented endpoints, newest first.
+
+    Returns:
+        Dict with "profiles": metadata for each stored profile (without report)
+    """
+    return {"profiles": ANALYSIS_METRICS.list_profiles()}
+
+
+@router.get("/profiles/{profile_id}", response_class=PlainTextResponse)
+async def get_profile(profile_id: str) -> str:
+    """
+    Get the text report of a captured profile.
+
+    Args:
+        profile_id: ID returned in the X-Profile-Id response header
+
+    Returns:
+        Profiler report as plain text
+
+    Raises:
+        HTTPException: 404 if the profile does not exist or was discarded
+    """
+    profile = ANALYSIS_METRICS.get_profile(profile_id)
+    if profile is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Profile {profile_id} not found",
+        )
+    report: str = profile["report"]
+    return report
@@ -1,21 +1,40 @@
 """Employee management API endpoints."""
 
 import logging
+from functools import partial
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from pydantic import BaseModel, Field, field_validator
 
 from ninebox.core.dependencies import get_employee_service, get_session_manager
 from ninebox.models.employee import Employee, PerformanceLevel, PotentialLevel
 from ninebox.models.filters import EmployeeFilters
-from ninebox.services.employee_service import EmployeeService, is_big_mover, is_medium_mover
+from ninebox.models.session import SessionState
+from ninebox.services.employee_index import EmployeeIndex
+from ninebox.services.employee_service import (
+    BIG_MOVER,
+    MEDIUM_MOVER,
+    EmployeeService,
+    classify_mover,
+    is_big_mover,
+    is_medium_mover,
+)
 from ninebox.services.sample_data_generator import (
     RichDatasetConfig,
     generate_rich_dataset,
     get_column_schema,
 )
 from ninebox.services.session_manager import SessionManager
+from ninebox.utils.etag import etag_matches, make_etag, not_modified_response, set_etag_headers
+from ninebox.utils.json_response import FastJSONResponse
+from ninebox.utils.query_parsing import (
+    MAX_PAGE_SIZE,
+    decode_cursor,
+    encode_cursor,
+    paging_query_key,
+    parse_field_list,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -92,6 +111,25 @@ class DonutMoveRequest(BaseModel):
     notes: str | None = None
 
 
+class ReassignManagerRequest(BaseModel):
+    """Request to move an employee under a different manager."""
+
+    manager_id: int  # Employee ID of the new manager
+
+
+class ManagerAssignment(BaseModel):
+    """One employee -> new manager assignment of a bulk reassignment."""
+
+    employee_id: int
+    manager_id: int
+
+
+class BulkReassignRequest(BaseModel):
+    """Request to move several employees under new managers at once."""
+
+    assignments: list[ManagerAssignment] = Field(..., min_length=1)
+
+
 class GenerateSampleRequest(BaseModel):
     """Request to generate sample employee dataset."""
 
@@ -135,18 +173,134 @@ class ColumnSchemaResponse(BaseModel):
     categories: list[str]
 
 
+# Fields a client can request with ?fields= (model fields plus computed mover flags)
+MOVER_FIELDS = {"is_big_mover", "is_medium_mover"}
+EMPLOYEE_RESPONSE_FIELDS = set(Employee.model_fields) | MOVER_FIELDS
+
+# Fields a client can sort by with ?sort= (list-valued fields have no natural order)
+SORTABLE_FIELDS = set(Employee.model_fields) - {"ratings_history", "flags"}
+
+
+def _serialize_employees(
+    employees: list[Employee],
+    session: SessionState,
+    fields: list[str] | None = None,
+    index: EmployeeIndex | None = None,
+) -> list[dict]:
+    """Serialize employees for the grid, adding in-session mover flags.
+
+    Args:
+        employees: Employees to serialize
+        session: Session holding the original employees for mover detection
+        fields: Optional projection; employee_id is always included
+        index: Session filter index; its cached mover classification is used
+            instead of recomputing movers when it covers the session
+
+    Returns:
+        JSON-compatible employee dicts
+    """
+    include = None
+    with_movers = True
+    if fields is not None:
+        include = {f for f in fields if f not in MOVER_FIELDS} | {"employee_id"}
+        with_movers = bool(MOVER_FIELDS.intersection(fields))
+
+    mover_classes: dict[int, int] = {}
+    if with_movers and index is not None and index.covers(session.current_employees):
+        mover_classes = {e.employee_id: index.mover_class(e.employee_id) for e in employees}
+    elif with_movers:
+        # No usable index: classify against the original employees directly
+        original_employees_map = {e.employee_id: e for e in session.original_employees}
+        mover_classes = {
+            e.employee_id: classify_mover(e, original_employees_map.get(e.employee_id))
+            for e in employees
+        }
+
+    employees_data = []
+    for emp in employees:
+        emp_dict = emp.model_dump(mode="json", include=include)
+        if with_movers:
+            mover = mover_classes[emp.employee_id]
+            if fields is None or "is_big_mover" in fields:
+                emp_dict["is_big_mover"] = bool(mover & BIG_MOVER)
+            if fields is None or "is_medium_mover" in fields:
+                emp_dict["is_medium_mover"] = bool(mover & MEDIUM_MOVER)
+        employees_data.append(emp_dict)
+    return employees_data
+
+
+def _sort_value(employee: Employee, field: str, descending: bool) -> tuple[bool, Any]:
+    # Tuples keep None away from real values (two Nones compare equal, never "<");
+    # the flag is flipped for descending sorts so missing values still come last
+    value = getattr(employee, field)
+    return ((value is None) != descending, value)
+
+
+def _sort_employees(employees: list[Employee], sort: str | None) -> list[Employee]:
+    """Sort employees by comma-separated keys, "-" prefix for descending.
+
+    Ties are broken by employee_id so pages are stable. Missing values sort last
+    in either direction.
+    """
+    if not sort or sort.strip() == "":
+        return employees
+
+    keys = [key.strip() for key in sort.split(",") if key.strip()]
+    parse_field_list(",".join(key.removeprefix("-") for key in keys), SORTABLE_FIELDS, "sort field")
+
+    # Stable sorts applied from the least to the most significant key
+    result = sorted(employees, key=lambda e: e.employee_id)
+    for key in reversed(keys):
+        field = key.removeprefix("-")
+        descending = field != key
+        result.sort(
+            key=partial(_sort_value, field=field, descending=descending), reverse=descending
+        )
+    return result
+
+
 @router.get("", response_model=dict)
 async def get_employees(
+    request: Request,
     levels: str | None = Query(None, description="Comma-separated levels (e.g., 'MT2,MT4')"),
     job_profiles: str | None = Query(None),
+    job_functions: str | None = Query(None),
+    locations: str | None = Query(None, description="Comma-separated locations (e.g., 'USA')"),
     managers: str | None = Query(None),
     exclude_ids: str | None = Query(None, description="Comma-separated employee IDs"),
     performance: str | None = Query(None),
     potential: str | None = Query(None),
+    flags: str | None = Query(None, description="Comma-separated flags (any match)"),
+    movers: str | None = Query(None, description="Comma-separated: big_mover, medium_mover"),
+    under_manager_ids: str | None = Query(
+        None, description="Comma-separated manager IDs; keeps everyone under them"
+    ),
+    fields: str | None = Query(
+        None, description="Comma-separated fields to return (e.g., 'name,grid_position')"
+    ),
+    sort: str | None = Query(
+        None, description="Comma-separated sort keys, '-' prefix for descending (e.g., '-name')"
+    ),
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+    cursor: str | None = Query(None, description="Cursor from a previous page's next_cursor"),
     session_mgr: SessionManager = Depends(get_session_manager),
     emp_service: EmployeeService = Depends(get_employee_service),
-) -> dict:
-    """Get filtered list of employees."""
+) -> Response:
+    """Get filtered list of employees.
+
+    Without paging parameters the whole filtered list is returned. With limit,
+    at most limit employees are returned and next_cursor (None on the last
+    page) fetches the next page. fields projects each employee down to the
+    requested fields, and sort orders the list server-side before paging.
+    A cursor is only valid for the query that produced it (400 otherwise)
+    and expires once the session changes (410); clients then start over.
+
+    Responses carry an ETag derived from the session revision and the query;
+    a matching If-None-Match returns 304 without filtering or serializing.
+
+    Example:
+        GET /api/employees?fields=name,grid_position&sort=-grid_position&limit=100
+    """
     logger.info(f"GET /employees called for user: {LOCAL_USER_ID}")
     session = session_mgr.get_session(LOCAL_USER_ID)
 
@@ -160,6 +314,11 @@ async def get_employees(
 
     logger.info(f"Found session with {len(session.current_employees)} employees")
 
+    revision_tag = session_mgr.get_revision_tag(session)
+    etag = make_etag(revision_tag, request)
+    if etag_matches(request, etag):
+        return not_modified_response(etag)
+
     # Parse query parameters using shared filter model
     filters = EmployeeFilters.from_query_params(
         levels=levels,
@@ -168,30 +327,140 @@ async def get_employees(
         performance=performance,
         potential=potential,
         exclude_ids=exclude_ids,
+        job_functions=job_functions,
+        locations=locations,
+        flags=flags,
+        movers=movers,
+        under_manager_ids=under_manager_ids,
     )
+    projection = parse_field_list(fields, EMPLOYEE_RESPONSE_FIELDS)
+    # Cursors are bound to this query and session revision, so a move between
+    # page fetches cannot silently skip or repeat employees
+    query_key = paging_query_key(request)
+    offset = decode_cursor(cursor, revision_tag, query_key)
+    index = session_mgr.get_employee_index(LOCAL_USER_ID)
 
     # Apply filters
     filtered_employees = emp_service.filter_employees(
         employees=session.current_employees,
+        index=index,
+        original_employees=session.original_employees,
+        org_service=(
+            session_mgr.get_org_service(LOCAL_USER_ID) if filters.under_manager_ids else None
+        ),
         **filters.to_filter_kwargs(),
     )
 
-    # Get original employees for in-session big mover detection
-    original_employees_map = {e.employee_id: e for e in session.original_employees}
+    # Sort and page before serializing so only the returned page is dumped
+    page = _sort_employees(filtered_employees, sort)
+    next_cursor = None
+    if limit is not None:
+        if offset + limit < len(page):
+            next_cursor = encode_cursor(offset + limit, revision_tag, query_key)
+        page = page[offset : offset + limit]
+    elif offset:
+        page = page[offset:]
+
+    # Payload is JSON-compatible already, so skip FastAPI's re-encoding pass
+    response = FastJSONResponse(
+        {
+            "employees": _serialize_employees(page, session, projection, index),
+            "total": len(session.current_employees),
+            "filtered": len(filtered_employees),
+            "next_cursor": next_cursor,
+        }
+    )
+    set_etag_headers(response, etag)
+    return response
 
-    # Serialize with movement flags computed
-    employees_data = []
-    for emp in filtered_employees:
-        emp_dict = emp.model_dump()
-        original_emp = original_employees_map.get(emp.employee_id)
-        emp_dict["is_big_mover"] = is_big_mover(emp, original_emp)
-        emp_dict["is_medium_mover"] = is_medium_mover(emp, original_emp)
-        employees_data.append(emp_dict)
 
+@router.get("/facets", response_model=dict)
+async def get_employee_facets(
+    request: Request,
+    response: Response,
+    levels: str | None = Query(None, description="Comma-separated levels (e.g., 'MT2,MT4')"),
+    job_profiles: str | None = Query(None),
+    job_functions: str | None = Query(None),
+    locations: str | None = Query(None, description="Comma-separated locations (e.g., 'USA')"),
+    managers: str | None = Query(None),
+    exclude_ids: str | None = Query(None, description="Comma-separated employee IDs"),
+    performance: str | None = Query(None),
+    potential: str | None = Query(None),
+    flags: str | None = Query(None, description="Comma-separated flags (any match)"),
+    movers: str | None = Query(None, description="Comma-separated: big_mover, medium_mover"),
+    under_manager_ids: str | None = Query(
+        None, description="Comma-separated manager IDs; keeps everyone under them"
+    ),
+    session_mgr: SessionManager = Depends(get_session_manager),
+) -> dict | Response:
+    """Get filtered employees plus live counts for every facet value.
+
+    Accepts the same filters as GET /employees. Facet counts are disjunctive:
+    the counts for one facet ignore that facet's own selection, so they tell
+    the UI how many employees each choice would leave. All counts come from
+    the session's filter index in a single pass.
+
+    Example response:
+        {
+            "employees": [...],
+            "total": 200,
+            "filtered": 48,
+            "facets": {
+                "levels": {"MT2": 10, "MT4": 22, ...},
+                "performance": {"High": 48, "Low": 61, "Medium": 91},
+                "flags": {"flight_risk": 3, ...},
+                ...
+            }
+        }
+    """
+    session = session_mgr.get_session(LOCAL_USER_ID)
+    index = session_mgr.get_employee_index(LOCAL_USER_ID)
+
+    if not session or index is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No active session",
+        )
+
+    etag = make_etag(session_mgr.get_revision_tag(session), request)
+    if etag_matches(request, etag):
+        return not_modified_response(etag)
+
+    filters = EmployeeFilters.from_query_params(
+        levels=levels,
+        job_profiles=job_profiles,
+        managers=managers,
+        performance=performance,
+        potential=potential,
+        exclude_ids=exclude_ids,
+        job_functions=job_functions,
+        locations=locations,
+        flags=flags,
+        movers=movers,
+        under_manager_ids=under_manager_ids,
+    )
+
+    try:
+        bits, facets = index.facet_counts(
+            org_service=(
+                session_mgr.get_org_service(LOCAL_USER_ID) if filters.under_manager_ids else None
+            ),
+            **filters.to_filter_kwargs(),
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+
+    filtered_employees = index.select(bits)
+
+    set_etag_headers(response, etag)
     return {
-        "employees": employees_data,
+        "employees": _serialize_employees(filtered_employees, session, index=index),
         "total": len(session.current_employees),
         "filtered": len(filtered_employees),
+        "facets": facets,
     }
 
 
@@ -543,6 +812,110 @@ async def move_employee_donut(
     }
 
 
+@router.patch("/{employee_id}/manager")
+async def reassign_manager(
+    employee_id: int,
+    request: ReassignManagerRequest,
+    session_mgr: SessionManager = Depends(get_session_manager),
+) -> dict:
+    """Move an employee, with their whole organization, under a different manager.
+
+    The change is tracked as a reporting_line_change event and removed again
+    when the employee is moved back to their original manager. The session's
+    org index is updated in place, so org-hierarchy, filter and intelligence
+    requests see the new structure without a rebuild.
+
+    Args:
+        employee_id: ID of the employee to move
+        request: ReassignManagerRequest with the new manager's employee ID
+
+    Returns:
+        dict: Response containing updated employee, change entry, and success status
+
+    Raises:
+        HTTPException: 400 if the new manager is in the employee's organization
+        HTTPException: 404 if either employee is not found or no active session
+    """
+    org_service = session_mgr.get_org_service(LOCAL_USER_ID)
+    if org_service is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No active session")
+    employee = org_service.get_employee_by_id(employee_id)
+    if employee is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Employee {employee_id} not found",
+        )
+    if org_service.get_employee_by_id(request.manager_id) is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Employee {request.manager_id} not found",
+        )
+
+    try:
+        change = session_mgr.reassign_manager(
+            user_id=LOCAL_USER_ID,
+            employee_id=employee_id,
+            new_manager_id=request.manager_id,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+
+    # The session updates the employee in place
+    return {
+        "employee": employee.model_dump(),
+        "change": change.model_dump(),
+        "success": True,
+    }
+
+
+@router.post("/reassign-managers")
+async def reassign_managers(
+    request: BulkReassignRequest,
+    session_mgr: SessionManager = Depends(get_session_manager),
+) -> dict:
+    """Move several employees under new managers in one step.
+
+    Assignments are applied in order and validated as a whole first: if any
+    employee is unknown, listed twice, or would end up in a reporting cycle,
+    nothing changes.
+
+    Example request:
+        {"assignments": [
+            {"employee_id": 12, "manager_id": 7},
+            {"employee_id": 13, "manager_id": 7}
+        ]}
+
+    Returns:
+        dict: Response containing one change entry per assignment and success status
+
+    Raises:
+        HTTPException: 400 if the assignments are invalid
+        HTTPException: 404 if no active session
+    """
+    if session_mgr.get_session(LOCAL_USER_ID) is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="No active session")
+
+    assignments = {a.employee_id: a.manager_id for a in request.assignments}
+    if len(assignments) != len(request.assignments):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Each employee can only be reassigned once per request",
+        )
+
+    try:
+        changes = session_mgr.reassign_managers(LOCAL_USER_ID, assignments)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e),
+        ) from e
+
+    return {"changes": [change.model_dump() for change in changes], "success": True}
+
+
 @router.post("/generate-sample", response_model=GenerateSampleResponse)
 async def generate_sample_employees(
     request: GenerateSampleRequest,
@@ -1,14 +1,31 @@
 """Intelligence API endpoints."""
 
 import asyncio
+import json
 import logging
-from typing import TypedDict
+from collections.abc import Callable, Iterator
+from functools import partial
+from typing import Any, Literal, TypedDict
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 
-from ninebox.core.dependencies import get_session_manager
-from ninebox.services.intelligence_service import calculate_overall_intelligence
+from ninebox.core.dependencies import get_employee_service, get_session_manager
+from ninebox.models.employee import Employee
+from ninebox.models.filters import EmployeeFilters
+from ninebox.models.session import SessionState
+from ninebox.services.analysis_frame import AnalysisFrame
+from ninebox.services.analysis_metrics import ANALYSIS_METRICS
+from ninebox.services.employee_service import EmployeeService
+from ninebox.services.intelligence_service import (
+    calculate_overall_intelligence,
+    calculate_slice_intelligence,
+    iter_intelligence,
+    iter_slice_intelligence,
+)
 from ninebox.services.session_manager import SessionManager
+from ninebox.utils.etag import etag_matches, make_etag, not_modified_response, set_etag_headers
+from ninebox.utils.profiling import available_profilers, profile_call
 
 router = APIRouter(prefix="/intelligence", tags=["intelligence"])
 
@@ -49,18 +66,83 @@ class IntelligenceResponse(TypedDict):
     manager_analysis: DimensionAnalysis
 
 
+def _filtered_employees(
+    session: SessionState,
+    session_mgr: SessionManager,
+    emp_service: EmployeeService,
+    filters: EmployeeFilters,
+) -> tuple[list[Employee], dict[str, Any]] | None:
+    """Apply /api/employees-style filters for a slice intelligence request.
+
+    Returns:
+        Tuple of (filtered employees, active filter kwargs), or None when no
+        filter is set and the full dataset should be analyzed
+    """
+    filter_kwargs = filters.to_filter_kwargs()
+    if not filter_kwargs:
+        return None
+    filtered = emp_service.filter_employees(
+        employees=session.current_employees,
+        index=session_mgr.get_employee_index(LOCAL_USER_ID),
+        original_employees=session.original_employees,
+        org_service=(
+            session_mgr.get_org_service(LOCAL_USER_ID) if filters.under_manager_ids else None
+        ),
+        **filter_kwargs,
+    )
+    return filtered, filter_kwargs
+
+
+def _population_frame(session: SessionState, session_mgr: SessionManager) -> AnalysisFrame:
+    """The session's analysis frame, used as the full-population baseline."""
+    frame = session_mgr.get_analysis_frame(LOCAL_USER_ID)
+    return frame if frame is not None else AnalysisFrame.from_employees(session.current_employees)
+
+
 @router.get("", response_model=None)
 async def get_intelligence(
+    request: Request,
+    response: Response,
+    profile: Literal["cprofile", "pyinstrument"] | None = Query(
+        None,
+        description="Profile this request; the report is stored under the X-Profile-Id header",
+    ),
+    levels: str | None = Query(None),
+    job_profiles: str | None = Query(None),
+    job_functions: str | None = Query(None),
+    locations: str | None = Query(None),
+    managers: str | None = Query(None),
+    exclude_ids: str | None = Query(None),
+    performance: str | None = Query(None),
+    potential: str | None = Query(None),
+    flags: str | None = Query(None),
+    movers: str | None = Query(None),
+    under_manager_ids: str | None = Query(None),
     session_mgr: SessionManager = Depends(get_session_manager),
-) -> IntelligenceResponse:
+    emp_service: EmployeeService = Depends(get_employee_service),
+) -> IntelligenceResponse | Response:
     """
-    Get statistical intelligence analysis for the full dataset.
+    Get statistical intelligence analysis for the full dataset or a filtered slice.
 
-    Note: This analyzes the FULL dataset, not filtered data.
-    Anomaly detection requires the full population to establish baseline.
+    Without filters, the full dataset is analyzed. With any of the
+    /api/employees filter parameters (levels, managers, locations, ...), only
+    the matching employees are analyzed, but each category is compared to the
+    same category across the full population (e.g. the slice's USA employees
+    against all USA employees) rather than to the slice itself. The
+    population tables are maintained by the session's analysis frame, so a
+    filtered request only pays for counting the slice.
+
+    Responses carry an ETag derived from the session revision; a matching
+    If-None-Match returns 304 without rerunning the analyses.
+
+    With ?profile=cprofile (or pyinstrument, if installed) the analyses are
+    rerun without the result cache under the profiler. The report can be
+    fetched from /api/diagnostics/profiles/{id}, with the id returned in the
+    X-Profile-Id header.
 
     Returns:
         IntelligenceResponse containing quality score, anomaly counts, and dimension analyses
+        (or an empty 304 response when the client's copy is current)
 
     Raises:
         HTTPException: 404 if no active session found
@@ -80,6 +162,17 @@ async def get_intelligence(
             detail="No active session found. Please upload an Excel file first.",
         )
 
+    if profile is not None and profile not in available_profilers():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Profiler '{profile}' is not installed",
+        )
+
+    revision = session_mgr.get_revision_tag(session)
+    etag = make_etag(revision, request)
+    if profile is None and etag_matches(request, etag):
+        return not_modified_response(etag)
+
     try:
         # Log diagnostic information
         logger = logging.getLogger(__name__)
@@ -100,11 +193,50 @@ async def get_intelligence(
                 detail="Session exists but contains no employee data. Please reload your Excel file.",
             )
 
-        # Calculate intelligence using full dataset (current_employees)
-        # Run in background thread to prevent blocking the event loop
-        intelligence = await asyncio.to_thread(
-            calculate_overall_intelligence, session.current_employees
+        filters = EmployeeFilters.from_query_params(
+            levels=levels,
+            job_profiles=job_profiles,
+            managers=managers,
+            performance=performance,
+            potential=potential,
+            exclude_ids=exclude_ids,
+            job_functions=job_functions,
+            locations=locations,
+            flags=flags,
+            movers=movers,
+            under_manager_ids=under_manager_ids,
         )
+        filtered = _filtered_employees(session, session_mgr, emp_service, filters)
+
+        # Run in background thread to prevent blocking the event loop
+        # The session's analysis frame keeps its contingency tables current
+        # across grid moves, so only the statistics are recomputed here
+        cache_kwargs: dict[str, Any] = {"session_id": session.session_id, "revision": revision}
+        analyze: Callable[..., dict[str, Any]]
+        if filtered is not None:
+            # Filtered slice, compared against the full-population frame
+            slice_employees, cache_kwargs["params"] = filtered
+            label = "slice_intelligence"
+            analyze = partial(
+                calculate_slice_intelligence,
+                slice_employees,
+                _population_frame(session, session_mgr),
+            )
+        else:
+            # Full dataset (current_employees)
+            frame = session_mgr.get_analysis_frame(LOCAL_USER_ID)
+            employees = frame if frame is not None else session.current_employees
+            label = "intelligence"
+            analyze = partial(calculate_overall_intelligence, employees)
+
+        if profile is not None:
+            # Skip the result cache so the profile shows the analyses themselves
+            intelligence, report, elapsed = await asyncio.to_thread(profile_call, profile, analyze)
+            profile_id = ANALYSIS_METRICS.add_profile(label, profile, elapsed, report)
+            response.headers["X-Profile-Id"] = profile_id
+        else:
+            intelligence = await asyncio.to_thread(analyze, **cache_kwargs)
+        set_etag_headers(response, etag)
         return IntelligenceResponse(**intelligence)  # type: ignore[typeddict-item, no-any-return]
     except HTTPException:
         # Re-raise HTTP exceptions
@@ -116,3 +248,123 @@ async def get_intelligence(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to calculate intelligence: {e!s}",
         ) from e
+
+
+def _ndjson_intelligence(results: Iterator[tuple[str, dict[str, Any]]]) -> Iterator[bytes]:
+    """Encode iter_intelligence() (or iter_slice_intelligence()) output as newline-delimited JSON.
+
+    Runs in Starlette's threadpool (StreamingResponse iterates sync generators
+    there), so the analyses never block the event loop.
+    """
+    try:
+        for field, result in results:
+            line: dict[str, Any] = (
+                {"type": "summary", **result}
+                if field == "summary"
+                else {"type": "dimension", "dimension": field, "result": result}
+            )
+            yield (json.dumps(line, separators=(",", ":")) + "\n").encode("utf-8")
+    except Exception as e:
+        # Headers are already sent, so report the failure in-band
+        logging.getLogger(__name__).exception(
+            f"Intelligence stream failed for user_id={LOCAL_USER_ID}"
+        )
+        error = {"type": "error", "detail": f"Failed to calculate intelligence: {e!s}"}
+        yield (json.dumps(error, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+@router.get("/stream", response_model=None)
+async def stream_intelligence(
+    request: Request,
+    levels: str | None = Query(None),
+    job_profiles: str | None = Query(None),
+    job_functions: str | None = Query(None),
+    locations: str | None = Query(None),
+    managers: str | None = Query(None),
+    exclude_ids: str | None = Query(None),
+    performance: str | None = Query(None),
+    potential: str | None = Query(None),
+    flags: str | None = Query(None),
+    movers: str | None = Query(None),
+    under_manager_ids: str | None = Query(None),
+    session_mgr: SessionManager = Depends(get_session_manager),
+    emp_service: EmployeeService = Depends(get_employee_service),
+) -> Response:
+    """
+    Stream the intelligence analysis one dimension at a time (NDJSON).
+
+    Same analyses as GET /api/intelligence, but each dimension is sent as soon
+    as it finishes so fast dimensions render while slow ones (e.g. manager on
+    large orgs) are still running. Each line is a JSON object:
+
+        {"type": "dimension", "dimension": "location_analysis", "result": {...}}
+        ...
+        {"type": "summary", "quality_score": 80, "anomaly_count": {...}}
+
+    Dimensions arrive in completion order; the summary is always last. An
+    unexpected failure after streaming started is reported as a final
+    {"type": "error", "detail": "..."} line.
+
+    Accepts the same filter parameters as GET /api/intelligence; with any
+    filter set, the filtered slice is analyzed against the full population.
+
+    Responses carry the same revision ETag as GET /api/intelligence.
+
+    Returns:
+        StreamingResponse with media type application/x-ndjson (or an empty
+        304 response when the client's copy is current)
+
+    Raises:
+        HTTPException: 404 if no active session found
+        HTTPException: 400 if the session contains no employees
+    """
+    session = session_mgr.get_session(LOCAL_USER_ID)
+    if not session:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No active session found. Please upload an Excel file first.",
+        )
+    if not session.current_employees:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Session exists but contains no employee data. Please reload your Excel file.",
+        )
+
+    revision = session_mgr.get_revision_tag(session)
+    etag = make_etag(revision, request)
+    if etag_matches(request, etag):
+        return not_modified_response(etag)
+
+    filters = EmployeeFilters.from_query_params(
+        levels=levels,
+        job_profiles=job_profiles,
+        managers=managers,
+        performance=performance,
+        potential=potential,
+        exclude_ids=exclude_ids,
+        job_functions=job_functions,
+        locations=locations,
+        flags=flags,
+        movers=movers,
+        under_manager_ids=under_manager_ids,
+    )
+    filtered = _filtered_employees(session, session_mgr, emp_service, filters)
+    if filtered is not None:
+        slice_employees, filter_kwargs = filtered
+        results = iter_slice_intelligence(
+            slice_employees,
+            _population_frame(session, session_mgr),
+            session_id=session.session_id,
+            revision=revision,
+            params=filter_kwargs,
+        )
+    else:
+        frame = session_mgr.get_analysis_frame(LOCAL_USER_ID)
+        employees = frame if frame is not None else session.current_employees
+        results = iter_intelligence(employees, session_id=session.session_id, revision=revision)
+    response = StreamingResponse(
+        _ndjson_intelligence(results),
+        media_type="application/x-ndjson",
+    )
+    set_etag_headers(response, etag)
+    return response
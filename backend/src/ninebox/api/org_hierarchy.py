@@ -8,6 +8,7 @@ from fastapi import APIRouter, Depends, HTTPException, Path, Query, status
 from ninebox.core.dependencies import get_org_service
 from ninebox.models.employee import Employee
 from ninebox.services.org_service import OrgService
+from ninebox.utils.query_parsing import MAX_PAGE_SIZE, decode_cursor, encode_cursor
 
 router = APIRouter(prefix="/org-hierarchy", tags=["org-hierarchy"])
 
@@ -45,6 +46,7 @@ class AllReportsResponse(TypedDict):
     direct_reports_count: int
     total_reports_count: int
     all_reports: list[dict]
+    next_cursor: str | None
 
 
 class OrgTreeNode(TypedDict):
@@ -63,6 +65,25 @@ class OrgTreeResponse(TypedDict):
     total_managers: int
 
 
+class OrgChildNode(TypedDict):
+    """One node of a lazily expanded organization tree."""
+
+    employee_id: int
+    name: str
+    job_title: str
+    team_size: int
+    direct_reports_count: int
+
+
+class OrgChildrenResponse(TypedDict):
+    """Response for one level of a lazily expanded organization tree."""
+
+    parent_id: int | None
+    children: list[OrgChildNode]
+    total_count: int
+    next_cursor: str | None
+
+
 @router.get("/managers", response_model=None)
 async def get_managers(
     min_team_size: int = Query(default=1, ge=1, description="Minimum team size to filter managers"),
@@ -89,9 +110,6 @@ async def get_managers(
         # Find managers with minimum team size
         manager_ids = org_service.find_managers(min_team_size=min_team_size)
 
-        # Build org tree once for O(1) lookups
-        org_tree = org_service.build_org_tree()
-
         # Build manager info list
         managers: list[ManagerInfo] = []
         for manager_id in manager_ids:
@@ -102,8 +120,8 @@ async def get_managers(
                 )
                 continue
 
-            # Get team size (all reports) using O(1) lookup
-            team_size = len(org_tree.get(manager_id, []))
+            # Get team size (all reports) from the interval encoding in O(1)
+            team_size = org_service.get_team_size(manager_id)
 
             managers.append(
                 {
@@ -129,6 +147,8 @@ async def get_managers(
 @router.get("/reports/{employee_id}", response_model=None)
 async def get_all_reports(
     employee_id: int = Path(..., description="Employee ID of the manager"),
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+    cursor: str | None = Query(None, description="Cursor from a previous page's next_cursor"),
     org_service: OrgService = Depends(get_org_service),
 ) -> AllReportsResponse:
     """
@@ -137,8 +157,14 @@ async def get_all_reports(
     Uses OrgService to traverse the org tree and return all employees
     reporting to the specified manager, both directly and indirectly.
 
+    Reports are listed in org-chart (pre-order) sequence. Without limit the
+    whole organization is returned; with limit, at most limit reports are
+    serialized and next_cursor (None on the last page) fetches the next page.
+
     Args:
         employee_id: Employee ID of the manager
+        limit: Maximum number of reports to return
+        cursor: Cursor from a previous page
         org_service: OrgService dependency
 
     Returns:
@@ -157,9 +183,15 @@ async def get_all_reports(
                 detail=f"Employee ID {employee_id} not found in dataset.",
             )
 
-        # Get direct and all reports
+        # Reports are a contiguous run of the pre-order, so slice just the page
         direct_reports = org_service.get_direct_reports(employee_id)
-        all_reports = org_service.get_all_reports(employee_id)
+        total_reports = org_service.get_team_size(employee_id)
+        subtree = org_service.get_subtree_range(employee_id)
+        assert subtree is not None  # nosec B101  # Type narrowing: the employee exists
+        start = subtree[0] + 1 + decode_cursor(cursor)
+        stop = subtree[1] if limit is None else min(start + limit, subtree[1])
+        page = org_service.preorder[start:stop] if start < stop else []
+        next_cursor = encode_cursor(stop - subtree[0] - 1) if stop < subtree[1] else None
 
         # Convert employees to dict representation for response
         def employee_to_dict(emp: Employee) -> dict:
@@ -176,8 +208,9 @@ async def get_all_reports(
             "manager_id": employee_id,
             "manager_name": manager.name,
             "direct_reports_count": len(direct_reports),
-            "total_reports_count": len(all_reports),
-            "all_reports": [employee_to_dict(emp) for emp in all_reports],
+            "total_reports_count": total_reports,
+            "all_reports": [employee_to_dict(emp) for emp in page],
+            "next_cursor": next_cursor,
         }
 
     except HTTPException:
@@ -224,16 +257,13 @@ async def get_reporting_chain(
         # Get reporting chain
         chain_ids = org_service.get_reporting_chain(employee_id)
 
-        # Build org tree once for O(1) lookups
-        org_tree = org_service.build_org_tree()
-
         # Build manager info list for chain
         reporting_chain: list[ManagerInfo] = []
         for mgr_id in chain_ids:
             mgr = org_service.get_employee_by_id(mgr_id)
             if mgr:
-                # Get team size using O(1) lookup
-                team_size = len(org_tree.get(mgr_id, []))
+                # Get team size from the interval encoding in O(1)
+                team_size = org_service.get_team_size(mgr_id)
                 reporting_chain.append(
                     {
                         "employee_id": mgr_id,
@@ -259,7 +289,7 @@ async def get_reporting_chain(
 
 
 @router.get("/tree", response_model=None)
-async def get_org_tree(  # noqa: PLR0912
+async def get_org_tree(
     min_team_size: int = Query(default=1, ge=1, description="Minimum team size to filter managers"),
     org_service: OrgService = Depends(get_org_service),
 ) -> OrgTreeResponse:
@@ -303,9 +333,6 @@ async def get_org_tree(  # noqa: PLR0912
         # Get all managers with minimum team size
         manager_ids = org_service.find_managers(min_team_size=min_team_size)
 
-        # Build org tree once for O(1) lookups
-        org_tree = org_service.build_org_tree()
-
         # Create set for fast lookup
         manager_id_set = set(manager_ids)
 
@@ -316,7 +343,7 @@ async def get_org_tree(  # noqa: PLR0912
             if not manager:
                 continue
 
-            team_size = len(org_tree.get(manager_id, []))
+            team_size = org_service.get_team_size(manager_id)
             manager_info_map[manager_id] = {
                 "employee_id": manager_id,
                 "name": manager.name,
@@ -340,34 +367,13 @@ async def get_org_tree(  # noqa: PLR0912
         for info in manager_info_map.values():
             info["direct_reports"].sort(key=lambda m: (-m["team_size"], m["name"]))
 
-        # Find root managers (those who don't report to another manager in our list)
-        root_managers = []
-        for manager_id in manager_ids:
-            manager = org_service.get_employee_by_id(manager_id)
-            if not manager:
-                continue
-
-            # Check if this manager's boss is in our manager list
-            manager_employee_data = org_service.get_employee_by_id(manager_id)
-            if not manager_employee_data:
-                continue
-
-            # Get this manager's reporting chain to find their boss
-            manager_chain = org_service.get_reporting_chain(manager_id)
-
-            # If the chain is empty, this is a root (CEO/top-level manager)
-            is_root = True
-
-            if manager_chain:
-                # The first person in the chain is their direct manager
-                # Check if that manager is also in our filtered manager list
-                direct_manager_id = manager_chain[0]
-                if direct_manager_id in manager_id_set:
-                    # They report to another manager in our filtered list, so not a root
-                    is_root = False
-
-            if is_root:
-                root_managers.append(manager_info_map[manager_id])
+        # Find root managers (those who don't report to another manager in our list);
+        # each manager's boss is a direct lookup in the org index
+        root_managers = [
+            manager_info_map[manager_id]
+            for manager_id in manager_info_map
+            if org_service.get_manager_id(manager_id) not in manager_id_set
+        ]
 
         # Sort roots by team size (desc) then name
         root_managers.sort(key=lambda m: (-m["team_size"], m["name"]))
@@ -380,3 +386,134 @@ async def get_org_tree(  # noqa: PLR0912
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to build organization tree: {e!s}",
         ) from e
+
+
+def _children_page(
+    org_service: OrgService,
+    parent_id: int | None,
+    children: list[Employee],
+    min_team_size: int,
+    limit: int,
+    cursor: str | None,
+) -> OrgChildrenResponse:
+    """Sort one level of the tree, filter it by team size and return a page of it."""
+    nodes: list[OrgChildNode] = []
+    for child in children:
+        team_size = org_service.get_team_size(child.employee_id)
+        if team_size < min_team_size:
+            continue
+        nodes.append(
+            {
+                "employee_id": child.employee_id,
+                "name": child.name,
+                "job_title": child.job_title,
+                "team_size": team_size,
+                "direct_reports_count": len(org_service.get_direct_reports(child.employee_id)),
+            }
+        )
+    nodes.sort(key=lambda n: (-n["team_size"], n["name"]))
+
+    offset = decode_cursor(cursor)
+    return {
+        "parent_id": parent_id,
+        "children": nodes[offset : offset + limit],
+        "total_count": len(nodes),
+        "next_cursor": encode_cursor(offset + limit) if offset + limit < len(nodes) else None,
+    }
+
+
+@router.get("/tree/roots", response_model=None)
+async def get_org_tree_roots(
+    min_team_size: int = Query(default=0, ge=0, description="Minimum team size to include"),
+    limit: int = Query(default=100, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+    cursor: str | None = Query(None, description="Cursor from a previous page's next_cursor"),
+    org_service: OrgService = Depends(get_org_service),
+) -> OrgChildrenResponse:
+    """
+    Get the top level of the organization tree for lazy expansion.
+
+    Returns the employees without a manager (normally just the CEO) with
+    their team sizes and direct report counts, so the UI can render the tree
+    one level at a time with get_org_tree_children() instead of loading the
+    whole structure from /tree.
+
+    Args:
+        min_team_size: Only include employees with at least this many reports
+        limit: Maximum number of nodes to return
+        cursor: Cursor from a previous page
+        org_service: OrgService dependency
+
+    Returns:
+        OrgChildrenResponse with parent_id None, sorted by team size (desc) then name
+
+    Raises:
+        HTTPException: 404 if no active session found
+        HTTPException: 500 if org service operation fails
+    """
+    try:
+        return _children_page(
+            org_service, None, org_service.get_roots(), min_team_size, limit, cursor
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"OrgHierarchy: Failed to get org tree roots: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to retrieve organization tree roots: {e!s}",
+        ) from e
+
+
+@router.get("/tree/{employee_id}/children", response_model=None)
+async def get_org_tree_children(
+    employee_id: int = Path(..., description="Employee ID of the node to expand"),
+    min_team_size: int = Query(default=0, ge=0, description="Minimum team size to include"),
+    limit: int = Query(default=100, ge=1, le=MAX_PAGE_SIZE, description="Page size"),
+    cursor: str | None = Query(None, description="Cursor from a previous page's next_cursor"),
+    org_service: OrgService = Depends(get_org_service),
+) -> OrgChildrenResponse:
+    """
+    Get one level of the organization tree below an employee.
+
+    Returns the employee's direct reports with their team sizes and direct
+    report counts; a node with direct_reports_count > 0 can be expanded with
+    another call. Team sizes are O(1) lookups in the org index, so the cost
+    is proportional to the number of direct reports, not the subtree.
+
+    Args:
+        employee_id: Employee ID of the node to expand
+        min_team_size: Only include direct reports with at least this many reports
+        limit: Maximum number of nodes to return
+        cursor: Cursor from a previous page
+        org_service: OrgService dependency
+
+    Returns:
+        OrgChildrenResponse sorted by team size (desc) then name
+
+    Raises:
+        HTTPException: 404 if no active session found or employee not found
+        HTTPException: 500 if org service operation fails
+    """
+    try:
+        if not org_service.get_employee_by_id(employee_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Employee ID {employee_id} not found in dataset.",
+            )
+
+        return _children_page(
+            org_service,
+            employee_id,
+            org_service.get_direct_reports(employee_id),
+            min_team_size,
+            limit,
+            cursor,
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"OrgHierarchy: Failed to get children of employee {employee_id}: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to retrieve organization tree children: {e!s}",
+        ) from e
@@ -1,6 +1,6 @@
 """Statistics API endpoints."""
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 
 from ninebox.core.dependencies import (
     get_employee_service,
@@ -11,6 +11,7 @@ from ninebox.models.filters import EmployeeFilters
 from ninebox.services.employee_service import EmployeeService
 from ninebox.services.session_manager import SessionManager
 from ninebox.services.statistics_service import StatisticsService
+from ninebox.utils.etag import etag_matches, make_etag, not_modified_response, set_etag_headers
 
 router = APIRouter(prefix="/statistics", tags=["statistics"])
 
@@ -18,19 +19,30 @@ router = APIRouter(prefix="/statistics", tags=["statistics"])
 LOCAL_USER_ID = "local-user"
 
 
-@router.get("")
+@router.get("", response_model=None)
 async def get_statistics(
+    request: Request,
+    response: Response,
     levels: str | None = Query(None),
     job_profiles: str | None = Query(None),
+    job_functions: str | None = Query(None),
+    locations: str | None = Query(None),
     managers: str | None = Query(None),
     exclude_ids: str | None = Query(None),
     performance: str | None = Query(None),
     potential: str | None = Query(None),
+    flags: str | None = Query(None),
+    movers: str | None = Query(None),
+    under_manager_ids: str | None = Query(None),
     session_mgr: SessionManager = Depends(get_session_manager),
     emp_service: EmployeeService = Depends(get_employee_service),
     stats_service: StatisticsService = Depends(get_statistics_service),
-) -> dict:
-    """Get statistics for filtered employees."""
+) -> dict | Response:
+    """Get statistics for filtered employees.
+
+    Responses carry an ETag derived from the session revision and the query;
+    a matching If-None-Match returns 304 without recomputing.
+    """
     session = session_mgr.get_session(LOCAL_USER_ID)
 
     if not session:
@@ -39,6 +51,10 @@ async def get_statistics(
             detail="No active session",
         )
 
+    etag = make_etag(session_mgr.get_revision_tag(session), request)
+    if etag_matches(request, etag):
+        return not_modified_response(etag)
+
     # Parse query parameters using shared filter model
     filters = EmployeeFilters.from_query_params(
         levels=levels,
@@ -47,15 +63,26 @@ async def get_statistics(
         performance=performance,
         potential=potential,
         exclude_ids=exclude_ids,
+        job_functions=job_functions,
+        locations=locations,
+        flags=flags,
+        movers=movers,
+        under_manager_ids=under_manager_ids,
     )
 
     # Apply filters
     filtered_employees = emp_service.filter_employees(
         employees=session.current_employees,
+        index=session_mgr.get_employee_index(LOCAL_USER_ID),
+        original_employees=session.original_employees,
+        org_service=(
+            session_mgr.get_org_service(LOCAL_USER_ID) if filters.under_manager_ids else None
+        ),
         **filters.to_filter_kwargs(),
     )
 
     # Calculate statistics
     stats = stats_service.calculate_distribution(filtered_employees)
 
+    set_etag_headers(response, etag)
     return stats
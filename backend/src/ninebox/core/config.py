@@ -1,6 +1,7 @@
 """Application configuration."""
 
 from pathlib import Path
+from typing import Literal
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -29,6 +30,18 @@ class Settings(BaseSettings):
     llm_model: str = "claude-sonnet-4-5-20250929"
     llm_max_tokens: int = 2048
 
+    # Intelligence analyses (see services/analysis_registry.py)
+    analysis_workers: int = 0  # Pool size for running analyses concurrently; 0 = sequential
+    # "process" pickles the whole analysis frame once per analysis, and tables a
+    # worker memoizes are discarded with its copy, so the frame's incrementally
+    # updated tables are rebuilt on every run; "thread" shares the session frame
+    analysis_executor: Literal["thread", "process"] = "thread"
+    # Per-analysis limit when run on a pool, counted from when a worker starts it
+    analysis_timeout_seconds: float | None = None
+    # Time budget for exact/Monte-Carlo tests of small manager teams per analysis run;
+    # teams not reached in time use the asymptotic chi-square p-value
+    analysis_exact_test_budget_seconds: float = 0.5
+
     model_config = SettingsConfigDict(
         env_file=str(ENV_FILE_PATH) if ENV_FILE_PATH.exists() else None,
         env_file_encoding="utf-8",
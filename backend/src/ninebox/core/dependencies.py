@@ -225,25 +225,31 @@ def get_validated_session(
 
 def get_org_service(
     session: SessionState = Depends(get_validated_session),  # noqa: B008
+    session_mgr: SessionManager = Depends(get_session_manager),  # noqa: B008
 ) -> OrgService:
-    """Dependency to get OrgService initialized with session employees.
+    """Dependency to get the session's cached OrgService.
 
-    Creates an OrgService instance initialized with the current employees from
-    the validated session. Validation is disabled to handle test data with
-    incomplete org structures.
+    Returns the org index SessionManager keeps for the validated session, so
+    repeated org-hierarchy requests reuse one tree instead of rebuilding it
+    per request. The index is unvalidated to handle test data with incomplete
+    org structures, and is rebuilt only when manager-related fields change.
 
     This dependency extracts the common OrgService initialization logic used
     across multiple endpoints in the org-hierarchy API.
 
     Args:
         session: Validated session (injected by get_validated_session)
+        session_mgr: SessionManager dependency (injected by FastAPI)
 
     Returns:
-        OrgService: Initialized org service with session employees
+        OrgService: Org service over the session's current employees
 
     Example:
         >>> from fastapi import Depends
         >>> def my_endpoint(org_service: OrgService = Depends(get_org_service)):
         ...     managers = org_service.find_managers(min_team_size=5)
     """
-    return OrgService(session.current_employees, validate=False)
+    org_service = session_mgr.get_org_service(LOCAL_USER_ID)
+    if org_service is None:
+        return OrgService(session.current_employees, validate=False)
+    return org_service
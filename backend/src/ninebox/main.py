@@ -39,6 +39,7 @@ else:
 
 from ninebox.api import (  # noqa: E402
     calibration_summary,
+    diagnostics,
     employees,
     intelligence,
     org_hierarchy,
@@ -82,6 +83,7 @@ app.include_router(calibration_summary.router, prefix="/api")
 app.include_router(preferences.router, prefix="/api")
 app.include_router(org_hierarchy.router, prefix="/api")
 app.include_router(update_analytics.router, prefix="/api")
+app.include_router(diagnostics.router, prefix="/api")
 
 
 @app.get("/")
@@ -164,10 +166,14 @@ def is_port_in_use(port: int) -> bool:
 
 
 if __name__ == "__main__":
+    import multiprocessing
     import os
 
     import uvicorn
 
+    # Required for process-pool analysis workers in the PyInstaller build
+    multiprocessing.freeze_support()
+
     # Allow port to be configured via environment variable (useful for testing)
     # Default to port 38000 to avoid conflicts with common services on 38000
     requested_port = int(os.getenv("PORT", "38000"))
@@ -353,9 +353,72 @@ class FlagRemoveEvent(TrackableEvent):
         return self.flag not in original_flags
 
 
+class ReportingLineChangeEvent(TrackableEvent):
+    """Reporting line change event.
+
+    Represents an employee (together with their whole organization) being
+    moved under a different manager during the session, e.g. to explore a
+    re-org. The manager is chosen by employee ID, so duplicated manager names
+    are unambiguous.
+
+    Attributes:
+        old_manager_id: Employee ID of the manager before the first change in
+            the session (None if the employee had no resolvable manager)
+        old_manager_name: direct_manager before the first change in the session
+        new_manager_id: Employee ID of the new manager
+        new_manager_name: Name of the new manager
+
+    Examples:
+        >>> event = ReportingLineChangeEvent(
+        ...     employee_id=12,
+        ...     employee_name="Grace Hill",
+        ...     old_manager_id=3,
+        ...     old_manager_name="Ian Ward",
+        ...     new_manager_id=7,
+        ...     new_manager_name="Kim Lee",
+        ... )
+        >>> print(f"{event.event_type}: {event.old_manager_name} -> {event.new_manager_name}")
+        reporting_line_change: Ian Ward -> Kim Lee
+    """
+
+    event_type: Literal["reporting_line_change"] = "reporting_line_change"
+    old_manager_id: int | None
+    old_manager_name: str
+    new_manager_id: int
+    new_manager_name: str
+
+    def is_net_zero(self, original_employee: Employee) -> bool:
+        """Check if employee reports to their original manager again.
+
+        Args:
+            original_employee: Employee from original uploaded data
+
+        Returns:
+            True if the new manager is the original manager, matched by ID
+            when the original manager was resolved and by name otherwise
+
+        Examples:
+            >>> original = Employee(employee_id=12, direct_manager="Ian Ward", ...)
+            >>> # Moved to Kim Lee, then back to Ian Ward
+            >>> event = ReportingLineChangeEvent(
+            ...     employee_id=12,
+            ...     employee_name="Grace Hill",
+            ...     old_manager_id=3,
+            ...     old_manager_name="Ian Ward",
+            ...     new_manager_id=3,
+            ...     new_manager_name="Ian Ward",
+            ... )
+            >>> event.is_net_zero(original)
+            True
+        """
+        if self.old_manager_id is not None:
+            return self.new_manager_id == self.old_manager_id
+        return self.new_manager_name == original_employee.direct_manager
+
+
 # Type alias for all event types (discriminated union)
 # Using Annotated with Discriminator for proper Pydantic v2 support
 Event = Annotated[
-    GridMoveEvent | DonutMoveEvent | FlagAddEvent | FlagRemoveEvent,
+    GridMoveEvent | DonutMoveEvent | FlagAddEvent | FlagRemoveEvent | ReportingLineChangeEvent,
     Discriminator("event_type"),
 ]
@@ -2,6 +2,7 @@
 
 from pydantic import BaseModel
 
+from ninebox.services.employee_service import map_location_to_display
 from ninebox.utils.query_parsing import parse_id_list
 
 
@@ -9,16 +10,24 @@ class EmployeeFilters(BaseModel):
     """
     Filters for querying employees.
 
-    Supports filtering by levels, job profiles, managers, performance,
-    potential, and excluding specific employee IDs.
+    Supports filtering by levels, job profiles, job functions, locations
+    (display names) or location codes, managers, performance, potential, flags,
+    mover class, whole organizations (everyone under given managers), and
+    excluding specific employee IDs.
     """
 
     levels: list[str] | None = None
     job_profiles: list[str] | None = None
+    job_functions: list[str] | None = None
+    locations: list[str] | None = None
+    location_codes: list[str] | None = None
     managers: list[str] | None = None
     performance: list[str] | None = None
     potential: list[str] | None = None
+    flags: list[str] | None = None
+    movers: list[str] | None = None
     exclude_ids: list[int] | None = None
+    under_manager_ids: list[int] | None = None
 
     @classmethod
     def from_query_params(
@@ -29,6 +38,11 @@ class EmployeeFilters(BaseModel):
         performance: str | None = None,
         potential: str | None = None,
         exclude_ids: str | None = None,
+        job_functions: str | None = None,
+        locations: str | None = None,
+        flags: str | None = None,
+        movers: str | None = None,
+        under_manager_ids: str | None = None,
     ) -> "EmployeeFilters":
         """
         Parse query parameters into EmployeeFilters.
@@ -40,6 +54,14 @@ class EmployeeFilters(BaseModel):
             performance: Comma-separated performance levels
             potential: Comma-separated potential levels
             exclude_ids: Comma-separated employee IDs to exclude
+            job_functions: Comma-separated job functions
+            locations: Comma-separated location display names (e.g., "USA,Europe");
+                raw codes with a different display name (e.g., "GBR") are
+                matched exactly, as location_codes
+            flags: Comma-separated employee flags
+            movers: Comma-separated mover classes ("big_mover", "medium_mover")
+            under_manager_ids: Comma-separated manager employee IDs whose
+                direct and indirect reports to keep
 
         Returns:
             EmployeeFilters instance
@@ -54,13 +76,22 @@ class EmployeeFilters(BaseModel):
             >>> filters.exclude_ids
             [1, 2, 3]
         """
+        location_values = cls._parse_string_list(locations) or []
+        location_codes = [v for v in location_values if map_location_to_display(v) != v]
+        display_names = [v for v in location_values if v not in location_codes]
         return cls(
             levels=cls._parse_string_list(levels),
             job_profiles=cls._parse_string_list(job_profiles),
+            job_functions=cls._parse_string_list(job_functions),
+            locations=display_names or None,
+            location_codes=location_codes or None,
             managers=cls._parse_string_list(managers),
             performance=cls._parse_string_list(performance),
             potential=cls._parse_string_list(potential),
+            flags=cls._parse_string_list(flags),
+            movers=cls._parse_string_list(movers),
             exclude_ids=parse_id_list(exclude_ids, "employee ID"),
+            under_manager_ids=parse_id_list(under_manager_ids, "manager ID"),
         )
 
     @staticmethod
@@ -38,6 +38,10 @@ class SessionState(BaseModel):
     donut_events: list[Event] = []
     donut_mode_active: bool = False
 
+    # Bumped by SessionManager on every mutation (in-memory only, not persisted).
+    # Read endpoints derive ETags from it to answer conditional GETs cheaply.
+    revision: int = 0
+
     model_config = ConfigDict(
         # Pydantic V2 automatically serializes datetime to ISO format
         # No need for custom json_encoders
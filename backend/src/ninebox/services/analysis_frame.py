@@ -0,0 +1,538 @@
+"""Columnar employee frame shared by the intelligence analyses.
+
+Every intelligence analysis groups the same employees by one category
+(location, function, level, tenure, manager) and counts a rating column
+(performance level, grid position, performance bucket). Reading those
+attributes off Pydantic models is the dominant cost, so AnalysisFrame reads
+each attribute exactly once, integer-codes the categories and stores the
+rating columns as compact arrays. Analyses then build contingency tables by
+counting (category code, rating code) pairs instead of re-walking the
+employee list.
+
+The frame is also a Sequence[Employee] over the original list, so analyses
+registered with the plain list signature keep working unchanged.
+
+Contingency tables (table()) and per-manager bucket tallies
+(manager_bucket_counts()) are memoized on the frame. SessionManager keeps one
+frame per session and calls update_employee() after each grid move, which
+adjusts every memoized table by -1/+1 in the affected cells instead of
+rebuilding it, so only the test statistics are recomputed after a move.
+
+A frame may be shared by analyses running on a thread pool; memoization and
+updates are serialized by a per-frame lock. Frames are picklable for process
+pools (the lock is recreated on unpickling).
+"""
+
+import threading
+from array import array
+from collections import Counter
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
+from typing import Any, overload
+
+from ninebox.models.employee import Employee
+from ninebox.models.grid_positions import PERFORMANCE_BUCKETS
+from ninebox.services.org_service import OrgService
+
+# Column order of performance-coded data; matches the contingency table
+# column order used by the chi-square analyses
+PERFORMANCE_LEVELS = ("High", "Medium", "Low")
+
+# Column order of performance-bucket codes (grid position tiers)
+PERFORMANCE_BUCKET_NAMES = ("High", "Medium", "Low")
+
+# Bucket code for grid positions outside every performance bucket (not 1-9)
+NO_BUCKET = len(PERFORMANCE_BUCKET_NAMES)
+
+_PERFORMANCE_CODES = {level: code for code, level in enumerate(PERFORMANCE_LEVELS)}
+_BUCKET_CODES = {
+    position: code
+    for code, bucket in enumerate(PERFORMANCE_BUCKET_NAMES)
+    for position in PERFORMANCE_BUCKETS[bucket]
+}
+
+# Categorical columns and the Employee attribute each one encodes
+CATEGORY_ATTRIBUTES = {
+    "location": "location",
+    "job_function": "job_function",
+    "job_level": "job_level",
+    "tenure": "tenure_category",
+    "manager": "direct_manager",
+}
+
+# Integer columns usable as table columns: (number of table columns, offset)
+VALUE_COLUMNS = {
+    "performance": (len(PERFORMANCE_LEVELS), 0),
+    "grid_position": (9, 1),
+    "performance_bucket": (NO_BUCKET + 1, 0),
+}
+
+
+@dataclass
+class CategoricalColumn:
+    """Integer-coded categorical column.
+
+    Attributes:
+        labels: Category label for each code, in order of first appearance
+        codes: Category code of each employee, aligned with the frame rows
+    """
+
+    labels: list[str]
+    codes: array
+    _lookup: dict[str, int] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self) -> None:
+        """Index the labels for code lookups."""
+        self._lookup = {label: code for code, label in enumerate(self.labels)}
+
+    def __len__(self) -> int:
+        """Number of rows in the column."""
+        return len(self.codes)
+
+    def code_of(self, label: str) -> int:
+        """Return the code of a label, assigning a new code if it is unseen.
+
+        Args:
+            label: Category label
+
+        Returns:
+            Integer code of the label
+        """
+        code = self._lookup.get(label)
+        if code is None:
+            code = self._lookup[label] = len(self.labels)
+            self.labels.append(label)
+        return code
+
+
+class AnalysisFrame(Sequence[Employee]):
+    """Array-backed view of an employee list for the intelligence analyses.
+
+    Build it once per analysis run with AnalysisFrame.from_employees() (or
+    as_analysis_frame()) and hand the same frame to every analysis.
+
+    Example:
+        >>> frame = AnalysisFrame.from_employees(employees)
+        >>> frame.table("location", "performance")
+        {'USA': [12, 40, 8], 'GBR': [5, 18, 2]}
+    """
+
+    def __init__(
+        self,
+        employees: list[Employee],
+        location: CategoricalColumn,
+        job_function: CategoricalColumn,
+        job_level: CategoricalColumn,
+        tenure: CategoricalColumn,
+        manager: CategoricalColumn,
+        performance: array,
+        grid_position: array,
+        performance_bucket: array,
+    ) -> None:
+        """Create a frame from pre-encoded columns (use from_employees() instead)."""
+        self.employees = employees
+        self.location = location
+        self.job_function = job_function
+        self.job_level = job_level
+        self.tenure = tenure
+        self.manager = manager
+        self.performance = performance
+        self.grid_position = grid_position
+        self.performance_bucket = performance_bucket
+        self._rows: dict[int, int] | None = None
+        # Memoized contingency tables, keyed by (category column, value column);
+        # each table is a list of counts per category code
+        self._tables: dict[tuple[str, str], list[list[int]]] = {}
+        # Org tree and per-manager bucket tallies, built on first manager analysis
+        self._org_service: OrgService | None = None
+        self._manager_counts: dict[int, list[int]] = {}
+        self._lock = threading.RLock()
+
+    def __getstate__(self) -> dict[str, Any]:
+        """Pickle state without the (unpicklable) lock."""
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict[str, Any]) -> None:
+        """Restore pickled state with a fresh lock."""
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+    @classmethod
+    def from_employees(cls, employees: Sequence[Employee]) -> "AnalysisFrame":
+        """Encode employees into a frame in a single pass.
+
+        A list is referenced rather than copied, so covers() can later tell
+        whether the frame still describes it.
+
+        Args:
+            employees: Employee records to analyze
+
+        Returns:
+            AnalysisFrame with one row per employee, in input order
+        """
+        employee_list = employees if isinstance(employees, list) else list(employees)
+        lookups: list[dict[str, int]] = [{}, {}, {}, {}, {}]
+        location_lookup, function_lookup, level_lookup, tenure_lookup, manager_lookup = lookups
+        location, job_function, job_level, tenure, manager = (array("i") for _ in range(5))
+        performance = array("b")
+        grid_position = array("i")
+        performance_bucket = array("b")
+
+        for emp in employee_list:
+            location.append(location_lookup.setdefault(emp.location, len(location_lookup)))
+            job_function.append(function_lookup.setdefault(emp.job_function, len(function_lookup)))
+            job_level.append(level_lookup.setdefault(emp.job_level, len(level_lookup)))
+            tenure.append(tenure_lookup.setdefault(emp.tenure_category, len(tenure_lookup)))
+            manager.append(manager_lookup.setdefault(emp.direct_manager, len(manager_lookup)))
+            performance.append(_PERFORMANCE_CODES[emp.performance.value])
+            grid_position.append(emp.grid_position)
+            performance_bucket.append(_BUCKET_CODES.get(emp.grid_position, NO_BUCKET))
+
+        return cls(
+            employees=employee_list,
+            location=CategoricalColumn(list(location_lookup), location),
+            job_function=CategoricalColumn(list(function_lookup), job_function),
+            job_level=CategoricalColumn(list(level_lookup), job_level),
+            tenure=CategoricalColumn(list(tenure_lookup), tenure),
+            manager=CategoricalColumn(list(manager_lookup), manager),
+            performance=performance,
+            grid_position=grid_position,
+            performance_bucket=performance_bucket,
+        )
+
+    @overload
+    def __getitem__(self, index: int) -> Employee: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Employee]: ...
+
+    def __getitem__(self, index: int | slice) -> Employee | list[Employee]:
+        """Return the employee(s) at the given row(s)."""
+        return self.employees[index]
+
+    def __len__(self) -> int:
+        """Number of employees in the frame."""
+        return len(self.employees)
+
+    def __iter__(self) -> Iterator[Employee]:
+        """Iterate over the employees in row order."""
+        return iter(self.employees)
+
+    def covers(self, employees: list[Employee]) -> bool:
+        """Check whether the frame was built over this exact employee list.
+
+        Args:
+            employees: Employee list to check
+
+        Returns:
+            True if the frame references the same list and its length is unchanged
+        """
+        return self.employees is employees and len(self.performance) == len(employees)
+
+    def row_of(self, employee_id: int) -> int | None:
+        """Row index of an employee, or None if not in the frame.
+
+        Args:
+            employee_id: Employee ID
+
+        Returns:
+            Row index into every column of the frame
+        """
+        if self._rows is None:
+            self._rows = {emp.employee_id: row for row, emp in enumerate(self.employees)}
+        return self._rows.get(employee_id)
+
+    def table(self, rows: str, values: str) -> dict[str, list[int]]:
+        """Contingency table of a categorical column against a value column.
+
+        The table is built on first use and then kept current by
+        update_employee(); callers receive a copy they may modify.
+
+        Args:
+            rows: Categorical column name (a key of CATEGORY_ATTRIBUTES)
+            values: Value column name (a key of VALUE_COLUMNS)
+
+        Returns:
+            Dict mapping each category label present in the frame to its
+            list of counts per value column
+
+        Raises:
+            ValueError: If a value falls outside the table columns
+
+        Example:
+            >>> frame.table("job_level", "performance_bucket")
+            {'MT4': [10, 30, 5, 0], 'MT5': [7, 22, 3, 0]}
+        """
+        column: CategoricalColumn = getattr(self, rows)
+        key = (rows, values)
+        with self._lock:
+            counts = self._tables.get(key)
+            if counts is None:
+                n_values, offset = VALUE_COLUMNS[values]
+                counts = self._count(column, getattr(self, values), n_values, offset)
+                self._tables[key] = counts
+            # Categories emptied by updates are omitted, matching a fresh count
+            return {
+                label: list(row)
+                for label, row in zip(column.labels, counts, strict=False)
+                if any(row)
+            }
+
+    @staticmethod
+    def _count(
+        rows: CategoricalColumn, values: Sequence[int], n_values: int, offset: int
+    ) -> list[list[int]]:
+        """Count rows per (category code, value) pair."""
+        table = [[0] * n_values for _ in rows.labels]
+        for (row, value), count in Counter(zip(rows.codes, values, strict=True)).items():
+            column = value - offset
+            if not 0 <= column < n_values:
+                raise ValueError(f"Value {value} outside the expected range of columns")
+            table[row][column] += count
+        return table
+
+    @staticmethod
+    def crosstab(
+        rows: CategoricalColumn, values: Sequence[int], n_values: int, offset: int = 0
+    ) -> dict[str, list[int]]:
+        """Count rows per (category, value) pair, without memoization.
+
+        Args:
+            rows: Categorical column giving the table rows
+            values: Integer column giving the table columns, aligned with rows
+            n_values: Number of table columns
+            offset: Subtracted from each value to get its column (e.g. 1 for
+                grid positions 1-9)
+
+        Returns:
+            Dict mapping each category label to its list of n_values counts,
+            for every category present in the frame
+
+        Raises:
+            ValueError: If a value falls outside the table columns
+        """
+        table = AnalysisFrame._count(rows, values, n_values, offset)
+        return dict(zip(rows.labels, table, strict=True))
+
+    @property
+    def org_service(self) -> OrgService:
+        """Organization tree over the frame's employees (built once, unvalidated).
+
+        This is also the session's org index (see SessionManager.get_org_service),
+        so the org-hierarchy endpoints and manager analyses share one tree.
+        """
+        with self._lock:
+            if self._org_service is None:
+                self._build_manager_counts()
+            assert self._org_service is not None  # nosec B101  # Type narrowing
+            return self._org_service
+
+    def manager_bucket_counts(self, manager_id: int) -> list[int]:
+        """Performance-bucket counts over all (direct and indirect) reports of a manager.
+
+        Args:
+            manager_id: Employee ID of the manager
+
+        Returns:
+            Counts per bucket code: [high, medium, low, outside every bucket]
+        """
+        with self._lock:
+            if self._org_service is None:
+                self._build_manager_counts()
+            return list(self._manager_counts.get(manager_id, [0] * (NO_BUCKET + 1)))
+
+    def subset_manager_rows(self, employee_ids: Iterable[int]) -> dict[int, list[int]]:
+        """Group a subset of the frame's employees under every manager above them.
+
+        Uses the frame's org tree, so a manager counts subset members
+        anywhere in their organization even if the manager (or intermediate
+        managers) are outside the subset. Costs O(subset size x management
+        depth) once the tree is built.
+
+        Args:
+            employee_ids: IDs of the subset; IDs not in the frame are ignored
+
+        Returns:
+            Dict mapping manager employee ID to the frame rows of the subset
+            members in their organization
+        """
+        with self._lock:
+            if self._org_service is None:
+                self._build_manager_counts()
+            org_service = self.org_service
+            manager_rows: dict[int, list[int]] = {}
+            for employee_id in employee_ids:
+                row = self.row_of(employee_id)
+                if row is None:
+                    continue
+                for manager_id in org_service.iter_managers(employee_id):
+                    manager_rows.setdefault(manager_id, []).append(row)
+            return manager_rows
+
+    def _build_manager_counts(self) -> None:
+        """Build the org tree and per-manager tallies in one post-order rollup."""
+        org_service = OrgService(self.employees, validate=False)
+        self._manager_counts = org_service.rollup().bucket_counts
+        self._org_service = org_service
+
+    def update_employee(self, employee_id: int) -> bool:
+        """Re-encode one employee after it was modified in place.
+
+        Memoized tables and manager tallies are adjusted by moving the
+        employee's count from its old cell to its new one, which is O(1) per
+        table (O(management depth) for manager tallies). A change of manager,
+        job level or name invalidates the org tree, which is rebuilt on next
+        use; any other change keeps it.
+
+        Args:
+            employee_id: ID of the modified employee
+
+        Returns:
+            True if the employee is in the frame, False otherwise
+        """
+        with self._lock:
+            return self._update_row(employee_id)
+
+    def reassign_manager(
+        self, employee_id: int, new_manager_id: int, previous_manager: str
+    ) -> bool:
+        """Re-encode an employee whose direct_manager was changed to another employee.
+
+        Unlike update_employee(), this keeps the org tree: it is updated in
+        place (see OrgService.reassign_manager), and the moved organization's
+        manager tallies are subtracted along the old management path and
+        added along the new one, up to the closest common manager.
+
+        Args:
+            employee_id: ID of the reassigned employee
+            new_manager_id: Employee ID of the new manager
+            previous_manager: The employee's direct_manager before the change
+
+        Returns:
+            True if the employee is in the frame, False otherwise
+
+        Raises:
+            ValueError: If the new manager is unknown or in the employee's
+                organization (the frame is left unchanged)
+        """
+        with self._lock:
+            row = self.row_of(employee_id)
+            if row is None:
+                return False
+            org_service = self._org_service
+            if org_service is not None:
+                moved = list(self._manager_counts.get(employee_id, [0] * (NO_BUCKET + 1)))
+                moved[self.performance_bucket[row]] += 1
+                old_path = list(org_service.iter_managers(employee_id))
+                org_service.reassign_manager(employee_id, new_manager_id, previous_manager)
+                new_path = list(org_service.iter_managers(employee_id))
+
+                common = set(old_path).intersection(new_path)
+                for manager_id in old_path:
+                    if manager_id in common:
+                        break
+                    counts = self._manager_counts[manager_id]
+                    for bucket, count in enumerate(moved):
+                        counts[bucket] -= count
+                    if not org_service.get_team_size(manager_id):
+                        del self._manager_counts[manager_id]
+                for manager_id in new_path:
+                    if manager_id in common:
+                        break
+                    counts = self._manager_counts.setdefault(manager_id, [0] * (NO_BUCKET + 1))
+                    for bucket, count in enumerate(moved):
+                        counts[bucket] += count
+            return self._update_row(employee_id, keep_org=True)
+
+    def _update_row(self, employee_id: int, keep_org: bool = False) -> bool:
+        """Re-encode one employee (caller holds the lock).
+
+        With keep_org, the caller has already brought the org tree up to date.
+        """
+        row = self.row_of(employee_id)
+        if row is None:
+            return False
+        emp = self.employees[row]
+
+        old_codes: dict[str, int] = {}
+        for name, attribute in CATEGORY_ATTRIBUTES.items():
+            column: CategoricalColumn = getattr(self, name)
+            old_codes[name] = column.codes[row]
+            column.codes[row] = column.code_of(getattr(emp, attribute))
+
+        old_values = {name: getattr(self, name)[row] for name in VALUE_COLUMNS}
+        self.performance[row] = _PERFORMANCE_CODES[emp.performance.value]
+        self.grid_position[row] = emp.grid_position
+        self.performance_bucket[row] = _BUCKET_CODES.get(emp.grid_position, NO_BUCKET)
+
+        for key in list(self._tables):
+            self._move_table_count(key, row, old_codes[key[0]], old_values[key[1]])
+
+        if (
+            self._org_service is not None
+            and not keep_org
+            and self._changes_org(self._org_service, row, emp, old_codes)
+        ):
+            self._org_service = None
+            self._manager_counts = {}
+        elif self._org_service is not None:
+            old_bucket = old_values["performance_bucket"]
+            new_bucket = self.performance_bucket[row]
+            if old_bucket != new_bucket:
+                for manager_id in self._org_service.iter_managers(emp.employee_id):
+                    counts = self._manager_counts[manager_id]
+                    counts[old_bucket] -= 1
+                    counts[new_bucket] += 1
+        return True
+
+    def _changes_org(
+        self, org_service: OrgService, row: int, emp: Employee, old_codes: dict[str, int]
+    ) -> bool:
+        """Whether a re-encoded row changed a field the org tree depends on.
+
+        Managers are resolved by name with job level as the duplicate-name
+        tiebreaker, so a change of manager, job level or name rebuilds the tree.
+        """
+        return (
+            self.manager.codes[row] != old_codes["manager"]
+            or self.job_level.codes[row] != old_codes["job_level"]
+            or emp.employee_id not in org_service.get_employee_ids_by_name(emp.name)
+        )
+
+    def _move_table_count(
+        self, key: tuple[str, str], row: int, old_code: int, old_value: int
+    ) -> None:
+        """Move one row's count between cells of a memoized table."""
+        rows, values = key
+        new_code = getattr(self, rows).codes[row]
+        new_value = getattr(self, values)[row]
+        if new_code == old_code and new_value == old_value:
+            return
+
+        n_values, offset = VALUE_COLUMNS[values]
+        if not 0 <= new_value - offset < n_values:
+            # Let the next table() call rebuild and report the invalid value
+            del self._tables[key]
+            return
+
+        table = self._tables[key]
+        while len(table) <= new_code:
+            table.append([0] * n_values)
+        table[old_code][old_value - offset] -= 1
+        table[new_code][new_value - offset] += 1
+
+
+def as_analysis_frame(employees: Sequence[Employee]) -> AnalysisFrame:
+    """Return employees as an AnalysisFrame, encoding them only if needed.
+
+    Args:
+        employees: Employee list, or a frame that was already built
+
+    Returns:
+        The given frame, or a new frame over the employees
+    """
+    if isinstance(employees, AnalysisFrame):
+        return employees
+    return AnalysisFrame.from_employees(employees)
@@ -0,0 +1,218 @@
+"""Rolling performance metrics for the registered intelligence analyses.
+
+iter_analyses() records one sample per analysis run: wall time, employee
+count, net allocated memory blocks (when measurable) and whether the result came from the cache or
+failed. Samples are kept in a fixed-size window per analysis, so the
+diagnostics endpoint shows recent behaviour (latency histogram and
+percentiles) without unbounded memory growth.
+
+Profiles captured on request (see ninebox.utils.profiling) are kept in a
+small ring buffer alongside the metrics.
+"""
+
+import threading
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Any
+
+# Upper bounds (milliseconds) of the latency histogram buckets; a final
+# open-ended bucket counts anything slower
+LATENCY_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+@dataclass(frozen=True)
+class AnalysisSample:
+    """One recorded analysis run.
+
+    Attributes:
+        elapsed_seconds: Wall time spent computing the result (0.0 for cache hits)
+        employee_count: Number of employees analyzed
+        net_allocated_blocks: Net change in the process' allocated memory
+            blocks during the run, or None if not measured (see
+            AnalysisOutcome.net_allocated_blocks)
+        cached: True if the result was read from the cache
+        failed: True if the analysis raised or timed out
+        recorded_at: Unix timestamp of the sample
+    """
+
+    elapsed_seconds: float
+    employee_count: int
+    net_allocated_blocks: int | None
+    cached: bool
+    failed: bool
+    recorded_at: float
+
+
+def _percentile(sorted_values: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of an ascending, non-empty list."""
+    rank = max(0, min(len(sorted_values) - 1, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+class AnalysisMetrics:
+    """Thread-safe rolling window of analysis samples and captured profiles.
+
+    Example:
+        >>> metrics = AnalysisMetrics(window=100)
+        >>> metrics.record("location", 0.012, employee_count=250, net_allocated_blocks=40)
+        >>> metrics.snapshot()["location"]["p50_ms"]
+        12.0
+    """
+
+    def __init__(self, window: int = 500, max_profiles: int = 10) -> None:
+        """Initialize empty metrics.
+
+        Args:
+            window: Samples kept per analysis; older samples are discarded
+            max_profiles: Captured profiles kept; older profiles are discarded
+        """
+        self.window = window
+        self._samples: dict[str, deque[AnalysisSample]] = {}
+        self._profiles: deque[dict[str, Any]] = deque(maxlen=max_profiles)
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        name: str,
+        elapsed_seconds: float,
+        employee_count: int,
+        net_allocated_blocks: int | None = None,
+        cached: bool = False,
+        failed: bool = False,
+    ) -> None:
+        """Record one analysis run.
+
+        Args:
+            name: Analysis name
+            elapsed_seconds: Wall time of the run
+            employee_count: Number of employees analyzed
+            net_allocated_blocks: Net allocated memory blocks during the run,
+                or None if not measured
+            cached: True if the result came from the cache
+            failed: True if the analysis failed or timed out
+        """
+        sample = AnalysisSample(
+            elapsed_seconds, employee_count, net_allocated_blocks, cached, failed, time.time()
+        )
+        with self._lock:
+            samples = self._samples.get(name)
+            if samples is None:
+                samples = self._samples[name] = deque(maxlen=self.window)
+            samples.append(sample)
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Summarize the current window for every analysis.
+
+        Latency statistics and the histogram cover computed runs only; cache
+        hits are counted separately so they do not mask slow computations.
+        The allocation mean covers only the runs where it was measured.
+
+        Returns:
+            Dict mapping analysis name to its summary:
+            {
+                "runs": 120, "cached_runs": 95, "errors": 0,
+                "mean_ms": 14.2, "p50_ms": 12.9, "p95_ms": 31.0, "max_ms": 40.3,
+                "mean_employee_count": 250.0, "mean_net_allocated_blocks": 812.4,
+                "histogram": [{"le_ms": 1, "count": 0}, ..., {"le_ms": None, "count": 0}],
+                "last_recorded_at": "2025-01-01T12:00:00+00:00"
+            }
+        """
+        with self._lock:
+            samples_by_name = {name: list(samples) for name, samples in self._samples.items()}
+        return {name: self._summarize(samples) for name, samples in samples_by_name.items()}
+
+    @staticmethod
+    def _summarize(samples: list[AnalysisSample]) -> dict[str, Any]:
+        """Summarize one analysis' samples."""
+        computed = [s for s in samples if not s.cached and not s.failed]
+        elapsed_ms = sorted(s.elapsed_seconds * 1000 for s in computed)
+        block_counts = [
+            s.net_allocated_blocks for s in computed if s.net_allocated_blocks is not None
+        ]
+
+        latency_counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        for value in elapsed_ms:
+            bucket = next(
+                (i for i, bound in enumerate(LATENCY_BUCKETS_MS) if value <= bound),
+                len(LATENCY_BUCKETS_MS),
+            )
+            latency_counts[bucket] += 1
+        histogram: list[dict[str, int | None]] = [
+            {"le_ms": bound, "count": count}
+            for bound, count in zip((*LATENCY_BUCKETS_MS, None), latency_counts, strict=True)
+        ]
+
+        return {
+            "runs": len(samples),
+            "cached_runs": sum(1 for s in samples if s.cached),
+            "errors": sum(1 for s in samples if s.failed),
+            "mean_ms": sum(elapsed_ms) / len(elapsed_ms) if elapsed_ms else None,
+            "p50_ms": _percentile(elapsed_ms, 0.5) if elapsed_ms else None,
+            "p95_ms": _percentile(elapsed_ms, 0.95) if elapsed_ms else None,
+            "max_ms": elapsed_ms[-1] if elapsed_ms else None,
+            "mean_employee_count": (
+                sum(s.employee_count for s in computed) / len(computed) if computed else None
+            ),
+            "mean_net_allocated_blocks": (
+                sum(block_counts) / len(block_counts) if block_counts else None
+            ),
+            "histogram": histogram,
+            "last_recorded_at": (
+                datetime.fromtimestamp(samples[-1].recorded_at, tz=UTC).isoformat()
+                if samples
+                else None
+            ),
+        }
+
+    def add_profile(self, label: str, profiler: str, duration_seconds: float, report: str) -> str:
+        """Store a captured profile report.
+
+        Args:
+            label: What was profiled, e.g. "intelligence"
+            profiler: Profiler used ("cprofile" or "pyinstrument")
+            duration_seconds: Wall time of the profiled call
+            report: Text report produced by the profiler
+
+        Returns:
+            ID to fetch the report with get_profile()
+        """
+        profile_id = uuid.uuid4().hex[:12]
+        with self._lock:
+            self._profiles.append(
+                {
+                    "profile_id": profile_id,
+                    "label": label,
+                    "profiler": profiler,
+                    "duration_ms": duration_seconds * 1000,
+                    "created_at": datetime.now(UTC).isoformat(),
+                    "report": report,
+                }
+            )
+        return profile_id
+
+    def list_profiles(self) -> list[dict[str, Any]]:
+        """List stored profiles, newest first, without their reports."""
+        with self._lock:
+            profiles = list(self._profiles)
+        return [
+            {key: value for key, value in profile.items() if key != "report"}
+            for profile in reversed(profiles)
+        ]
+
+    def get_profile(self, profile_id: str) -> dict[str, Any] | None:
+        """Get a stored profile, including its report, or None if it was discarded."""
+        with self._lock:
+            return next((p for p in self._profiles if p["profile_id"] == profile_id), None)
+
+    def clear(self) -> None:
+        """Drop all samples and profiles."""
+        with self._lock:
+            self._samples.clear()
+            self._profiles.clear()
+
+
+# Process-wide metrics recorded by analysis_registry.iter_analyses()
+ANALYSIS_METRICS = AnalysisMetrics()
@@ -5,13 +5,34 @@ It enables dual use: Intelligence tab visualizations AND LLM agent data generati
 
 The registry makes it easy to add new analyses with one-line registration,
 ensuring consistency between UI display and AI calibration summaries.
+
+Analyses are independent of each other, so they can run concurrently on a
+thread or process pool (Settings.analysis_workers / analysis_executor), with
+a per-analysis timeout. iter_analyses() yields each result as it finishes;
+run_all_analyses() collects them in registry order.
 """
 
 import logging
-from collections.abc import Callable
+import sys
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator, Mapping, Sequence
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass
 from typing import Any
 
+from ninebox.core.config import settings
 from ninebox.models.employee import Employee
+from ninebox.services.analysis_frame import AnalysisFrame, as_analysis_frame
+from ninebox.services.analysis_metrics import ANALYSIS_METRICS
 from ninebox.services.intelligence_service import (
     calculate_function_analysis,
     calculate_level_analysis,
@@ -24,8 +45,18 @@ from ninebox.services.intelligence_service import (
 logger = logging.getLogger(__name__)
 
 
-# Type alias for analysis functions
-AnalysisFunction = Callable[[list[Employee]], dict[str, Any]]
+# Type alias for analysis functions. run_all_analyses passes an AnalysisFrame,
+# which is also a Sequence[Employee], so analyses may use either interface.
+AnalysisFunction = Callable[[list[Employee] | AnalysisFrame], dict[str, Any]]
+
+
+def _manager_analysis(employees: list[Employee] | AnalysisFrame) -> dict[str, Any]:
+    """Run calculate_manager_analysis with its default team size thresholds.
+
+    Defined at module level (not as a lambda) so process pools can pickle it.
+    """
+    return calculate_manager_analysis(employees)
+
 
 # Central registry of all analyses - list of (name, function) tuples
 ANALYSIS_REGISTRY: list[tuple[str, AnalysisFunction]] = [
@@ -33,12 +64,451 @@ ANALYSIS_REGISTRY: list[tuple[str, AnalysisFunction]] = [
     ("function", calculate_function_analysis),
     ("level", calculate_level_analysis),
     ("tenure", calculate_tenure_analysis),
-    ("manager", calculate_manager_analysis),
+    ("manager", _manager_analysis),
     ("per_level_distribution", calculate_per_level_distribution),
 ]
 
+# Cache key: (session_id, revision token, analysis name, frozen parameters)
+CacheKey = tuple[str, str, str, Hashable]
+
+
+def _freeze(value: object) -> Hashable:
+    """Convert nested parameters into a hashable, order-independent value.
+
+    Raises:
+        TypeError: If a leaf value is not hashable
+    """
+    if isinstance(value, Mapping):
+        pairs: list[tuple[str, Hashable]] = [
+            (str(k), _freeze(v)) for k, v in value.items() if v is not None
+        ]
+        return tuple(sorted(pairs, key=lambda pair: pair[0]))
+    if isinstance(value, list | tuple | set | frozenset):
+        items: list[Hashable] = [_freeze(v) for v in value]
+        return (
+            tuple(sorted(items, key=repr)) if isinstance(value, set | frozenset) else tuple(items)
+        )
+    if not isinstance(value, Hashable):
+        raise TypeError(f"Analysis parameter is not hashable: {value!r}")
+    return value
+
+
+class AnalysisCache:
+    """Thread-safe LRU cache of analysis results per session revision.
+
+    Results are keyed by (session_id, revision, analysis name, parameters), so
+    a session mutation (which bumps the revision) makes older entries
+    unreachable; SessionManager also calls invalidate_session() on every
+    mutation so they are dropped immediately instead of aging out.
+
+    Concurrent requests for the same missing key compute it once: the second
+    caller waits for the first and then reads its result.
+
+    Cached results are shared between callers and must be treated as read-only.
+
+    Example:
+        >>> cache = AnalysisCache(maxsize=128)
+        >>> cache.get_or_compute("s1", "ab12:s1:3", "location", None, lambda: {"status": "green"})
+        {'status': 'green'}
+    """
+
+    def __init__(self, maxsize: int = 256) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            maxsize: Maximum number of results kept; least recently used entries
+                are evicted first
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[CacheKey, dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._key_locks: dict[CacheKey, threading.Lock] = {}
+
+    def __len__(self) -> int:
+        """Number of cached results."""
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(
+        session_id: str, revision: str, name: str, params: Mapping[str, Any] | None = None
+    ) -> CacheKey:
+        """Build a cache key.
+
+        Args:
+            session_id: Session the employees belong to
+            revision: Session revision token (SessionManager.get_revision_tag())
+            name: Analysis name
+            params: Values that further identify the input or options, e.g.
+                active filters; None values are ignored
+
+        Returns:
+            Hashable cache key
+        """
+        return (session_id, revision, name, _freeze(params or {}))
+
+    def get(self, key: CacheKey) -> dict[str, Any] | None:
+        """Return a cached result and mark it recently used, or None on a miss."""
+        with self._lock:
+            result = self._entries.get(key)
+            if result is not None:
+                self._entries.move_to_end(key)
+            return result
+
+    def lookup(self, key: CacheKey) -> dict[str, Any] | None:
+        """Like get(), but counts the lookup as a hit or a miss.
+
+        Used when the caller computes a missing result itself (e.g. on a pool)
+        and stores it with put().
+        """
+        result = self.get(key)
+        with self._lock:
+            if result is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+        return result
+
+    def put(self, key: CacheKey, result: dict[str, Any]) -> None:
+        """Store a result, evicting the least recently used entries if full."""
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def get_or_compute(
+        self,
+        session_id: str,
+        revision: str,
+        name: str,
+        params: Mapping[str, Any] | None,
+        compute: Callable[[], dict[str, Any]],
+    ) -> dict[str, Any]:
+        """Return the cached result for a key, computing and storing it on a miss.
+
+        Exceptions from compute propagate and nothing is cached.
+
+        Args:
+            session_id: Session the employees belong to
+            revision: Session revision token
+            name: Analysis name
+            params: Extra key values (see make_key)
+            compute: Zero-argument function producing the result
+
+        Returns:
+            Analysis result
+        """
+        key = self.make_key(session_id, revision, name, params)
+        result = self.get(key)
+        if result is not None:
+            with self._lock:
+                self.hits += 1
+            return result
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            # Another thread may have filled the entry while we waited
+            result = self.get(key)
+            if result is not None:
+                with self._lock:
+                    self.hits += 1
+                return result
+            try:
+                result = compute()
+                self.put(key, result)
+                with self._lock:
+                    self.misses += 1
+            finally:
+                with self._lock:
+                    self._key_locks.pop(key, None)
+        return result
+
+    def invalidate_session(self, session_id: str) -> None:
+        """Drop every cached result for a session.
+
+        Args:
+            session_id: Session whose results are stale
+        """
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == session_id]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all cached results and reset the hit/miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+# Process-wide cache shared by the intelligence and calibration summary endpoints
+ANALYSIS_CACHE = AnalysisCache()
+
+
+# How often iter_analyses() checks whether queued analyses have started, to
+# start their timeout clocks
+_START_POLL_SECONDS = 0.05
+
+_executor: Executor | None = None
+_executor_lock = threading.Lock()
+
+
+def get_analysis_executor() -> Executor | None:
+    """Get the process-wide pool configured for running analyses.
+
+    The pool is created on first use from Settings.analysis_workers and
+    Settings.analysis_executor. A process pool receives a pickled copy of the
+    frame per analysis, so work memoized on it in a worker does not carry over
+    to later runs.
+
+    Returns:
+        ThreadPoolExecutor or ProcessPoolExecutor, or None if analyses are
+        configured to run sequentially (analysis_workers <= 0)
+    """
+    global _executor  # noqa: PLW0603
+    if settings.analysis_workers <= 0:
+        return None
+    with _executor_lock:
+        if _executor is None:
+            if settings.analysis_executor == "process":
+                _executor = ProcessPoolExecutor(max_workers=settings.analysis_workers)
+            else:
+                _executor = ThreadPoolExecutor(
+                    max_workers=settings.analysis_workers, thread_name_prefix="analysis"
+                )
+        return _executor
+
+
+@dataclass(frozen=True)
+class AnalysisOutcome:
+    """Result of one registered analysis within a run.
+
+    Attributes:
+        name: Analysis name from ANALYSIS_REGISTRY
+        result: Analysis result, or an error result if it failed or timed out
+        elapsed_seconds: Wall time spent computing the result (0.0 for cache hits)
+        cached: True if the result was read from ANALYSIS_CACHE
+        net_allocated_blocks: Net change in the process' allocated memory blocks
+            while computing the result, or None if it was not measured (cache
+            hits, failures, and analyses sharing a process with others on a
+            thread pool, where the count would include their allocations)
+    """
+
+    name: str
+    result: dict[str, Any]
+    elapsed_seconds: float
+    cached: bool = False
+    net_allocated_blocks: int | None = None
+
+
+def _timed_analysis(
+    analysis_fn: AnalysisFunction, frame: AnalysisFrame, count_blocks: bool = True
+) -> tuple[dict[str, Any], float, int | None]:
+    """Run one analysis, measuring wall time and net allocated memory blocks.
+
+    sys.getallocatedblocks() is process-wide, so pass count_blocks=False when
+    other analyses may run in the same process at the same time.
+
+    Module-level so process pools can pickle it.
+    """
+    blocks = sys.getallocatedblocks() if count_blocks else None
+    start = time.perf_counter()
+    result = analysis_fn(frame)
+    elapsed = time.perf_counter() - start
+    return result, elapsed, sys.getallocatedblocks() - blocks if blocks is not None else None
+
+
+def _error_result(name: str, error: BaseException) -> dict[str, Any]:
+    """Log a failed analysis and build its error result."""
+    logger.error(f"Analysis '{name}' failed: {error!s}", exc_info=error)
+    return {
+        "status": "error",
+        "error": f"Analysis failed: {type(error).__name__}",
+        "sample_size": 0,
+    }
+
+
+def iter_analyses(
+    employees: Sequence[Employee],
+    session_id: str | None = None,
+    revision: str | None = None,
+    params: Mapping[str, Any] | None = None,
+    executor: Executor | None = None,
+    timeout: float | None = None,
+) -> Iterator[AnalysisOutcome]:
+    """Run all registered analyses, yielding each outcome as it becomes available.
+
+    Without an executor the analyses run one after another in the calling
+    thread and are yielded in registry order. With an executor every analysis
+    that is not cached is submitted at once and outcomes are yielded in
+    completion order, so callers can forward partial results while the slow
+    analyses (e.g. manager) are still running.
+
+    Error isolation is the same in both modes: a failing analysis yields an
+    error result and the others continue. An analysis still running
+    `timeout` seconds after a worker started it yields a TimeoutError result;
+    time spent queued for a worker does not count. Running analyses cannot
+    be interrupted, so a timed-out analysis keeps its worker busy until it
+    returns (delaying any still queued) and its late result is discarded.
+
+    Caching follows run_all_analyses(). In executor mode, hits are resolved
+    before submission and successful results are stored on completion.
+
+    Every outcome is also recorded in ANALYSIS_METRICS for the diagnostics
+    endpoint.
+
+    Args:
+        employees: Employee records (or an AnalysisFrame) to analyze
+        session_id: Session the employees belong to (enables caching)
+        revision: Session revision token from SessionManager.get_revision_tag()
+        params: Extra values identifying the input, e.g. active filters
+        executor: Thread or process pool to run analyses on, or None to run
+            sequentially
+        timeout: Per-analysis timeout in seconds for executor runs, counted from
+            when the analysis starts (None = no limit)
+
+    Yields:
+        AnalysisOutcome for each registered analysis
+
+    Example:
+        >>> with ThreadPoolExecutor(max_workers=6) as pool:
+        ...     for outcome in iter_analyses(employees, executor=pool, timeout=5.0):
+        ...         print(outcome.name, outcome.result["status"], outcome.elapsed_seconds)
+    """
+    employee_count = len(employees)
+    for outcome in _run_analyses(employees, session_id, revision, params, executor, timeout):
+        ANALYSIS_METRICS.record(
+            outcome.name,
+            outcome.elapsed_seconds,
+            employee_count,
+            net_allocated_blocks=outcome.net_allocated_blocks,
+            cached=outcome.cached,
+            failed=outcome.result.get("status") == "error",
+        )
+        yield outcome
+
+
+def _run_analyses(
+    employees: Sequence[Employee],
+    session_id: str | None,
+    revision: str | None,
+    params: Mapping[str, Any] | None,
+    executor: Executor | None,
+    timeout: float | None,
+) -> Iterator[AnalysisOutcome]:
+    """Run the registered analyses for iter_analyses(), yielding unrecorded outcomes."""
+    use_cache = session_id is not None and revision is not None
+    frame: AnalysisFrame | None = None
+
+    def get_frame() -> AnalysisFrame:
+        # Encode lazily so fully cached runs never touch the employees
+        nonlocal frame
+        if frame is None:
+            frame = as_analysis_frame(employees)
+        return frame
+
+    if executor is None:
+        for name, analysis_fn in list(ANALYSIS_REGISTRY):
+            measured: list[tuple[float, int | None]] = []
+
+            def compute(
+                fn: AnalysisFunction = analysis_fn,
+                measured: list[tuple[float, int | None]] = measured,
+            ) -> dict[str, Any]:
+                result, elapsed, blocks = _timed_analysis(fn, get_frame())
+                measured.append((elapsed, blocks))
+                return result
+
+            try:
+                if use_cache:
+                    assert session_id is not None and revision is not None  # nosec B101  # Type narrowing
+                    result = ANALYSIS_CACHE.get_or_compute(
+                        session_id, revision, name, params, compute
+                    )
+                else:
+                    result = compute()
+            except Exception as e:
+                yield AnalysisOutcome(name, _error_result(name, e), 0.0)
+                continue
+            if measured:
+                elapsed, blocks = measured[0]
+                yield AnalysisOutcome(name, result, elapsed, net_allocated_blocks=blocks)
+            else:
+                yield AnalysisOutcome(name, result, 0.0, cached=True)
+        return
+
+    # Worker processes run one analysis at a time; pool threads share a process
+    count_blocks = isinstance(executor, ProcessPoolExecutor)
+
+    # name and cache key for each submitted analysis
+    pending: dict[Future, tuple[str, CacheKey | None]] = {}
+    for name, analysis_fn in list(ANALYSIS_REGISTRY):
+        key = None
+        if use_cache:
+            assert session_id is not None and revision is not None  # nosec B101  # Type narrowing
+            key = ANALYSIS_CACHE.make_key(session_id, revision, name, params)
+            cached = ANALYSIS_CACHE.lookup(key)
+            if cached is not None:
+                yield AnalysisOutcome(name, cached, 0.0, cached=True)
+                continue
+        try:
+            future = executor.submit(_timed_analysis, analysis_fn, get_frame(), count_blocks)
+        except Exception as e:
+            yield AnalysisOutcome(name, _error_result(name, e), 0.0)
+            continue
+        pending[future] = (name, key)
+
+    # Deadlines (monotonic) start when a worker picks the analysis up, so time
+    # spent queued behind other analyses does not count against it
+    deadlines: dict[Future, float] = {}
+    while pending:
+        now = time.monotonic()
+        if timeout is not None:
+            for future in pending:
+                if future not in deadlines and (future.running() or future.done()):
+                    deadlines[future] = now + timeout
+        wait_seconds = max(0.0, min(deadlines.values()) - now) if deadlines else None
+        if timeout is not None and len(deadlines) < len(pending):
+            # Poll for queued analyses starting
+            wait_seconds = (
+                _START_POLL_SECONDS
+                if wait_seconds is None
+                else min(wait_seconds, _START_POLL_SECONDS)
+            )
+        done, _ = wait(pending, timeout=wait_seconds, return_when=FIRST_COMPLETED)
 
-def run_all_analyses(employees: list[Employee]) -> dict[str, dict[str, Any]]:
+        for future in done:
+            name, key = pending.pop(future)
+            deadlines.pop(future, None)
+            try:
+                result, elapsed, blocks = future.result()
+            except Exception as e:
+                yield AnalysisOutcome(name, _error_result(name, e), 0.0)
+                continue
+            if key is not None:
+                ANALYSIS_CACHE.put(key, result)
+            yield AnalysisOutcome(name, result, elapsed, net_allocated_blocks=blocks)
+
+        now = time.monotonic()
+        for future, deadline in list(deadlines.items()):
+            if deadline <= now:
+                name, _ = pending.pop(future)
+                del deadlines[future]
+                error = TimeoutError(f"Analysis '{name}' exceeded {timeout}s")
+                yield AnalysisOutcome(name, _error_result(name, error), float(timeout or 0.0))
+
+
+def run_all_analyses(
+    employees: Sequence[Employee],
+    session_id: str | None = None,
+    revision: str | None = None,
+    params: Mapping[str, Any] | None = None,
+    executor: Executor | None = None,
+    timeout: float | None = None,
+) -> dict[str, dict[str, Any]]:
     """Run all registered analyses and return results.
 
     This function executes all analyses registered in ANALYSIS_REGISTRY,
@@ -46,14 +516,31 @@ def run_all_analyses(employees: list[Employee]) -> dict[str, dict[str, Any]]:
     - Intelligence tab visualizations (UI display)
     - AI calibration summary generation (LLM data source)
 
+    The employees are encoded into a single AnalysisFrame up front and the
+    same frame is handed to every analysis, so attribute extraction happens
+    once per run instead of once per analysis.
+
     If an analysis fails, it returns an error status instead of crashing
     the entire pipeline. This allows partial results to be returned.
 
+    When session_id and revision are given, each analysis result is looked up
+    in (and stored to) ANALYSIS_CACHE, so repeated calls for an unchanged
+    session reuse earlier results. Failed analyses are never cached.
+
+    Analyses run on the configured pool (get_analysis_executor()) unless an
+    executor is passed; see iter_analyses() for timeout semantics.
+
     Args:
         employees: List of employee records to analyze
+        session_id: Session the employees belong to (enables caching)
+        revision: Session revision token from SessionManager.get_revision_tag()
+        params: Extra values identifying the input, e.g. active filters
+        executor: Pool to run analyses on (default: configured pool, if any)
+        timeout: Per-analysis timeout in seconds (default:
+            Settings.analysis_timeout_seconds)
 
     Returns:
-        Dictionary mapping analysis names to their results
+        Dictionary mapping analysis names to their results, in registry order
         Example:
         {
             "location": {"status": "green", "p_value": 0.23, ...},
@@ -71,18 +558,19 @@ def run_all_analyses(employees: list[Employee]) -> dict[str, dict[str, Any]]:
             }
         }
     """
-    results = {}
-    for name, analysis_fn in ANALYSIS_REGISTRY:
-        try:
-            results[name] = analysis_fn(employees)
-        except Exception as e:
-            logger.error(f"Analysis '{name}' failed: {e!s}", exc_info=True)
-            results[name] = {
-                "status": "error",
-                "error": f"Analysis failed: {type(e).__name__}",
-                "sample_size": 0,
-            }
-    return results
+    if executor is None:
+        executor = get_analysis_executor()
+    if timeout is None:
+        timeout = settings.analysis_timeout_seconds
+
+    outcomes = {}
+    for outcome in iter_analyses(employees, session_id, revision, params, executor, timeout):
+        logger.debug(
+            f"Analysis '{outcome.name}' took {outcome.elapsed_seconds * 1000:.1f}ms"
+            f"{' (cached)' if outcome.cached else ''}"
+        )
+        outcomes[outcome.name] = outcome.result
+    return {name: outcomes[name] for name, _ in ANALYSIS_REGISTRY if name in outcomes}
 
 
 def get_registered_analyses() -> list[str]:
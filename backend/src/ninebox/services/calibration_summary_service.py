@@ -15,8 +15,10 @@ from typing import Any, TypedDict
 
 from ninebox.models.employee import Employee
 from ninebox.models.grid_positions import PERFORMANCE_BUCKETS
+from ninebox.services.analysis_frame import AnalysisFrame
 from ninebox.services.insight_generator import InsightGenerator
 from ninebox.services.insight_transformer import InsightTransformer
+from ninebox.services.org_service import OrgService
 from ninebox.types.insights import Insight, InsightSourceData
 
 logger = logging.getLogger(__name__)
@@ -170,13 +172,25 @@ class CalibrationSummaryService:
         return f"{prefix}-{hash_suffix}"
 
     def calculate_summary(
-        self, employees: list[Employee], use_agent: bool = True
+        self,
+        employees: list[Employee],
+        use_agent: bool = True,
+        session_id: str | None = None,
+        revision: str | None = None,
+        frame: AnalysisFrame | None = None,
     ) -> CalibrationSummaryResponse:
         """Calculate complete calibration summary.
 
         Args:
             employees: List of employee records
             use_agent: If True, use LLM agent for insights. If False, use legacy logic.
+            session_id: Session the employees belong to; with revision, reuses
+                analysis results cached by the intelligence endpoint
+            revision: Session revision token from SessionManager.get_revision_tag()
+            frame: Analysis frame over the employees to reuse (e.g. from
+                SessionManager.get_analysis_frame()), so the analyses and org
+                data share the session's encoded tables and org index; built
+                on demand if omitted
 
         Returns:
             CalibrationSummaryResponse with data overview, time allocation, insights, and summary
@@ -199,18 +213,26 @@ class CalibrationSummaryService:
         time_allocation = self.calculate_time_allocation(employees)
 
         # Run all analyses using new registry
-        from ninebox.services.analysis_registry import run_all_analyses
+        from ninebox.services.analysis_registry import ANALYSIS_CACHE, run_all_analyses
 
-        analyses = run_all_analyses(employees)
+        analyses = run_all_analyses(
+            frame if frame is not None else employees, session_id=session_id, revision=revision
+        )
 
         # Build org data for LLM context
-        from ninebox.services.org_service import OrgService
+        def build_org_data() -> dict[str, Any]:
+            org = frame.org_service if frame is not None else OrgService(employees, validate=False)
+            return {
+                "total_employees": len(employees),
+                "total_managers": len(org.find_managers(min_team_size=1)),
+            }
 
-        org_service = OrgService(employees, validate=False)
-        org_data = {
-            "total_employees": len(employees),
-            "total_managers": len(org_service.find_managers(min_team_size=1)),
-        }
+        if session_id is not None and revision is not None:
+            org_data = ANALYSIS_CACHE.get_or_compute(
+                session_id, revision, "org_data", None, build_org_data
+            )
+        else:
+            org_data = build_org_data()
 
         # Choose insight generation approach
         if use_agent:
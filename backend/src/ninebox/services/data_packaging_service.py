@@ -251,14 +251,13 @@ def _build_org_data(employees: list[Employee], anonymize: bool = True) -> dict[s
             continue
 
         direct_reports = org_service.get_direct_reports(manager_id)
-        all_reports = org_service.get_all_reports(manager_id)
 
         # Build base manager record (safe for LLM)
         manager_record = {
             "id": f"Manager_{manager_id}",
             "level": manager_emp.job_level,
             "direct_report_count": len(direct_reports),
-            "total_org_size": len(all_reports),
+            "total_org_size": org_service.get_team_size(manager_id),
         }
 
         # Add PII fields only if not anonymizing
@@ -0,0 +1,428 @@
+"""Inverted filter index over a session's employees.
+
+The index maps every facet value (job level, function, display location,
+manager, performance, potential, flag, mover class) to a bitset of the
+positions of the employees holding that value. Bitsets are plain Python
+ints, so combining filters is a handful of big-integer ANDs/ORs instead of
+one list comprehension per filter, and the cost of a filter request no
+longer grows with the number of filters.
+
+The index is built once per session (see SessionManager.get_employee_index) and
+kept current by re-indexing single employees when they are mutated, so it must
+always be queried against the exact list it was built from.
+"""
+
+from collections.abc import Callable, Iterable
+
+from ninebox.models.employee import Employee, PerformanceLevel, PotentialLevel
+from ninebox.services.employee_service import (
+    MOVER_FACET_VALUES,
+    classify_mover,
+    map_location_to_display,
+)
+from ninebox.services.org_service import OrgService
+
+# Facet name -> extractor for the values indexed under that facet. Facet names
+# match the keyword arguments of EmployeeService.filter_employees. Most facets
+# are single-valued; flags is the only one where an employee can hold several.
+FACET_EXTRACTORS: dict[str, Callable[[Employee], tuple[str, ...]]] = {
+    "levels": lambda e: (e.job_level,),
+    "job_profiles": lambda e: (e.job_profile,),
+    "job_functions": lambda e: (e.job_function,),
+    "locations": lambda e: (map_location_to_display(e.location),),
+    "location_codes": lambda e: (e.location,),
+    "managers": lambda e: (e.direct_manager,),
+    "performance": lambda e: (e.performance.value,),
+    "potential": lambda e: (e.potential.value,),
+    "flags": lambda e: tuple(e.flags or ()),
+}
+
+# Derived facet holding each employee's mover class ("big_mover"/"medium_mover").
+# It needs the session's original employees, so it is indexed separately.
+MOVERS_FACET = "movers"
+
+# Facets reported by EmployeeIndex.facet_counts(), in response order
+COUNTED_FACETS = (
+    "levels",
+    "job_functions",
+    "locations",
+    "managers",
+    "performance",
+    "potential",
+    "flags",
+    MOVERS_FACET,
+)
+
+# Placeholder values that get_filter_options never offers as choices
+_UNOFFERED_VALUES = {"", "None"}
+
+
+def iter_bit_positions(bits: int) -> list[int]:
+    """Return the positions of the set bits in ascending order.
+
+    Args:
+        bits: Bitset to decode
+
+    Returns:
+        List of bit positions, lowest first
+
+    Example:
+        >>> iter_bit_positions(0b10110)
+        [1, 2, 4]
+    """
+    # bin() is implemented in C, so scanning its output is far cheaper than
+    # peeling bits off a 50k-bit integer one at a time.
+    return [i for i, char in enumerate(reversed(bin(bits))) if char == "1"]
+
+
+class EmployeeIndex:
+    """Facet value -> bitset index over a fixed list of employees.
+
+    Position i in every bitset refers to employees[i] of the indexed list.
+    The list itself is not copied: employees mutated in place must be
+    re-indexed with update_employee() so their facet bits stay accurate.
+
+    The index also caches every employee's mover classification (see
+    classify_mover) as a small bitfield, so serializing or filtering movers
+    does not re-scan ratings history on every request.
+
+    Example:
+        >>> index = EmployeeIndex(session.current_employees)
+        >>> bits = index.match(levels=["MT4"], performance=["High"])
+        >>> index.select(bits)  # employees in their original order
+    """
+
+    def __init__(
+        self, employees: list[Employee], original_employees: list[Employee] | None = None
+    ) -> None:
+        """Build the index in a single pass over the employees.
+
+        Args:
+            employees: Employee list to index (usually session.current_employees)
+            original_employees: Employees as uploaded, for in-session mover
+                detection (usually session.original_employees)
+        """
+        self._employees = employees
+        self._size = len(employees)
+        self._all_bits = (1 << self._size) - 1
+        self._positions: dict[int, int] = {}
+        self._facets: dict[str, dict[str, int]] = {
+            name: {} for name in (*FACET_EXTRACTORS, MOVERS_FACET)
+        }
+        # Values each position is currently indexed under, for cheap removal
+        self._indexed_values: list[dict[str, tuple[str, ...]]] = []
+        self._originals = {e.employee_id: e for e in original_employees or ()}
+        # Mover classification bitfield per position (BIG_MOVER | MEDIUM_MOVER)
+        self._movers = [0] * self._size
+
+        for position, employee in enumerate(employees):
+            self._positions[employee.employee_id] = position
+            self._indexed_values.append({})
+            self._add(position, employee)
+
+    @property
+    def size(self) -> int:
+        """Number of indexed employees."""
+        return self._size
+
+    @property
+    def all_bits(self) -> int:
+        """Bitset with every indexed employee set."""
+        return self._all_bits
+
+    def covers(self, employees: list[Employee]) -> bool:
+        """Check whether this index was built over the given list.
+
+        Args:
+            employees: Employee list about to be filtered
+
+        Returns:
+            True if the index can answer queries for this exact list
+        """
+        return employees is self._employees and len(employees) == self._size
+
+    def _add(self, position: int, employee: Employee) -> None:
+        bit = 1 << position
+        indexed = self._indexed_values[position]
+        for facet, extract in FACET_EXTRACTORS.items():
+            facet_values = extract(employee)
+            values = self._facets[facet]
+            for value in facet_values:
+                values[value] = values.get(value, 0) | bit
+            indexed[facet] = facet_values
+
+        mover = classify_mover(employee, self._originals.get(employee.employee_id))
+        self._movers[position] = mover
+        mover_values = tuple(name for flag, name in MOVER_FACET_VALUES.items() if mover & flag)
+        values = self._facets[MOVERS_FACET]
+        for value in mover_values:
+            values[value] = values.get(value, 0) | bit
+        indexed[MOVERS_FACET] = mover_values
+
+    def _remove(self, position: int) -> None:
+        mask = ~(1 << position)
+        for facet, facet_values in self._indexed_values[position].items():
+            values = self._facets[facet]
+            for value in facet_values:
+                remaining = values[value] & mask
+                if remaining:
+                    values[value] = remaining
+                else:
+                    del values[value]
+        self._indexed_values[position] = {}
+
+    def update_employee(self, employee_id: int) -> None:
+        """Re-index one employee after it was mutated in place.
+
+        Args:
+            employee_id: ID of the employee whose facet values may have changed
+        """
+        position = self._positions.get(employee_id)
+        if position is None:
+            return
+        self._remove(position)
+        self._add(position, self._employees[position])
+
+    def mover_class(self, employee_id: int) -> int:
+        """Cached mover classification for one employee.
+
+        Args:
+            employee_id: Employee ID
+
+        Returns:
+            Bitfield of BIG_MOVER/MEDIUM_MOVER, 0 if not a mover or not indexed
+        """
+        position = self._positions.get(employee_id)
+        return 0 if position is None else self._movers[position]
+
+    def facet_bits(self, facet: str, values: Iterable[str]) -> int:
+        """Union of the bitsets for the given values of one facet.
+
+        Args:
+            facet: Facet name (a key of FACET_EXTRACTORS)
+            values: Facet values to include
+
+        Returns:
+            Bitset of employees holding any of the values
+        """
+        index = self._facets[facet]
+        bits = 0
+        for value in values:
+            bits |= index.get(value, 0)
+        return bits
+
+    def _level_bits(self, levels: list[str]) -> int:
+        # Level filtering is substring based ("MT4" matches "MT4 Senior"), so
+        # union every distinct indexed level that contains a requested level.
+        # There are only a handful of distinct levels, so this stays cheap.
+        bits = 0
+        for job_level, level_bits in self._facets["levels"].items():
+            if any(level in job_level for level in levels):
+                bits |= level_bits
+        return bits
+
+    def _positions_bits(self, employee_ids: Iterable[int]) -> int:
+        # Bitset of the given employees; IDs not in the index are ignored
+        bits = 0
+        positions = self._positions
+        for employee_id in employee_ids:
+            position = positions.get(employee_id)
+            if position is not None:
+                bits |= 1 << position
+        return bits
+
+    def _filter_bits(
+        self,
+        levels: list[str] | None = None,
+        job_profiles: list[str] | None = None,
+        job_functions: list[str] | None = None,
+        locations: list[str] | None = None,
+        location_codes: list[str] | None = None,
+        managers: list[str] | None = None,
+        exclude_ids: list[int] | None = None,
+        performance: list[str] | None = None,
+        potential: list[str] | None = None,
+        flags: list[str] | None = None,
+        movers: list[str] | None = None,
+        under_manager_ids: list[int] | None = None,
+        org_service: OrgService | None = None,
+    ) -> dict[str, int]:
+        # One bitset per active filter, keyed by facet name ("exclude_ids"
+        # for the exclusion mask, "under_manager_ids" for the subtree mask).
+        # Empty/None filters are left out.
+        bits: dict[str, int] = {}
+
+        if levels:
+            bits["levels"] = self._level_bits(levels)
+        if job_profiles:
+            bits["job_profiles"] = self.facet_bits("job_profiles", job_profiles)
+        if job_functions:
+            bits["job_functions"] = self.facet_bits("job_functions", job_functions)
+        if locations or location_codes:
+            # Display names and raw codes are values of the same location filter
+            bits["locations"] = self.facet_bits("locations", locations or ()) | self.facet_bits(
+                "location_codes", location_codes or ()
+            )
+        if managers:
+            bits["managers"] = self.facet_bits("managers", managers)
+        if exclude_ids:
+            bits["exclude_ids"] = self._all_bits & ~self._positions_bits(exclude_ids)
+        if performance:
+            bits["performance"] = self.facet_bits(
+                "performance", [PerformanceLevel(p).value for p in performance]
+            )
+        if potential:
+            bits["potential"] = self.facet_bits(
+                "potential", [PotentialLevel(p).value for p in potential]
+            )
+        if flags:
+            bits["flags"] = self.facet_bits("flags", flags)
+        if movers:
+            bits[MOVERS_FACET] = self.facet_bits(MOVERS_FACET, movers)
+        if under_manager_ids and org_service is not None:
+            bits["under_manager_ids"] = self._positions_bits(
+                e.employee_id for e in org_service.get_organization_members(under_manager_ids)
+            )
+
+        return bits
+
+    def match(
+        self,
+        levels: list[str] | None = None,
+        job_profiles: list[str] | None = None,
+        job_functions: list[str] | None = None,
+        locations: list[str] | None = None,
+        location_codes: list[str] | None = None,
+        managers: list[str] | None = None,
+        exclude_ids: list[int] | None = None,
+        performance: list[str] | None = None,
+        potential: list[str] | None = None,
+        flags: list[str] | None = None,
+        movers: list[str] | None = None,
+        under_manager_ids: list[int] | None = None,
+        org_service: OrgService | None = None,
+    ) -> int:
+        """Compute the bitset of employees matching all given filters.
+
+        Semantics are identical to EmployeeService.filter_employees: values
+        within one filter are ORed, filters are ANDed, and empty/None filters
+        are ignored.
+
+        under_manager_ids is answered from org_service's subtree ranges, so
+        it needs an OrgService built over the indexed employees (see
+        SessionManager.get_org_service) and is ignored without one.
+
+        Returns:
+            Bitset of matching employee positions
+
+        Raises:
+            ValueError: If a performance or potential value is not a valid level
+        """
+        bits = self._all_bits
+        for filter_bits in self._filter_bits(
+            levels=levels,
+            job_profiles=job_profiles,
+            job_functions=job_functions,
+            locations=locations,
+            location_codes=location_codes,
+            managers=managers,
+            exclude_ids=exclude_ids,
+            performance=performance,
+            potential=potential,
+            flags=flags,
+            movers=movers,
+            under_manager_ids=under_manager_ids,
+            org_service=org_service,
+        ).values():
+            bits &= filter_bits
+        return bits
+
+    def facet_counts(
+        self,
+        levels: list[str] | None = None,
+        job_profiles: list[str] | None = None,
+        job_functions: list[str] | None = None,
+        locations: list[str] | None = None,
+        location_codes: list[str] | None = None,
+        managers: list[str] | None = None,
+        exclude_ids: list[int] | None = None,
+        performance: list[str] | None = None,
+        potential: list[str] | None = None,
+        flags: list[str] | None = None,
+        movers: list[str] | None = None,
+        under_manager_ids: list[int] | None = None,
+        org_service: OrgService | None = None,
+    ) -> tuple[int, dict[str, dict[str, int]]]:
+        """Match the filters and count every facet value against the result.
+
+        Counts are disjunctive: the counts for one facet apply every active
+        filter except that facet's own, so each number is how many employees
+        the filter state would leave if that value were (also) selected.
+        Each filter bitset is computed once and reused for every facet.
+        Takes the same filters as match(), including under_manager_ids with
+        its org_service.
+
+        Returns:
+            Tuple of (matching bitset, facet name -> value -> count) for the
+            facets in COUNTED_FACETS
+
+        Raises:
+            ValueError: If a performance or potential value is not a valid level
+
+        Example:
+            >>> bits, counts = index.facet_counts(performance=["High"])
+            >>> counts["performance"]["Low"]  # Ignores the performance filter
+            42
+            >>> counts["levels"]["MT4"]  # High performers at MT4
+            7
+        """
+        filter_bits = self._filter_bits(
+            levels=levels,
+            job_profiles=job_profiles,
+            job_functions=job_functions,
+            locations=locations,
+            location_codes=location_codes,
+            managers=managers,
+            exclude_ids=exclude_ids,
+            performance=performance,
+            potential=potential,
+            flags=flags,
+            movers=movers,
+            under_manager_ids=under_manager_ids,
+            org_service=org_service,
+        )
+
+        matched = self._all_bits
+        for bits in filter_bits.values():
+            matched &= bits
+
+        counts: dict[str, dict[str, int]] = {}
+        for facet in COUNTED_FACETS:
+            if facet in filter_bits:
+                base = self._all_bits
+                for name, bits in filter_bits.items():
+                    if name != facet:
+                        base &= bits
+            else:
+                base = matched
+            counts[facet] = {
+                value: (value_bits & base).bit_count()
+                for value, value_bits in sorted(self._facets[facet].items())
+                if value not in _UNOFFERED_VALUES
+            }
+
+        return matched, counts
+
+    def select(self, bits: int) -> list[Employee]:
+        """Materialize a bitset into employees, preserving list order.
+
+        Args:
+            bits: Bitset produced by match()
+
+        Returns:
+            Matching employees in the order of the indexed list
+        """
+        if bits == self._all_bits:
+            return list(self._employees)
+        employees = self._employees
+        return [employees[position] for position in iter_bit_positions(bits)]
@@ -2,8 +2,13 @@
 
 from datetime import date
 from enum import Enum
+from typing import TYPE_CHECKING
 
 from ninebox.models.employee import Employee, PerformanceLevel, PotentialLevel
+from ninebox.services.org_service import OrgService
+
+if TYPE_CHECKING:
+    from ninebox.services.employee_index import EmployeeIndex
 
 
 class PerformanceTier(str, Enum):
@@ -315,6 +320,11 @@ def is_medium_mover(employee: Employee, original_employee: Employee | None = Non
     if is_big_mover(employee, original_employee):
         return False
 
+    return _has_medium_move(employee, original_employee)
+
+
+def _has_medium_move(employee: Employee, original_employee: Employee | None) -> bool:
+    """Check the medium mover distance rule, ignoring the big mover exclusion."""
     comparison_positions = []
     if employee.prior_grid_position:
         comparison_positions.append(employee.prior_grid_position)
@@ -327,6 +337,38 @@ def is_medium_mover(employee: Employee, original_employee: Employee | None = Non
     )
 
 
+# Bits of the mover classification bitfield returned by classify_mover
+BIG_MOVER = 1
+MEDIUM_MOVER = 2
+
+# Facet value used to filter on each mover bit
+MOVER_FACET_VALUES = {BIG_MOVER: "big_mover", MEDIUM_MOVER: "medium_mover"}
+
+
+def classify_mover(employee: Employee, original_employee: Employee | None = None) -> int:
+    """Classify an employee's movement as a compact bitfield.
+
+    Evaluates is_big_mover once and only checks the medium rule when needed,
+    so it is cheaper than calling is_big_mover and is_medium_mover separately.
+
+    Args:
+        employee: Current employee data
+        original_employee: Original employee data from file upload (for in-session detection)
+
+    Returns:
+        BIG_MOVER, MEDIUM_MOVER, or 0 if the employee is neither
+
+    Examples:
+        >>> classify_mover(employee, original) & BIG_MOVER
+        1
+    """
+    if is_big_mover(employee, original_employee):
+        return BIG_MOVER
+    if _has_medium_move(employee, original_employee):
+        return MEDIUM_MOVER
+    return 0
+
+
 class EmployeeService:
     """Filter and query employees."""
 
@@ -337,12 +379,55 @@ class EmployeeService:
         job_profiles: list[str] | None = None,
         job_functions: list[str] | None = None,
         locations: list[str] | None = None,
+        location_codes: list[str] | None = None,
         managers: list[str] | None = None,
         exclude_ids: list[int] | None = None,
         performance: list[str] | None = None,
         potential: list[str] | None = None,
+        flags: list[str] | None = None,
+        movers: list[str] | None = None,
+        under_manager_ids: list[int] | None = None,
+        index: "EmployeeIndex | None" = None,
+        original_employees: list[Employee] | None = None,
+        org_service: OrgService | None = None,
     ) -> list[Employee]:
-        """Apply filters to employee list."""
+        """Apply filters to employee list.
+
+        When an EmployeeIndex built over this exact list is supplied, the
+        filters are answered with bitset intersections instead of scanning
+        the list once per filter. Results are identical either way.
+
+        The movers filter ("big_mover", "medium_mover") uses the index's cached
+        classification; without an index it is computed against
+        original_employees for in-session movement.
+
+        The under_manager_ids filter keeps everyone (directly or indirectly)
+        under any of the given managers, using the subtree ranges of
+        org_service, which must be built over the same employees (usually
+        SessionManager.get_org_service). Without one, a tree is built for the
+        call.
+        """
+        if under_manager_ids and org_service is None:
+            org_service = OrgService(employees, validate=False)
+
+        if index is not None and index.covers(employees):
+            bits = index.match(
+                levels=levels,
+                job_profiles=job_profiles,
+                job_functions=job_functions,
+                locations=locations,
+                location_codes=location_codes,
+                managers=managers,
+                exclude_ids=exclude_ids,
+                performance=performance,
+                potential=potential,
+                flags=flags,
+                movers=movers,
+                under_manager_ids=under_manager_ids,
+                org_service=org_service,
+            )
+            return index.select(bits)
+
         filtered = employees
 
         # Filter by level (e.g., ["MT2", "MT4"])
@@ -357,9 +442,16 @@ class EmployeeService:
         if job_functions:
             filtered = [e for e in filtered if e.job_function in job_functions]
 
-        # Filter by location (map to display names for comparison)
-        if locations:
-            filtered = [e for e in filtered if map_location_to_display(e.location) in locations]
+        # Filter by location (map to display names for comparison), or by
+        # raw location code (e.g., ["GBR"]); either kind of value matches
+        if locations or location_codes:
+            display_names = set(locations or ())
+            codes = set(location_codes or ())
+            filtered = [
+                e
+                for e in filtered
+                if map_location_to_display(e.location) in display_names or e.location in codes
+            ]
 
         # Filter by manager
         if managers:
@@ -379,6 +471,25 @@ class EmployeeService:
             pot_levels = [PotentialLevel(p) for p in potential]
             filtered = [e for e in filtered if e.potential in pot_levels]
 
+        # Filter by flag (employee holds any of the requested flags)
+        if flags:
+            filtered = [e for e in filtered if any(flag in (e.flags or []) for flag in flags)]
+
+        # Filter by mover class (big and/or medium movers)
+        if movers:
+            wanted = sum(bit for bit, name in MOVER_FACET_VALUES.items() if name in movers)
+            originals = {e.employee_id: e for e in original_employees or []}
+            filtered = [
+                e for e in filtered if classify_mover(e, originals.get(e.employee_id)) & wanted
+            ]
+
+        # Filter to whole organizations (everyone under any of the managers)
+        if under_manager_ids and org_service is not None:
+            members = {
+                e.employee_id for e in org_service.get_organization_members(under_manager_ids)
+            }
+            filtered = [e for e in filtered if e.employee_id in members]
+
         return filtered
 
     def get_filter_options(self, employees: list[Employee]) -> dict:
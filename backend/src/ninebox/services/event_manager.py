@@ -42,6 +42,7 @@ class EventManager:
         event: Event,
         original_employee: Employee,
         is_donut: bool = False,
+        persist: bool = True,
     ) -> None:
         """Track an event, removing it if net-zero.
 
@@ -49,7 +50,7 @@ class EventManager:
         1. Remove existing events of same type for this employee/property
         2. Check if event is net-zero (back to original state)
         3. If not net-zero, add event to session
-        4. Persist session
+        4. Persist session (unless the caller persists once for a batch)
 
         For flag events, we match on both event_type AND flag value to allow
         multiple different flag events for the same employee. For other events,
@@ -60,6 +61,8 @@ class EventManager:
             event: Event to track
             original_employee: Employee from original uploaded data
             is_donut: True if this is a donut mode event
+            persist: False to skip persisting, for callers tracking several
+                events and persisting once afterwards
         """
         event_list = session.donut_events if is_donut else session.events
 
@@ -87,8 +90,8 @@ class EventManager:
         if not event.is_net_zero(original_employee):
             event_list.append(event)
 
-        # Always persist
-        self.session_manager._persist_session(session)
+        if persist:
+            self.session_manager._persist_session(session)
 
     def get_employee_events(
         self,
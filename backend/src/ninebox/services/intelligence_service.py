@@ -6,12 +6,20 @@ in employee rating distributions across various dimensions (location, function,
 
 import logging
 import math
+import time
+from collections.abc import Iterator, Mapping
 from typing import Any, cast
 
+from ninebox.core.config import settings
 from ninebox.models.employee import Employee
-from ninebox.models.grid_positions import PERFORMANCE_BUCKETS
+from ninebox.services.analysis_frame import (
+    NO_BUCKET,
+    PERFORMANCE_LEVELS,
+    AnalysisFrame,
+    as_analysis_frame,
+)
 from ninebox.services.org_service import OrgService
-from ninebox.utils import pure_statistics as ps
+from ninebox.utils import stats_backend as ps
 
 
 def _chi_square_test(
@@ -45,47 +53,6 @@ def _calculate_z_scores(
     return ps.calculate_z_scores(observed, expected)
 
 
-def _calculate_manager_chi_square(
-    observed_counts: list[int],
-    expected_pct: list[float],
-    team_size: int,
-) -> tuple[float, float]:
-    """Perform chi-square goodness-of-fit test for manager distribution.
-
-    Tests whether a manager's rating distribution significantly deviates
-    from the expected baseline (typically 20/70/10 for High/Medium/Low)
-    using chi-square goodness-of-fit test.
-
-    This is different from chi-square test of independence used in other
-    analyses. GOF test compares observed distribution to a theoretical
-    baseline, not to other categories.
-
-    Args:
-        observed_counts: [high_count, medium_count, low_count] - actual counts
-        expected_pct: [20.0, 70.0, 10.0] - baseline percentages
-        team_size: Total employees under manager
-
-    Returns:
-        Tuple of (chi2_statistic, p_value)
-        - chi2_statistic: Chi-square test statistic
-        - p_value: Statistical significance (p < 0.05 indicates significant deviation)
-
-    Example:
-        >>> _calculate_manager_chi_square([5, 4, 1], [20.0, 70.0, 10.0], 10)
-        (5.357, 0.069)  # Not significant at alpha=0.05
-
-    Note:
-        For small teams (< 15), the Low category may have expected count < 5,
-        which violates chi-square assumptions. However, this is acceptable for
-        exploratory analysis and is more rigorous than the previous heuristic.
-    """
-    # Calculate expected counts from percentages
-    expected = [team_size * p / 100.0 for p in expected_pct]
-
-    # Perform chi-square goodness-of-fit test
-    return ps.chi_square_goodness_of_fit(observed_counts, expected)
-
-
 def _cramers_v(chi2: float, n: int, rows: int, cols: int) -> float:
     """Calculate Cramér's V effect size.
 
@@ -177,14 +144,14 @@ def _get_status(
     return "red"
 
 
-def calculate_location_analysis(employees: list[Employee]) -> dict[str, Any]:
+def calculate_location_analysis(employees: list[Employee] | AnalysisFrame) -> dict[str, Any]:
     """Analyze performance distribution across job locations.
 
     Tests whether the distribution of performance ratings (High/Medium/Low)
     differs significantly across locations using chi-square test.
 
     Args:
-        employees: List of employee records
+        employees: List of employee records, or an AnalysisFrame built from them
 
     Returns:
         Dictionary containing:
@@ -201,21 +168,15 @@ def calculate_location_analysis(employees: list[Employee]) -> dict[str, Any]:
         return _empty_analysis("No employees to analyze")
 
     # Group by location and performance
-    locations = {}
-    for emp in employees:
-        loc = emp.location
-        perf = emp.performance.value
-        if loc not in locations:
-            locations[loc] = {"High": 0, "Medium": 0, "Low": 0}
-        locations[loc][perf] += 1
+    locations = as_analysis_frame(employees).table("location", "performance")
 
     if len(locations) < 2:
         return _empty_analysis("Insufficient locations for comparison (need >= 2)")
 
     # Build contingency table: rows=locations, cols=performance levels
     location_names = sorted(locations.keys())
-    perf_levels = ["High", "Medium", "Low"]
-    contingency = [[locations[loc][perf] for perf in perf_levels] for loc in location_names]
+    perf_levels = PERFORMANCE_LEVELS
+    contingency = [locations[loc] for loc in location_names]
 
     # Check sample size FIRST (more important than checking for empty categories)
     n = len(employees)
@@ -281,13 +242,13 @@ def calculate_location_analysis(employees: list[Employee]) -> dict[str, Any]:
     }
 
 
-def calculate_function_analysis(employees: list[Employee]) -> dict[str, Any]:
+def calculate_function_analysis(employees: list[Employee] | AnalysisFrame) -> dict[str, Any]:
     """Analyze grid position distribution across job functions.
 
     Tests whether the 9-box distribution differs significantly across job functions.
 
     Args:
-        employees: List of employee records
+        employees: List of employee records, or an AnalysisFrame built from them
 
     Returns:
         Dictionary with statistical analysis results (same structure as location_analysis)
@@ -300,13 +261,12 @@ def calculate_function_analysis(employees: list[Employee]) -> dict[str, Any]:
         return _empty_analysis("No employees to analyze")
 
     # Group by function and grid position
-    functions = {}
-    for emp in employees:
-        func = emp.job_function
-        pos = emp.grid_position
-        if func not in functions:
-            functions[func] = dict.fromkeys(range(1, 10), 0)
-        functions[func][pos] += 1
+    functions = {
+        func: dict(zip(range(1, 10), counts, strict=True))
+        for func, counts in as_analysis_frame(employees)
+        .table("job_function", "grid_position")
+        .items()
+    }
 
     if len(functions) < 2:
         return _empty_analysis("Insufficient functions for comparison (need >= 2)")
@@ -444,14 +404,14 @@ def calculate_function_analysis(employees: list[Employee]) -> dict[str, Any]:
     }
 
 
-def calculate_level_analysis(employees: list[Employee]) -> dict[str, Any]:
+def calculate_level_analysis(employees: list[Employee] | AnalysisFrame) -> dict[str, Any]:
     """Analyze performance uniformity across job levels.
 
     CRITICAL: This is a UNIFORMITY test - we WANT p > 0.05.
     Ratings should be calibrated within each level, so distributions should be similar.
 
     Args:
-        employees: List of employee records
+        employees: List of employee records, or an AnalysisFrame built from them
 
     Returns:
         Dictionary with statistical analysis results (same structure as location_analysis)
@@ -460,21 +420,15 @@ def calculate_level_analysis(employees: list[Employee]) -> dict[str, Any]:
         return _empty_analysis("No employees to analyze")
 
     # Group by level and performance
-    levels = {}
-    for emp in employees:
-        level = emp.job_level
-        perf = emp.performance.value
-        if level not in levels:
-            levels[level] = {"High": 0, "Medium": 0, "Low": 0}
-        levels[level][perf] += 1
+    levels = as_analysis_frame(employees).table("job_level", "performance")
 
     if len(levels) < 2:
         return _empty_analysis("Insufficient levels for comparison (need >= 2)")
 
     # Build contingency table: rows=levels, cols=performance
     level_names = sorted(levels.keys())
-    perf_levels = ["High", "Medium", "Low"]
-    contingency = [[levels[lvl][perf] for perf in perf_levels] for lvl in level_names]
+    perf_levels = PERFORMANCE_LEVELS
+    contingency = [levels[lvl] for lvl in level_names]
 
     # Check sample size
     n = len(employees)
@@ -539,13 +493,13 @@ def calculate_level_analysis(employees: list[Employee]) -> dict[str, Any]:
     }
 
 
-def calculate_tenure_analysis(employees: list[Employee]) -> dict[str, Any]:
+def calculate_tenure_analysis(employees: list[Employee] | AnalysisFrame) -> dict[str, Any]:
     """Analyze performance distribution across tenure categories.
 
     Tests whether performance ratings differ significantly by tenure.
 
     Args:
-        employees: List of employee records
+        employees: List of employee records, or an AnalysisFrame built from them
 
     Returns:
         Dictionary with statistical analysis results (same structure as location_analysis)
@@ -554,21 +508,15 @@ def calculate_tenure_analysis(employees: list[Employee]) -> dict[str, Any]:
         return _empty_analysis("No employees to analyze")
 
     # Group by tenure and performance
-    tenures = {}
-    for emp in employees:
-        tenure = emp.tenure_category
-        perf = emp.performance.value
-        if tenure not in tenures:
-            tenures[tenure] = {"High": 0, "Medium": 0, "Low": 0}
-        tenures[tenure][perf] += 1
+    tenures = as_analysis_frame(employees).table("tenure", "performance")
 
     if len(tenures) < 2:
         return _empty_analysis("Insufficient tenure categories for comparison (need >= 2)")
 
     # Build contingency table: rows=tenure categories, cols=performance
     tenure_names = sorted(tenures.keys())
-    perf_levels = ["High", "Medium", "Low"]
-    contingency = [[tenures[ten][perf] for perf in perf_levels] for ten in tenure_names]
+    perf_levels = PERFORMANCE_LEVELS
+    contingency = [tenures[ten] for ten in tenure_names]
 
     # Check sample size
     n = len(employees)
@@ -633,18 +581,47 @@ def calculate_tenure_analysis(employees: list[Employee]) -> dict[str, Any]:
     }
 
 
+class _ManagerReports(Mapping[str, list[Employee]]):
+    """Manager name -> all reports, sliced from the org index only when looked up.
+
+    The analysis needs report lists for the few managers it displays, so
+    materializing every qualified manager's organization up front would cost
+    O(sum of team sizes) for nothing.
+    """
+
+    def __init__(self, org_service: OrgService, manager_ids: dict[str, int]) -> None:
+        """Wrap an org index and the employee ID of each manager name."""
+        self._org_service = org_service
+        self._manager_ids = manager_ids
+
+    def __getitem__(self, manager_name: str) -> list[Employee]:
+        """All (direct and indirect) reports of the named manager."""
+        return self._org_service.get_all_reports(self._manager_ids[manager_name])
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the manager names."""
+        return iter(self._manager_ids)
+
+    def __len__(self) -> int:
+        """Number of managers."""
+        return len(self._manager_ids)
+
+
 def _build_qualified_managers(
-    employees: list[Employee], min_team_size: int
-) -> tuple[dict[str, list[Employee]], dict[str, Any] | None]:
+    frame: AnalysisFrame, min_team_size: int
+) -> tuple[Mapping[str, list[Employee]], dict[str, list[int]], dict[str, Any] | None]:
     """Build organization tree and filter managers by minimum team size.
 
     Args:
-        employees: List of employee records
+        frame: Analysis frame over the employee records
         min_team_size: Minimum organization size for manager to be included
 
     Returns:
-        Tuple of (qualified_managers dict, error_result or None)
-        - qualified_managers: Dict mapping manager_name -> list of reports
+        Tuple of (qualified_managers dict, bucket_counts dict, error_result or None)
+        - qualified_managers: Mapping of manager_name -> list of reports (each
+          list is sliced from the org index on lookup)
+        - bucket_counts: Dict mapping manager_name -> performance bucket counts of
+          the reports ([high, medium, low, outside every bucket])
         - error_result: Error analysis dict if no qualified managers found, None otherwise
     """
     # Use OrgService to build org tree (replaces 60+ lines of manual tree building)
@@ -658,7 +635,10 @@ def _build_qualified_managers(
     #
     # Trade-off: We accept potentially invalid org structures to allow flexible test data.
     # Invalid manager references are logged as errors rather than raising exceptions.
-    org_service = OrgService(employees, validate=False)
+    #
+    # The frame builds the tree once and keeps per-manager bucket tallies current
+    # across grid moves, so only the statistics are recomputed after a move.
+    org_service = frame.org_service
 
     # Filter managers by minimum team size
     manager_ids = org_service.find_managers(min_team_size=min_team_size)
@@ -666,19 +646,24 @@ def _build_qualified_managers(
     if not manager_ids:
         all_manager_ids = org_service.find_managers(min_team_size=1)
         if not all_manager_ids:
-            return {}, _empty_analysis("No managers found in dataset")
+            return {}, {}, _empty_analysis("No managers found in dataset")
 
         # Get team size range for error message
-        all_team_sizes = [len(org_service.get_all_reports(mgr_id)) for mgr_id in all_manager_ids]
-        return {}, _empty_analysis(
-            f"No managers with team size >= {min_team_size}. "
-            f"Found {len(all_manager_ids)} managers with teams of "
-            f"{min(all_team_sizes)}-{max(all_team_sizes)} employees."
+        all_team_sizes = [org_service.get_team_size(mgr_id) for mgr_id in all_manager_ids]
+        return (
+            {},
+            {},
+            _empty_analysis(
+                f"No managers with team size >= {min_team_size}. "
+                f"Found {len(all_manager_ids)} managers with teams of "
+                f"{min(all_team_sizes)}-{max(all_team_sizes)} employees."
+            ),
         )
 
-    # Build qualified_managers dict: manager_name -> reports
+    # Build qualified_managers: manager_name -> reports
     # Convert from ID-based (OrgService) to name-based (for backwards compatibility)
-    qualified_managers = {}
+    qualified_ids: dict[str, int] = {}
+    bucket_counts = {}
     for manager_id in manager_ids:
         manager = org_service.get_employee_by_id(manager_id)
         if not manager:
@@ -688,15 +673,15 @@ def _build_qualified_managers(
             )
             continue
 
-        reports = org_service.get_all_reports(manager_id)
-        qualified_managers[manager.name] = reports
+        qualified_ids[manager.name] = manager_id
+        bucket_counts[manager.name] = frame.manager_bucket_counts(manager_id)
 
-    return qualified_managers, None
+    return _ManagerReports(org_service, qualified_ids), bucket_counts, None
 
 
 def _calculate_single_manager_distribution(
     manager_name: str,
-    reports: list[Employee],
+    bucket_counts: list[int],
     baseline_high: float,
     baseline_medium: float,
     baseline_low: float,
@@ -705,17 +690,18 @@ def _calculate_single_manager_distribution(
 
     Args:
         manager_name: Name of the manager
-        reports: List of employees reporting to this manager
+        bucket_counts: Performance bucket counts of the manager's reports
+            ([high, medium, low, outside every bucket])
         baseline_high: Baseline percentage for high performers
         baseline_medium: Baseline percentage for medium performers
         baseline_low: Baseline percentage for low performers
 
     Returns:
-        Dictionary containing distribution metrics
+        Dictionary containing distribution metrics (employee_ids is added by
+        the caller for the managers it keeps)
     """
-    # Validate grid positions and filter out invalid ones
-    valid_reports = [emp for emp in reports if emp.grid_position in range(1, 10)]
-    invalid_count = len(reports) - len(valid_reports)
+    # Employees outside every bucket have invalid grid positions (not 1-9)
+    high_count, medium_count, low_count, invalid_count = bucket_counts
 
     if invalid_count > 0:
         logging.getLogger(__name__).warning(
@@ -723,15 +709,11 @@ def _calculate_single_manager_distribution(
             f"grid positions (not in 1-9). These employees are excluded from distribution analysis."
         )
 
-    # Count employees in each performance bucket
+    # Performance buckets (grid_positions.PERFORMANCE_BUCKETS)
     # High: positions 9, 8, 6
     # Medium: positions 7, 5, 3
     # Low: positions 4, 2, 1
-    high_count = sum(1 for emp in valid_reports if emp.grid_position in [9, 8, 6])
-    medium_count = sum(1 for emp in valid_reports if emp.grid_position in [7, 5, 3])
-    low_count = sum(1 for emp in valid_reports if emp.grid_position in [4, 2, 1])
-
-    team_size = len(valid_reports)
+    team_size = high_count + medium_count + low_count
     high_pct = (high_count / team_size * 100) if team_size > 0 else 0
     medium_pct = (medium_count / team_size * 100) if team_size > 0 else 0
     low_pct = (low_count / team_size * 100) if team_size > 0 else 0
@@ -746,7 +728,6 @@ def _calculate_single_manager_distribution(
     return {
         "manager_name": manager_name,
         "team_size": team_size,
-        "employee_ids": [emp.employee_id for emp in valid_reports],  # All report IDs
         "high_count": high_count,
         "medium_count": medium_count,
         "low_count": low_count,
@@ -761,7 +742,8 @@ def _calculate_single_manager_distribution(
 
 
 def _calculate_manager_distributions(
-    qualified_managers: dict[str, list[Employee]],
+    qualified_managers: Mapping[str, list[Employee]],
+    bucket_counts: dict[str, list[int]],
     baseline_high: float,
     baseline_medium: float,
     baseline_low: float,
@@ -770,7 +752,8 @@ def _calculate_manager_distributions(
     """Calculate rating distributions for all managers.
 
     Args:
-        qualified_managers: Dict mapping manager_name -> list of reports
+        qualified_managers: Mapping of manager_name -> list of reports
+        bucket_counts: Dict mapping manager_name -> performance bucket counts
         baseline_high: Baseline percentage for high performers
         baseline_medium: Baseline percentage for medium performers
         baseline_low: Baseline percentage for low performers
@@ -782,9 +765,9 @@ def _calculate_manager_distributions(
         - total_manager_count: Total number of managers analyzed
     """
     manager_distributions = []
-    for manager_name, reports in qualified_managers.items():
+    for manager_name in qualified_managers:
         distribution = _calculate_single_manager_distribution(
-            manager_name, reports, baseline_high, baseline_medium, baseline_low
+            manager_name, bucket_counts[manager_name], baseline_high, baseline_medium, baseline_low
         )
         manager_distributions.append(distribution)
 
@@ -793,6 +776,13 @@ def _calculate_manager_distributions(
     total_manager_count = len(manager_distributions)
     top_managers = manager_distributions[:max_displayed]
 
+    # List report IDs (valid grid positions only) for the managers being returned
+    for distribution in top_managers:
+        reports = qualified_managers[distribution["manager_name"]]
+        distribution["employee_ids"] = [
+            emp.employee_id for emp in reports if emp.grid_position in range(1, 10)
+        ]
+
     return top_managers, total_manager_count
 
 
@@ -807,6 +797,13 @@ def _calculate_manager_statistics(
     Performs chi-square goodness-of-fit test for each manager to determine if their
     rating distribution significantly deviates from the expected baseline (20/70/10).
 
+    Small teams (any expected count < 5, e.g. fewer than 50 reports at a 10% Low
+    baseline) get an exact multinomial p-value instead of the asymptotic one, or a
+    seeded Monte-Carlo estimate when there are too many outcomes to enumerate.
+    Teams sharing a size share one null distribution. Exact tests stop after
+    Settings.analysis_exact_test_budget_seconds; later teams keep the asymptotic
+    p-value. Each deviation records the method in "p_value_method".
+
     Args:
         top_managers: List of managers with distribution metrics
         baseline_high: Expected percentage of high performers (typically 20.0)
@@ -819,20 +816,25 @@ def _calculate_manager_statistics(
         - significant_count: Number of managers with significant deviations (p < 0.05)
         - max_deviation: Maximum total deviation across all managers
     """
-    deviations = []
-    for mgr in top_managers:
-        team_size = cast("int", mgr["team_size"])
-
-        # Prepare data for chi-square goodness-of-fit test
-        observed_counts = [
+    # Goodness-of-fit test for every manager in one batch (exact for small teams)
+    expected_pct = [baseline_high, baseline_medium, baseline_low]
+    observed_rows = [
+        [
             cast("int", mgr["high_count"]),
             cast("int", mgr["medium_count"]),
             cast("int", mgr["low_count"]),
         ]
-        expected_pct = [baseline_high, baseline_medium, baseline_low]
+        for mgr in top_managers
+    ]
+    test_results = ps.multinomial_goodness_of_fit_batch(
+        observed_rows,
+        [p / 100.0 for p in expected_pct],
+        deadline=time.monotonic() + settings.analysis_exact_test_budget_seconds,
+    )
 
-        # Perform chi-square goodness-of-fit test
-        chi2, p_value = _calculate_manager_chi_square(observed_counts, expected_pct, team_size)
+    deviations = []
+    for mgr, (chi2, p_value, p_value_method) in zip(top_managers, test_results, strict=True):
+        team_size = cast("int", mgr["team_size"])
 
         # For backward compatibility with _get_status, calculate a z-score-like metric
         # from the chi-square statistic. For chi-square with 2 df, significant values are:
@@ -854,6 +856,7 @@ def _calculate_manager_statistics(
                 "total_deviation": round(cast("float", mgr["total_deviation"]), 1),
                 "chi_square": round(chi2, 3),
                 "p_value": round(p_value, 4),
+                "p_value_method": p_value_method,  # "exact", "monte_carlo" or "chi_square"
                 "z_score": round(z_score_equivalent, 2),  # For backward compatibility
                 "is_significant": bool(p_value < 0.05),  # Standard significance level
             }
@@ -869,7 +872,7 @@ def _calculate_manager_statistics(
 
 
 def calculate_manager_analysis(
-    employees: list[Employee],
+    employees: list[Employee] | AnalysisFrame,
     min_team_size: int = 10,
     max_displayed: int = 10,
 ) -> dict[str, Any]:
@@ -884,7 +887,7 @@ def calculate_manager_analysis(
     to compare categories against each other.
 
     Args:
-        employees: List of employee records
+        employees: List of employee records, or an AnalysisFrame built from them
         min_team_size: Minimum organization size for manager to be included (default: 10)
         max_displayed: Maximum number of managers to return (default: 10)
 
@@ -923,13 +926,50 @@ def calculate_manager_analysis(
     BASELINE_LOW = 10.0
 
     # Step 1: Build org tree and filter managers
-    qualified_managers, error_result = _build_qualified_managers(employees, min_team_size)
+    qualified_managers, bucket_counts, error_result = _build_qualified_managers(
+        as_analysis_frame(employees), min_team_size
+    )
     if error_result:
         return error_result
 
+    return _manager_analysis_result(
+        qualified_managers,
+        bucket_counts,
+        len(employees),
+        max_displayed,
+        (BASELINE_HIGH, BASELINE_MEDIUM, BASELINE_LOW),
+    )
+
+
+def _manager_analysis_result(
+    qualified_managers: Mapping[str, list[Employee]],
+    bucket_counts: dict[str, list[int]],
+    sample_size: int,
+    max_displayed: int,
+    baseline: tuple[float, float, float],
+) -> dict[str, Any]:
+    """Test the qualified managers against the baseline and build the analysis result.
+
+    Args:
+        qualified_managers: Mapping of manager_name -> list of reports
+        bucket_counts: Dict mapping manager_name -> performance bucket counts
+        sample_size: Number of employees analyzed
+        max_displayed: Maximum number of managers to return
+        baseline: Expected (high, medium, low) percentages
+
+    Returns:
+        Manager analysis result (see calculate_manager_analysis)
+    """
+    baseline_high, baseline_medium, baseline_low = baseline
+
     # Step 2: Calculate distributions for each manager
     top_managers, total_manager_count = _calculate_manager_distributions(
-        qualified_managers, BASELINE_HIGH, BASELINE_MEDIUM, BASELINE_LOW, max_displayed
+        qualified_managers,
+        bucket_counts,
+        baseline_high,
+        baseline_medium,
+        baseline_low,
+        max_displayed,
     )
 
     if not top_managers:
@@ -937,7 +977,7 @@ def calculate_manager_analysis(
 
     # Step 3: Calculate statistical metrics using chi-square goodness-of-fit
     deviations, _significant_count, max_deviation = _calculate_manager_statistics(
-        top_managers, BASELINE_HIGH, BASELINE_MEDIUM, BASELINE_LOW
+        top_managers, baseline_high, baseline_medium, baseline_low
     )
 
     # Step 4: Build final result
@@ -966,14 +1006,16 @@ def calculate_manager_analysis(
         "p_value": round(min_p_value, 4),  # Minimum p-value across all managers
         "effect_size": round(effect_size, 3),
         "degrees_of_freedom": 2,  # df = k - 1 = 3 - 1 = 2 for goodness-of-fit with 3 categories
-        "sample_size": len(employees),
+        "sample_size": sample_size,
         "status": status,
         "deviations": deviations,
         "interpretation": interpretation,
     }
 
 
-def calculate_per_level_distribution(employees: list[Employee]) -> dict[str, Any]:
+def calculate_per_level_distribution(
+    employees: list[Employee] | AnalysisFrame,
+) -> dict[str, Any]:
     """Analyze performance distribution within each job level.
 
     This analysis addresses the critical use case: detecting when overall rating
@@ -994,7 +1036,7 @@ def calculate_per_level_distribution(employees: list[Employee]) -> dict[str, Any
     - High performers: positions 3, 6, 8, 9
 
     Args:
-        employees: List of employee records
+        employees: List of employee records, or an AnalysisFrame built from them
 
     Returns:
         Dictionary containing:
@@ -1016,21 +1058,12 @@ def calculate_per_level_distribution(employees: list[Employee]) -> dict[str, Any
     BASELINE_MEDIUM = 70.0
     BASELINE_LOW = 10.0
 
-    # Use canonical performance tier definitions from grid_positions.py
+    # Count employees per level in each canonical performance tier (grid_positions.py)
     # High: [9, 8, 6] - Star, Growth, High Impact (top 20%)
     # Medium: [7, 5, 3] - Enigma, Core Talent, Workhorse
     # Low: [4, 2, 1] - Inconsistent, Effective Pro, Underperformer
-    HIGH_PERFORMER_POSITIONS = PERFORMANCE_BUCKETS["High"]
-    MEDIUM_PERFORMER_POSITIONS = PERFORMANCE_BUCKETS["Medium"]
-    LOW_PERFORMER_POSITIONS = PERFORMANCE_BUCKETS["Low"]
-
-    # Group employees by level
-    levels_data: dict[str, list[Employee]] = {}
-    for emp in employees:
-        level = emp.job_level
-        if level not in levels_data:
-            levels_data[level] = []
-        levels_data[level].append(emp)
+    # plus a trailing column for positions outside every tier
+    levels_data = as_analysis_frame(employees).table("job_level", "performance_bucket")
 
     if len(levels_data) < 2:
         return _empty_analysis("Insufficient levels for comparison (need >= 2)")
@@ -1046,19 +1079,9 @@ def calculate_per_level_distribution(employees: list[Employee]) -> dict[str, Any
     level_names = sorted(levels_data.keys())
 
     for level in level_names:
-        level_employees = levels_data[level]
-        total_count = len(level_employees)
-
-        # Count employees in each performance tier
-        high_count = sum(
-            1 for emp in level_employees if emp.grid_position in HIGH_PERFORMER_POSITIONS
-        )
-        medium_count = sum(
-            1 for emp in level_employees if emp.grid_position in MEDIUM_PERFORMER_POSITIONS
-        )
-        low_count = sum(
-            1 for emp in level_employees if emp.grid_position in LOW_PERFORMER_POSITIONS
-        )
+        tier_counts = levels_data[level]
+        total_count = sum(tier_counts)
+        high_count, medium_count, low_count, _ = tier_counts
 
         # Calculate percentages
         high_pct = (high_count / total_count * 100) if total_count > 0 else 0
@@ -1244,13 +1267,61 @@ def _generate_per_level_summary(
         return f"Analysis shows multiple levels with rating anomalies: {level_list}. Focus calibration on these levels."
 
 
-def calculate_overall_intelligence(employees: list[Employee]) -> dict[str, Any]:
+# Registry analyses reported by the intelligence endpoints, mapped to their
+# response field (per_level_distribution is only used by calibration summaries)
+INTELLIGENCE_DIMENSIONS = {
+    "location": "location_analysis",
+    "function": "function_analysis",
+    "level": "level_analysis",
+    "tenure": "tenure_analysis",
+    "manager": "manager_analysis",
+}
+
+
+def summarize_intelligence(dimensions: dict[str, dict[str, Any]]) -> dict[str, Any]:
+    """Compute the anomaly counts and data quality score from dimension results.
+
+    Args:
+        dimensions: Dimension results keyed by response field (see
+            INTELLIGENCE_DIMENSIONS); missing dimensions count as neither
+            green, yellow nor red
+
+    Returns:
+        Dictionary containing:
+        - quality_score: Overall data quality score (0-100)
+        - anomaly_count: Dict with green/yellow/red counts
+    """
+    analyses = [dimensions.get(field, {}) for field in INTELLIGENCE_DIMENSIONS.values()]
+
+    # Count anomalies by severity
+    anomaly_count = {
+        "green": sum(1 for a in analyses if a.get("status") == "green"),
+        "yellow": sum(1 for a in analyses if a.get("status") == "yellow"),
+        "red": sum(1 for a in analyses if a.get("status") == "red"),
+    }
+
+    # Calculate quality score (0-100)
+    # Green = 100 points, Yellow = 50 points, Red = 0 points
+    total_points = anomaly_count["green"] * 100 + anomaly_count["yellow"] * 50
+    quality_score = total_points // len(analyses) if analyses else 0
+
+    return {"quality_score": quality_score, "anomaly_count": anomaly_count}
+
+
+def calculate_overall_intelligence(
+    employees: list[Employee] | AnalysisFrame,
+    session_id: str | None = None,
+    revision: str | None = None,
+) -> dict[str, Any]:
     """Calculate overall intelligence analysis across all dimensions.
 
     Aggregates all individual analyses and computes overall data quality score.
 
     Args:
-        employees: List of employee records
+        employees: List of employee records, or an AnalysisFrame built from them
+        session_id: Session the employees belong to; with revision, enables the
+            shared analysis cache
+        revision: Session revision token from SessionManager.get_revision_tag()
 
     Returns:
         Dictionary containing:
@@ -1266,39 +1337,347 @@ def calculate_overall_intelligence(employees: list[Employee]) -> dict[str, Any]:
     from ninebox.services.analysis_registry import run_all_analyses
 
     # Run all analyses through the registry
-    all_results = run_all_analyses(employees)
+    all_results = run_all_analyses(employees, session_id=session_id, revision=revision)
 
     # Extract individual analyses (excluding per_level_distribution which is not used here)
-    location = all_results.get("location", {})
-    function = all_results.get("function", {})
-    level = all_results.get("level", {})
-    tenure = all_results.get("tenure", {})
-    manager = all_results.get("manager", {})
-
-    # Count anomalies by severity
-    analyses = [location, function, level, tenure, manager]
-    anomaly_count = {
-        "green": sum(1 for a in analyses if a.get("status") == "green"),
-        "yellow": sum(1 for a in analyses if a.get("status") == "yellow"),
-        "red": sum(1 for a in analyses if a.get("status") == "red"),
+    dimensions = {
+        field: all_results.get(name, {}) for name, field in INTELLIGENCE_DIMENSIONS.items()
     }
 
-    # Calculate quality score (0-100)
-    # Green = 100 points, Yellow = 50 points, Red = 0 points
-    total_points = anomaly_count["green"] * 100 + anomaly_count["yellow"] * 50
-    quality_score = total_points // len(analyses) if analyses else 0
+    return {**summarize_intelligence(dimensions), **dimensions}
+
+
+def iter_intelligence(
+    employees: list[Employee] | AnalysisFrame,
+    session_id: str | None = None,
+    revision: str | None = None,
+) -> Iterator[tuple[str, dict[str, Any]]]:
+    """Run the intelligence analyses, yielding each dimension as soon as it finishes.
+
+    Streaming counterpart of calculate_overall_intelligence(): analyses run
+    through analysis_registry.iter_analyses() on the configured pool, so fast
+    dimensions are yielded while slow ones (e.g. manager on a large org) are
+    still running. The quality score needs every dimension and comes last.
+
+    Args:
+        employees: List of employee records, or an AnalysisFrame built from them
+        session_id: Session the employees belong to; with revision, enables the
+            shared analysis cache
+        revision: Session revision token from SessionManager.get_revision_tag()
+
+    Yields:
+        (response field, dimension result) for each dimension in completion
+        order (e.g. ("location_analysis", {...})), then ("summary",
+        {"quality_score": ..., "anomaly_count": ...})
+    """
+    # Import here to avoid circular dependency (analysis_registry imports from this module)
+    from ninebox.services.analysis_registry import get_analysis_executor, iter_analyses
+
+    dimensions: dict[str, dict[str, Any]] = {}
+    for outcome in iter_analyses(
+        employees,
+        session_id=session_id,
+        revision=revision,
+        executor=get_analysis_executor(),
+        timeout=settings.analysis_timeout_seconds,
+    ):
+        field = INTELLIGENCE_DIMENSIONS.get(outcome.name)
+        if field is not None:
+            dimensions[field] = outcome.result
+            yield field, outcome.result
+
+    yield "summary", summarize_intelligence(dimensions)
+
+
+# Slice (filtered-population) intelligence
+#
+# A filtered view (one VP's org, one level) is tested against the full
+# population instead of against itself: each category in the slice is
+# expected to rate like the same category does across the whole session
+# (e.g. the slice's USA employees like all USA employees). The baseline
+# tables come from the session's AnalysisFrame, which memoizes them and keeps
+# them current across grid moves, so a filtered request only encodes and
+# counts the slice.
+
+# Slice dimensions: response field -> (category column, value column, columns
+# counted as high performers)
+_SLICE_DIMENSIONS = {
+    "location_analysis": ("location", "performance", (0,)),
+    # Grid positions 3, 6, 9 (High performance at any potential)
+    "function_analysis": ("job_function", "grid_position", (2, 5, 8)),
+    "level_analysis": ("job_level", "performance", (0,)),
+    "tenure_analysis": ("tenure", "performance", (0,)),
+}
+
+# Slice categories smaller than this are pooled into "Other" (function only,
+# matching calculate_function_analysis)
+_SLICE_MIN_FUNCTION_SIZE = 10
+
+
+def calculate_slice_dimension(
+    slice_frame: AnalysisFrame, population: AnalysisFrame, field: str
+) -> dict[str, Any]:
+    """Test one dimension of a filtered slice against the full-population baseline.
+
+    For each category of the slice, the expected counts are the slice's
+    category size times the rating proportions of that category across the
+    whole population. The chi-square goodness-of-fit statistics of all
+    categories are summed (degrees of freedom add up likewise).
+
+    Args:
+        slice_frame: Frame over the filtered employees
+        population: Frame over every employee of the session (the baseline)
+        field: Response field, one of "location_analysis", "function_analysis",
+            "level_analysis" or "tenure_analysis"
+
+    Returns:
+        Dictionary with the same structure as calculate_location_analysis();
+        expected_high_pct in each deviation is the population's rate for that
+        category, and effect_size is Cohen's w (capped at 1)
+    """
+    rows, values, high_columns = _SLICE_DIMENSIONS[field]
+    n = len(slice_frame)
+    if n == 0:
+        return _empty_analysis("No employees to analyze")
+    if n < 30:
+        return _empty_analysis(f"Sample size too small (N={n}, need >= 30)")
+
+    observed_table = slice_frame.table(rows, values)
+    baseline_table = population.table(rows, values)
+
+    # Expected counts per category from the population's proportions
+    categories: dict[str, tuple[list[int], list[float]]] = {}
+    for category, observed in observed_table.items():
+        baseline = baseline_table.get(category)
+        if baseline is None:
+            return _empty_analysis(f"Category '{category}' is missing from the population baseline")
+        baseline_total = sum(baseline)
+        if not baseline_total:
+            return _empty_analysis(f"Category '{category}' is missing from the population baseline")
+        total = sum(observed)
+        categories[category] = (observed, [total * count / baseline_total for count in baseline])
+
+    if rows == "job_function":
+        categories = _pool_small_categories(categories, _SLICE_MIN_FUNCTION_SIZE)
+
+    chi2 = 0.0
+    dof = 0
+    deviations = []
+    for category in sorted(categories):
+        observed, expected = categories[category]
+        cells = [(o, e) for o, e in zip(observed, expected, strict=True) if e > 0]
+        chi2 += sum((o - e) ** 2 / e for o, e in cells)
+        dof += len(cells) - 1
+
+        total = sum(observed)
+        observed_high = sum(observed[i] for i in high_columns)
+        expected_high = sum(expected[i] for i in high_columns)
+        z_score = (
+            (observed_high - expected_high) / math.sqrt(expected_high) if expected_high > 0 else 0.0
+        )
+        deviations.append(
+            {
+                "category": category,
+                "observed_high_pct": round(observed_high / total * 100, 1),
+                "expected_high_pct": round(expected_high / total * 100, 1),
+                "z_score": round(z_score, 2),
+                "sample_size": total,
+                "is_significant": bool(abs(z_score) >= 2.0),
+            }
+        )
+
+    p_value = ps.chi_square_survival(chi2, dof) if dof > 0 else 1.0
+    effect_size = min(1.0, math.sqrt(chi2 / n))
+
+    deviations.sort(key=lambda x: abs(cast("float", x["z_score"])), reverse=True)
+
+    status = _get_status(
+        p_value, effect_size, deviations, is_uniformity_test=field == "level_analysis"
+    )
+    generate_interpretation = {
+        "location_analysis": _generate_location_interpretation,
+        "function_analysis": _generate_function_interpretation,
+        "level_analysis": _generate_level_interpretation,
+        "tenure_analysis": _generate_tenure_interpretation,
+    }[field]
+    interpretation = generate_interpretation(status, p_value, effect_size, deviations)
 
     return {
-        "quality_score": quality_score,
-        "anomaly_count": anomaly_count,
-        "location_analysis": location,
-        "function_analysis": function,
-        "level_analysis": level,
-        "tenure_analysis": tenure,
-        "manager_analysis": manager,
+        "chi_square": round(chi2, 3),
+        "p_value": round(p_value, 4),
+        "effect_size": round(effect_size, 3),
+        "degrees_of_freedom": dof,
+        "sample_size": n,
+        "status": status,
+        "deviations": deviations,
+        "interpretation": interpretation,
     }
 
 
+def _pool_small_categories(
+    categories: dict[str, tuple[list[int], list[float]]], min_size: int
+) -> dict[str, tuple[list[int], list[float]]]:
+    """Merge categories with fewer than min_size observations into "Other".
+
+    Observed and expected counts are summed, so "Other" keeps each member's
+    own baseline rather than a pooled one.
+    """
+    pooled: dict[str, tuple[list[int], list[float]]] = {}
+    other_observed: list[int] = []
+    other_expected: list[float] = []
+    for category, (observed, expected) in categories.items():
+        if sum(observed) >= min_size:
+            pooled[category] = (observed, expected)
+            continue
+        if not other_observed:
+            other_observed = [0] * len(observed)
+            other_expected = [0.0] * len(expected)
+        other_observed = [a + b for a, b in zip(other_observed, observed, strict=True)]
+        other_expected = [a + b for a, b in zip(other_expected, expected, strict=True)]
+    if other_observed:
+        pooled["Other"] = (other_observed, other_expected)
+    return pooled
+
+
+def calculate_slice_manager_analysis(
+    slice_frame: AnalysisFrame,
+    population: AnalysisFrame,
+    min_team_size: int = 10,
+    max_displayed: int = 10,
+) -> dict[str, Any]:
+    """Analyze manager rating distributions within a filtered slice.
+
+    Managers are found in the population's org tree, so a slice of one level
+    still attributes its employees to every manager above them. Each
+    manager's slice members are tested against the 20/70/10 baseline, as in
+    calculate_manager_analysis().
+
+    Args:
+        slice_frame: Frame over the filtered employees
+        population: Frame over every employee of the session
+        min_team_size: Minimum number of slice members under a manager
+        max_displayed: Maximum number of managers to return
+
+    Returns:
+        Dictionary with the same structure as calculate_manager_analysis()
+    """
+    if not slice_frame:
+        return _empty_analysis("No employees to analyze")
+
+    manager_rows = population.subset_manager_rows(emp.employee_id for emp in slice_frame)
+    bucket = population.performance_bucket
+    qualified_managers: dict[str, list[Employee]] = {}
+    bucket_counts: dict[str, list[int]] = {}
+    for manager_id, rows in manager_rows.items():
+        if len(rows) < min_team_size:
+            continue
+        manager = population.org_service.get_employee_by_id(manager_id)
+        if manager is None:
+            continue
+        counts = [0] * (NO_BUCKET + 1)
+        for row in rows:
+            counts[bucket[row]] += 1
+        qualified_managers[manager.name] = [population[row] for row in rows]
+        bucket_counts[manager.name] = counts
+
+    if not qualified_managers:
+        return _empty_analysis(
+            f"No managers with at least {min_team_size} employees in the filtered view"
+        )
+
+    return _manager_analysis_result(
+        qualified_managers, bucket_counts, len(slice_frame), max_displayed, (20.0, 70.0, 10.0)
+    )
+
+
+def iter_slice_intelligence(
+    employees: list[Employee],
+    population: AnalysisFrame,
+    session_id: str | None = None,
+    revision: str | None = None,
+    params: dict[str, Any] | None = None,
+) -> Iterator[tuple[str, dict[str, Any]]]:
+    """Run the intelligence analyses on a filtered slice, one dimension at a time.
+
+    Args:
+        employees: Filtered employees (a subset of the population)
+        population: Frame over every employee of the session; its memoized
+            tables are the baseline
+        session_id: Session the employees belong to; with revision, enables the
+            shared analysis cache
+        revision: Session revision token from SessionManager.get_revision_tag()
+        params: Active filters, part of the cache key
+
+    Yields:
+        (response field, dimension result) for each dimension, then
+        ("summary", {"quality_score": ..., "anomaly_count": ...})
+    """
+    # Import here to avoid circular dependency (analysis_registry imports from this module)
+    from ninebox.services.analysis_registry import ANALYSIS_CACHE
+
+    slice_frame: AnalysisFrame | None = None
+
+    def compute(field: str) -> dict[str, Any]:
+        nonlocal slice_frame
+        if slice_frame is None:
+            slice_frame = AnalysisFrame.from_employees(employees)
+        if field == "manager_analysis":
+            return calculate_slice_manager_analysis(slice_frame, population)
+        return calculate_slice_dimension(slice_frame, population, field)
+
+    dimensions: dict[str, dict[str, Any]] = {}
+    for field in INTELLIGENCE_DIMENSIONS.values():
+        if session_id is not None and revision is not None:
+            result = ANALYSIS_CACHE.get_or_compute(
+                session_id,
+                revision,
+                f"slice:{field}",
+                params,
+                lambda field=field: compute(field),  # type: ignore[misc]
+            )
+        else:
+            result = compute(field)
+        dimensions[field] = result
+        yield field, result
+
+    yield "summary", summarize_intelligence(dimensions)
+
+
+def calculate_slice_intelligence(
+    employees: list[Employee],
+    population: AnalysisFrame,
+    session_id: str | None = None,
+    revision: str | None = None,
+    params: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Calculate intelligence for a filtered slice against the full population.
+
+    Args:
+        employees: Filtered employees (a subset of the population)
+        population: Frame over every employee of the session
+        session_id: Session the employees belong to; with revision, enables the
+            shared analysis cache
+        revision: Session revision token from SessionManager.get_revision_tag()
+        params: Active filters, part of the cache key
+
+    Returns:
+        Dictionary with the same structure as calculate_overall_intelligence()
+
+    Example:
+        >>> population = AnalysisFrame.from_employees(session.current_employees)
+        >>> vp_org = [e for e in session.current_employees if e.management_chain_02 == "Ann"]
+        >>> calculate_slice_intelligence(vp_org, population)["location_analysis"]["status"]
+        'green'
+    """
+    results = dict(
+        iter_slice_intelligence(
+            employees, population, session_id=session_id, revision=revision, params=params
+        )
+    )
+    summary = results.pop("summary")
+    return {**summary, **results}
+
+
 def _empty_analysis(reason: str) -> dict[str, Any]:
     """Return empty analysis result with explanation.
 
@@ -1562,7 +1941,7 @@ def _generate_manager_interpretation(
     deviations: list[dict[str, Any]],
     total_manager_count: int,
     max_displayed: int,
-    qualified_managers: dict[str, list[Any]],
+    qualified_managers: Mapping[str, list[Any]],
 ) -> str:
     """Generate human-readable interpretation for manager analysis.
 
@@ -1575,7 +1954,7 @@ def _generate_manager_interpretation(
         deviations: List of manager deviation dictionaries
         total_manager_count: Total number of managers analyzed
         max_displayed: Maximum number of managers to display
-        qualified_managers: Dictionary mapping manager names to employee lists
+        qualified_managers: Mapping of manager names to employee lists
 
     Returns:
         Human-readable interpretation string
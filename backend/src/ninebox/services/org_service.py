@@ -15,9 +15,28 @@ duplicate name issues. Employee names can be duplicated in datasets, but
 employee IDs are guaranteed unique.
 """
 
-from dataclasses import dataclass
+import re
+from array import array
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import islice
 
 from ninebox.models.employee import Employee
+from ninebox.models.grid_positions import PERFORMANCE_BUCKETS
+
+_MT_LEVEL_PATTERN = re.compile(r"MT(\d+)")
+_DIGITS_PATTERN = re.compile(r"\d+")
+
+# Performance-bucket index of each grid position, in PERFORMANCE_BUCKETS order
+# (High, Medium, Low); positions outside 1-9 count in a final extra bucket
+_BUCKET_INDEX = {
+    position: index
+    for index, positions in enumerate(PERFORMANCE_BUCKETS.values())
+    for position in positions
+}
+_OUTSIDE_BUCKETS = len(PERFORMANCE_BUCKETS)
 
 
 @dataclass
@@ -27,14 +46,148 @@ class OrgValidationResult:
     Attributes:
         is_valid: Whether the org structure is valid
         circular_references: List of employee IDs involved in circular reporting chains
+            (members of a reporting cycle, and self-managed employees)
         orphaned_employees: List of employee IDs with invalid manager references
         errors: List of validation error messages
+        cycles: Every reporting cycle, as member IDs in reporting order (each
+            member's manager is the next one, the last reports to the first)
+        self_managed: Employee IDs whose manager reference resolves to themselves
     """
 
     is_valid: bool
     circular_references: list[int]
     orphaned_employees: list[int]
     errors: list[str]
+    cycles: list[list[int]] = field(default_factory=list)
+    self_managed: list[int] = field(default_factory=list)
+
+
+@dataclass
+class OrgRollup:
+    """Aggregates over every manager's organization (all direct and indirect reports).
+
+    The manager themselves is not counted. Only employees with at least one
+    report have entries.
+
+    Attributes:
+        grid_counts: Manager ID -> reports per grid position (index 0 = box 1,
+            index 8 = box 9); positions outside 1-9 are not counted
+        bucket_counts: Manager ID -> reports per performance bucket
+            ([high, medium, low, outside every bucket])
+        flag_counts: Manager ID -> number of reports carrying each flag
+    """
+
+    grid_counts: dict[int, list[int]]
+    bucket_counts: dict[int, list[int]]
+    flag_counts: dict[int, Counter[str]]
+
+
+@lru_cache(maxsize=1024)
+def _job_level_rank(job_level: str) -> int:
+    """Numeric seniority rank of a job level (see OrgService._get_job_level_rank)."""
+    job_level_upper = job_level.upper()
+
+    # Check for keywords first (most reliable)
+    if "VP" in job_level_upper or "VICE PRESIDENT" in job_level_upper:
+        return 60
+    if "DIRECTOR" in job_level_upper:
+        return 50
+    if "MANAGER" in job_level_upper:
+        return 40
+    if "SENIOR" in job_level_upper:
+        return 30
+    if "LEAD" in job_level_upper:
+        return 25
+
+    # Try to extract MT number (MT6 = 60, MT5 = 50, etc.)
+    match = _MT_LEVEL_PATTERN.search(job_level_upper)
+    if match:
+        return int(match.group(1)) * 10
+
+    # Try to extract any number
+    match = _DIGITS_PATTERN.search(job_level)
+    if match:
+        return int(match.group()) * 10
+
+    return 0  # Unknown level
+
+
+_CHAIN_FIELDS = tuple(f"management_chain_{level:02d}" for level in range(1, 7))
+
+
+def _chain_levels(employee: Employee) -> list[str | None]:
+    """An employee's management chain columns, level 01 first, with blanks as None."""
+    levels: list[str | None] = []
+    for field_name in _CHAIN_FIELDS:
+        name = getattr(employee, field_name)
+        levels.append(name if name and name != "None" else None)
+    return levels
+
+
+def _chain_is_bottom_up(levels: list[str | None], direct_manager: str) -> bool | None:
+    """Detect the orientation of filled-in chain columns.
+
+    Returns:
+        True if level 01 is the direct manager, False if the last filled level
+        is, None if neither end matches direct_manager
+    """
+    filled = [name for name in levels if name is not None]
+    if levels[0] == direct_manager:
+        return True
+    if filled and filled[-1] == direct_manager:
+        return False
+    return None
+
+
+def _management_chain_names(employee: Employee) -> list[str] | None:
+    """An employee's management chain columns as names, nearest manager first.
+
+    HR exports number the chain levels either from the employee upward
+    (level 01 = direct manager) or from the top down (the last filled level =
+    direct manager), so the orientation is taken from whichever end matches
+    direct_manager. Only the contiguous run of levels starting at the direct
+    manager is used.
+
+    Args:
+        employee: Employee to read
+
+    Returns:
+        Manager names nearest first; an empty list if the columns are not
+        filled in; None if they are filled in but neither end matches
+        direct_manager
+    """
+    levels = _chain_levels(employee)
+    filled = [position for position, name in enumerate(levels) if name is not None]
+    if not filled:
+        return []
+    bottom_up = _chain_is_bottom_up(levels, employee.direct_manager)
+    if bottom_up is None:
+        return None
+    run = levels if bottom_up else levels[filled[-1] :: -1]
+
+    names: list[str] = []
+    for name in run:
+        if name is None:
+            break
+        names.append(name)
+    return names
+
+
+def _rewrite_management_chain(employee: Employee, names: list[str], bottom_up: bool) -> None:
+    """Overwrite an employee's chain columns with new manager names, nearest first.
+
+    Top-down columns keep their last filled level as the direct manager, so
+    the topmost names are dropped if the new chain does not fit above it.
+    """
+    levels: list[str | None] = [None] * len(_CHAIN_FIELDS)
+    if bottom_up:
+        levels[: len(names)] = names[: len(levels)]
+    else:
+        last = max(position for position, name in enumerate(_chain_levels(employee)) if name)
+        for position, name in zip(range(last, -1, -1), names, strict=False):
+            levels[position] = name
+    for field_name, level in zip(_CHAIN_FIELDS, levels, strict=True):
+        setattr(employee, field_name, level)
 
 
 class OrgService:
@@ -48,6 +201,11 @@ class OrgService:
     The service uses employee_id as the primary key to avoid duplicate name issues.
     Employee names can be duplicated, but IDs are guaranteed unique.
 
+    The tree is stored as a DFS pre-order of all employees (nested sets): each
+    employee's organization is the contiguous run of positions between their
+    enter and exit indices, so team sizes and "is X under Y" checks are O(1)
+    and "all reports" is a slice, using O(N) memory regardless of depth.
+
     IMPORTANT: This service caches results based on the employee list provided in
     __init__. If employee data changes, create a new OrgService instance. The service
     validates the org structure on initialization to catch data quality issues early.
@@ -91,9 +249,33 @@ class OrgService:
         # Keep old single-ID mapping for backward compatibility
         self._name_to_id: dict[str, int] = {emp.name: emp.employee_id for emp in self._employees}
 
+        # Number of employees naming each manager, for duplicate-name tiebreaking,
+        # and the resolved top-two candidates per duplicated name (filled lazily)
+        self._report_counts: Counter[str] = Counter(emp.direct_manager for emp in self._employees)
+        self._ranked_candidates: dict[str, tuple[int, int | None]] = {}
+        # Duplicated names keyed by (name, their direct_manager), so a management
+        # chain's skip-level name picks out the right candidate (filled lazily)
+        self._candidates_by_manager: dict[tuple[str, str], list[int]] | None = None
+
         # Lazy-loaded caches
         self._org_tree: dict[int, list[Employee]] | None = None
         self._direct_reports: dict[int, list[Employee]] | None = None
+        self._manager_of: dict[int, int] = {}
+        # Employees whose manager reference could not be resolved, and those
+        # whose reference resolves to themselves (filled with direct reports)
+        self._orphaned: list[int] = []
+        self._self_managed: list[int] = []
+        self._validation: OrgValidationResult | None = None
+
+        # Interval encoding, built with the first tree query: employees in DFS
+        # pre-order, each employee's position, and subtree size per position
+        # (the employee plus all their reports)
+        self._preorder: list[Employee] | None = None
+        self._roots: list[Employee] = []
+        self._enter: dict[int, int] = {}
+        self._subtree_size = array("i")
+        # Whether the layout had to enter a reporting cycle (see preorder)
+        self._has_cycles = False
 
         # Validate structure if requested
         if validate:
@@ -107,7 +289,8 @@ class OrgService:
     def _get_job_level_rank(self, job_level: str) -> int:
         """Extract numeric rank from job level for tiebreaking.
 
-        Higher numbers = higher seniority (VP > Director > Manager > IC)
+        Higher numbers = higher seniority (VP > Director > Manager > IC). Ranks
+        are cached per job level string, since a dataset has only a handful.
 
         Args:
             job_level: Job level string (e.g., "MT6", "VP Engineering", "Director")
@@ -123,39 +306,14 @@ class OrgService:
             >>> _get_job_level_rank("Director Sales")
             50
         """
-        import re
-
-        job_level_upper = job_level.upper()
-
-        # Check for keywords first (most reliable)
-        if "VP" in job_level_upper or "VICE PRESIDENT" in job_level_upper:
-            return 60
-        if "DIRECTOR" in job_level_upper:
-            return 50
-        if "MANAGER" in job_level_upper:
-            return 40
-        if "SENIOR" in job_level_upper:
-            return 30
-        if "LEAD" in job_level_upper:
-            return 25
-
-        # Try to extract MT number (MT6 = 60, MT5 = 50, etc.)
-        match = re.search(r"MT(\d+)", job_level_upper)
-        if match:
-            level_num = int(match.group(1))
-            return level_num * 10
-
-        # Try to extract any number
-        match = re.search(r"\d+", job_level)
-        if match:
-            return int(match.group()) * 10
-
-        return 0  # Unknown level
+        return _job_level_rank(job_level)
 
     def _resolve_manager_id(self, manager_name: str, employee: Employee) -> int | None:
         """Resolve manager name to employee ID with duplicate name handling.
 
-        When multiple employees share the same name, uses tiebreaking logic:
+        When multiple employees share the same name and the employee's management
+        chain columns name the manager's own manager, the one candidate reporting
+        to that skip-level manager is chosen. Otherwise uses tiebreaking logic:
         1. Job level priority (VPs > Directors > Managers > ICs)
         2. Manager status (employees who have direct reports)
         3. First match if all else equal
@@ -190,49 +348,73 @@ class OrgService:
                 return None
             return candidate_id
 
-        # Multiple matches - apply tiebreakers
-        best_id = None
-        best_rank = -1
-        best_has_reports = False
+        # Multiple matches - the management chain names the manager's own
+        # manager, which identifies them if exactly one candidate reports there
+        chain = _management_chain_names(employee)
+        if chain is not None and len(chain) >= 2 and chain[0] == manager_name:
+            matches = [
+                candidate_id
+                for candidate_id in self._get_candidates_by_manager().get(
+                    (manager_name, chain[1]), ()
+                )
+                if candidate_id != employee.employee_id
+            ]
+            if len(matches) == 1:
+                return matches[0]
+
+        # Otherwise take the best candidate, or the runner-up if the best is the
+        # employee themselves
+        best_id, runner_up_id = self._rank_candidates(manager_name)
+        return runner_up_id if best_id == employee.employee_id else best_id
+
+    def _get_candidates_by_manager(self) -> dict[tuple[str, str], list[int]]:
+        """Index employees with duplicated names by (name, direct_manager), built once."""
+        if self._candidates_by_manager is None:
+            candidates: dict[tuple[str, str], list[int]] = {}
+            for emp in self._employees:
+                if len(self._name_to_ids[emp.name]) > 1:
+                    candidates.setdefault((emp.name, emp.direct_manager), []).append(
+                        emp.employee_id
+                    )
+            self._candidates_by_manager = candidates
+        return self._candidates_by_manager
 
-        for candidate_id in candidate_ids:
-            # Skip self-management
-            if candidate_id == employee.employee_id:
-                continue
+    def _rank_candidates(self, manager_name: str) -> tuple[int, int | None]:
+        """Find the two best candidates for a duplicated manager name (cached per name).
 
-            candidate = self._employee_by_id.get(candidate_id)
-            if not candidate:
-                continue
+        Candidates are ranked by job level, then by whether anyone else names
+        them as manager; ties go to the earlier employee. Report counts come
+        from the precomputed name index, so ranking costs O(candidates) once
+        per name and every later resolution is O(1).
 
-            # Tiebreaker 1: Job level rank
-            rank = self._get_job_level_rank(candidate.job_level)
+        Args:
+            manager_name: Name shared by several employees
 
-            # Tiebreaker 2: Manager status (has direct reports)
-            # Check if this candidate has any direct reports
-            has_reports = False
-            for emp in self._employees:
-                if emp.direct_manager == candidate.name and emp.employee_id != candidate_id:
-                    # Found at least one report
-                    has_reports = True
-                    break
-
-            # Determine if this candidate is better than current best
-            is_better = False
-            if best_id is None:
-                is_better = True
-            elif rank > best_rank:
-                # Higher job level wins
-                is_better = True
-            elif rank == best_rank and has_reports and not best_has_reports:
-                # Same job level, but this one has reports
-                is_better = True
-
-            if is_better:
-                best_id = candidate_id
-                best_rank = rank
-                best_has_reports = has_reports
-
-        return best_id
+        Returns:
+            (best, runner-up) employee IDs; runner-up is None if only one candidate
+        """
+        ranked = self._ranked_candidates.get(manager_name)
+        if ranked is not None:
+            return ranked
+
+        report_count = self._report_counts[manager_name]
+        best: tuple[tuple[int, bool], int] | None = None
+        runner_up: tuple[tuple[int, bool], int] | None = None
+        for candidate_id in self._name_to_ids[manager_name]:
+            candidate = self._employee_by_id[candidate_id]
+            # Tiebreaker 1: Job level rank
+            # Tiebreaker 2: Manager status (someone other than themselves names them)
+            has_reports = report_count - (candidate.direct_manager == manager_name) > 0
+            key = (_job_level_rank(candidate.job_level), has_reports)
+            if best is None or key > best[0]:
+                best, runner_up = (key, candidate_id), best
+            elif runner_up is None or key > runner_up[0]:
+                runner_up = (key, candidate_id)
+
+        assert best is not None  # nosec B101  # Type narrowing: the name has candidates
+        ranked = (best[1], runner_up[1] if runner_up is not None else None)
+        self._ranked_candidates[manager_name] = ranked
+        return ranked
 
     def build_org_tree(self) -> dict[int, list[Employee]]:
         """Build complete organizational tree with all reports (direct + indirect).
@@ -240,69 +422,109 @@ class OrgService:
         Returns a dictionary mapping manager employee IDs to all employees reporting
         to them (both directly and indirectly through the hierarchy).
 
+        This materializes a list per manager (O(N x depth) memory); prefer
+        get_all_reports(), get_team_size() and is_in_organization(), which
+        read the interval encoding directly.
+
         Returns:
             Dictionary where keys are manager employee_ids and values are lists of
-            all employees (direct and indirect reports) under that manager
+            all employees (direct and indirect) under that manager
 
         Example:
             >>> org_tree = org_service.build_org_tree()
             >>> ceo_org = org_tree[ceo.employee_id]  # All employees under CEO
             >>> len(ceo_org)  # Total employees reporting to CEO
             199
-
-        Implementation:
-            1. Build direct reports mapping
-            2. Recursively traverse hierarchy to get all indirect reports
-            3. Cache results for performance
         """
         if self._org_tree is not None:
             return self._org_tree
 
-        # Build direct reports first
-        direct_reports = self._build_direct_reports()
-
-        # Recursively build full org tree (direct + indirect reports)
-        org_tree: dict[int, list[Employee]] = {}
-
-        def get_all_reports_recursive(
-            manager_id: int, visited: set[int] | None = None
-        ) -> list[Employee]:
-            """Recursively get all employees under a manager.
-
-            Args:
-                manager_id: Employee ID of the manager
-                visited: Set of already-visited manager IDs (prevents infinite loops)
-
-            Returns:
-                List of all employees (direct + indirect) reporting to this manager
-            """
-            if visited is None:
-                visited = set()
-
-            # Prevent circular references
-            if manager_id in visited:
-                return []
+        self._org_tree = {
+            manager_id: self.get_all_reports(manager_id)
+            for manager_id in self._build_direct_reports()
+        }
+        return self._org_tree
 
-            visited.add(manager_id)
+    @property
+    def preorder(self) -> list[Employee]:
+        """All employees in DFS pre-order (do not modify).
 
-            all_reports = []
+        Every employee is followed directly by their whole organization, so
+        the organization of the employee at position i is preorder[i + 1 :
+        i + subtree size]. Roots (employees without a resolvable manager) are
+        visited in input order; a reporting cycle, which has no root, is
+        entered at the first of its members reached from below.
+        """
+        if self._preorder is None:
+            self._build_tree_index()
+        assert self._preorder is not None  # nosec B101  # Type narrowing
+        return self._preorder
 
-            # Get direct reports
-            if manager_id in direct_reports:
-                for emp in direct_reports[manager_id]:
-                    all_reports.append(emp)
-                    # Get their reports (indirect)
-                    all_reports.extend(get_all_reports_recursive(emp.employee_id, visited))
+    def get_roots(self) -> list[Employee]:
+        """Get the employees at the top of the tree.
 
-            return all_reports
+        Returns:
+            Employees without a resolvable manager (normally just the CEO), in
+            input order
 
-        # Build org tree for each manager
-        for manager_id in direct_reports:
-            org_tree[manager_id] = get_all_reports_recursive(manager_id)
+        Example:
+            >>> [emp.name for emp in org_service.get_roots()]
+            ['Mary Moore']
+        """
+        if self._preorder is None:
+            self._build_tree_index()
+        return list(self._roots)
 
-        # Cache the result
-        self._org_tree = org_tree
-        return org_tree
+    def _build_tree_index(self) -> None:
+        """Lay the tree out in DFS pre-order with subtree sizes (iterative, O(N))."""
+        direct_reports = self._build_direct_reports()
+        preorder: list[Employee] = []
+        enter: dict[int, int] = {}
+        subtree_size = array("i")
+        self._has_cycles = False
+
+        def visit(root: Employee) -> None:
+            enter[root.employee_id] = len(preorder)
+            preorder.append(root)
+            subtree_size.append(1)
+            stack = [(root.employee_id, iter(direct_reports.get(root.employee_id, ())))]
+            while stack:
+                employee_id, reports = stack[-1]
+                report = next(reports, None)
+                if report is None:
+                    stack.pop()
+                    position = enter[employee_id]
+                    subtree_size[position] = len(preorder) - position
+                elif report.employee_id not in enter:
+                    enter[report.employee_id] = len(preorder)
+                    preorder.append(report)
+                    subtree_size.append(1)
+                    stack.append(
+                        (report.employee_id, iter(direct_reports.get(report.employee_id, ())))
+                    )
+
+        roots = [emp for emp in self._employees if emp.employee_id not in self._manager_of]
+        for emp in roots:
+            if emp.employee_id not in enter:
+                visit(emp)
+
+        # Whatever is left sits in or below a reporting cycle; walk up to the cycle
+        # and enter it there so its members still get contiguous intervals
+        for emp in self._employees:
+            if emp.employee_id in enter:
+                continue
+            seen = {emp.employee_id}
+            employee_id = emp.employee_id
+            while self._manager_of[employee_id] not in seen:
+                employee_id = self._manager_of[employee_id]
+                seen.add(employee_id)
+            visit(self._employee_by_id[self._manager_of[employee_id]])
+            self._has_cycles = True
+
+        self._preorder = preorder
+        self._roots = roots
+        self._enter = enter
+        self._subtree_size = subtree_size
 
     def _build_direct_reports(self) -> dict[int, list[Employee]]:
         """Build mapping of managers to their direct reports only.
@@ -318,6 +540,8 @@ class OrgService:
             return self._direct_reports
 
         direct_reports: dict[int, list[Employee]] = {}
+        self._orphaned = []
+        self._self_managed = []
 
         for emp in self._employees:
             manager_identifier = emp.direct_manager
@@ -333,16 +557,22 @@ class OrgService:
             # Try to resolve as a name first (sample data uses names)
             if manager_identifier in self._name_to_ids:
                 manager_id = self._resolve_manager_id(manager_identifier, emp)
+                if manager_id is None:
+                    # The only employee with that name is the employee themselves
+                    self._self_managed.append(emp.employee_id)
+                    continue
             # If it's already an ID stored as string, convert it
             elif manager_identifier.isdigit():
                 manager_id = int(manager_identifier)
 
             # Skip if we couldn't resolve the manager or manager doesn't exist
             if manager_id is None or manager_id not in self._employee_by_id:
+                self._orphaned.append(emp.employee_id)
                 continue
 
             # Skip self-managed employees
             if manager_id == emp.employee_id:
+                self._self_managed.append(emp.employee_id)
                 continue
 
             # Add to direct reports
@@ -350,6 +580,7 @@ class OrgService:
                 direct_reports[manager_id] = []
 
             direct_reports[manager_id].append(emp)
+            self._manager_of[emp.employee_id] = manager_id
 
         # Cache the result
         self._direct_reports = direct_reports
@@ -379,21 +610,207 @@ class OrgService:
             employee_id: Employee ID of the manager
 
         Returns:
-            List of all employees (direct and indirect) reporting to this employee
+            List of all employees (direct and indirect) reporting to this employee,
+            in pre-order (a slice of preorder)
 
         Example:
             >>> all_team = org_service.get_all_reports(manager.employee_id)
             >>> len(all_team)  # Total org size under this manager
             25
         """
-        org_tree = self.build_org_tree()
-        return org_tree.get(employee_id, [])
+        subtree = self.get_subtree_range(employee_id)
+        if subtree is None:
+            return []
+        enter, exit_ = subtree
+        return self.preorder[enter + 1 : exit_]
+
+    def get_subtree_range(self, employee_id: int) -> tuple[int, int] | None:
+        """Get the pre-order interval of an employee and their organization.
+
+        Args:
+            employee_id: Employee ID
+
+        Returns:
+            (enter, exit) positions in preorder, exit exclusive, or None if the
+            employee is not in the dataset
+
+        Example:
+            >>> org_service.get_subtree_range(ceo.employee_id)
+            (0, 200)
+        """
+        if self._preorder is None:
+            self._build_tree_index()
+        enter = self._enter.get(employee_id)
+        if enter is None:
+            return None
+        return enter, enter + self._subtree_size[enter]
+
+    def get_team_size(self, employee_id: int) -> int:
+        """Count all reports (direct + indirect) of an employee in O(1).
+
+        Args:
+            employee_id: Employee ID of the manager
+
+        Returns:
+            Number of employees in their organization (0 if unknown or no reports)
+
+        Example:
+            >>> org_service.get_team_size(ceo.employee_id)
+            199
+        """
+        subtree = self.get_subtree_range(employee_id)
+        return subtree[1] - subtree[0] - 1 if subtree is not None else 0
+
+    def is_in_organization(self, employee_id: int, manager_id: int) -> bool:
+        """Check in O(1) whether an employee reports (directly or not) to a manager.
+
+        Args:
+            employee_id: Employee ID to check
+            manager_id: Employee ID of the manager
+
+        Returns:
+            True if the employee is in the manager's organization; an employee
+            is not in their own organization
+
+        Example:
+            >>> org_service.is_in_organization(engineer.employee_id, ceo.employee_id)
+            True
+        """
+        subtree = self.get_subtree_range(manager_id)
+        position = self._enter.get(employee_id)
+        if subtree is None or position is None:
+            return False
+        return subtree[0] < position < subtree[1]
+
+    def get_organization_members(self, manager_ids: Iterable[int]) -> list[Employee]:
+        """Get everyone under any of several managers, without duplicates.
+
+        The managers' pre-order intervals are merged, so a manager listed
+        together with one of their own reports contributes each employee
+        once, and the result is a concatenation of preorder slices.
+
+        Args:
+            manager_ids: Employee IDs of the managers (unknown IDs are ignored)
+
+        Returns:
+            Employees in the managers' organizations, in pre-order; the
+            managers themselves are included only if they report to another
+            of the listed managers
+
+        Example:
+            >>> members = org_service.get_organization_members([vp_a_id, vp_b_id])
+            >>> len(members)  # Both VPs' teams, sizes 40 and 25
+            65
+        """
+        ranges = sorted(
+            (subtree[0] + 1, subtree[1])
+            for subtree in map(self.get_subtree_range, manager_ids)
+            if subtree is not None
+        )
+        preorder = self.preorder
+        members: list[Employee] = []
+        covered = 0
+        for start, stop in ranges:
+            # Intervals are nested or disjoint, so skipping those that start
+            # before the covered prefix ends drops exactly the nested ones
+            if start >= covered:
+                members.extend(preorder[start:stop])
+                covered = stop
+        return members
+
+    def rollup(self) -> OrgRollup:
+        """Aggregate 9-box, performance-bucket and flag counts for every organization.
+
+        One post-order pass over the tree: each employee is added to their
+        manager's totals, and each manager's totals are then folded into their
+        own manager's. Stats for all managers cost O(N) in total rather than
+        O(sum of team sizes). The result reflects the employees' current grid
+        positions and flags and is not cached.
+
+        Returns:
+            OrgRollup keyed by manager employee ID
+
+        Example:
+            >>> rollup = org_service.rollup()
+            >>> rollup.bucket_counts[ceo.employee_id]
+            [41, 139, 19, 0]
+        """
+        preorder = self.preorder
+        grid_counts: dict[int, list[int]] = {}
+        bucket_counts: dict[int, list[int]] = {}
+        flag_counts: dict[int, Counter[str]] = {}
+
+        # Reverse pre-order visits every employee after their whole organization
+        for position in range(len(preorder) - 1, -1, -1):
+            emp = preorder[position]
+            manager_id = self._manager_of.get(emp.employee_id)
+            # A cycle's entry point has its manager inside its own organization
+            if manager_id is None or self._enter[manager_id] > position:
+                continue
+
+            grids = grid_counts.setdefault(manager_id, [0] * 9)
+            buckets = bucket_counts.setdefault(manager_id, [0] * (_OUTSIDE_BUCKETS + 1))
+            flags = flag_counts.setdefault(manager_id, Counter())
+            if 1 <= emp.grid_position <= 9:
+                grids[emp.grid_position - 1] += 1
+            buckets[_BUCKET_INDEX.get(emp.grid_position, _OUTSIDE_BUCKETS)] += 1
+            if emp.flags:
+                flags.update(emp.flags)
+
+            if emp.employee_id in grid_counts:
+                for box, count in enumerate(grid_counts[emp.employee_id]):
+                    grids[box] += count
+                for bucket, count in enumerate(bucket_counts[emp.employee_id]):
+                    buckets[bucket] += count
+                flags.update(flag_counts[emp.employee_id])
+
+        return OrgRollup(
+            grid_counts=grid_counts, bucket_counts=bucket_counts, flag_counts=flag_counts
+        )
+
+    def get_manager_id(self, employee_id: int) -> int | None:
+        """Get an employee's resolved direct manager in O(1).
+
+        Args:
+            employee_id: Employee ID
+
+        Returns:
+            Employee ID of the direct manager, or None for roots (no manager, or
+            a manager reference that does not resolve to another employee)
+
+        Example:
+            >>> org_service.get_manager_id(engineer.employee_id)
+            42
+        """
+        self._build_direct_reports()
+        return self._manager_of.get(employee_id)
+
+    def iter_managers(self, employee_id: int) -> Iterator[int]:
+        """Yield every manager whose organization contains an employee, nearest first.
+
+        This is the upward walk of the interval tree, so it agrees with
+        get_all_reports() and is_in_organization() even for reporting cycles
+        (the walk stops where the cycle was entered).
+
+        Args:
+            employee_id: Employee ID
+
+        Yields:
+            Manager employee IDs from the direct manager upward
+        """
+        if self._preorder is None:
+            self._build_tree_index()
+        manager_id = self._manager_of.get(employee_id)
+        while manager_id is not None and self.is_in_organization(employee_id, manager_id):
+            yield manager_id
+            employee_id, manager_id = manager_id, self._manager_of.get(manager_id)
 
     def get_reporting_chain(self, employee_id: int) -> list[int]:
         """Get the upward reporting chain from an employee to the CEO.
 
         Returns the chain of manager IDs from the employee's direct manager up to
-        the CEO (root of the tree).
+        the CEO (root of the tree). Each hop is a lookup in the resolved
+        manager index (see get_manager_id()), so no names are resolved here.
 
         Args:
             employee_id: Employee ID to get chain for
@@ -412,44 +829,45 @@ class OrgService:
         if employee_id not in self._employee_by_id:
             raise ValueError(f"Employee ID not found: {employee_id}")
 
-        emp = self._employee_by_id[employee_id]
-
-        # Build chain by following manager references
+        self._build_direct_reports()
         chain = []
         visited_ids = set()  # Prevent circular references
-        visited_names = set()  # Track manager names to detect cycles
-        current_employee: Employee | None = emp
-
-        while (
-            current_employee
-            and current_employee.direct_manager
-            and current_employee.direct_manager != "None"
-        ):
-            # Prevent circular references
-            if current_employee.direct_manager in visited_names:
-                break
-            visited_names.add(current_employee.direct_manager)
-
-            # Resolve manager name to ID using context-aware logic
-            manager_id = self._resolve_manager_id(current_employee.direct_manager, current_employee)
+        manager_id = self._manager_of.get(employee_id)
+        while manager_id is not None and manager_id not in visited_ids:
+            visited_ids.add(manager_id)
+            chain.append(manager_id)
+            manager_id = self._manager_of.get(manager_id)
 
-            if manager_id is None:
-                # Manager not found or couldn't be resolved
-                break
+        return chain
 
-            # Prevent circular references by ID
-            if manager_id in visited_ids:
-                break
-            visited_ids.add(manager_id)
+    def find_chain_inconsistencies(self) -> list[int]:
+        """Find employees whose management chain columns disagree with the tree.
 
-            chain.append(manager_id)
+        The chain columns of each employee are compared, level by level, with
+        the names along their resolved reporting chain (which follows
+        direct_manager). Employees without chain columns are skipped.
 
-            # Move up the chain
-            current_employee = self._employee_by_id.get(manager_id)
-            if not current_employee:
-                break
+        Returns:
+            IDs of employees whose chain columns match neither end of
+            direct_manager, or name someone other than their resolved
+            manager, skip-level manager, and so on
 
-        return chain
+        Example:
+            >>> org_service.find_chain_inconsistencies()
+            []
+        """
+        inconsistent = []
+        for emp in self._employees:
+            names = _management_chain_names(emp)
+            if names == []:
+                continue
+            if names is not None:
+                chain = self.get_reporting_chain(emp.employee_id)[: len(names)]
+                resolved = [self._employee_by_id[manager_id].name for manager_id in chain]
+                if resolved == names:
+                    continue
+            inconsistent.append(emp.employee_id)
+        return inconsistent
 
     def find_managers(self, min_team_size: int = 1) -> list[int]:
         """Find all employees who have at least N total employees reporting to them.
@@ -466,11 +884,166 @@ class OrgService:
             >>> len(large_team_managers)
             15
         """
-        org_tree = self.build_org_tree()
         return [
-            manager_id for manager_id, reports in org_tree.items() if len(reports) >= min_team_size
+            manager_id
+            for manager_id in self._build_direct_reports()
+            if self.get_team_size(manager_id) >= min_team_size
         ]
 
+    def reassign_manager(
+        self, employee_id: int, new_manager_id: int, previous_manager: str
+    ) -> None:
+        """Move an employee, with their whole organization, under a new manager.
+
+        Call this after setting the employee's direct_manager to the new
+        manager's name. The tree is updated in place rather than rebuilt: the
+        employee's subtree is moved as one block in the pre-order, subtree
+        sizes change only along the paths from the old and the new manager up
+        to their closest common manager, and only positions between the old
+        and new location are renumbered. The employee becomes the new
+        manager's last direct report; other employees keep their resolved
+        managers.
+
+        Filled-in management chain columns of the moved organization are
+        rewritten to the new reporting line (keeping their orientation), so
+        duplicated names still resolve the same way when the employees are
+        loaded again.
+
+        If the tree contains a reporting cycle, the layout is recomputed from
+        the (already resolved) manager links on next use instead.
+
+        Args:
+            employee_id: Employee ID to move
+            new_manager_id: Employee ID of the new manager (picked by ID, so a
+                duplicated name is not re-resolved)
+            previous_manager: The employee's direct_manager before the change
+
+        Raises:
+            ValueError: If either employee is unknown, or the new manager is
+                the employee or someone in their organization
+
+        Example:
+            >>> employee.direct_manager = new_manager.name
+            >>> org_service.reassign_manager(
+            ...     employee.employee_id, new_manager.employee_id, "Old Boss"
+            ... )
+            >>> org_service.get_manager_id(employee.employee_id) == new_manager.employee_id
+            True
+        """
+        employee = self._employee_by_id.get(employee_id)
+        if employee is None:
+            raise ValueError(f"Employee ID not found: {employee_id}")
+        if new_manager_id not in self._employee_by_id:
+            raise ValueError(f"Manager ID not found: {new_manager_id}")
+        if new_manager_id == employee_id or self.is_in_organization(new_manager_id, employee_id):
+            raise ValueError(
+                f"Employee {new_manager_id} is in the organization of employee {employee_id}; "
+                "reporting to them would create a reporting cycle"
+            )
+
+        # Chain orientations, read before the managers change
+        moved = [employee, *self.get_all_reports(employee_id)]
+        orientations = [
+            _chain_is_bottom_up(
+                _chain_levels(emp),
+                previous_manager if emp is employee else emp.direct_manager,
+            )
+            for emp in moved
+        ]
+
+        # Name indexes used to resolve duplicated manager names
+        self._report_counts[previous_manager] -= 1
+        self._report_counts[employee.direct_manager] += 1
+        self._ranked_candidates.pop(previous_manager, None)
+        self._ranked_candidates.pop(employee.direct_manager, None)
+        if self._candidates_by_manager is not None and len(self._name_to_ids[employee.name]) > 1:
+            old_key = (employee.name, previous_manager)
+            self._candidates_by_manager[old_key].remove(employee_id)
+            if not self._candidates_by_manager[old_key]:
+                del self._candidates_by_manager[old_key]
+            self._candidates_by_manager.setdefault(
+                (employee.name, employee.direct_manager), []
+            ).append(employee_id)
+
+        direct_reports = self._build_direct_reports()
+        # Built by is_in_organization()
+        assert self._preorder is not None  # nosec B101  # Type narrowing
+        old_manager_id = self._manager_of.get(employee_id)
+        if self._has_cycles:
+            self._preorder = None
+        else:
+            self._move_subtree(employee_id, new_manager_id)
+
+        if old_manager_id is not None:
+            reports = direct_reports[old_manager_id]
+            del reports[next(i for i, report in enumerate(reports) if report is employee)]
+            if not reports:
+                del direct_reports[old_manager_id]
+        elif self._preorder is not None:
+            self._roots = [root for root in self._roots if root is not employee]
+        direct_reports.setdefault(new_manager_id, []).append(employee)
+        self._manager_of[employee_id] = new_manager_id
+
+        if employee_id in self._orphaned:
+            self._orphaned.remove(employee_id)
+        if employee_id in self._self_managed:
+            self._self_managed.remove(employee_id)
+        self._org_tree = None
+        self._validation = None
+
+        for emp, bottom_up in zip(moved, orientations, strict=True):
+            if bottom_up is not None:
+                names = [
+                    self._employee_by_id[manager_id].name
+                    for manager_id in islice(
+                        self.iter_managers(emp.employee_id), len(_CHAIN_FIELDS)
+                    )
+                ]
+                _rewrite_management_chain(emp, names, bottom_up)
+
+    def _move_subtree(self, employee_id: int, new_manager_id: int) -> None:
+        """Relocate an employee's pre-order block to the end of the new manager's organization.
+
+        Must run before the employee's manager link is updated, so the old
+        ancestry can still be walked.
+        """
+        preorder = self.preorder
+        enter = self._enter
+        sizes = self._subtree_size
+        start = enter[employee_id]
+        size = sizes[start]
+        stop = start + size
+        manager_enter = enter[new_manager_id]
+        insert_at = manager_enter + sizes[manager_enter]
+
+        # Sizes change only below the closest common manager of both positions
+        old_path = list(self.iter_managers(employee_id))
+        old_ancestors = set(old_path)
+        new_path = [new_manager_id, *self.iter_managers(new_manager_id)]
+        common = None
+        for manager_id in new_path:
+            if manager_id in old_ancestors:
+                common = manager_id
+                break
+            sizes[enter[manager_id]] += size
+        for manager_id in old_path:
+            if manager_id == common:
+                break
+            sizes[enter[manager_id]] -= size
+
+        # The new location is either before the block or after it (the new
+        # manager is not inside it), so rotate the span between the two
+        if insert_at <= start:
+            low, high = insert_at, stop
+            preorder[low:high] = preorder[start:stop] + preorder[low:start]
+            sizes[low:high] = sizes[start:stop] + sizes[low:start]
+        else:
+            low, high = start, insert_at
+            preorder[low:high] = preorder[stop:insert_at] + preorder[start:stop]
+            sizes[low:high] = sizes[stop:insert_at] + sizes[start:stop]
+        for position in range(low, high):
+            enter[preorder[position].employee_id] = position
+
     def validate_structure(self) -> OrgValidationResult:
         """Validate the organizational structure for consistency and correctness.
 
@@ -479,6 +1052,11 @@ class OrgService:
         - Orphaned employees (manager doesn't exist in dataset)
         - Self-managed employees (manager is themselves)
 
+        Orphans and self-managers are recorded while resolving managers; cycles
+        are found by one iterative DFS over the resolved manager links that
+        colours each employee once, so validation is O(N) regardless of depth.
+        The result is cached with the tree.
+
         Returns:
             OrgValidationResult with validation status and any issues found
 
@@ -487,53 +1065,70 @@ class OrgService:
             >>> if not result.is_valid:
             ...     print(f"Errors: {result.errors}")
         """
-        errors = []
-        circular_refs = []
-        orphaned = []
+        if self._validation is not None:
+            return self._validation
 
-        # Check each employee
-        for emp in self._employees:
-            manager = emp.direct_manager
+        self._build_direct_reports()
+        errors = []
 
-            if not manager or manager == "None":
-                continue  # CEO or no manager is valid
+        for employee_id in self._self_managed:
+            emp = self._employee_by_id[employee_id]
+            errors.append(f"Employee {emp.name} (ID: {employee_id}) is self-managed")
+
+        for employee_id in self._orphaned:
+            emp = self._employee_by_id[employee_id]
+            errors.append(
+                f"Employee {emp.name} (ID: {employee_id}) has invalid manager reference: "
+                f"{emp.direct_manager}"
+            )
+
+        cycles = self._find_cycles()
+        for cycle in cycles:
+            names = " -> ".join(self._employee_by_id[member].name for member in cycle)
+            errors.append(f"Circular reference detected: {names} (IDs: {cycle})")
+
+        self._validation = OrgValidationResult(
+            is_valid=len(errors) == 0,
+            circular_references=self._self_managed
+            + [member for cycle in cycles for member in cycle],
+            orphaned_employees=list(self._orphaned),
+            errors=errors,
+            cycles=cycles,
+            self_managed=list(self._self_managed),
+        )
+        return self._validation
 
-            # Resolve manager name to ID
-            if manager in self._name_to_ids:
-                manager_id = self._resolve_manager_id(manager, emp)
-                if manager_id is None:
-                    # Could not resolve (e.g., self-management case)
-                    errors.append(f"Employee {emp.name} (ID: {emp.employee_id}) is self-managed")
-                    circular_refs.append(emp.employee_id)
-                    continue
-            else:
-                # Manager doesn't exist in dataset
-                errors.append(
-                    f"Employee {emp.name} (ID: {emp.employee_id}) has invalid manager reference: {manager}"
-                )
-                orphaned.append(emp.employee_id)
-                continue
+    def _find_cycles(self) -> list[list[int]]:
+        """Find every reporting cycle in the resolved manager links.
 
-            # Check for circular references by following the chain
-            # A cycle exists if any manager appears twice in the chain
-            chain = self.get_reporting_chain(emp.employee_id)
-            if len(chain) != len(set(chain)):
-                # Find duplicate IDs to report in error message
-                duplicates = [id for id in set(chain) if chain.count(id) > 1]
-                errors.append(
-                    f"Circular reference detected: {emp.name} (ID: {emp.employee_id}) "
-                    f"has duplicate managers in chain: {duplicates}"
-                )
-                circular_refs.append(emp.employee_id)
+        Each employee has at most one manager, so walking up from an
+        unvisited employee is a DFS path. Employees on the current path are
+        "in progress"; reaching one of them again closes a cycle, while
+        reaching a finished employee or a root ends the walk. Every employee
+        is entered and finished exactly once.
 
-        is_valid = len(errors) == 0
+        Returns:
+            Cycles as member IDs in reporting order, in input order of the
+            employee that first reached them
+        """
+        in_progress, finished = 1, 2
+        colour: dict[int, int] = {}
+        manager_of = self._manager_of
+        cycles: list[list[int]] = []
 
-        return OrgValidationResult(
-            is_valid=is_valid,
-            circular_references=circular_refs,
-            orphaned_employees=orphaned,
-            errors=errors,
-        )
+        for emp in self._employees:
+            path: list[int] = []
+            current: int | None = emp.employee_id
+            while current is not None and current not in colour:
+                colour[current] = in_progress
+                path.append(current)
+                current = manager_of.get(current)
+            if current is not None and colour[current] == in_progress:
+                cycles.append(path[path.index(current) :])
+            for member in path:
+                colour[member] = finished
+
+        return cycles
 
     def get_employee_by_id(self, employee_id: int) -> Employee | None:
         """Get an employee by their ID.
@@ -573,3 +1168,18 @@ class OrgService:
             employee_id = employee_ids[0]
             return self._employee_by_id.get(employee_id)
         return None
+
+    def get_employee_ids_by_name(self, name: str) -> list[int]:
+        """Get the IDs of every employee with a given name.
+
+        Args:
+            name: Employee name to look up
+
+        Returns:
+            Employee IDs in input order (empty if no employee has the name)
+
+        Example:
+            >>> org_service.get_employee_ids_by_name("Alice Smith")
+            [123, 456]
+        """
+        return list(self._name_to_ids.get(name, ()))
@@ -14,12 +14,17 @@ from ninebox.models.events import (
     FlagAddEvent,
     FlagRemoveEvent,
     GridMoveEvent,
+    ReportingLineChangeEvent,
 )
 from ninebox.models.grid_positions import calculate_grid_position
 from ninebox.models.session import SessionState
+from ninebox.services.analysis_frame import AnalysisFrame
+from ninebox.services.analysis_registry import ANALYSIS_CACHE
 from ninebox.services.database import DatabaseManager
+from ninebox.services.employee_index import EmployeeIndex
 from ninebox.services.event_manager import EventManager
 from ninebox.services.excel_parser import JobFunctionConfig
+from ninebox.services.org_service import OrgService
 from ninebox.services.session_serializer import SessionSerializer
 
 logger = logging.getLogger(__name__)
@@ -48,6 +53,13 @@ class SessionManager:
         self._sessions: dict[str, SessionState] = {}
         self._sessions_loaded: bool = False
         self.event_manager = EventManager(self)
+        # Per-session filter indexes, built on first use and kept current on mutation
+        self._employee_indexes: dict[str, EmployeeIndex] = {}
+        # Per-session analysis frames, whose contingency tables follow grid moves
+        self._analysis_frames: dict[str, AnalysisFrame] = {}
+        # Distinguishes this process's revisions from those of an earlier run,
+        # since revisions restart at 0 when sessions are restored
+        self._epoch = uuid.uuid4().hex[:12]
 
     @property
     def sessions(self) -> dict[str, SessionState]:
@@ -110,6 +122,8 @@ class SessionManager:
         )
 
         self._sessions[user_id] = session
+        self._employee_indexes.pop(user_id, None)
+        self._analysis_frames.pop(user_id, None)
         self._persist_session(session)
         return session_id
 
@@ -129,10 +143,114 @@ class SessionManager:
         self._ensure_sessions_loaded()
         if user_id in self.sessions:
             self._delete_session_from_db(user_id)
+            ANALYSIS_CACHE.invalidate_session(self._sessions[user_id].session_id)
             del self._sessions[user_id]
+            self._employee_indexes.pop(user_id, None)
+            self._analysis_frames.pop(user_id, None)
             return True
         return False
 
+    def get_employee_index(self, user_id: str) -> EmployeeIndex | None:
+        """Get the filter index for a session's current employees.
+
+        The index is built on first request and then maintained incrementally
+        by the mutation methods of this class, so repeated filter requests do
+        not rescan the employee list.
+
+        Sessions are lazily loaded from database on first access.
+
+        Args:
+            user_id: User session identifier
+
+        Returns:
+            EmployeeIndex over session.current_employees, or None if no session exists
+        """
+        self._ensure_sessions_loaded()
+        session = self.sessions.get(user_id)
+        if not session:
+            return None
+
+        index = self._employee_indexes.get(user_id)
+        if index is None or not index.covers(session.current_employees):
+            index = EmployeeIndex(session.current_employees, session.original_employees)
+            self._employee_indexes[user_id] = index
+        return index
+
+    def get_analysis_frame(self, user_id: str) -> AnalysisFrame | None:
+        """Get the intelligence analysis frame for a session's current employees.
+
+        The frame is built on first request; afterwards grid moves update its
+        memoized contingency tables and manager tallies in place, so the next
+        intelligence run only recomputes the test statistics.
+
+        Sessions are lazily loaded from database on first access.
+
+        Args:
+            user_id: User session identifier
+
+        Returns:
+            AnalysisFrame over session.current_employees, or None if no session exists
+        """
+        self._ensure_sessions_loaded()
+        session = self.sessions.get(user_id)
+        if not session:
+            return None
+
+        frame = self._analysis_frames.get(user_id)
+        if frame is None or not frame.covers(session.current_employees):
+            frame = AnalysisFrame.from_employees(session.current_employees)
+            self._analysis_frames[user_id] = frame
+        return frame
+
+    def get_org_service(self, user_id: str) -> OrgService | None:
+        """Get the org index for a session's current employees.
+
+        The index lives on the session's analysis frame, so the org-hierarchy
+        endpoints, the calibration summary and the manager analyses share one
+        tree. It is built on first request and kept across session revisions
+        until a manager, name or job level changes or the employee list is
+        replaced.
+
+        Sessions are lazily loaded from database on first access.
+
+        Args:
+            user_id: User session identifier
+
+        Returns:
+            Unvalidated OrgService over session.current_employees, or None if
+            no session exists
+        """
+        frame = self.get_analysis_frame(user_id)
+        return frame.org_service if frame is not None else None
+
+    def get_revision_tag(self, session: SessionState) -> str:
+        """Get a token identifying the current state of a session.
+
+        The token changes whenever the session is mutated (see
+        SessionState.revision), when a new session replaces it, and when the
+        backend restarts, so it is safe to use as the basis of an ETag.
+
+        Args:
+            session: Session returned by get_session()
+
+        Returns:
+            Revision token
+
+        Example:
+            >>> manager.get_revision_tag(manager.get_session("user1"))
+            '3f9c2a1b7d4e:5b0e...:12'
+        """
+        return f"{self._epoch}:{session.session_id}:{session.revision}"
+
+    def _reindex_employee(self, user_id: str, employee_id: int) -> None:
+        """Refresh one employee in the session's filter index and analysis frame, if built."""
+        index = self._employee_indexes.get(user_id)
+        if index is not None:
+            index.update_employee(employee_id)
+        frame = self._analysis_frames.get(user_id)
+        if frame is not None:
+            frame.update_employee(employee_id)
+
     def move_employee(
         self,
         user_id: str,
@@ -220,6 +338,7 @@ class SessionManager:
         employee.potential = new_potential
         employee.grid_position = new_position
         employee.last_modified = now
+        self._reindex_employee(user_id, employee_id)
 
         # Track event (EventManager handles net-zero logic and persistence)
         self.event_manager.track_event(session, event, original_employee)
@@ -228,14 +347,170 @@ class SessionManager:
         has_grid_events = any(
             e.employee_id == employee_id and e.event_type == "grid_move" for e in session.events
         )
-        has_flag_events = any(
-            e.employee_id == employee_id and e.event_type in ["flag_add", "flag_remove"]
+        has_other_events = any(
+            e.employee_id == employee_id
+            and e.event_type in ["flag_add", "flag_remove", "reporting_line_change"]
             for e in session.events
         )
-        employee.modified_in_session = has_grid_events or has_flag_events
+        employee.modified_in_session = has_grid_events or has_other_events
 
         return event
 
+    def reassign_manager(
+        self, user_id: str, employee_id: int, new_manager_id: int
+    ) -> ReportingLineChangeEvent:
+        """Move an employee (with their organization) under a different manager.
+
+        Creates a ReportingLineChangeEvent and uses EventManager to track it.
+        The event is removed when the employee is moved back to their
+        original manager.
+
+        Sessions are lazily loaded from database on first access.
+
+        Args:
+            user_id: User session identifier
+            employee_id: Employee to move
+            new_manager_id: Employee ID of the new manager
+
+        Returns:
+            ReportingLineChangeEvent: The reporting line change event
+
+        Raises:
+            ValueError: If no active session, either employee is not found, the
+                new manager's name is shared by several employees, or the move
+                would create a reporting cycle
+
+        Example:
+            >>> manager.reassign_manager("user1", 123, 45)
+            ReportingLineChangeEvent(employee_id=123, old_manager_id=12, new_manager_id=45, ...)
+        """
+        return self.reassign_managers(user_id, {employee_id: new_manager_id})[0]
+
+    def reassign_managers(
+        self, user_id: str, assignments: dict[int, int]
+    ) -> list[ReportingLineChangeEvent]:
+        """Move several employees under new managers in one step.
+
+        Assignments are applied in order, each against the structure left by
+        the previous ones, and the session is persisted once. All of them are
+        validated before anything changes, so a batch that would create a
+        reporting cycle is rejected as a whole.
+
+        The session's org index is updated in place rather than rebuilt (see
+        OrgService.reassign_manager), so re-org exploration on large
+        organizations stays interactive.
+
+        Sessions are lazily loaded from database on first access.
+
+        Args:
+            user_id: User session identifier
+            assignments: Employee ID -> employee ID of their new manager
+
+        Returns:
+            One ReportingLineChangeEvent per assignment, in order
+
+        Raises:
+            ValueError: If no active session, any employee is not found, a new
+                manager's name is shared by several employees (it could not be
+                told apart when the session is reloaded), or the assignments
+                would create a reporting cycle
+
+        Example:
+            >>> manager.reassign_managers("user1", {123: 45, 124: 45})
+            [ReportingLineChangeEvent(employee_id=123, ...),
+             ReportingLineChangeEvent(employee_id=124, ...)]
+        """
+        self._ensure_sessions_loaded()
+        session = self.sessions.get(user_id)
+        if not session:
+            raise ValueError("No active session")
+
+        frame = self.get_analysis_frame(user_id)
+        if frame is None:
+            raise ValueError("No active session")
+        org_service = frame.org_service
+
+        # Validate against the structure as it will be after each assignment
+        originals = {
+            e.employee_id: e for e in session.original_employees if e.employee_id in assignments
+        }
+        changes: list[tuple[Employee, Employee, Employee]] = []
+        pending: dict[int, int] = {}
+        for employee_id, new_manager_id in assignments.items():
+            employee = org_service.get_employee_by_id(employee_id)
+            new_manager = org_service.get_employee_by_id(new_manager_id)
+            if employee is None:
+                raise ValueError(f"Employee {employee_id} not found")
+            if new_manager is None:
+                raise ValueError(f"Employee {new_manager_id} not found")
+            # direct_manager stores a name, which must lead back to this manager on reload
+            if len(org_service.get_employee_ids_by_name(new_manager.name)) > 1:
+                raise ValueError(
+                    f"Employee {employee_id} cannot report to employee {new_manager_id}: "
+                    f"the name '{new_manager.name}' is shared by several employees"
+                )
+            original_employee = originals.get(employee_id)
+            if not original_employee:
+                raise ValueError(f"Original employee {employee_id} not found")
+            manager_id: int | None = new_manager_id
+            visited = set()
+            while manager_id is not None and manager_id not in visited:
+                if manager_id == employee_id:
+                    raise ValueError(
+                        f"Employee {employee_id} cannot report to employee {new_manager_id}: "
+                        "this would create a reporting cycle"
+                    )
+                visited.add(manager_id)
+                manager_id = pending.get(manager_id, org_service.get_manager_id(manager_id))
+            pending[employee_id] = new_manager_id
+            changes.append((employee, new_manager, original_employee))
+
+        now = datetime.now(timezone.utc)
+        events = []
+        for employee, new_manager, original_employee in changes:
+            employee_id = employee.employee_id
+            new_manager_id = new_manager.employee_id
+
+            # Keep the pre-session manager from an earlier change, to track the net change
+            existing_event = next(
+                (
+                    e
+                    for e in session.events
+                    if e.employee_id == employee_id and e.event_type == "reporting_line_change"
+                ),
+                None,
+            )
+            event = ReportingLineChangeEvent(
+                employee_id=employee_id,
+                employee_name=employee.name,
+                timestamp=now,
+                old_manager_id=(
+                    existing_event.old_manager_id
+                    if existing_event
+                    else org_service.get_manager_id(employee_id)
+                ),
+                old_manager_name=(
+                    existing_event.old_manager_name if existing_event else employee.direct_manager
+                ),
+                new_manager_id=new_manager_id,
+                new_manager_name=new_manager.name,
+            )
+
+            previous_manager = employee.direct_manager
+            employee.direct_manager = new_manager.name
+            employee.last_modified = now
+            frame.reassign_manager(employee_id, new_manager_id, previous_manager)
+            index = self._employee_indexes.get(user_id)
+            if index is not None:
+                index.update_employee(employee_id)
+
+            self.event_manager.track_event(session, event, original_employee, persist=False)
+            employee.modified_in_session = any(e.employee_id == employee_id for e in session.events)
+            events.append(event)
+
+        self._persist_session(session)
+        return events
+
     def update_change_notes(self, user_id: str, employee_id: int, notes: str) -> Event | None:
         """Update notes for an employee's grid move event.
 
@@ -535,12 +810,14 @@ class SessionManager:
         # Update employee
         employee.flags = new_flags
         employee.last_modified = now
+        self._reindex_employee(user_id, employee_id)
 
         # Update modified status
         original_flags = set((original_employee.flags or []) if original_employee else [])
         has_flag_changes = new_flags_set != original_flags
         has_other_events = any(
-            e.employee_id == employee_id and e.event_type in ["grid_move", "donut_move"]
+            e.employee_id == employee_id
+            and e.event_type in ["grid_move", "donut_move", "reporting_line_change"]
             for e in session.events
         )
         employee.modified_in_session = has_flag_changes or has_other_events
@@ -639,6 +916,9 @@ class SessionManager:
         Serializes the session and saves it to the SQLite database.
         Uses INSERT OR REPLACE to handle both new sessions and updates.
 
+        Every mutation of a session ends here, so this is also where the
+        session revision is bumped and its cached analysis results dropped.
+
         Args:
             session: SessionState object to persist
 
@@ -650,6 +930,9 @@ class SessionManager:
             >>> manager._persist_session(session)
             # Session is now saved to database
         """
+        session.revision += 1
+        ANALYSIS_CACHE.invalidate_session(session.session_id)
+
         try:
             data = SessionSerializer.serialize(session)
 
@@ -209,7 +209,7 @@ class SessionSerializer:
 
         Uses Pydantic's discriminated union to automatically deserialize
         to the correct event type (GridMoveEvent, DonutMoveEvent, FlagAddEvent,
-        FlagRemoveEvent) based on the event_type field.
+        FlagRemoveEvent, ReportingLineChangeEvent) based on the event_type field.
 
         Handles:
         - Converting datetime strings to datetime objects
@@ -248,6 +248,7 @@ class SessionSerializer:
             FlagAddEvent,
             FlagRemoveEvent,
             GridMoveEvent,
+            ReportingLineChangeEvent,
         )
 
         # Use discriminated union - Pydantic will pick the right type based on event_type
@@ -260,6 +261,8 @@ class SessionSerializer:
             return FlagAddEvent.model_validate(data)
         elif event_type == "flag_remove":
             return FlagRemoveEvent.model_validate(data)
+        elif event_type == "reporting_line_change":
+            return ReportingLineChangeEvent.model_validate(data)
         else:
             # Fallback - let Pydantic figure it out
             return Event.model_validate(data)  # type: ignore[return-value, attr-defined, no-any-return]
@@ -0,0 +1,92 @@
+"""ETag helpers for conditional GETs on session-derived read endpoints.
+
+Read endpoints (employees, statistics, intelligence, calibration summary) are
+pure functions of the session state and the request query. Their ETag is
+therefore derived from the session revision token and the query alone, which
+lets an endpoint answer a matching If-None-Match with 304 before doing any
+computation or serialization.
+"""
+
+import hashlib
+
+from fastapi import Request, Response, status
+
+# Tell browsers to store responses but revalidate every time, so repeat polls
+# send If-None-Match automatically and unchanged data comes back as a 304.
+CACHE_CONTROL = "no-cache"
+
+
+def make_etag(revision_tag: str, request: Request) -> str:
+    """
+    Build a weak ETag from a session revision token and the request query.
+
+    Query parameters are sorted so equivalent requests share an ETag
+    regardless of parameter order.
+
+    Args:
+        revision_tag: Token from SessionManager.get_revision_tag()
+        request: Incoming request (path and query parameters are included)
+
+    Returns:
+        Weak ETag header value, e.g. W/"1b2c..."
+
+    Examples:
+        >>> make_etag("abc:session-1:3", request)
+        'W/"5d41402abc4b2a76b9719d911017c592"'
+    """
+    query = sorted(request.query_params.multi_items())
+    key = f"{revision_tag}|{request.url.path}|{query}"
+    digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+    return f'W/"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """
+    Check whether the request's If-None-Match header matches an ETag.
+
+    Uses weak comparison as required for If-None-Match (RFC 9110), so W/
+    prefixes are ignored on both sides.
+
+    Args:
+        request: Incoming request
+        etag: Current ETag of the resource
+
+    Returns:
+        True if the client's cached representation is still current
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+
+    opaque = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque for candidate in header.split(","))
+
+
+def not_modified_response(etag: str) -> Response:
+    """
+    Build an empty 304 Not Modified response for an ETag.
+
+    Args:
+        etag: Current ETag of the resource
+
+    Returns:
+        304 response carrying the ETag and cache headers
+    """
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": CACHE_CONTROL},
+    )
+
+
+def set_etag_headers(response: Response, etag: str) -> None:
+    """
+    Attach the ETag and cache headers to a successful response.
+
+    Args:
+        response: Response to decorate (the injected response for dict returns)
+        etag: Current ETag of the resource
+    """
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
@@ -0,0 +1,46 @@
+"""Fast JSON response for payloads that are already JSON-compatible.
+
+FastAPI normally runs every returned dict through jsonable_encoder before
+serializing it, which walks each employee dict a second time. Endpoints that
+build their payload with model_dump(mode="json") can return a FastJSONResponse
+instead and skip that pass. orjson is used when it is installed; otherwise the
+standard library encoder produces the same compact output Starlette would.
+"""
+
+import json
+from typing import Any
+
+from fastapi.responses import Response
+
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:  # pragma: no cover - depends on the installed environment
+    _HAS_ORJSON = False
+
+
+class FastJSONResponse(Response):
+    """JSON response that serializes JSON-compatible content directly.
+
+    Content must contain only JSON types (dict, list, str, int, float, bool,
+    None), e.g. the output of model_dump(mode="json").
+
+    Example:
+        >>> data = [e.model_dump(mode="json") for e in employees]
+        >>> return FastJSONResponse({"employees": data})
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        """Serialize content to JSON bytes."""
+        if _HAS_ORJSON:
+            return orjson.dumps(content)
+        return json.dumps(
+            content,
+            ensure_ascii=False,
+            allow_nan=False,
+            indent=None,
+            separators=(",", ":"),
+        ).encode("utf-8")
@@ -0,0 +1,450 @@
+"""NumPy-backed statistical functions with the same API as pure_statistics.
+
+Each function mirrors its pure_statistics counterpart (same arguments, same
+return types, same exceptions) but does the per-cell work as array operations.
+Tables are still accepted and returned as nested lists so callers never see
+NumPy types.
+
+Results agree with pure_statistics to floating point precision:
+- Per-cell terms (expected frequencies, z-scores, chi-square contributions)
+  use the same IEEE operations and are bit-for-bit identical
+- Chi-square statistics sum the per-cell terms in the same order as the pure
+  loops, so they are identical too
+- P-values reuse the pure incomplete gamma implementation
+- Fisher's exact test and the exact multinomial test use a vectorized
+  log-factorial table, which can differ from the pure implementation in the
+  last few bits
+- Monte-Carlo multinomial p-values are reproducible for a given seed but come
+  from NumPy's generator, so they differ from pure_statistics' estimates
+
+Importing this module raises ImportError when NumPy is not installed; use
+ninebox.utils.stats_backend to get whichever implementation is available.
+"""
+
+import threading
+import time
+from functools import lru_cache
+from typing import Any, cast
+
+import numpy as np
+
+from ninebox.utils.pure_statistics import (
+    MULTINOMIAL_MAX_EXACT_OUTCOMES,
+    MULTINOMIAL_NULL_CACHE_SIZE,
+    MULTINOMIAL_SEED,
+    MULTINOMIAL_SIMULATIONS,
+    _multinomial_method,
+    _validate_probabilities,
+    chi_square_survival,
+    multinomial_outcomes,
+    sqrt,
+)
+
+__all__ = [
+    "all_values_ge",
+    "any_zero",
+    "calculate_z_scores",
+    "chi_square_goodness_of_fit",
+    "chi_square_goodness_of_fit_batch",
+    "chi_square_survival",
+    "chi_square_test",
+    "fisher_exact_test",
+    "fisher_exact_test_batch",
+    "multinomial_goodness_of_fit_batch",
+    "sqrt",
+    "sum_cols",
+    "sum_rows",
+]
+
+# Shared log(n!) array for the exact tests, grown (by doubling) on demand
+_log_factorials = np.zeros(1)
+_log_factorials_lock = threading.Lock()
+
+
+def chi_square_test(
+    contingency_table: list[list[int]],
+    correction: bool = True,
+) -> tuple[float, float, int, list[list[float]]]:
+    """Perform chi-square test of independence.
+
+    Vectorized equivalent of pure_statistics.chi_square_test.
+
+    Args:
+        contingency_table: 2D list of observed frequencies
+        correction: If True, apply Yates' continuity correction for 2x2 tables (default: True)
+
+    Returns:
+        Tuple of (chi2_statistic, p_value, degrees_of_freedom, expected_frequencies)
+
+    Raises:
+        ValueError: If table has zero row or column sums
+    """
+    table = np.asarray(contingency_table, dtype=float)
+    if table.ndim != 2 or table.size == 0:
+        raise ValueError("Contingency table must have at least 1 row and 1 column")
+    n_rows, n_cols = table.shape
+
+    row_totals = table.sum(axis=1)
+    col_totals = table.sum(axis=0)
+    n_total = row_totals.sum()
+
+    if n_total == 0:
+        raise ValueError("Contingency table has zero total")
+    if (row_totals == 0).any():
+        raise ValueError("Contingency table has empty rows")
+    if (col_totals == 0).any():
+        raise ValueError("Contingency table has empty columns")
+
+    expected = np.outer(row_totals, col_totals) / n_total
+
+    diff = np.abs(table - expected)
+    if correction and n_rows == 2 and n_cols == 2:
+        # Yates' correction: reduce |O - E| by 0.5
+        diff = np.maximum(0.0, diff - 0.5)
+    terms = _safe_divide(diff**2, expected)
+
+    chi2 = sum(terms.ravel().tolist())
+    dof = (n_rows - 1) * (n_cols - 1)
+    p_value = chi_square_survival(chi2, dof)
+
+    return chi2, p_value, dof, expected.tolist()
+
+
+def chi_square_goodness_of_fit(observed: list[int], expected: list[float]) -> tuple[float, float]:
+    """Perform chi-square goodness-of-fit test.
+
+    Vectorized equivalent of pure_statistics.chi_square_goodness_of_fit.
+
+    Args:
+        observed: List of observed frequencies
+        expected: List of expected frequencies
+
+    Returns:
+        Tuple of (chi2_statistic, p_value)
+    """
+    if len(observed) != len(expected):
+        raise ValueError("Observed and expected must have same length")
+    return chi_square_goodness_of_fit_batch([observed], [expected])[0]
+
+
+def chi_square_goodness_of_fit_batch(
+    observed: list[list[int]], expected: list[list[float]]
+) -> list[tuple[float, float]]:
+    """Perform a chi-square goodness-of-fit test for each row of a table.
+
+    All rows' chi-square contributions are computed in one array operation,
+    e.g. one row per manager.
+
+    Args:
+        observed: Observed frequencies, one row per test
+        expected: Expected frequencies, aligned with observed
+
+    Returns:
+        List of (chi2_statistic, p_value) tuples, one per row
+    """
+    if len(observed) != len(expected):
+        raise ValueError("Observed and expected must have same number of rows")
+    if not observed:
+        return []
+
+    obs = np.asarray(observed, dtype=float)
+    exp = np.asarray(expected, dtype=float)
+    if obs.shape != exp.shape:
+        raise ValueError("Observed and expected must have same length")
+
+    terms = _safe_divide((obs - exp) ** 2, exp)
+    dof = obs.shape[1] - 1
+    results = []
+    for row in terms.tolist():
+        chi2 = sum(row)
+        results.append((chi2, chi_square_survival(chi2, dof)))
+    return results
+
+
+def fisher_exact_test(table: list[list[int]]) -> tuple[float, float]:
+    """Perform Fisher's exact test for 2x2 contingency tables.
+
+    Vectorized equivalent of pure_statistics.fisher_exact_test: the
+    hypergeometric probabilities of every table with the observed margins are
+    computed at once from the shared log-factorial array.
+
+    Args:
+        table: 2x2 contingency table [[a, b], [c, d]]
+
+    Returns:
+        Tuple of (odds_ratio, p_value)
+
+    Raises:
+        ValueError: If table is not 2x2
+    """
+    return fisher_exact_test_batch([table])[0]
+
+
+def fisher_exact_test_batch(tables: list[list[list[int]]]) -> list[tuple[float, float]]:
+    """Perform Fisher's exact test for many 2x2 tables in one array operation.
+
+    The feasible tables for every input are laid end to end, so all
+    hypergeometric probabilities come from a single pass over the shared
+    log-factorial array; p-values are then summed per input table.
+
+    Args:
+        tables: 2x2 contingency tables [[a, b], [c, d]]
+
+    Returns:
+        List of (odds_ratio, p_value) tuples, one per table
+
+    Raises:
+        ValueError: If any table is not 2x2
+    """
+    for table in tables:
+        if len(table) != 2 or len(table[0]) != 2 or len(table[1]) != 2:
+            raise ValueError("Fisher's exact test requires a 2x2 table")
+    if not tables:
+        return []
+
+    cells = np.asarray(tables, dtype=np.int64).reshape(len(tables), 4)
+    a, b, c, d = cells.T
+    n1 = a + b  # Row 1 totals
+    n2 = c + d  # Row 2 totals
+    k1 = a + c  # Column 1 totals
+    n = n1 + n2  # Grand totals
+    log_factorial = _log_factorial_table(int(n.max()))
+
+    # Every feasible top-left cell x, for all tables back to back
+    lower = np.maximum(0, k1 - n2)
+    sizes = np.minimum(n1, k1) - lower + 1
+    starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+    owner = np.repeat(np.arange(len(tables)), sizes)
+    x = lower[owner] + np.arange(int(sizes.sum())) - starts[owner]
+
+    log_margins = (
+        log_factorial[n1]
+        + log_factorial[n2]
+        + log_factorial[k1]
+        + log_factorial[n - k1]
+        - log_factorial[n]
+    )
+    probabilities = np.exp(
+        log_margins[owner]
+        - log_factorial[x]
+        - log_factorial[n1[owner] - x]
+        - log_factorial[k1[owner] - x]
+        - log_factorial[n2[owner] - k1[owner] + x]
+    )
+    current_p = probabilities[starts + a - lower]
+
+    # Two-tailed: include all tables with probability <= current table
+    extreme = probabilities <= current_p[owner] * (1.0 + 1e-7)
+    p_values = np.add.reduceat(np.where(extreme, probabilities, 0.0), starts)
+
+    results = []
+    for (cell_a, cell_b, cell_c, cell_d), p_value in zip(
+        cells.tolist(), p_values.tolist(), strict=True
+    ):
+        if cell_b == 0 or cell_c == 0:
+            odds_ratio = float("inf")
+        elif cell_a == 0 or cell_d == 0:
+            odds_ratio = 0.0
+        else:
+            odds_ratio = (cell_a * cell_d) / (cell_b * cell_c)
+        results.append((odds_ratio, min(p_value, 1.0)))
+    return results
+
+
+def multinomial_goodness_of_fit_batch(
+    observed: list[list[int]],
+    probabilities: list[float],
+    min_expected: float = 5.0,
+    max_exact_outcomes: int = MULTINOMIAL_MAX_EXACT_OUTCOMES,
+    simulations: int = MULTINOMIAL_SIMULATIONS,
+    seed: int = MULTINOMIAL_SEED,
+    deadline: float | None = None,
+) -> list[tuple[float, float, str]]:
+    """Goodness-of-fit test of each row against one multinomial distribution.
+
+    Vectorized equivalent of pure_statistics.multinomial_goodness_of_fit_batch:
+    each null distribution (all outcomes, or all Monte-Carlo draws, for one
+    row total) is evaluated as one array, and every row with that total is
+    looked up in it with a single searchsorted.
+
+    Args:
+        observed: Observed counts, one row per test (e.g. per manager)
+        probabilities: Category probabilities under the null (positive, summing to 1)
+        min_expected: Expected count at or above which the asymptotic test is used
+        max_exact_outcomes: Largest number of outcomes enumerated exactly
+        simulations: Monte-Carlo draws per row total
+        seed: Random seed for the Monte-Carlo draws
+        deadline: time.monotonic() value after which no resampling starts
+
+    Returns:
+        List of (chi2_statistic, p_value, method) tuples, one per row, where
+        method is "exact", "monte_carlo" or "chi_square"
+    """
+    probs = _validate_probabilities(observed, probabilities)
+    if not observed:
+        return []
+
+    totals = [sum(row) for row in observed]
+    expected = [[total * p for p in probs] for total in totals]
+    asymptotic = chi_square_goodness_of_fit_batch(observed, expected)
+    results = [(chi2, p_value, "chi_square") for chi2, p_value in asymptotic]
+
+    small_rows: dict[int, list[int]] = {}
+    for i, total in enumerate(totals):
+        if min(expected[i]) < min_expected:
+            small_rows.setdefault(total, []).append(i)
+
+    for total, rows in small_rows.items():
+        if deadline is not None and time.monotonic() >= deadline:
+            break
+        method = _multinomial_method(total, len(probs), max_exact_outcomes)
+        statistics, tail = _multinomial_null(total, probs, method, simulations, seed)
+        chi2 = np.array([asymptotic[i][0] for i in rows])
+        # Tolerate rounding so the observed outcome counts as "at least as extreme"
+        positions = np.searchsorted(statistics, chi2 - 1e-9 * np.maximum(1.0, chi2))
+        for i, p_value in zip(rows, tail[positions].tolist(), strict=True):
+            results[i] = (asymptotic[i][0], p_value, method)
+    return results
+
+
+@lru_cache(maxsize=MULTINOMIAL_NULL_CACHE_SIZE)
+def _multinomial_null(
+    total: int, probabilities: tuple[float, ...], method: str, simulations: int, seed: int
+) -> tuple[np.ndarray, np.ndarray]:
+    """Null distribution of the chi-square statistic for a row total.
+
+    Returns:
+        Tuple of (statistics in ascending order, tail) as in
+        pure_statistics._multinomial_null()
+    """
+    probs = np.asarray(probabilities)
+    expected = total * probs
+    if method == "exact":
+        outcomes = np.asarray(multinomial_outcomes(total, len(probs)), dtype=np.int64)
+        log_factorial = _log_factorial_table(total)
+        log_p = (
+            log_factorial[total] - log_factorial[outcomes].sum(axis=1) + outcomes @ np.log(probs)
+        )
+        weights = np.exp(log_p)
+    else:
+        rng = np.random.default_rng([seed, total])
+        outcomes = rng.multinomial(total, probs, size=simulations)
+        weights = np.ones(simulations)
+
+    statistics = _safe_divide((outcomes - expected) ** 2.0, expected).sum(axis=1)
+    order = np.argsort(statistics, kind="stable")
+    statistics = statistics[order]
+    if method == "exact":
+        tail = np.concatenate((np.cumsum(weights[order][::-1])[::-1], [0.0]))
+        return statistics, np.minimum(tail, 1.0)
+    # (draws at least as extreme + 1) / (simulations + 1)
+    tail = (simulations - np.arange(simulations + 1) + 1) / (simulations + 1)
+    return statistics, tail
+
+
+def _log_factorial_table(n: int) -> np.ndarray:
+    """Return the shared array of log(k!) for k = 0..n (or more), growing it if needed."""
+    global _log_factorials  # noqa: PLW0603
+    table = _log_factorials
+    if len(table) > n:
+        return table
+    with _log_factorials_lock:
+        table = _log_factorials
+        if len(table) <= n:
+            size = max(n + 1, 2 * len(table))
+            steps = np.log(np.arange(len(table), size, dtype=float))
+            table = np.concatenate((table, table[-1] + np.cumsum(steps)))
+            _log_factorials = table
+    return table
+
+
+def calculate_z_scores(observed: list[list[int]], expected: list[list[float]]) -> list[list[float]]:
+    """Calculate standardized residuals (z-scores) for each cell.
+
+    Z-score formula: (observed - expected) / sqrt(expected)
+
+    Args:
+        observed: 2D list of observed frequencies
+        expected: 2D list of expected frequencies
+
+    Returns:
+        2D list of z-scores (standardized residuals)
+    """
+    if not observed:
+        return []
+    obs = np.asarray(observed, dtype=float)
+    exp = np.asarray(expected, dtype=float)
+    z_scores = _safe_divide(obs - exp, np.sqrt(np.maximum(exp, 0.0)), where=exp > 0)
+    return cast("list[list[float]]", z_scores.tolist())
+
+
+def all_values_ge(values: list[list[float]], threshold: float) -> bool:
+    """Check if all values in 2D list are >= threshold.
+
+    Args:
+        values: 2D list of values
+        threshold: Minimum threshold
+
+    Returns:
+        True if all values >= threshold
+    """
+    return bool((np.asarray(values, dtype=float) >= threshold).all())
+
+
+def sum_rows(table: list[list[Any]]) -> list[Any]:
+    """Calculate sum of each row.
+
+    Args:
+        table: 2D list
+
+    Returns:
+        List of row sums
+    """
+    if not table:
+        return []
+    return cast("list[Any]", np.asarray(table).sum(axis=1).tolist())
+
+
+def sum_cols(table: list[list[Any]]) -> list[Any]:
+    """Calculate sum of each column.
+
+    Args:
+        table: 2D list
+
+    Returns:
+        List of column sums
+    """
+    if not table:
+        return []
+    return cast("list[Any]", np.asarray(table).sum(axis=0).tolist())
+
+
+def any_zero(values: list[Any]) -> bool:
+    """Check if any value in list equals zero.
+
+    Args:
+        values: List of values
+
+    Returns:
+        True if any value is zero
+    """
+    return bool((np.asarray(values) == 0).any())
+
+
+def _safe_divide(
+    numerator: np.ndarray, denominator: np.ndarray, where: np.ndarray | None = None
+) -> np.ndarray:
+    """Divide elementwise, yielding 0.0 wherever the denominator is not positive.
+
+    Args:
+        numerator: Dividend array
+        denominator: Divisor array
+        where: Cells to divide (default: cells with a positive denominator)
+
+    Returns:
+        Quotient array with 0.0 in the skipped cells
+    """
+    if where is None:
+        where = denominator > 0
+    quotient = np.divide(numerator, denominator, out=np.zeros_like(numerator), where=where)
+    return cast("np.ndarray", quotient)
@@ -0,0 +1,80 @@
+"""Opt-in profiling of a single call with cProfile or pyinstrument.
+
+Used by endpoints that accept a ?profile= query parameter so latency
+regressions can be attributed in the field. cProfile ships with Python;
+pyinstrument is used when it is installed.
+
+Only the calling thread is profiled: work submitted to an analysis pool
+(Settings.analysis_workers > 0) shows up as time waiting on futures.
+"""
+
+import cProfile
+import io
+import pstats
+import time
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+try:
+    from pyinstrument import Profiler as PyinstrumentProfiler
+except ImportError:  # pragma: no cover - depends on the installed environment
+    PyinstrumentProfiler = None
+
+T = TypeVar("T")
+
+# Number of functions listed in cProfile reports
+CPROFILE_REPORT_LINES = 60
+
+
+def available_profilers() -> list[str]:
+    """Profilers usable in this environment.
+
+    Returns:
+        ["cprofile"], plus "pyinstrument" when it is installed
+    """
+    return ["cprofile"] if PyinstrumentProfiler is None else ["cprofile", "pyinstrument"]
+
+
+def profile_call(
+    profiler: str, fn: Callable[..., T], *args: Any, **kwargs: Any
+) -> tuple[T, str, float]:
+    """Call a function under a profiler.
+
+    Args:
+        profiler: "cprofile" or "pyinstrument"
+        fn: Function to call
+        *args: Positional arguments for fn
+        **kwargs: Keyword arguments for fn
+
+    Returns:
+        Tuple of (fn's return value, text report, wall time in seconds)
+
+    Raises:
+        ValueError: If the profiler is unknown or not installed
+
+    Example:
+        >>> result, report, seconds = profile_call("cprofile", run_all_analyses, employees)
+        >>> print(report)  # functions sorted by cumulative time
+    """
+    if profiler not in available_profilers():
+        raise ValueError(
+            f"Profiler '{profiler}' is not available (choose from {available_profilers()})"
+        )
+
+    start = time.perf_counter()
+    if profiler == "pyinstrument":
+        instrument = PyinstrumentProfiler()
+        instrument.start()
+        try:
+            result = fn(*args, **kwargs)
+        finally:
+            instrument.stop()
+        elapsed = time.perf_counter() - start
+        return result, instrument.output_text(unicode=False, color=False), elapsed
+
+    profile = cProfile.Profile()
+    result = profile.runcall(fn, *args, **kwargs)
+    elapsed = time.perf_counter() - start
+    stream = io.StringIO()
+    pstats.Stats(profile, stream=stream).sort_stats("cumulative").print_stats(CPROFILE_REPORT_LINES)
+    return result, stream.getvalue(), elapsed
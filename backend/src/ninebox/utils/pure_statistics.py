@@ -1,7 +1,8 @@
 """Pure Python statistical functions to replace scipy/numpy dependencies.
 
 This module provides implementations of chi-square tests, Fisher's exact test,
-and related statistical operations without requiring scipy or numpy.
+exact/Monte-Carlo multinomial tests and related statistical operations without
+requiring scipy or numpy.
 
 All functions are implemented using standard library only (math module).
 
@@ -18,9 +19,30 @@ This trade-off is acceptable for 9Boxer's use case where p-values are used for
 threshold decisions (green/yellow/red status), not precise scientific reporting.
 """
 
+import bisect
 import math
+import random
+import threading
+import time
+from collections.abc import Sequence
+from functools import lru_cache
 from typing import Any
 
+# Shared table of log(n!) for the exact tests: _LOG_FACTORIALS[n] == log(n!).
+# Grown on demand by log_factorial() and never shrunk.
+_LOG_FACTORIALS: list[float] = [0.0]
+_LOG_FACTORIALS_LOCK = threading.Lock()
+
+# Defaults for multinomial_goodness_of_fit_batch(): enumerate at most this many
+# outcomes exactly (C(n + 2, 2) <= 5000 covers 3-category rows up to n = 98),
+# otherwise draw this many Monte-Carlo samples with this seed
+MULTINOMIAL_MAX_EXACT_OUTCOMES = 5000
+MULTINOMIAL_SIMULATIONS = 10000
+MULTINOMIAL_SEED = 9
+
+# Null distributions kept per (row total, probabilities, method, options)
+MULTINOMIAL_NULL_CACHE_SIZE = 256
+
 
 def sqrt(x: float) -> float:
     """Square root using math.sqrt."""
@@ -124,6 +146,28 @@ def chi_square_goodness_of_fit(observed: list[int], expected: list[float]) -> tu
     return chi2, p_value
 
 
+def chi_square_goodness_of_fit_batch(
+    observed: list[list[int]], expected: list[list[float]]
+) -> list[tuple[float, float]]:
+    """Perform a chi-square goodness-of-fit test for each row of a table.
+
+    Equivalent to calling chi_square_goodness_of_fit() on each
+    (observed row, expected row) pair, e.g. one row per manager.
+
+    Args:
+        observed: Observed frequencies, one row per test
+        expected: Expected frequencies, aligned with observed
+
+    Returns:
+        List of (chi2_statistic, p_value) tuples, one per row
+    """
+    if len(observed) != len(expected):
+        raise ValueError("Observed and expected must have same number of rows")
+    return [
+        chi_square_goodness_of_fit(obs, exp) for obs, exp in zip(observed, expected, strict=True)
+    ]
+
+
 def fisher_exact_test(table: list[list[int]]) -> tuple[float, float]:
     """Perform Fisher's exact test for 2x2 contingency tables.
 
@@ -159,6 +203,208 @@ def fisher_exact_test(table: list[list[int]]) -> tuple[float, float]:
     return odds_ratio, p_value
 
 
+def fisher_exact_test_batch(tables: list[list[list[int]]]) -> list[tuple[float, float]]:
+    """Perform Fisher's exact test for many 2x2 tables.
+
+    Equivalent to calling fisher_exact_test() on each table, sharing the
+    log-factorial table between them, e.g. one table per small subgroup.
+
+    Args:
+        tables: 2x2 contingency tables [[a, b], [c, d]]
+
+    Returns:
+        List of (odds_ratio, p_value) tuples, one per table
+
+    Raises:
+        ValueError: If any table is not 2x2
+    """
+    return [fisher_exact_test(table) for table in tables]
+
+
+def log_factorial(n: int) -> float:
+    """Return log(n!) from the shared, lazily grown log-factorial table.
+
+    Args:
+        n: Non-negative integer
+
+    Returns:
+        Natural logarithm of n factorial
+
+    Example:
+        >>> round(log_factorial(5), 6)  # log(120)
+        4.787492
+    """
+    if n >= len(_LOG_FACTORIALS):
+        with _LOG_FACTORIALS_LOCK:
+            total = _LOG_FACTORIALS[-1]
+            for i in range(len(_LOG_FACTORIALS), n + 1):
+                total += math.log(i)
+                _LOG_FACTORIALS.append(total)
+    return _LOG_FACTORIALS[n]
+
+
+def multinomial_goodness_of_fit_batch(
+    observed: list[list[int]],
+    probabilities: list[float],
+    min_expected: float = 5.0,
+    max_exact_outcomes: int = MULTINOMIAL_MAX_EXACT_OUTCOMES,
+    simulations: int = MULTINOMIAL_SIMULATIONS,
+    seed: int = MULTINOMIAL_SEED,
+    deadline: float | None = None,
+) -> list[tuple[float, float, str]]:
+    """Goodness-of-fit test of each row against one multinomial distribution.
+
+    The statistic is Pearson's chi-square, as in chi_square_goodness_of_fit().
+    Rows whose expected counts are all >= min_expected use the asymptotic
+    chi-square p-value. Smaller rows, where that approximation is poor, get
+    P(X² >= observed X²) under the multinomial null instead:
+
+    - "exact": every outcome is enumerated when there are at most
+      max_exact_outcomes of them
+    - "monte_carlo": otherwise, estimated from `simulations` draws with a
+      fixed seed, so results are reproducible
+
+    The null distribution depends only on the row total, so rows with the
+    same total share it (and it stays cached across calls). Once the
+    time.monotonic() deadline has passed, remaining rows fall back to the
+    asymptotic p-value.
+
+    Args:
+        observed: Observed counts, one row per test (e.g. per manager)
+        probabilities: Category probabilities under the null (positive, summing to 1)
+        min_expected: Expected count at or above which the asymptotic test is used
+        max_exact_outcomes: Largest number of outcomes enumerated exactly
+        simulations: Monte-Carlo draws per row total
+        seed: Random seed for the Monte-Carlo draws
+        deadline: time.monotonic() value after which no resampling starts
+
+    Returns:
+        List of (chi2_statistic, p_value, method) tuples, one per row, where
+        method is "exact", "monte_carlo" or "chi_square"
+
+    Raises:
+        ValueError: If probabilities are not positive and summing to 1, or a
+            row length differs from the number of categories
+
+    Example:
+        >>> multinomial_goodness_of_fit_batch([[5, 4, 1], [40, 100, 20]], [0.2, 0.7, 0.1])
+        [(5.785..., 0.0658..., 'exact'), (4.285..., 0.117..., 'chi_square')]
+    """
+    probs_key = _validate_probabilities(observed, probabilities)
+    results = []
+    for row in observed:
+        total = sum(row)
+        chi2, p_value = chi_square_goodness_of_fit(row, [total * p for p in probs_key])
+        method = "chi_square"
+        if min(total * p for p in probs_key) < min_expected and (
+            deadline is None or time.monotonic() < deadline
+        ):
+            method = _multinomial_method(total, len(probs_key), max_exact_outcomes)
+            null = _multinomial_null(total, probs_key, method, simulations, seed)
+            p_value = _null_tail_probability(null, chi2)
+        results.append((chi2, p_value, method))
+    return results
+
+
+def _validate_probabilities(
+    observed: list[list[int]], probabilities: list[float] | tuple[float, ...]
+) -> tuple[float, ...]:
+    """Check multinomial test inputs, returning the probabilities as a tuple."""
+    if not probabilities or any(p <= 0 for p in probabilities):
+        raise ValueError("Probabilities must be positive")
+    if abs(sum(probabilities) - 1.0) > 1e-6:
+        raise ValueError("Probabilities must sum to 1")
+    if any(len(row) != len(probabilities) for row in observed):
+        raise ValueError("Each observed row must have one count per probability")
+    return tuple(probabilities)
+
+
+def _multinomial_method(total: int, categories: int, max_exact_outcomes: int) -> str:
+    """Choose "exact" or "monte_carlo" for a row total."""
+    outcomes = math.comb(total + categories - 1, categories - 1)
+    return "exact" if outcomes <= max_exact_outcomes else "monte_carlo"
+
+
+def multinomial_outcomes(total: int, categories: int) -> list[tuple[int, ...]]:
+    """Every way of splitting total counts across categories, in lexicographic order.
+
+    Args:
+        total: Number of observations
+        categories: Number of categories
+
+    Returns:
+        List of count tuples, each summing to total
+
+    Example:
+        >>> multinomial_outcomes(2, 2)
+        [(0, 2), (1, 1), (2, 0)]
+    """
+    if categories == 1:
+        return [(total,)]
+    return [
+        (first, *rest)
+        for first in range(total + 1)
+        for rest in multinomial_outcomes(total - first, categories - 1)
+    ]
+
+
+@lru_cache(maxsize=MULTINOMIAL_NULL_CACHE_SIZE)
+def _multinomial_null(
+    total: int, probabilities: tuple[float, ...], method: str, simulations: int, seed: int
+) -> tuple[list[float], list[float]]:
+    """Null distribution of the chi-square statistic for a row total.
+
+    Returns:
+        Tuple of (statistics in ascending order, tail) where tail[i] is the
+        p-value of a statistic just above statistics[i - 1]; tail has one more
+        entry than statistics (the p-value beyond every null statistic)
+    """
+    expected = [total * p for p in probabilities]
+    if method == "exact":
+        log_probabilities = [math.log(p) for p in probabilities]
+        weighted = []
+        for counts in multinomial_outcomes(total, len(probabilities)):
+            log_p = log_factorial(total) + sum(
+                count * log_prob - log_factorial(count)
+                for count, log_prob in zip(counts, log_probabilities, strict=True)
+            )
+            weighted.append((_pearson_statistic(counts, expected), math.exp(log_p)))
+        weighted.sort()
+        tail = [0.0] * (len(weighted) + 1)
+        for i in range(len(weighted) - 1, -1, -1):
+            tail[i] = tail[i + 1] + weighted[i][1]
+        return [statistic for statistic, _ in weighted], [min(p, 1.0) for p in tail]
+
+    rng = random.Random(seed * 1_000_003 + total)
+    categories = range(len(probabilities))
+    statistics = []
+    for _ in range(simulations):
+        draw_counts = [0] * len(probabilities)
+        for category in rng.choices(categories, weights=probabilities, k=total):
+            draw_counts[category] += 1
+        statistics.append(_pearson_statistic(draw_counts, expected))
+    statistics.sort()
+    # (draws at least as extreme + 1) / (simulations + 1)
+    tail = [(simulations - i + 1) / (simulations + 1) for i in range(simulations + 1)]
+    return statistics, tail
+
+
+def _pearson_statistic(counts: Sequence[int], expected: list[float]) -> float:
+    """Pearson's chi-square statistic, summed as in chi_square_goodness_of_fit()."""
+    chi2 = 0.0
+    for obs, exp in zip(counts, expected, strict=True):
+        if exp > 0:
+            chi2 += ((obs - exp) ** 2) / exp
+    return chi2
+
+
+def _null_tail_probability(null: tuple[list[float], list[float]], chi2: float) -> float:
+    """P(statistic >= chi2) under a null from _multinomial_null()."""
+    statistics, tail = null
+    # Tolerate rounding so the observed outcome counts as "at least as extreme"
+    return tail[bisect.bisect_left(statistics, chi2 - 1e-9 * max(1.0, chi2))]
+
+
 def _fisher_exact_pvalue(a: int, b: int, c: int, d: int) -> float:
     """Calculate Fisher's exact test p-value using hypergeometric distribution.
 
@@ -173,8 +419,27 @@ def _fisher_exact_pvalue(a: int, b: int, c: int, d: int) -> float:
     k1 = a + c  # Column 1 total
     n = a + b + c + d  # Grand total
 
+    # log(n1! n2! k1! k2! / n!) is shared by every table with these margins
+    log_margins = (
+        log_factorial(n1)
+        + log_factorial(n2)
+        + log_factorial(k1)
+        + log_factorial(n - k1)
+        - log_factorial(n)
+    )
+
+    def table_prob(x: int) -> float:
+        # P(X = x) = n1! n2! k1! k2! / (n! x! (n1-x)! (k1-x)! (n2-k1+x)!)
+        return math.exp(
+            log_margins
+            - log_factorial(x)
+            - log_factorial(n1 - x)
+            - log_factorial(k1 - x)
+            - log_factorial(n2 - k1 + x)
+        )
+
     # Calculate probability of current table
-    current_p = _hypergeometric_prob(a, n1, k1, n)
+    current_p = table_prob(a)
 
     # Calculate probabilities for all more extreme tables
     min_val = max(0, k1 - n2)
@@ -182,7 +447,7 @@ def _fisher_exact_pvalue(a: int, b: int, c: int, d: int) -> float:
 
     p_value = 0.0
     for x in range(min_val, max_val + 1):
-        p = _hypergeometric_prob(x, n1, k1, n)
+        p = table_prob(x)
         # Include all tables with probability <= current table
         if p <= current_p * (1.0 + 1e-7):  # Small tolerance for floating point
             p_value += p
@@ -190,43 +455,6 @@ def _fisher_exact_pvalue(a: int, b: int, c: int, d: int) -> float:
     return min(p_value, 1.0)
 
 
-def _hypergeometric_prob(k: int, n1: int, k1: int, n: int) -> float:
-    """Calculate hypergeometric probability.
-
-    P(X = k) = C(k1, k) * C(n-k1, n1-k) / C(n, n1)
-
-    Args:
-        k: Number of successes
-        n1: Sample size
-        k1: Population successes
-        n: Population size
-
-    Returns:
-        Probability
-    """
-    # Use log probabilities to avoid overflow
-    log_p = _log_combination(k1, k) + _log_combination(n - k1, n1 - k) - _log_combination(n, n1)
-    return math.exp(log_p)
-
-
-def _log_combination(n: int, k: int) -> float:
-    """Calculate log of binomial coefficient C(n, k)."""
-    if k > n or k < 0:
-        return float("-inf")
-    if k in (0, n):
-        return 0.0
-
-    # Use the more efficient side
-    k = min(k, n - k)
-
-    # Calculate using log factorials to avoid overflow
-    result = 0.0
-    for i in range(k):
-        result += math.log(n - i) - math.log(i + 1)
-
-    return result
-
-
 def chi_square_survival(x: float, df: int) -> float:
     """Calculate survival function (1 - CDF) for chi-square distribution.
 
@@ -1,6 +1,15 @@
 """Utilities for parsing and validating query parameters."""
 
-from fastapi import HTTPException
+import base64
+import hashlib
+
+from fastapi import HTTPException, Request
+
+# Largest page a cursor-paginated endpoint returns
+MAX_PAGE_SIZE = 10000
+
+# Query parameters that may change between pages of the same listing
+_PAGING_PARAMS = frozenset({"cursor", "limit"})
 
 
 def parse_id_list(ids_str: str | None, param_name: str = "ID") -> list[int] | None:
@@ -34,3 +43,143 @@ def parse_id_list(ids_str: str | None, param_name: str = "ID") -> list[int] | No
             status_code=400,
             detail=f"Invalid {param_name}: must be comma-separated integers (got: {ids_str})",
         ) from e
+
+
+def parse_field_list(
+    fields_str: str | None, allowed: set[str], param_name: str = "field"
+) -> list[str] | None:
+    """
+    Parse comma-separated field names and validate them against an allowed set.
+
+    Args:
+        fields_str: Comma-separated field names, e.g., "name,grid_position"
+        allowed: Field names that may be requested
+        param_name: Name of parameter for error messages
+
+    Returns:
+        List of field names in request order (duplicates removed), or None if
+        fields_str is None/empty
+
+    Raises:
+        HTTPException: 400 Bad Request if any field is not allowed
+
+    Examples:
+        >>> parse_field_list("name, grid_position", {"name", "grid_position"})
+        ['name', 'grid_position']
+        >>> parse_field_list("salary", {"name"})  # Raises HTTPException
+    """
+    if not fields_str or fields_str.strip() == "":
+        return None
+
+    fields = list(dict.fromkeys(f.strip() for f in fields_str.split(",") if f.strip()))
+    invalid = [f for f in fields if f not in allowed]
+    if invalid:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid {param_name}: {', '.join(invalid)}. "
+            f"Allowed: {', '.join(sorted(allowed))}",
+        )
+    return fields or None
+
+
+def paging_query_key(request: Request) -> str:
+    """
+    Describe the listing a request pages through, for binding cursors to it.
+
+    Covers the path and every query parameter except cursor and limit, sorted
+    so parameter order does not matter.
+
+    Args:
+        request: Incoming request
+
+    Returns:
+        String identifying the filters, sort and projection of the listing
+    """
+    query = sorted(
+        (key, value)
+        for key, value in request.query_params.multi_items()
+        if key not in _PAGING_PARAMS
+    )
+    return f"{request.url.path}|{query}"
+
+
+def _cursor_digest(value: str) -> str:
+    """Short digest of a cursor binding value."""
+    return hashlib.blake2b(value.encode(), digest_size=6).hexdigest()
+
+
+def encode_cursor(
+    offset: int, revision_tag: str | None = None, query_key: str | None = None
+) -> str:
+    """
+    Encode a list offset as an opaque pagination cursor.
+
+    When revision_tag and query_key are given, the cursor only decodes for the
+    same listing (see paging_query_key()) at the same session revision, so a
+    page is never computed against different filters or data.
+
+    Args:
+        offset: Index of the first item of the next page
+        revision_tag: Session revision token the page was computed at
+        query_key: Listing the page belongs to, from paging_query_key()
+
+    Returns:
+        URL-safe cursor string
+
+    Examples:
+        >>> decode_cursor(encode_cursor(200))
+        200
+        >>> cursor = encode_cursor(200, "abc:s1:3", "/api/employees|[]")
+        >>> decode_cursor(cursor, "abc:s1:3", "/api/employees|[]")
+        200
+    """
+    payload = f"o:{offset}"
+    if revision_tag is not None and query_key is not None:
+        payload += f":{_cursor_digest(revision_tag)}:{_cursor_digest(query_key)}"
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(
+    cursor: str | None, revision_tag: str | None = None, query_key: str | None = None
+) -> int:
+    """
+    Decode a pagination cursor produced by encode_cursor().
+
+    Args:
+        cursor: Cursor from a previous page, or None for the first page
+        revision_tag: Current session revision token; with query_key, the
+            cursor must have been encoded with the same binding
+        query_key: Current listing, from paging_query_key()
+
+    Returns:
+        Offset of the first item to return (0 when cursor is None/empty)
+
+    Raises:
+        HTTPException: 400 Bad Request if the cursor is malformed or belongs to
+            a different query; 410 Gone if the session changed since the
+            cursor was issued
+    """
+    if not cursor:
+        return 0
+
+    bound = revision_tag is not None and query_key is not None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        prefix, *parts = base64.urlsafe_b64decode(padded).decode().split(":")
+        offset = int(parts[0])
+        if prefix != "o" or offset < 0 or len(parts) != (3 if bound else 1):
+            raise ValueError(cursor)
+    except (ValueError, IndexError, UnicodeDecodeError) as e:
+        raise HTTPException(status_code=400, detail=f"Invalid cursor: {cursor}") from e
+
+    if revision_tag is not None and query_key is not None:
+        if parts[2] != _cursor_digest(query_key):
+            raise HTTPException(
+                status_code=400, detail="Cursor belongs to a different query; start from page one"
+            )
+        if parts[1] != _cursor_digest(revision_tag):
+            raise HTTPException(
+                status_code=410,
+                detail="Cursor expired: the data changed; start from page one",
+            )
+    return offset
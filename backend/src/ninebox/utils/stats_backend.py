@@ -0,0 +1,105 @@
+"""Statistics backend selection.
+
+Exposes the pure_statistics API backed by the fastest available
+implementation: numpy_statistics when NumPy is importable, otherwise
+pure_statistics. Both modules have the same functions and results, so
+callers import this module instead of choosing one:
+
+    from ninebox.utils import stats_backend as ps
+
+Set NINEBOX_STATS_BACKEND=pure to force the pure Python implementation
+(e.g. to reproduce the frozen build's behaviour without NumPy).
+"""
+
+import logging
+import os
+from typing import Any, Protocol
+
+from ninebox.utils import pure_statistics
+
+logger = logging.getLogger(__name__)
+
+
+class StatsBackend(Protocol):
+    """Functions every statistics implementation module provides.
+
+    pure_statistics and numpy_statistics both satisfy this protocol, so the
+    re-exported names below keep their real signatures for type checking.
+    """
+
+    def all_values_ge(self, values: list[list[float]], threshold: float) -> bool: ...
+
+    def any_zero(self, values: list[Any]) -> bool: ...
+
+    def calculate_z_scores(
+        self, observed: list[list[int]], expected: list[list[float]]
+    ) -> list[list[float]]: ...
+
+    def chi_square_goodness_of_fit(
+        self, observed: list[int], expected: list[float]
+    ) -> tuple[float, float]: ...
+
+    def chi_square_goodness_of_fit_batch(
+        self, observed: list[list[int]], expected: list[list[float]]
+    ) -> list[tuple[float, float]]: ...
+
+    def chi_square_survival(self, x: float, df: int) -> float: ...
+
+    def chi_square_test(
+        self, contingency_table: list[list[int]], correction: bool = True
+    ) -> tuple[float, float, int, list[list[float]]]: ...
+
+    def fisher_exact_test(self, table: list[list[int]]) -> tuple[float, float]: ...
+
+    def fisher_exact_test_batch(
+        self, tables: list[list[list[int]]]
+    ) -> list[tuple[float, float]]: ...
+
+    def multinomial_goodness_of_fit_batch(
+        self,
+        observed: list[list[int]],
+        probabilities: list[float],
+        min_expected: float = ...,
+        max_exact_outcomes: int = ...,
+        simulations: int = ...,
+        seed: int = ...,
+        deadline: float | None = None,
+    ) -> list[tuple[float, float, str]]: ...
+
+    def sqrt(self, x: float) -> float: ...
+
+    def sum_cols(self, table: list[list[Any]]) -> list[Any]: ...
+
+    def sum_rows(self, table: list[list[Any]]) -> list[Any]: ...
+
+
+def _load_backend() -> StatsBackend:
+    """Import the statistics implementation to use for this process."""
+    if os.getenv("NINEBOX_STATS_BACKEND", "").lower() == "pure":
+        return pure_statistics
+    try:
+        from ninebox.utils import numpy_statistics  # noqa: PLC0415
+    except ImportError:
+        logger.info("NumPy not available, using pure Python statistics backend")
+        return pure_statistics
+    return numpy_statistics
+
+
+_backend = _load_backend()
+
+# Name of the active implementation: "numpy" or "pure"
+BACKEND = "numpy" if _backend is not pure_statistics else "pure"
+
+all_values_ge = _backend.all_values_ge
+any_zero = _backend.any_zero
+calculate_z_scores = _backend.calculate_z_scores
+chi_square_goodness_of_fit = _backend.chi_square_goodness_of_fit
+chi_square_goodness_of_fit_batch = _backend.chi_square_goodness_of_fit_batch
+chi_square_survival = _backend.chi_square_survival
+chi_square_test = _backend.chi_square_test
+fisher_exact_test = _backend.fisher_exact_test
+fisher_exact_test_batch = _backend.fisher_exact_test_batch
+multinomial_goodness_of_fit_batch = _backend.multinomial_goodness_of_fit_batch
+sqrt = _backend.sqrt
+sum_cols = _backend.sum_cols
+sum_rows = _backend.sum_rows
@@ -403,3 +403,63 @@ def test_org_tree_has_single_root(
     assert root_employee.get("job_level") == "MT6", (
         f"Root of org tree should be MT6 (CEO), but found {root_employee.get('job_level')}"
     )
+
+
+def test_get_all_reports_when_paginated_then_pages_concatenate_to_full_list(
+    test_client: TestClient,
+    sample_session_with_org_hierarchy: dict,
+) -> None:
+    """Test cursor pagination on /reports/{id} returns every report exactly once, in order."""
+    managers = test_client.get("/api/org-hierarchy/managers?min_team_size=20").json()["managers"]
+    manager_id = managers[0]["employee_id"]
+    full = test_client.get(f"/api/org-hierarchy/reports/{manager_id}").json()
+    assert full["next_cursor"] is None
+
+    paged: list[dict] = []
+    cursor = None
+    while True:
+        url = f"/api/org-hierarchy/reports/{manager_id}?limit=7"
+        data = test_client.get(url + (f"&cursor={cursor}" if cursor else "")).json()
+        assert len(data["all_reports"]) <= 7
+        assert data["total_reports_count"] == full["total_reports_count"]
+        paged.extend(data["all_reports"])
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+
+    assert paged == full["all_reports"]
+
+
+def test_get_org_tree_children_when_expanded_level_by_level_then_matches_team_sizes(
+    test_client: TestClient,
+    sample_session_with_org_hierarchy: dict,
+) -> None:
+    """Test lazy expansion returns one level with team sizes consistent with the parent."""
+    roots = test_client.get("/api/org-hierarchy/tree/roots").json()
+    assert roots["parent_id"] is None
+    assert roots["total_count"] == 1
+    ceo = roots["children"][0]
+    assert ceo["team_size"] == 199
+
+    level = test_client.get(f"/api/org-hierarchy/tree/{ceo['employee_id']}/children").json()
+    assert level["parent_id"] == ceo["employee_id"]
+    assert level["total_count"] == ceo["direct_reports_count"]
+    assert sum(child["team_size"] + 1 for child in level["children"]) == ceo["team_size"]
+    sizes = [child["team_size"] for child in level["children"]]
+    assert sizes == sorted(sizes, reverse=True)
+
+    first_page = test_client.get(
+        f"/api/org-hierarchy/tree/{ceo['employee_id']}/children?limit=1"
+    ).json()
+    assert first_page["children"] == level["children"][:1]
+    assert first_page["next_cursor"] is not None
+
+
+def test_get_org_tree_children_when_invalid_employee_id_then_returns_404(
+    test_client: TestClient,
+    sample_session_with_org_hierarchy: dict,
+) -> None:
+    """Test expanding an unknown employee returns 404."""
+    response = test_client.get("/api/org-hierarchy/tree/999999/children")
+
+    assert response.status_code == 404
@@ -0,0 +1,339 @@
+"""Performance tests for OrgService on large and pathological org shapes.
+
+Every benchmark runs against four org shapes at 1k, 10k and 100k employees:
+
+- realistic: the 6-level pyramid from ManagementChainBuilder
+- deep: 12 levels of equal width, each employee reporting to a random
+  employee one level up
+- wide: spans of 500 direct reports per manager
+- duplicate_names: the realistic pyramid with ~20 employees sharing each
+  name, so managers are resolved through the management chain columns and
+  the duplicate-name tiebreakers
+
+Baselines (mean seconds on a developer machine) are recorded in
+org_service_baselines.json; a benchmark fails when its mean exceeds the
+baseline by REGRESSION_FACTOR. After an intentional change, re-record them
+from the means in --benchmark-json output.
+Use --benchmark-compare to track performance over time.
+"""
+
+import gc
+import json
+import random
+from collections.abc import Callable, Iterator
+from datetime import date
+from pathlib import Path
+from typing import Any, NamedTuple
+
+import pytest
+from fastapi.testclient import TestClient
+
+from ninebox.core.dependencies import get_org_service
+from ninebox.models.employee import Employee, PerformanceLevel, PotentialLevel
+from ninebox.services.org_service import OrgService
+from ninebox.services.sample_data_generator import ManagementChainBuilder
+
+# Check if pytest-benchmark is available
+try:
+    import pytest_benchmark  # noqa: F401
+
+    BENCHMARK_AVAILABLE = True
+except ImportError:
+    BENCHMARK_AVAILABLE = False
+
+pytestmark = [
+    pytest.mark.performance,
+    pytest.mark.slow,
+    pytest.mark.skipif(
+        not BENCHMARK_AVAILABLE,
+        reason="pytest-benchmark not installed. Install with: pip install pytest-benchmark",
+    ),
+]
+
+SEED = 42
+SHAPES = ("realistic", "deep", "wide", "duplicate_names")
+SIZES = (1_000, 10_000, 100_000)
+DEEP_LEVELS = 12
+WIDE_SPAN = 500
+EMPLOYEES_PER_NAME = 20
+CHAIN_SAMPLE_SIZE = 1_000
+
+# Fewer rounds for the larger datasets keep the suite within a few minutes
+ROUNDS = {1_000: 20, 10_000: 5, 100_000: 3}
+
+# Allow 3x the recorded mean: CI runners are slower and noisier than the
+# machine the baselines were recorded on, while the regressions this suite
+# guards against (quadratic scans, per-call rebuilds) cost 10x or more
+REGRESSION_FACTOR = 3.0
+
+# Timings of a few milliseconds are dominated by timer, scheduler and
+# request overhead, so baselines are raised to this floor before scaling
+MIN_BASELINE = 0.01
+
+# Mean seconds per call: {operation: {"shape-size": seconds}}
+BASELINES: dict[str, dict[str, float]] = json.loads(
+    (Path(__file__).parent / "org_service_baselines.json").read_text()
+)
+
+
+class OrgDataset(NamedTuple):
+    """A generated org and the employees the benchmarks query."""
+
+    shape: str
+    size: int
+    employees: list[Employee]
+
+
+def _org_employee(
+    employee_id: int, name: str, job_level: str, manager_names: list[str]
+) -> Employee:
+    """Create an employee with their chain columns filled in, nearest manager first."""
+    chain = [*manager_names[:6], *[None] * (6 - min(len(manager_names), 6))]
+    return Employee(
+        employee_id=employee_id,
+        name=name,
+        business_title=f"{job_level} Title",
+        job_title=f"{job_level} Title",
+        job_profile="EngineeringUSA",
+        job_level=job_level,
+        job_function="Engineering",
+        location="USA",
+        direct_manager=manager_names[0] if manager_names else "None",
+        management_chain_01=chain[0],
+        management_chain_02=chain[1],
+        management_chain_03=chain[2],
+        management_chain_04=chain[3],
+        management_chain_05=chain[4],
+        management_chain_06=chain[5],
+        hire_date=date(2020, 1, 1),
+        tenure_category="3-5 years",
+        time_in_job_profile="2 years",
+        performance=PerformanceLevel.MEDIUM,
+        potential=PotentialLevel.MEDIUM,
+        grid_position=5,
+        talent_indicator="Solid Contributor",
+    )
+
+
+def _employees_from_managers(
+    managers: list[int | None], names: list[str], job_levels: list[str]
+) -> list[Employee]:
+    """Create employees from manager positions (each manager precedes their reports)."""
+    chains: list[list[str]] = []
+    employees = []
+    for position, manager in enumerate(managers):
+        chain = [] if manager is None else [names[manager], *chains[manager][:5]]
+        chains.append(chain)
+        employees.append(_org_employee(position + 1, names[position], job_levels[position], chain))
+    return employees
+
+
+def _generate_pyramid(size: int, unique_names: bool) -> list[Employee]:
+    """The ManagementChainBuilder pyramid, optionally with heavily duplicated names."""
+    hierarchy = ManagementChainBuilder().build_org_hierarchy(size=size, seed=SEED)
+    position_of = {emp_id: position for position, emp_id in enumerate(hierarchy)}
+    nodes = list(hierarchy.values())
+    managers = [position_of[node.manager] if node.manager else None for node in nodes]
+    if unique_names:
+        names = [f"Employee {position + 1}" for position in range(size)]
+    else:
+        pool_size = size // EMPLOYEES_PER_NAME
+        names = [f"Name {position % pool_size}" for position in range(size)]
+    return _employees_from_managers(managers, names, [node.level for node in nodes])
+
+
+def _generate_deep(size: int) -> list[Employee]:
+    """12 levels of equal width; everyone reports to a random employee one level up."""
+    rng = random.Random(SEED)  # nosec B311
+    levels: list[list[int]] = [[0]] + [[] for _ in range(DEEP_LEVELS - 1)]
+    managers: list[int | None] = [None]
+    job_levels = ["MT6"]
+    for position in range(1, size):
+        level = 1 + (position - 1) * (DEEP_LEVELS - 1) // (size - 1)
+        managers.append(rng.choice(levels[level - 1]))
+        levels[level].append(position)
+        job_levels.append(f"MT{max(1, 6 - level // 2)}")
+    names = [f"Employee {position + 1}" for position in range(size)]
+    return _employees_from_managers(managers, names, job_levels)
+
+
+def _generate_wide(size: int) -> list[Employee]:
+    """Every manager has 500 direct reports (filled breadth-first)."""
+    managers = [None, *((position - 1) // WIDE_SPAN for position in range(1, size))]
+    names = [f"Employee {position + 1}" for position in range(size)]
+    job_levels = ["MT6" if position == 0 else "MT3" for position in range(size)]
+    return _employees_from_managers(managers, names, job_levels)
+
+
+GENERATORS: dict[str, Callable[[int], list[Employee]]] = {
+    "realistic": lambda size: _generate_pyramid(size, unique_names=True),
+    "deep": _generate_deep,
+    "wide": _generate_wide,
+    "duplicate_names": lambda size: _generate_pyramid(size, unique_names=False),
+}
+
+
+@pytest.fixture(
+    scope="module",
+    params=[(shape, size) for size in SIZES for shape in SHAPES],
+    ids=lambda param: f"{param[0]}-{param[1]}",
+)
+def org_dataset(request: pytest.FixtureRequest) -> Iterator[OrgDataset]:
+    """Generate one org shape at one size (shared by every benchmark on it).
+
+    The employees are frozen out of garbage collection while in use, so the
+    per-test gc.collect() in the root conftest does not rescan 100k objects.
+    """
+    shape, size = request.param
+    dataset = OrgDataset(shape, size, GENERATORS[shape](size))
+    gc.freeze()
+    yield dataset
+    gc.unfreeze()
+
+
+@pytest.fixture(scope="module")
+def warm_org_service(org_dataset: OrgDataset) -> OrgService:
+    """An OrgService over the dataset with managers resolved and the tree laid out."""
+    service = OrgService(org_dataset.employees, validate=False)
+    service.get_roots()
+    return service
+
+
+@pytest.fixture
+def org_client(test_client: TestClient, warm_org_service: OrgService) -> Iterator[TestClient]:
+    """A test client whose org-hierarchy endpoints are served from the dataset."""
+    test_client.app.dependency_overrides[get_org_service] = lambda: warm_org_service
+    yield test_client
+    test_client.app.dependency_overrides.pop(get_org_service, None)
+
+
+def _assert_within_baseline(benchmark: Any, operation: str, dataset: OrgDataset) -> None:
+    """Fail if the benchmark mean regressed past the recorded baseline."""
+    if benchmark.stats is None:  # benchmarks disabled (--benchmark-disable)
+        return
+    baseline = max(BASELINES[operation][f"{dataset.shape}-{dataset.size}"], MIN_BASELINE)
+    mean = benchmark.stats.stats.mean
+    assert mean <= baseline * REGRESSION_FACTOR, (
+        f"{operation} on {dataset.shape}-{dataset.size} took {mean:.4f}s "
+        f"> {baseline * REGRESSION_FACTOR:.4f}s (baseline {baseline:.4f}s x {REGRESSION_FACTOR})"
+    )
+
+
+class TestOrgServiceBuildPerformance:
+    """Benchmarks for work done once per OrgService (timed on a fresh service each round)."""
+
+    def test_build_org_tree_when_fresh_service_then_within_baseline(
+        self,
+        benchmark: pytest.fixture,
+        org_dataset: OrgDataset,
+    ) -> None:
+        """Benchmark manager resolution, tree layout and the materialized org tree.
+
+        Target: <3s at 100k employees (the deep shape materializes ~12 entries per employee)
+        """
+
+        def fresh_service() -> tuple[tuple[OrgService], dict]:
+            return (OrgService(org_dataset.employees, validate=False),), {}
+
+        def build_org_tree(service: OrgService) -> dict[int, list[Employee]]:
+            return service.build_org_tree()
+
+        benchmark.pedantic(build_org_tree, setup=fresh_service, rounds=ROUNDS[org_dataset.size])
+        _assert_within_baseline(benchmark, "build_org_tree", org_dataset)
+
+    def test_validate_structure_when_fresh_service_then_within_baseline(
+        self,
+        benchmark: pytest.fixture,
+        org_dataset: OrgDataset,
+    ) -> None:
+        """Benchmark validation (manager resolution plus the cycle search).
+
+        Target: <2s at 100k employees (duplicate names are the slowest to resolve)
+        """
+
+        def fresh_service() -> tuple[tuple[OrgService], dict]:
+            return (OrgService(org_dataset.employees, validate=False),), {}
+
+        def validate_structure(service: OrgService) -> None:
+            assert service.validate_structure().is_valid
+
+        benchmark.pedantic(validate_structure, setup=fresh_service, rounds=ROUNDS[org_dataset.size])
+        _assert_within_baseline(benchmark, "validate_structure", org_dataset)
+
+
+class TestOrgServiceQueryPerformance:
+    """Benchmarks for per-request queries against an already built OrgService."""
+
+    def test_get_reporting_chain_when_1000_employees_then_within_baseline(
+        self,
+        benchmark: pytest.fixture,
+        org_dataset: OrgDataset,
+        warm_org_service: OrgService,
+    ) -> None:
+        """Benchmark reporting chains for 1,000 employees spread across the org.
+
+        Target: <10ms for all 1,000 chains
+        """
+        step = org_dataset.size // CHAIN_SAMPLE_SIZE
+        sample = [emp.employee_id for emp in org_dataset.employees[::step]]
+
+        def get_reporting_chains() -> int:
+            return sum(len(warm_org_service.get_reporting_chain(emp_id)) for emp_id in sample)
+
+        benchmark.pedantic(get_reporting_chains, rounds=ROUNDS[org_dataset.size])
+        _assert_within_baseline(benchmark, "get_reporting_chain", org_dataset)
+
+    def test_find_managers_when_min_team_size_10_then_within_baseline(
+        self,
+        benchmark: pytest.fixture,
+        org_dataset: OrgDataset,
+        warm_org_service: OrgService,
+    ) -> None:
+        """Benchmark finding managers of 10+ employees.
+
+        Target: <100ms at 100k employees
+        """
+
+        def find_managers() -> list[int]:
+            return warm_org_service.find_managers(min_team_size=10)
+
+        benchmark.pedantic(find_managers, rounds=ROUNDS[org_dataset.size])
+        _assert_within_baseline(benchmark, "find_managers", org_dataset)
+
+
+class TestOrgHierarchyEndpointPerformance:
+    """Benchmarks for the org-hierarchy endpoints over a cached OrgService."""
+
+    @pytest.mark.parametrize(
+        "endpoint",
+        ["managers", "tree", "tree_roots", "tree_children", "reports", "reporting_chain"],
+    )
+    def test_endpoint_when_large_org_then_within_baseline(
+        self,
+        benchmark: pytest.fixture,
+        org_dataset: OrgDataset,
+        warm_org_service: OrgService,
+        org_client: TestClient,
+        endpoint: str,
+    ) -> None:
+        """Benchmark one org-hierarchy endpoint, paginated endpoints at their default page.
+
+        Target: <100ms per request at 100k employees (<1s for the full manager list and tree)
+        """
+        root_id = warm_org_service.get_roots()[0].employee_id
+        leaf_id = org_dataset.employees[-1].employee_id
+        url = {
+            "managers": "/api/org-hierarchy/managers?min_team_size=10",
+            "tree": "/api/org-hierarchy/tree?min_team_size=10",
+            "tree_roots": "/api/org-hierarchy/tree/roots",
+            "tree_children": f"/api/org-hierarchy/tree/{root_id}/children",
+            "reports": f"/api/org-hierarchy/reports/{root_id}?limit=100",
+            "reporting_chain": f"/api/org-hierarchy/reporting-chain/{leaf_id}",
+        }[endpoint]
+
+        def request_endpoint() -> None:
+            response = org_client.get(url)
+            assert response.status_code == 200
+
+        benchmark.pedantic(request_endpoint, rounds=ROUNDS[org_dataset.size])
+        _assert_within_baseline(benchmark, f"endpoint:{endpoint}", org_dataset)
@@ -0,0 +1,64 @@
+"""Tests for diagnostics API endpoints."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from ninebox.services.analysis_metrics import ANALYSIS_METRICS
+from ninebox.services.analysis_registry import get_registered_analyses
+
+pytestmark = pytest.mark.unit
+
+
+def test_get_analysis_diagnostics_when_intelligence_run_then_reports_each_analysis(
+    test_client: TestClient, session_with_employees: dict[str, str]
+) -> None:
+    """Test timings recorded by an intelligence request are exposed."""
+    ANALYSIS_METRICS.clear()
+    test_client.get("/api/intelligence", headers=session_with_employees)
+
+    response = test_client.get("/api/diagnostics/analyses")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert set(data["analyses"]) == set(get_registered_analyses())
+    assert data["analyses"]["location"]["runs"] >= 1
+    assert data["execution"]["stats_backend"] in ["numpy", "pure"]
+    assert {"size", "hits", "misses"} <= set(data["cache"])
+
+
+def test_get_intelligence_when_profile_requested_then_report_retrievable(
+    test_client: TestClient, session_with_employees: dict[str, str]
+) -> None:
+    """Test ?profile=cprofile stores a report under the X-Profile-Id header."""
+    response = test_client.get(
+        "/api/intelligence", params={"profile": "cprofile"}, headers=session_with_employees
+    )
+
+    assert response.status_code == 200
+    assert "quality_score" in response.json()
+    profile_id = response.headers["X-Profile-Id"]
+
+    listed = test_client.get("/api/diagnostics/profiles").json()["profiles"]
+    assert profile_id in [p["profile_id"] for p in listed]
+
+    report = test_client.get(f"/api/diagnostics/profiles/{profile_id}")
+    assert report.status_code == 200
+    assert "calculate_overall_intelligence" in report.text
+
+
+def test_get_intelligence_when_profiler_unknown_then_returns_422(
+    test_client: TestClient, session_with_employees: dict[str, str]
+) -> None:
+    """Test unknown profiler names are rejected by validation."""
+    response = test_client.get(
+        "/api/intelligence", params={"profile": "perf"}, headers=session_with_employees
+    )
+
+    assert response.status_code == 422
+
+
+def test_get_profile_when_unknown_id_then_returns_404(test_client: TestClient) -> None:
+    """Test missing profiles return 404."""
+    response = test_client.get("/api/diagnostics/profiles/missing")
+
+    assert response.status_code == 404
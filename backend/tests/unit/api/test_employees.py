@@ -64,6 +64,117 @@ def test_get_employees_when_exclude_ids_then_excludes_correctly(
     assert all(emp["employee_id"] not in [1, 3] for emp in data["employees"])
 
 
+def test_get_employees_when_under_manager_ids_then_returns_whole_organization(
+    test_client: TestClient, session_with_employees: dict[str, str]
+) -> None:
+    """Test GET /api/employees and /api/statistics filter to everyone under a manager."""
+    roots = test_client.get("/api/org-hierarchy/tree/roots", headers=session_with_employees).json()
+    manager_id = roots["children"][0]["employee_id"]
+    reports = test_client.get(
+        f"/api/org-hierarchy/reports/{manager_id}", headers=session_with_employees
+    ).json()
+    expected_ids = {emp["employee_id"] for emp in reports["all_reports"]}
+
+    response = test_client.get(
+        f"/api/employees?under_manager_ids={manager_id}", headers=session_with_employees
+    )
+    statistics = test_client.get(
+        f"/api/statistics?under_manager_ids={manager_id}", headers=session_with_employees
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["filtered"] == reports["total_reports_count"] > 0
+    assert {emp["employee_id"] for emp in data["employees"]} == expected_ids
+    assert statistics.json()["total_employees"] == len(expected_ids)
+
+
+def test_reassign_manager_when_called_then_org_hierarchy_reflects_move(
+    test_client: TestClient, session_with_employees: dict[str, str]
+) -> None:
+    """Test PATCH /api/employees/{id}/manager moves a whole team and records an event."""
+    roots = test_client.get("/api/org-hierarchy/tree/roots", headers=session_with_employees).json()
+    ceo_id = roots["children"][0]["employee_id"]
+    teams = test_client.get(
+        f"/api/org-hierarchy/tree/{ceo_id}/children", headers=session_with_employees
+    ).json()["children"]
+    moved, target = teams[0], teams[1]
+
+    response = test_client.patch(
+        f"/api/employees/{moved['employee_id']}/manager",
+        json={"manager_id": target["employee_id"]},
+        headers=session_with_employees,
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["change"]["event_type"] == "reporting_line_change"
+    assert data["change"]["new_manager_id"] == target["employee_id"]
+    assert data["employee"]["direct_manager"] == target["name"]
+    reports = test_client.get(
+        f"/api/org-hierarchy/reports/{target['employee_id']}", headers=session_with_employees
+    ).json()
+    assert reports["total_reports_count"] == target["team_size"] + moved["team_size"] + 1
+
+    cycle = test_client.patch(
+        f"/api/employees/{target['employee_id']}/manager",
+        json={"manager_id": moved["employee_id"]},
+        headers=session_with_employees,
+    )
+    missing = test_client.patch(
+        f"/api/employees/{moved['employee_id']}/manager",
+        json={"manager_id": 99999},
+        headers=session_with_employees,
+    )
+    assert cycle.status_code == 400
+    assert missing.status_code == 404
+
+
+def test_reassign_managers_when_bulk_then_applies_all_or_none(
+    test_client: TestClient, session_with_employees: dict[str, str]
+) -> None:
+    """Test POST /api/employees/reassign-managers applies a batch atomically."""
+    roots = test_client.get("/api/org-hierarchy/tree/roots", headers=session_with_employees).json()
+    ceo_id = roots["children"][0]["employee_id"]
+    teams = test_client.get(
+        f"/api/org-hierarchy/tree/{ceo_id}/children", headers=session_with_employees
+    ).json()["children"]
+    first, target = (team["employee_id"] for team in teams[:2])
+    second = test_client.get(
+        f"/api/org-hierarchy/tree/{first}/children", headers=session_with_employees
+    ).json()["children"][0]["employee_id"]
+
+    rejected = test_client.post(
+        "/api/employees/reassign-managers",
+        json={
+            "assignments": [
+                {"employee_id": first, "manager_id": target},
+                {"employee_id": target, "manager_id": first},
+            ]
+        },
+        headers=session_with_employees,
+    )
+    accepted = test_client.post(
+        "/api/employees/reassign-managers",
+        json={
+            "assignments": [
+                {"employee_id": first, "manager_id": target},
+                {"employee_id": second, "manager_id": target},
+            ]
+        },
+        headers=session_with_employees,
+    )
+
+    assert rejected.status_code == 400
+    assert accepted.status_code == 200
+    assert [c["employee_id"] for c in accepted.json()["changes"]] == [first, second]
+    filtered = test_client.get(
+        f"/api/employees?under_manager_ids={target}&fields=employee_id",
+        headers=session_with_employees,
+    ).json()
+    assert {first, second} <= {emp["employee_id"] for emp in filtered["employees"]}
+
+
 def test_get_employee_by_id_when_exists_then_returns_employee(
     test_client: TestClient, session_with_employees: dict[str, str]
 ) -> None:
@@ -612,3 +723,201 @@ def test_update_employee_when_multiple_field_updates_then_modified_status_correc
     assert data["employee"]["notes"] == "High potential employee"
     # Should NOT be modified since position hasn't changed
     assert data["employee"]["modified_in_session"] is False
+
+
+def test_get_employee_facets_when_no_filters_then_counts_all_employees(
+    test_client: TestClient, session_with_employees: dict[str, str]
+) -> None:
+    """Test GET /api/employees/facets returns employees and per-facet counts."""
+    response = test_client.get("/api/employees/facets", headers=session_with_employees)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["filtered"] == 50
+    assert len(data["employees"]) == 50
+    assert set(data["facets"]) == {
+        "levels",
+        "job_functions",
+        "locations",
+        "managers",
+        "performance",
+        "potential",
+        "flags",
+        "movers",
+    }
+    assert sum(data["facets"]["performance"].values()) == 50
+
+
+def test_get_employee_facets_when_filtered_then_matches_get_employees(
+    test_client: TestClient, session_with_employees: dict[str, str]
+) -> None:
+    """Test facet results agree with GET /api/employees for the same filters."""
+    employees_response = test_client.get(
+        "/api/employees?levels=MT4&performance=High", headers=session_with_employees
+    )
+    facets_response = test_client.get(
+        "/api/employees/facets?levels=MT4&performance=High", headers=session_with_employees
+    )
+
+    assert facets_response.status_code == 200
+    data = facets_response.json()
+    assert data["employees"] == employees_response.json()["employees"]
+    # The performance counts ignore the performance selection itself
+    assert data["facets"]["performance"].get("High", 0) == data["filtered"]
+    assert sum(data["facets"]["levels"].values()) >= data["filtered"]
+
+
+def test_get_employee_facets_when_invalid_performance_then_returns_400(
+    test_client: TestClient, session_with_employees: dict[str, str]
+) -> None:
+    """Test invalid performance filter values are rejected."""
+    response = test_client.get(
+        "/api/employees/facets?performance=Excellent", headers=session_with_employees
+    )
+
+    assert response.status_code == 400
+
+
+def test_get_employees_when_limit_then_pages_with_cursor(
+    test_client: TestClient, session_with_employees: dict[str, str]
+) -> None:
+    """Test cursor pagination walks the full filtered list exactly once."""
+    seen: list[int] = []
+    url = "/api/employees?limit=20"
+    pages = 0
+    while url:
+        response = test_client.get(url, headers=session_with_employees)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["filtered"] == 50
+        assert len(data["employees"]) <= 20
+        seen.extend(emp["employee_id"] for emp in data["employees"])
+        pages += 1
+        cursor = data["next_cursor"]
+        url = f"/api/employees?limit=20&cursor={cursor}" if cursor else ""
+
+    assert pages == 3
+    assert len(seen) == len(set(seen)) == 50
+
+
+def test_get_employees_when_cursor_reused_after_change_then_rejected(
+    test_client: TestClient, session_with_employees: dict[str, str]
+) -> None:
+    """Test cursors are rejected for another query (400) or after a move (410)."""
+    first = test_client.get("/api/employees?limit=20&sort=name", headers=session_with_employees)
+    cursor = first.json()["next_cursor"]
+
+    other_query = test_client.get(
+        f"/api/employees?limit=20&sort=-name&cursor={cursor}", headers=session_with_employees
+    )
+    assert other_query.status_code == 400
+
+    move = test_client.patch(
+        "/api/employees/1/move",
+        json={"performance": "Medium", "potential": "Low"},
+        headers=session_with_employees,
+    )
+    assert move.status_code == 200
+    stale = test_client.get(
+        f"/api/employees?limit=20&sort=name&cursor={cursor}", headers=session_with_employees
+    )
+    assert stale.status_code == 410
+
+
+def test_get_employees_when_fields_then_projects_employees(
+    test_client: TestClient, session_with_employees: dict[str, str]
+) -> None:
+    """Test fields= returns only the requested fields plus employee_id."""
+    response = test_client.get(
+        "/api/employees?fields=name,grid_position,is_big_mover", headers=session_with_employees
+    )
+
+    assert response.status_code == 200
+    employees = response.json()["employees"]
+    assert len(employees) == 50
+    assert all(
+        set(emp) == {"employee_id", "name", "grid_position", "is_big_mover"} for emp in employees
+    )
+
+
+def test_get_employees_when_sort_descending_then_orders_server_side(
+    test_client: TestClient, session_with_employees: dict[str, str]
+) -> None:
+    """Test sort= orders by the key, breaking ties by employee_id."""
+    response = test_client.get(
+        "/api/employees?sort=-grid_position&fields=grid_position", headers=session_with_employees
+    )
+
+    assert response.status_code == 200
+    employees = response.json()["employees"]
+    keys = [(-emp["grid_position"], emp["employee_id"]) for emp in employees]
+    assert keys == sorted(keys)
+
+
+def test_sort_employees_when_values_missing_then_sorted_last_in_both_directions() -> None:
+    """Test employees without a value for the sort key come last, ascending or descending."""
+    from ninebox.api.employees import _sort_employees
+    from tests.conftest import create_simple_test_employee
+
+    employees = [create_simple_test_employee(employee_id=i, name=f"E{i}") for i in range(1, 5)]
+    for employee, notes in zip(employees, [None, "b", None, "a"], strict=True):
+        employee.notes = notes
+
+    ascending = _sort_employees(employees, "notes")
+    descending = _sort_employees(employees, "-notes")
+
+    assert [e.employee_id for e in ascending] == [4, 2, 1, 3]
+    assert [e.employee_id for e in descending] == [2, 4, 1, 3]
+
+
+def test_get_employees_when_invalid_fields_or_sort_then_returns_400(
+    test_client: TestClient, session_with_employees: dict[str, str]
+) -> None:
+    """Test unknown projection and sort fields are rejected."""
+    assert (
+        test_client.get("/api/employees?fields=salary", headers=session_with_employees).status_code
+        == 400
+    )
+    assert (
+        test_client.get("/api/employees?sort=flags", headers=session_with_employees).status_code
+        == 400
+    )
+    assert (
+        test_client.get("/api/employees?sort=--name", headers=session_with_employees).status_code
+        == 400
+    )
+    assert (
+        test_client.get("/api/employees?cursor=bogus", headers=session_with_employees).status_code
+        == 400
+    )
+
+
+def test_get_employees_when_if_none_match_current_then_returns_304(
+    test_client: TestClient, session_with_employees: dict[str, str]
+) -> None:
+    """Test conditional GET returns 304 until the session changes."""
+    first = test_client.get("/api/employees?levels=MT4", headers=session_with_employees)
+    etag = first.headers["etag"]
+
+    cached = test_client.get(
+        "/api/employees?levels=MT4", headers={**session_with_employees, "If-None-Match": etag}
+    )
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
+
+    # A different query has its own ETag
+    other = test_client.get(
+        "/api/employees?levels=MT5", headers={**session_with_employees, "If-None-Match": etag}
+    )
+    assert other.status_code == 200
+
+    test_client.patch(
+        "/api/employees/1/move",
+        json={"performance": "Low", "potential": "Low"},
+        headers=session_with_employees,
+    )
+    changed = test_client.get(
+        "/api/employees?levels=MT4", headers={**session_with_employees, "If-None-Match": etag}
+    )
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
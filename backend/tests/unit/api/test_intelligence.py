@@ -342,3 +342,123 @@ def test_get_intelligence_when_response_then_matches_typeddict_structure(
         "manager_analysis",
     ]:
         assert set(data[dimension].keys()) == dimension_keys
+
+
+def test_stream_intelligence_when_session_exists_then_streams_dimensions_then_summary(
+    test_client: TestClient, session_with_employees: dict[str, str]
+) -> None:
+    """Test the NDJSON stream carries every dimension and ends with the summary."""
+    import json
+
+    full = test_client.get("/api/intelligence", headers=session_with_employees).json()
+
+    response = test_client.get("/api/intelligence/stream", headers=session_with_employees)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    dimensions = {line["dimension"]: line["result"] for line in lines[:-1]}
+    assert all(line["type"] == "dimension" for line in lines[:-1])
+    assert dimensions == {key: value for key, value in full.items() if key.endswith("_analysis")}
+    assert lines[-1] == {
+        "type": "summary",
+        "quality_score": full["quality_score"],
+        "anomaly_count": full["anomaly_count"],
+    }
+
+
+def test_stream_intelligence_when_etag_matches_then_returns_304(
+    test_client: TestClient, session_with_employees: dict[str, str]
+) -> None:
+    """Test the stream honours the session revision ETag."""
+    first = test_client.get("/api/intelligence/stream", headers=session_with_employees)
+    etag = first.headers["etag"]
+
+    cached = test_client.get(
+        "/api/intelligence/stream", headers={**session_with_employees, "If-None-Match": etag}
+    )
+
+    assert cached.status_code == 304
+
+
+def test_stream_intelligence_when_no_session_then_returns_404(test_client: TestClient) -> None:
+    """Test streaming without a session fails before any line is sent."""
+    response = test_client.get("/api/intelligence/stream")
+
+    assert response.status_code == 404
+
+
+def test_get_intelligence_when_filtered_then_analyzes_slice_only(
+    test_client: TestClient, session_with_employees: dict[str, str]
+) -> None:
+    """Test filter parameters restrict the analysis to the matching employees."""
+    employees = test_client.get("/api/employees", headers=session_with_employees).json()[
+        "employees"
+    ]
+    level = employees[0]["job_level"]
+    expected_size = sum(1 for e in employees if e["job_level"] == level)
+
+    response = test_client.get(
+        "/api/intelligence", params={"levels": level}, headers=session_with_employees
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    for dimension in ["location_analysis", "level_analysis", "tenure_analysis"]:
+        assert data[dimension]["sample_size"] in (0, expected_size)
+    level_categories = {d["category"] for d in data["level_analysis"]["deviations"]}
+    assert level_categories <= {level}
+
+
+def test_get_intelligence_when_under_manager_ids_then_analyzes_organization(
+    test_client: TestClient, session_with_employees: dict[str, str]
+) -> None:
+    """Test under_manager_ids restricts the analysis to the manager's organization."""
+    roots = test_client.get("/api/org-hierarchy/tree/roots", headers=session_with_employees).json()
+    manager_id = roots["children"][0]["employee_id"]
+    team_size = roots["children"][0]["team_size"]
+
+    response = test_client.get(
+        "/api/intelligence",
+        params={"under_manager_ids": manager_id},
+        headers=session_with_employees,
+    )
+
+    assert response.status_code == 200
+    data = response.json()
+    for dimension in ["location_analysis", "level_analysis", "tenure_analysis"]:
+        assert data[dimension]["sample_size"] in (0, team_size)
+
+
+def test_get_intelligence_when_filtered_then_etag_differs_from_full_dataset(
+    test_client: TestClient, session_with_employees: dict[str, str]
+) -> None:
+    """Test filtered and unfiltered responses are cached under different ETags."""
+    full = test_client.get("/api/intelligence", headers=session_with_employees)
+    filtered = test_client.get(
+        "/api/intelligence", params={"locations": "USA"}, headers=session_with_employees
+    )
+
+    assert full.status_code == filtered.status_code == 200
+    assert full.headers["etag"] != filtered.headers["etag"]
+
+
+def test_stream_intelligence_when_filtered_then_matches_filtered_get(
+    test_client: TestClient, session_with_employees: dict[str, str]
+) -> None:
+    """Test the stream applies the same filters as GET /api/intelligence."""
+    import json
+
+    params = {"locations": "USA"}
+    full = test_client.get("/api/intelligence", params=params, headers=session_with_employees)
+
+    response = test_client.get(
+        "/api/intelligence/stream", params=params, headers=session_with_employees
+    )
+
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    dimensions = {line["dimension"]: line["result"] for line in lines[:-1]}
+    assert dimensions == {
+        key: value for key, value in full.json().items() if key.endswith("_analysis")
+    }
+    assert lines[-1]["quality_score"] == full.json()["quality_score"]
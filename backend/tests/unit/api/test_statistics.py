@@ -200,3 +200,19 @@ def test_get_statistics_when_invalid_exclude_ids_then_returns_400(
 
 # NOTE: test_get_statistics_when_no_auth_then_returns_401 removed
 # This app is local-only without authentication
+
+
+def test_get_statistics_when_if_none_match_current_then_returns_304(
+    test_client: TestClient, session_with_employees: dict[str, str]
+) -> None:
+    """Test statistics support conditional GET keyed on the session revision."""
+    first = test_client.get("/api/statistics", headers=session_with_employees)
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+
+    cached = test_client.get(
+        "/api/statistics", headers={**session_with_employees, "If-None-Match": etag}
+    )
+
+    assert cached.status_code == 304
+    assert cached.content == b""
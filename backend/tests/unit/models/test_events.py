@@ -11,6 +11,7 @@ from ninebox.models.events import (
     FlagAddEvent,
     FlagRemoveEvent,
     GridMoveEvent,
+    ReportingLineChangeEvent,
     TrackableEvent,
 )
 from tests.test_utils import create_test_employee
@@ -365,6 +366,48 @@ class TestFlagRemoveEvent:
         assert event.event_type == "flag_remove"
 
 
+class TestReportingLineChangeEvent:
+    """Tests for ReportingLineChangeEvent class."""
+
+    def test_is_net_zero_when_back_to_original_manager(self) -> None:
+        """Test that the event is net-zero by manager ID, or by name if there was none."""
+        original_employee = create_test_employee(employee_id=4, name="Carl")
+        original_employee.direct_manager = "Vic"
+
+        back = ReportingLineChangeEvent(
+            employee_id=4,
+            employee_name="Carl",
+            old_manager_id=2,
+            old_manager_name="Vic",
+            new_manager_id=2,
+            new_manager_name="Vic",
+        )
+        moved = back.model_copy(update={"new_manager_id": 3, "new_manager_name": "Val"})
+        unresolved = back.model_copy(update={"old_manager_id": None})
+
+        assert back.is_net_zero(original_employee) is True
+        assert moved.is_net_zero(original_employee) is False
+        assert unresolved.is_net_zero(original_employee) is True
+
+    def test_event_round_trips_through_discriminated_union(self) -> None:
+        """Test that the event deserializes to its own type from the Event union."""
+        from pydantic import TypeAdapter
+
+        event = ReportingLineChangeEvent(
+            employee_id=4,
+            employee_name="Carl",
+            old_manager_id=None,
+            old_manager_name="Former Boss",
+            new_manager_id=3,
+            new_manager_name="Val",
+        )
+
+        restored = TypeAdapter(Event).validate_json(event.model_dump_json())
+
+        assert isinstance(restored, ReportingLineChangeEvent)
+        assert restored == event
+
+
 class TestEventSerialization:
     """Tests for event serialization and Pydantic validation."""
 
@@ -83,6 +83,26 @@ def test_from_query_params_when_invalid_exclude_ids_then_raises_400() -> None:
     assert "employee ID" in exc_info.value.detail
 
 
+def test_from_query_params_when_under_manager_ids_then_parses_ids() -> None:
+    """Test that under_manager_ids is parsed as a list of manager IDs."""
+    filters = EmployeeFilters.from_query_params(under_manager_ids="7, 12")
+
+    assert filters.under_manager_ids == [7, 12]
+    assert filters.to_filter_kwargs() == {"under_manager_ids": [7, 12]}
+
+    with pytest.raises(HTTPException) as exc_info:
+        EmployeeFilters.from_query_params(under_manager_ids="7,x")
+    assert "manager ID" in exc_info.value.detail
+
+
+
+def test_from_query_params_when_raw_location_codes_then_split_from_display_names() -> None:
+    """Test raw codes with a different display name become location_codes."""
+    filters = EmployeeFilters.from_query_params(locations="GBR,Europe,USA")
+
+    assert filters.locations == ["Europe", "USA"]
+    assert filters.location_codes == ["GBR"]
+
 def test_to_filter_kwargs_when_some_none_then_only_includes_non_none() -> None:
     """Test that to_filter_kwargs excludes None values."""
     filters = EmployeeFilters(
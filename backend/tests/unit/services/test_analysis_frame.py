@@ -0,0 +1,333 @@
+"""Tests for the columnar analysis frame shared by the intelligence analyses."""
+
+from collections import Counter
+from unittest.mock import patch
+
+import pytest
+
+from ninebox.models.employee import Employee, PerformanceLevel, PotentialLevel
+from ninebox.models.grid_positions import PERFORMANCE_BUCKETS, calculate_grid_position
+from ninebox.services.analysis_frame import (
+    NO_BUCKET,
+    PERFORMANCE_LEVELS,
+    AnalysisFrame,
+    as_analysis_frame,
+)
+from ninebox.services.analysis_registry import run_all_analyses
+from ninebox.services.intelligence_service import (
+    calculate_function_analysis,
+    calculate_location_analysis,
+    calculate_manager_analysis,
+    calculate_overall_intelligence,
+    calculate_per_level_distribution,
+)
+from ninebox.services.session_manager import SessionManager
+
+pytestmark = pytest.mark.unit
+
+
+def test_from_employees_when_encoded_then_columns_decode_to_attributes(
+    rich_sample_employees_large: list[Employee],
+) -> None:
+    """Test every column decodes back to the employee attribute it was read from."""
+    employees = rich_sample_employees_large
+    frame = AnalysisFrame.from_employees(employees)
+
+    assert len(frame) == len(employees)
+    for row, emp in enumerate(employees):
+        assert frame.location.labels[frame.location.codes[row]] == emp.location
+        assert frame.job_function.labels[frame.job_function.codes[row]] == emp.job_function
+        assert frame.job_level.labels[frame.job_level.codes[row]] == emp.job_level
+        assert frame.tenure.labels[frame.tenure.codes[row]] == emp.tenure_category
+        assert frame.manager.labels[frame.manager.codes[row]] == emp.direct_manager
+        assert PERFORMANCE_LEVELS[frame.performance[row]] == emp.performance.value
+        assert frame.grid_position[row] == emp.grid_position
+
+
+def test_crosstab_when_performance_by_location_then_matches_counter(
+    rich_sample_employees_large: list[Employee],
+) -> None:
+    """Test the contingency counts equal a direct count over the employees."""
+    employees = rich_sample_employees_large
+    frame = AnalysisFrame.from_employees(employees)
+
+    table = frame.crosstab(frame.location, frame.performance, len(PERFORMANCE_LEVELS))
+
+    pairs = Counter((e.location, e.performance.value) for e in employees)
+    assert table == {
+        loc: [pairs[(loc, perf)] for perf in PERFORMANCE_LEVELS]
+        for loc in {e.location for e in employees}
+    }
+
+
+def test_crosstab_when_performance_buckets_then_counts_each_tier(
+    rich_sample_employees_large: list[Employee],
+) -> None:
+    """Test bucket codes follow PERFORMANCE_BUCKETS, with a trailing no-bucket column."""
+    employees = rich_sample_employees_large
+    employees[0].grid_position = 0  # Outside every bucket
+    frame = AnalysisFrame.from_employees(employees)
+
+    table = frame.crosstab(frame.job_level, frame.performance_bucket, NO_BUCKET + 1)
+
+    level = employees[0].job_level
+    level_employees = [e for e in employees if e.job_level == level]
+    assert table[level] == [
+        sum(1 for e in level_employees if e.grid_position in PERFORMANCE_BUCKETS["High"]),
+        sum(1 for e in level_employees if e.grid_position in PERFORMANCE_BUCKETS["Medium"]),
+        sum(1 for e in level_employees if e.grid_position in PERFORMANCE_BUCKETS["Low"]),
+        1,
+    ]
+
+
+def test_crosstab_when_value_out_of_range_then_raises_value_error(
+    rich_sample_employees_small: list[Employee],
+) -> None:
+    """Test invalid grid positions are rejected instead of silently dropped."""
+    rich_sample_employees_small[0].grid_position = 10
+    frame = AnalysisFrame.from_employees(rich_sample_employees_small)
+
+    with pytest.raises(ValueError):
+        frame.crosstab(frame.job_function, frame.grid_position, 9, offset=1)
+
+
+def test_as_analysis_frame_when_given_frame_then_returns_same_object(
+    rich_sample_employees_small: list[Employee],
+) -> None:
+    """Test an existing frame is reused rather than re-encoded."""
+    frame = AnalysisFrame.from_employees(rich_sample_employees_small)
+
+    assert as_analysis_frame(frame) is frame
+    assert as_analysis_frame(rich_sample_employees_small) is not frame
+
+
+def test_row_of_when_employee_present_then_returns_row_index(
+    rich_sample_employees_small: list[Employee],
+) -> None:
+    """Test the employee_id lookup maps into the column rows."""
+    frame = AnalysisFrame.from_employees(rich_sample_employees_small)
+    target = rich_sample_employees_small[5]
+
+    assert frame.row_of(target.employee_id) == 5
+    assert frame.row_of(-1) is None
+
+
+@pytest.mark.parametrize(
+    "analysis",
+    [calculate_location_analysis, calculate_function_analysis, calculate_per_level_distribution],
+)
+def test_analysis_when_given_frame_then_matches_list_input(
+    rich_sample_employees_large: list[Employee], analysis
+) -> None:
+    """Test analyses produce the same result from a frame as from the plain list."""
+    employees = rich_sample_employees_large
+    frame = AnalysisFrame.from_employees(employees)
+
+    assert analysis(frame) == analysis(employees)
+
+
+def test_run_all_analyses_when_called_then_encodes_employees_once(
+    rich_sample_employees_large: list[Employee],
+) -> None:
+    """Test a single frame is built per run and shared by every analysis."""
+    with patch.object(
+        AnalysisFrame, "from_employees", wraps=AnalysisFrame.from_employees
+    ) as from_employees:
+        results = run_all_analyses(rich_sample_employees_large)
+
+    assert from_employees.call_count == 1
+    assert all(result["status"] != "error" for result in results.values())
+
+
+TABLE_KEYS = [
+    ("location", "performance"),
+    ("job_level", "performance"),
+    ("tenure", "performance"),
+    ("job_function", "grid_position"),
+    ("job_level", "performance_bucket"),
+]
+
+
+def _move(employee: Employee, performance: PerformanceLevel, potential: PotentialLevel) -> None:
+    """Move an employee in place, the way SessionManager.move_employee does."""
+    employee.performance = performance
+    employee.potential = potential
+    employee.grid_position = calculate_grid_position(performance, potential)
+
+
+def test_update_employee_when_employees_moved_then_tables_match_fresh_frame(
+    rich_sample_employees_large: list[Employee],
+) -> None:
+    """Test delta-updated tables equal the tables of a frame built after the moves."""
+    employees = rich_sample_employees_large
+    frame = AnalysisFrame.from_employees(employees)
+    for key in TABLE_KEYS:
+        frame.table(*key)
+
+    for emp in employees[:40:3]:
+        _move(emp, PerformanceLevel.LOW, PotentialLevel.HIGH)
+        assert frame.update_employee(emp.employee_id)
+    for emp in employees[1:40:5]:
+        _move(emp, PerformanceLevel.HIGH, PotentialLevel.HIGH)
+        assert frame.update_employee(emp.employee_id)
+
+    fresh = AnalysisFrame.from_employees(employees)
+    for key in TABLE_KEYS:
+        assert frame.table(*key) == fresh.table(*key)
+
+
+def test_update_employee_when_bucket_changes_then_manager_counts_follow(
+    rich_sample_employees_large: list[Employee],
+) -> None:
+    """Test manager tallies are adjusted along the moved employee's management chain."""
+    employees = rich_sample_employees_large
+    frame = AnalysisFrame.from_employees(employees)
+    manager_ids = list(frame.org_service.build_org_tree())
+
+    for emp in employees[::7]:
+        _move(emp, PerformanceLevel.LOW, PotentialLevel.LOW)
+        frame.update_employee(emp.employee_id)
+
+    fresh = AnalysisFrame.from_employees(employees)
+    for manager_id in manager_ids:
+        assert frame.manager_bucket_counts(manager_id) == fresh.manager_bucket_counts(manager_id)
+
+
+def test_update_employee_when_manager_changes_then_org_tree_rebuilt(
+    rich_sample_employees_large: list[Employee],
+) -> None:
+    """Test reassigning an employee's manager invalidates the cached org tree."""
+    employees = rich_sample_employees_large
+    frame = AnalysisFrame.from_employees(employees)
+    org_service = frame.org_service
+    target = next(e for e in employees if e.direct_manager != employees[0].direct_manager)
+
+    target.direct_manager = employees[0].direct_manager
+    frame.update_employee(target.employee_id)
+
+    assert frame.org_service is not org_service
+    assert frame.manager.labels[frame.manager.codes[frame.row_of(target.employee_id)]] == (
+        employees[0].direct_manager
+    )
+
+
+def test_subset_manager_rows_when_subset_given_then_counts_members_under_each_manager(
+    rich_sample_employees_large: list[Employee],
+) -> None:
+    """Test subset members are grouped under every manager above them in the full tree."""
+    employees = rich_sample_employees_large
+    frame = AnalysisFrame.from_employees(employees)
+    subset = {emp.employee_id for emp in employees[::3]}
+
+    manager_rows = frame.subset_manager_rows([*subset, 999999])
+
+    org_tree = frame.org_service.build_org_tree()
+    for manager_id, reports in org_tree.items():
+        expected = sorted(frame.row_of(e.employee_id) for e in reports if e.employee_id in subset)
+        assert sorted(manager_rows.get(manager_id, [])) == expected
+
+
+def test_update_employee_when_unknown_id_then_returns_false(
+    rich_sample_employees_small: list[Employee],
+) -> None:
+    """Test updates for employees outside the frame are ignored."""
+    frame = AnalysisFrame.from_employees(rich_sample_employees_small)
+
+    assert frame.update_employee(-1) is False
+
+
+def test_update_employee_when_moved_then_intelligence_matches_fresh_list(
+    rich_sample_employees_large: list[Employee],
+) -> None:
+    """Test intelligence on an incrementally updated frame equals a from-scratch run."""
+    employees = rich_sample_employees_large
+    frame = AnalysisFrame.from_employees(employees)
+    calculate_overall_intelligence(frame)
+
+    for emp in employees[:60:4]:
+        _move(emp, PerformanceLevel.HIGH, PotentialLevel.MEDIUM)
+        frame.update_employee(emp.employee_id)
+
+    assert calculate_overall_intelligence(frame) == calculate_overall_intelligence(list(employees))
+    assert calculate_manager_analysis(frame) == calculate_manager_analysis(list(employees))
+
+
+def test_get_analysis_frame_when_employee_moved_then_frame_stays_current(
+    sample_employees: list[Employee],
+) -> None:
+    """Test SessionManager keeps the session frame in sync with grid moves."""
+    session_manager = SessionManager()
+    session_manager.create_session(
+        user_id="user1",
+        employees=sample_employees,
+        filename="test.xlsx",
+        file_path="/tmp/test.xlsx",
+        sheet_name="Employee Data",
+        sheet_index=1,
+    )
+    frame = session_manager.get_analysis_frame("user1")
+    assert frame is not None
+    frame.table("location", "performance")
+    employee_id = sample_employees[0].employee_id
+
+    session_manager.move_employee("user1", employee_id, PerformanceLevel.LOW, PotentialLevel.LOW)
+
+    session = session_manager.get_session("user1")
+    assert session is not None
+    assert session_manager.get_analysis_frame("user1") is frame
+    fresh = AnalysisFrame.from_employees(session.current_employees)
+    assert frame.table("location", "performance") == fresh.table("location", "performance")
+
+
+def test_get_analysis_frame_when_no_session_then_returns_none() -> None:
+    """Test no frame is built without a session."""
+    assert SessionManager().get_analysis_frame("missing") is None
+
+
+def test_update_employee_when_job_level_or_name_changes_then_org_tree_rebuilt(
+    rich_sample_employees_large: list[Employee],
+) -> None:
+    """Test the duplicate-name tiebreaker fields also invalidate the cached org tree."""
+    employees = rich_sample_employees_large
+    frame = AnalysisFrame.from_employees(employees)
+
+    org_service = frame.org_service
+    employees[3].job_level = "VP Engineering"
+    frame.update_employee(employees[3].employee_id)
+    assert frame.org_service is not org_service
+
+    org_service = frame.org_service
+    employees[4].name = "Renamed Employee"
+    frame.update_employee(employees[4].employee_id)
+    assert frame.org_service is not org_service
+
+
+def test_get_org_service_when_employee_moved_then_same_index_reused(
+    sample_employees: list[Employee],
+) -> None:
+    """Test the session org index survives grid moves and is the frame's org tree."""
+    session_manager = SessionManager()
+    session_manager.create_session(
+        user_id="user1",
+        employees=sample_employees,
+        filename="test.xlsx",
+        file_path="/tmp/test.xlsx",
+        sheet_name="Employee Data",
+        sheet_index=1,
+    )
+    org_service = session_manager.get_org_service("user1")
+    assert org_service is not None
+
+    session_manager.move_employee(
+        "user1", sample_employees[0].employee_id, PerformanceLevel.LOW, PotentialLevel.LOW
+    )
+
+    assert session_manager.get_org_service("user1") is org_service
+    frame = session_manager.get_analysis_frame("user1")
+    assert frame is not None
+    assert frame.org_service is org_service
+
+
+def test_get_org_service_when_no_session_then_returns_none() -> None:
+    """Test no org index is built without a session."""
+    assert SessionManager().get_org_service("missing") is None
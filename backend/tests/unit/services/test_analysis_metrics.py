@@ -0,0 +1,115 @@
+"""Tests for the rolling per-analysis metrics."""
+
+import pytest
+
+from ninebox.models.employee import Employee
+from ninebox.services.analysis_metrics import LATENCY_BUCKETS_MS, AnalysisMetrics
+from ninebox.services.analysis_registry import ANALYSIS_REGISTRY, iter_analyses
+
+pytestmark = pytest.mark.unit
+
+
+def test_snapshot_when_samples_recorded_then_summarizes_computed_runs() -> None:
+    """Test percentiles and means cover computed runs, with hits and errors counted apart."""
+    metrics = AnalysisMetrics()
+    for ms in range(1, 101):
+        metrics.record("location", ms / 1000, employee_count=200, net_allocated_blocks=10)
+    metrics.record("location", 0.0, employee_count=200, cached=True)
+    metrics.record("location", 0.0, employee_count=200, failed=True)
+
+    summary = metrics.snapshot()["location"]
+
+    assert (summary["runs"], summary["cached_runs"], summary["errors"]) == (102, 1, 1)
+    assert summary["p50_ms"] == pytest.approx(50.0)
+    assert summary["p95_ms"] == pytest.approx(95.0)
+    assert summary["max_ms"] == pytest.approx(100.0)
+    assert summary["mean_employee_count"] == 200
+    assert summary["mean_net_allocated_blocks"] == 10
+    assert sum(bucket["count"] for bucket in summary["histogram"]) == 100
+
+
+def test_snapshot_when_slow_sample_then_lands_in_open_ended_bucket() -> None:
+    """Test histogram buckets use inclusive upper bounds plus an overflow bucket."""
+    metrics = AnalysisMetrics()
+    metrics.record("manager", 0.001, employee_count=10)
+    metrics.record("manager", 60.0, employee_count=10)
+
+    histogram = metrics.snapshot()["manager"]["histogram"]
+
+    assert len(histogram) == len(LATENCY_BUCKETS_MS) + 1
+    assert histogram[0] == {"le_ms": 1, "count": 1}
+    assert histogram[-1] == {"le_ms": None, "count": 1}
+
+
+def test_record_when_window_full_then_oldest_samples_dropped() -> None:
+    """Test memory is bounded by the rolling window."""
+    metrics = AnalysisMetrics(window=3)
+    for seconds in (10.0, 0.001, 0.002, 0.003):
+        metrics.record("tenure", seconds, employee_count=5)
+
+    summary = metrics.snapshot()["tenure"]
+
+    assert summary["runs"] == 3
+    assert summary["max_ms"] == pytest.approx(3.0)
+
+
+def test_snapshot_when_only_cache_hits_then_latency_is_none() -> None:
+    """Test an analysis served only from cache reports no latency figures."""
+    metrics = AnalysisMetrics()
+    metrics.record("level", 0.0, employee_count=5, cached=True)
+
+    summary = metrics.snapshot()["level"]
+
+    assert summary["p50_ms"] is None
+    assert summary["mean_employee_count"] is None
+
+
+def test_add_profile_when_stored_then_listed_newest_first_without_report() -> None:
+    """Test the profile ring buffer keeps the newest reports."""
+    metrics = AnalysisMetrics(max_profiles=2)
+    first = metrics.add_profile("intelligence", "cprofile", 0.5, "report 1")
+    second = metrics.add_profile("intelligence", "cprofile", 0.25, "report 2")
+    third = metrics.add_profile("intelligence", "cprofile", 0.125, "report 3")
+
+    listed = metrics.list_profiles()
+
+    assert [p["profile_id"] for p in listed] == [third, second]
+    assert "report" not in listed[0]
+    assert listed[0]["duration_ms"] == 125.0
+    assert metrics.get_profile(first) is None
+    profile = metrics.get_profile(second)
+    assert profile is not None
+    assert profile["report"] == "report 2"
+
+
+def test_iter_analyses_when_run_then_records_sample_per_analysis(
+    rich_sample_employees_small: list[Employee],
+) -> None:
+    """Test the registry records each analysis with its employee count."""
+    from ninebox.services.analysis_metrics import ANALYSIS_METRICS
+
+    ANALYSIS_METRICS.clear()
+
+    outcomes = list(iter_analyses(rich_sample_employees_small))
+
+    snapshot = ANALYSIS_METRICS.snapshot()
+    assert set(snapshot) == {name for name, _ in ANALYSIS_REGISTRY}
+    assert len(outcomes) == len(ANALYSIS_REGISTRY)
+    for summary in snapshot.values():
+        assert summary["runs"] == 1
+        assert summary["mean_employee_count"] == len(rich_sample_employees_small)
+        assert summary["p50_ms"] is not None
+
+
+def test_iter_analyses_when_thread_pool_then_allocations_not_attributed(
+    rich_sample_employees_small: list[Employee],
+) -> None:
+    """Test process-wide block counts are only recorded when analyses run alone."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    sequential = list(iter_analyses(rich_sample_employees_small))
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        pooled = list(iter_analyses(rich_sample_employees_small, executor=pool))
+
+    assert all(outcome.net_allocated_blocks is not None for outcome in sequential)
+    assert all(outcome.net_allocated_blocks is None for outcome in pooled)
@@ -413,3 +413,255 @@ class TestAnalysisRegistry:
             # Clean up
             ANALYSIS_REGISTRY.pop()
             ANALYSIS_REGISTRY.pop()
+
+
+class TestAnalysisCache:
+    """Test the revision-keyed LRU cache of analysis results."""
+
+    def test_get_or_compute_when_key_repeated_then_computes_once(self) -> None:
+        """Test a second lookup for the same key is served from the cache."""
+        from ninebox.services.analysis_registry import AnalysisCache
+
+        cache = AnalysisCache()
+        calls = []
+
+        def compute() -> dict:
+            calls.append(1)
+            return {"status": "green"}
+
+        first = cache.get_or_compute("s1", "r1", "location", None, compute)
+        second = cache.get_or_compute("s1", "r1", "location", None, compute)
+
+        assert first is second
+        assert len(calls) == 1
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_get_or_compute_when_revision_or_params_differ_then_recomputes(self) -> None:
+        """Test the revision and parameters are part of the key."""
+        from ninebox.services.analysis_registry import AnalysisCache
+
+        cache = AnalysisCache()
+        mt4 = {"levels": ["MT4"]}
+        cache.get_or_compute("s1", "r1", "location", mt4, lambda: {"n": 1})
+
+        new_revision = cache.get_or_compute("s1", "r2", "location", mt4, lambda: {"n": 2})
+        new_params = cache.get_or_compute("s1", "r1", "location", {"levels": ["MT5"]}, dict)
+        same_key = cache.get_or_compute("s1", "r1", "location", mt4, lambda: {"n": 4})
+
+        assert new_revision == {"n": 2}
+        assert new_params == {}
+        assert same_key == {"n": 1}
+
+    def test_put_when_full_then_evicts_least_recently_used(self) -> None:
+        """Test the cache is bounded and keeps recently read entries."""
+        from ninebox.services.analysis_registry import AnalysisCache
+
+        cache = AnalysisCache(maxsize=2)
+        key_a = cache.make_key("s1", "r1", "a")
+        key_b = cache.make_key("s1", "r1", "b")
+        key_c = cache.make_key("s1", "r1", "c")
+        cache.put(key_a, {"name": "a"})
+        cache.put(key_b, {"name": "b"})
+        cache.get(key_a)
+
+        cache.put(key_c, {"name": "c"})
+
+        assert len(cache) == 2
+        assert cache.get(key_b) is None
+        assert cache.get(key_a) == {"name": "a"}
+
+    def test_get_or_compute_when_compute_raises_then_nothing_cached(self) -> None:
+        """Test failures propagate and are retried on the next call."""
+        from ninebox.services.analysis_registry import AnalysisCache
+
+        cache = AnalysisCache()
+
+        def failing() -> dict:
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            cache.get_or_compute("s1", "r1", "location", None, failing)
+
+        assert len(cache) == 0
+        assert cache.get_or_compute("s1", "r1", "location", None, lambda: {"ok": True}) == {
+            "ok": True
+        }
+
+    def test_run_all_analyses_when_session_keyed_then_second_run_uses_cache(self) -> None:
+        """Test repeated runs for an unchanged session revision reuse every result."""
+        from ninebox.services.analysis_registry import ANALYSIS_CACHE, run_all_analyses
+
+        employees = [create_employee(i, location="USA" if i % 2 else "UK") for i in range(40)]
+        ANALYSIS_CACHE.invalidate_session("cache-test")
+        misses = ANALYSIS_CACHE.misses
+
+        first = run_all_analyses(employees, session_id="cache-test", revision="r1")
+        second = run_all_analyses(employees, session_id="cache-test", revision="r1")
+
+        assert ANALYSIS_CACHE.misses - misses == len(first)
+        assert all(second[name] is first[name] for name in first)
+        ANALYSIS_CACHE.invalidate_session("cache-test")
+
+    def test_session_manager_when_employee_moved_then_session_results_invalidated(
+        self, sample_employees: list[Employee]
+    ) -> None:
+        """Test SessionManager mutations drop the session's cached results."""
+        from ninebox.services.analysis_registry import ANALYSIS_CACHE
+        from ninebox.services.session_manager import SessionManager
+
+        session_manager = SessionManager()
+        session_id = session_manager.create_session(
+            user_id="user1",
+            employees=sample_employees,
+            filename="test.xlsx",
+            file_path="/tmp/test.xlsx",
+            sheet_name="Employee Data",
+            sheet_index=1,
+        )
+        session = session_manager.get_session("user1")
+        assert session is not None
+        revision = session_manager.get_revision_tag(session)
+        key = ANALYSIS_CACHE.make_key(session_id, revision, "location")
+        ANALYSIS_CACHE.put(key, {"status": "green"})
+
+        session_manager.move_employee(
+            "user1", sample_employees[0].employee_id, PerformanceLevel.LOW, PotentialLevel.LOW
+        )
+
+        assert ANALYSIS_CACHE.get(key) is None
+        assert session_manager.get_revision_tag(session) != revision
+
+
+class TestParallelExecution:
+    """Test running registered analyses on a thread or process pool."""
+
+    @staticmethod
+    def _employees() -> list[Employee]:
+        return [
+            create_employee(
+                i,
+                location=["USA", "UK", "India"][i % 3],
+                level=["MT4", "MT5"][i % 2],
+                performance=[PerformanceLevel.HIGH, PerformanceLevel.MEDIUM][i % 2],
+                grid_position=[9, 5, 1][i % 3],
+            )
+            for i in range(60)
+        ]
+
+    def test_run_all_analyses_when_thread_pool_then_matches_sequential(self) -> None:
+        """Test pool execution returns the same results in registry order."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from ninebox.services.analysis_registry import run_all_analyses
+
+        employees = self._employees()
+        sequential = run_all_analyses(employees)
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            parallel = run_all_analyses(employees, executor=pool)
+
+        assert parallel == sequential
+        assert list(parallel) == list(sequential)
+
+    def test_run_all_analyses_when_process_pool_then_matches_sequential(self) -> None:
+        """Test analyses and the frame survive pickling to worker processes."""
+        from concurrent.futures import ProcessPoolExecutor
+
+        from ninebox.services.analysis_registry import run_all_analyses
+
+        employees = self._employees()
+
+        with ProcessPoolExecutor(max_workers=2) as pool:
+            parallel = run_all_analyses(employees, executor=pool)
+
+        assert parallel == run_all_analyses(employees)
+
+    def test_run_all_analyses_when_pool_and_one_fails_then_others_succeed(self) -> None:
+        """Test error isolation is unchanged on a pool."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from ninebox.services.analysis_registry import ANALYSIS_REGISTRY, run_all_analyses
+
+        def failing_analysis(employees: list[Employee]) -> dict:
+            raise KeyError("missing key")
+
+        ANALYSIS_REGISTRY.append(("failing_test", failing_analysis))
+        try:
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                results = run_all_analyses(self._employees(), executor=pool)
+        finally:
+            ANALYSIS_REGISTRY.pop()
+
+        assert results["failing_test"]["error"] == "Analysis failed: KeyError"
+        assert results["location"]["status"] in ["green", "yellow", "red"]
+
+    def test_iter_analyses_when_analysis_exceeds_timeout_then_yields_timeout_error(
+        self,
+    ) -> None:
+        """Test a slow analysis is reported as timed out while the rest complete first."""
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        from ninebox.services.analysis_registry import ANALYSIS_REGISTRY, iter_analyses
+
+        release = threading.Event()
+
+        def slow_analysis(employees: list[Employee]) -> dict:
+            release.wait(timeout=10)
+            return {"status": "green", "sample_size": len(employees)}
+
+        ANALYSIS_REGISTRY.insert(0, ("slow_test", slow_analysis))
+        try:
+            with ThreadPoolExecutor(max_workers=len(ANALYSIS_REGISTRY)) as pool:
+                outcomes = list(iter_analyses(self._employees(), executor=pool, timeout=0.5))
+                release.set()
+        finally:
+            ANALYSIS_REGISTRY.pop(0)
+
+        assert outcomes[-1].name == "slow_test"
+        assert outcomes[-1].result["error"] == "Analysis failed: TimeoutError"
+        assert all(o.result["status"] != "error" for o in outcomes[:-1])
+        assert all(o.elapsed_seconds >= 0.0 and not o.cached for o in outcomes)
+
+    def test_iter_analyses_when_queued_behind_slow_analysis_then_queue_wait_not_counted(
+        self,
+    ) -> None:
+        """Test the timeout clock starts when a worker picks the analysis up."""
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+
+        from ninebox.services.analysis_registry import ANALYSIS_REGISTRY, iter_analyses
+
+        def slow_analysis(employees: list[Employee]) -> dict:
+            time.sleep(0.3)
+            return {"status": "green", "sample_size": len(employees)}
+
+        ANALYSIS_REGISTRY[:0] = [("slow_first", slow_analysis), ("slow_second", slow_analysis)]
+        try:
+            with ThreadPoolExecutor(max_workers=1) as pool:
+                outcomes = list(iter_analyses(self._employees(), executor=pool, timeout=0.5))
+        finally:
+            del ANALYSIS_REGISTRY[:2]
+
+        assert len(outcomes) == len(ANALYSIS_REGISTRY) + 2
+        assert all(o.result["status"] != "error" for o in outcomes)
+
+    def test_iter_analyses_when_session_keyed_on_pool_then_second_run_cached(self) -> None:
+        """Test pool runs store results and serve repeats from the cache."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from ninebox.services.analysis_registry import ANALYSIS_CACHE, iter_analyses
+
+        employees = self._employees()
+        ANALYSIS_CACHE.invalidate_session("pool-test")
+        try:
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                first = list(iter_analyses(employees, "pool-test", "r1", executor=pool))
+                second = list(iter_analyses(employees, "pool-test", "r1", executor=pool))
+        finally:
+            ANALYSIS_CACHE.invalidate_session("pool-test")
+
+        assert not any(o.cached for o in first)
+        assert all(o.cached for o in second)
+        results = {o.name: o.result for o in first}
+        assert all(o.result is results[o.name] for o in second)
@@ -6,7 +6,9 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from ninebox.models.employee import Employee, PerformanceLevel, PotentialLevel
+from ninebox.services.analysis_frame import AnalysisFrame
 from ninebox.services.calibration_summary_service import CalibrationSummaryService
+from ninebox.services.org_service import OrgService
 
 pytestmark = pytest.mark.unit
 
@@ -72,6 +74,23 @@ class TestCalibrationSummaryService:
         assert result["data_overview"]["center_box_count"] == 1
         assert result["time_allocation"]["estimated_duration_minutes"] >= 30  # Min bound
 
+    def test_calculate_summary_when_frame_given_then_reuses_its_org_index(
+        self, service: CalibrationSummaryService
+    ) -> None:
+        """Test the analyses and org data run on the session frame without rebuilding the tree."""
+        employees = [create_employee(i, grid_position=(i % 9) + 1) for i in range(1, 31)]
+        frame = AnalysisFrame.from_employees(employees)
+        org_service = frame.org_service
+
+        with patch.object(
+            OrgService, "__init__", autospec=True, side_effect=OrgService.__init__
+        ) as init:
+            result = service.calculate_summary(employees, use_agent=False, frame=frame)
+
+        init.assert_not_called()
+        assert frame.org_service is org_service
+        assert result["data_overview"]["total_employees"] == 30
+
     def test_data_overview_counts_stars(
         self, service: CalibrationSummaryService
     ) -> None:
@@ -175,5 +175,6 @@ def test_get_org_service_returns_org_service_with_session_employees(
     assert len(session.current_employees) > 0
 
     # Get org service should work with validated session
-    org_service = get_org_service(session=session)
+    org_service = get_org_service(session=session, session_mgr=manager)
     assert isinstance(org_service, OrgService)
+    assert get_org_service(session=session, session_mgr=manager) is org_service
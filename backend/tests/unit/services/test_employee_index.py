@@ -0,0 +1,306 @@
+"""Tests for the inverted employee filter index."""
+
+import pytest
+
+from ninebox.models.employee import Employee, PerformanceLevel, PotentialLevel
+from ninebox.services.employee_index import EmployeeIndex, iter_bit_positions
+from ninebox.services.employee_service import BIG_MOVER, EmployeeService, classify_mover
+from ninebox.services.org_service import OrgService
+from ninebox.services.session_manager import SessionManager
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def employee_service() -> EmployeeService:
+    """Create employee service instance."""
+    return EmployeeService()
+
+
+FILTER_CASES = [
+    {},
+    {"levels": ["MT4"]},
+    {"levels": ["MT"]},  # Substring matching, same as the list-based filter
+    {"levels": ["MT2", "MT5"], "performance": ["High"]},
+    {"job_functions": ["Engineering", "Sales"]},
+    {"locations": ["USA", "Europe"], "potential": ["Low", "Medium"]},
+    {"performance": ["High"], "potential": ["High"]},
+    {"job_functions": ["Nonexistent"]},
+]
+
+
+@pytest.mark.parametrize("filters", FILTER_CASES)
+def test_filter_employees_when_index_supplied_then_matches_list_filtering(
+    employee_service: EmployeeService,
+    rich_sample_employees_large: list[Employee],
+    filters: dict,
+) -> None:
+    """Test the bitset path returns the same employees, in the same order, as the scan path."""
+    index = EmployeeIndex(rich_sample_employees_large)
+
+    expected = employee_service.filter_employees(rich_sample_employees_large, **filters)
+    actual = employee_service.filter_employees(rich_sample_employees_large, index=index, **filters)
+
+    assert [e.employee_id for e in actual] == [e.employee_id for e in expected]
+
+
+def test_filter_employees_when_index_with_managers_and_exclusions_then_matches_list_filtering(
+    employee_service: EmployeeService, rich_sample_employees_large: list[Employee]
+) -> None:
+    """Test manager and exclude_ids filters through the index."""
+    index = EmployeeIndex(rich_sample_employees_large)
+    manager = rich_sample_employees_large[20].direct_manager
+    exclude_ids = [e.employee_id for e in rich_sample_employees_large[:30]]
+
+    expected = employee_service.filter_employees(
+        rich_sample_employees_large, managers=[manager], exclude_ids=exclude_ids
+    )
+    actual = employee_service.filter_employees(
+        rich_sample_employees_large, index=index, managers=[manager], exclude_ids=exclude_ids
+    )
+
+    assert [e.employee_id for e in actual] == [e.employee_id for e in expected]
+
+
+def test_filter_employees_when_index_built_over_other_list_then_falls_back_to_scan(
+    employee_service: EmployeeService, rich_sample_employees_large: list[Employee]
+) -> None:
+    """Test an index is never used for a list it was not built from."""
+    index = EmployeeIndex(rich_sample_employees_large[:10])
+
+    filtered = employee_service.filter_employees(
+        rich_sample_employees_large, index=index, performance=["High"]
+    )
+
+    assert len(filtered) == sum(
+        1 for e in rich_sample_employees_large if e.performance == PerformanceLevel.HIGH
+    )
+
+
+def test_match_when_invalid_performance_then_raises_value_error(
+    rich_sample_employees_small: list[Employee],
+) -> None:
+    """Test invalid enum values fail the same way as the list-based filter."""
+    index = EmployeeIndex(rich_sample_employees_small)
+
+    with pytest.raises(ValueError):
+        index.match(performance=["Excellent"])
+
+
+def test_update_employee_when_employee_moved_then_facet_bits_follow(
+    rich_sample_employees_small: list[Employee],
+) -> None:
+    """Test re-indexing a mutated employee moves it between facet values."""
+    employees = rich_sample_employees_small
+    index = EmployeeIndex(employees)
+    target = next(e for e in employees if e.performance != PerformanceLevel.HIGH)
+
+    target.performance = PerformanceLevel.HIGH
+    index.update_employee(target.employee_id)
+
+    high = index.select(index.match(performance=["High"]))
+    assert target in high
+    assert len(high) == sum(1 for e in employees if e.performance == PerformanceLevel.HIGH)
+
+
+def test_iter_bit_positions_when_bits_set_then_returns_ascending_positions() -> None:
+    """Test decoding a bitset."""
+    assert iter_bit_positions(0) == []
+    assert iter_bit_positions(0b10110) == [1, 2, 4]
+    assert iter_bit_positions(1 << 70) == [70]
+
+
+def test_get_employee_index_when_employee_moved_then_index_stays_current(
+    sample_employees: list[Employee],
+) -> None:
+    """Test SessionManager keeps the cached index in sync with grid moves."""
+    session_manager = SessionManager()
+    session_manager.create_session(
+        user_id="user1",
+        employees=sample_employees,
+        filename="test.xlsx",
+        file_path="/tmp/test.xlsx",
+        sheet_name="Employee Data",
+        sheet_index=1,
+    )
+    index = session_manager.get_employee_index("user1")
+    assert index is not None
+    employee_id = sample_employees[0].employee_id
+
+    session_manager.move_employee("user1", employee_id, PerformanceLevel.LOW, PotentialLevel.LOW)
+
+    assert session_manager.get_employee_index("user1") is index
+    low_ids = [e.employee_id for e in index.select(index.match(performance=["Low"]))]
+    assert employee_id in low_ids
+
+
+def test_get_employee_index_when_no_session_then_returns_none() -> None:
+    """Test no index is built without a session."""
+    assert SessionManager().get_employee_index("missing") is None
+
+
+def test_filter_employees_when_flags_filter_then_index_matches_list_filtering(
+    employee_service: EmployeeService, rich_sample_employees_large: list[Employee]
+) -> None:
+    """Test the multi-valued flags facet matches employees holding any requested flag."""
+    index = EmployeeIndex(rich_sample_employees_large)
+    flags = ["flight_risk", "promotion_ready"]
+
+    expected = employee_service.filter_employees(rich_sample_employees_large, flags=flags)
+    actual = employee_service.filter_employees(
+        rich_sample_employees_large, index=index, flags=flags
+    )
+
+    assert [e.employee_id for e in actual] == [e.employee_id for e in expected]
+
+
+def test_facet_counts_when_no_filters_then_counts_whole_population(
+    rich_sample_employees_large: list[Employee],
+) -> None:
+    """Test unfiltered facet counts equal plain value counts."""
+    employees = rich_sample_employees_large
+    index = EmployeeIndex(employees)
+
+    bits, counts = index.facet_counts()
+
+    assert bits == index.all_bits
+    assert sum(counts["performance"].values()) == len(employees)
+    assert counts["levels"] == {
+        level: sum(1 for e in employees if e.job_level == level)
+        for level in {e.job_level for e in employees}
+    }
+    for flag, count in counts["flags"].items():
+        assert count == sum(1 for e in employees if flag in (e.flags or []))
+
+
+def test_facet_counts_when_filtered_then_each_facet_ignores_its_own_selection(
+    employee_service: EmployeeService, rich_sample_employees_large: list[Employee]
+) -> None:
+    """Test counts are disjunctive: a facet's counts apply every other active filter."""
+    employees = rich_sample_employees_large
+    index = EmployeeIndex(employees)
+    filters = {"performance": ["High"], "job_functions": ["Engineering"]}
+
+    bits, counts = index.facet_counts(**filters)
+
+    assert index.select(bits) == employee_service.filter_employees(employees, **filters)
+    for value, count in counts["performance"].items():
+        expected = employee_service.filter_employees(
+            employees, performance=[value], job_functions=["Engineering"]
+        )
+        assert count == len(expected)
+    for value, count in counts["locations"].items():
+        expected = employee_service.filter_employees(employees, locations=[value], **filters)
+        assert count == len(expected)
+
+
+
+def test_filter_employees_when_location_codes_then_index_matches_list_filtering(
+    employee_service: EmployeeService, rich_sample_employees_large: list[Employee]
+) -> None:
+    """Test location_codes match raw codes exactly and combine with display names."""
+    employees = rich_sample_employees_large
+    index = EmployeeIndex(employees)
+
+    cases = [{"location_codes": ["GBR"]}, {"locations": ["USA"], "location_codes": ["GBR"]}]
+    for filters in cases:
+        expected = employee_service.filter_employees(employees, **filters)
+        actual = employee_service.filter_employees(employees, index=index, **filters)
+
+        assert expected
+        assert all(e.location in {"USA", "GBR"} for e in expected)
+        assert [e.employee_id for e in actual] == [e.employee_id for e in expected]
+    assert not employee_service.filter_employees(employees, locations=["GBR"])
+
+def test_mover_class_when_indexed_then_matches_classify_mover(
+    rich_sample_employees_large: list[Employee],
+) -> None:
+    """Test the cached mover bitfield equals a fresh classification."""
+    employees = rich_sample_employees_large
+    index = EmployeeIndex(employees, employees)
+
+    assert all(index.mover_class(e.employee_id) == classify_mover(e, e) for e in employees)
+    _, counts = index.facet_counts()
+    assert counts["movers"].get("big_mover", 0) == sum(
+        1 for e in employees if classify_mover(e, e) & BIG_MOVER
+    )
+
+
+def test_filter_employees_when_movers_filter_then_index_matches_list_filtering(
+    employee_service: EmployeeService, rich_sample_employees_large: list[Employee]
+) -> None:
+    """Test the movers facet filters like the list-based classification."""
+    employees = rich_sample_employees_large
+    originals = [e.model_copy() for e in employees]
+    for employee in employees[:40]:
+        employee.grid_position = 10 - employee.grid_position
+    index = EmployeeIndex(employees, originals)
+
+    for movers in (["big_mover"], ["medium_mover"], ["big_mover", "medium_mover"]):
+        expected = employee_service.filter_employees(
+            employees, movers=movers, original_employees=originals
+        )
+        actual = employee_service.filter_employees(
+            employees, movers=movers, index=index, original_employees=originals
+        )
+        assert [e.employee_id for e in actual] == [e.employee_id for e in expected]
+
+
+def test_get_employee_index_when_employee_moved_then_only_mover_class_updates(
+    sample_employees: list[Employee],
+) -> None:
+    """Test a grid move reclassifies the moved employee as an in-session mover."""
+    session_manager = SessionManager()
+    session_manager.create_session(
+        user_id="user1",
+        employees=sample_employees,
+        filename="test.xlsx",
+        file_path="/tmp/test.xlsx",
+        sheet_name="Employee Data",
+        sheet_index=1,
+    )
+    index = session_manager.get_employee_index("user1")
+    assert index is not None
+    session = session_manager.get_session("user1")
+    assert session is not None
+    target = next(
+        e
+        for e in session.current_employees
+        if e.grid_position == 9 and not index.mover_class(e.employee_id) & BIG_MOVER
+    )
+    before = {e.employee_id: index.mover_class(e.employee_id) for e in session.current_employees}
+
+    session_manager.move_employee(
+        "user1", target.employee_id, PerformanceLevel.LOW, PotentialLevel.LOW
+    )
+
+    assert index.mover_class(target.employee_id) & BIG_MOVER
+    after = {e.employee_id: index.mover_class(e.employee_id) for e in session.current_employees}
+    changed = {employee_id for employee_id in before if before[employee_id] != after[employee_id]}
+    assert changed == {target.employee_id}
+
+
+def test_filter_employees_when_under_manager_ids_then_index_matches_list_filtering(
+    employee_service: EmployeeService, rich_sample_employees_large: list[Employee]
+) -> None:
+    """Test the subtree filter keeps each manager's whole organization, with or without an index."""
+    employees = rich_sample_employees_large
+    org_service = OrgService(employees, validate=False)
+    managers = org_service.find_managers(min_team_size=2)[:3]
+    expected_ids = {
+        report.employee_id
+        for manager_id in managers
+        for report in org_service.get_all_reports(manager_id)
+    }
+    index = EmployeeIndex(employees)
+
+    scanned = employee_service.filter_employees(employees, under_manager_ids=managers)
+    indexed = employee_service.filter_employees(
+        employees, index=index, org_service=org_service, under_manager_ids=managers
+    )
+
+    assert {e.employee_id for e in scanned} == expected_ids
+    assert [e.employee_id for e in indexed] == [e.employee_id for e in scanned]
+    bits, counts = index.facet_counts(under_manager_ids=managers, org_service=org_service)
+    assert bits.bit_count() == len(expected_ids)
+    assert sum(counts["performance"].values()) == len(expected_ids)
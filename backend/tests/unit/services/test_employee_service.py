@@ -4,8 +4,11 @@ import pytest
 
 from ninebox.models.employee import Employee, HistoricalRating, PerformanceLevel, PotentialLevel
 from ninebox.services.employee_service import (
+    BIG_MOVER,
+    MEDIUM_MOVER,
     EmployeeService,
     PerformanceTier,
+    classify_mover,
     get_tier_from_historical_rating,
     get_axis_distance,
     get_most_recent_prior_year_rating,
@@ -602,6 +605,23 @@ def test_is_medium_mover_when_no_comparison_available_then_false() -> None:
     assert is_medium_mover(employee) is False
 
 
+@pytest.mark.parametrize(
+    ("original_position", "current_position"),
+    [(2, 9), (5, 9), (1, 5), (5, 5), (3, 7)],
+)
+def test_classify_mover_when_compared_then_agrees_with_mover_predicates(
+    original_position: int, current_position: int
+) -> None:
+    """Test the mover bitfield matches is_big_mover/is_medium_mover."""
+    current = create_simple_test_employee(grid_position=current_position)
+    original = create_simple_test_employee(grid_position=original_position)
+
+    mover = classify_mover(current, original)
+
+    assert bool(mover & BIG_MOVER) is is_big_mover(current, original)
+    assert bool(mover & MEDIUM_MOVER) is is_medium_mover(current, original)
+
+
 # Current-cycle ratings must not be mistaken for prior-year history
 
 
@@ -5,10 +5,8 @@ from datetime import date
 import pytest
 
 from ninebox.models.employee import Employee, PerformanceLevel, PotentialLevel
-from ninebox.services.intelligence_service import (
-    _calculate_manager_chi_square,
-    calculate_manager_analysis,
-)
+from ninebox.services.intelligence_service import calculate_manager_analysis
+from ninebox.utils import stats_backend as ps
 
 pytestmark = pytest.mark.unit
 
@@ -46,21 +44,23 @@ def create_employee_with_manager(
     )
 
 
-def test_calculate_manager_chi_square_perfect_fit() -> None:
+def test_chi_square_goodness_of_fit_batch_perfect_fit() -> None:
     """Test chi-square GOF with perfect 20/70/10 distribution."""
     # Perfect distribution: 2 high, 7 medium, 1 low out of 10
     observed = [2, 7, 1]
     expected_pct = [20.0, 70.0, 10.0]
     team_size = 10
 
-    chi2, p_value = _calculate_manager_chi_square(observed, expected_pct, team_size)
+    expected = [team_size * pct / 100.0 for pct in expected_pct]
+
+    [(chi2, p_value)] = ps.chi_square_goodness_of_fit_batch([observed], [expected])
 
     # Perfect fit should have chi2 = 0 and p_value = 1.0
     assert chi2 == pytest.approx(0.0, abs=0.01)
     assert p_value == pytest.approx(1.0, abs=0.01)
 
 
-def test_calculate_manager_chi_square_significant_deviation() -> None:
+def test_chi_square_goodness_of_fit_batch_significant_deviation() -> None:
     """Test chi-square GOF with significant deviation from baseline."""
     # Highly biased: 8 high, 2 medium, 0 low out of 10
     # Expected: 2 high, 7 medium, 1 low
@@ -68,14 +68,16 @@ def test_calculate_manager_chi_square_significant_deviation() -> None:
     expected_pct = [20.0, 70.0, 10.0]
     team_size = 10
 
-    chi2, p_value = _calculate_manager_chi_square(observed, expected_pct, team_size)
+    expected = [team_size * pct / 100.0 for pct in expected_pct]
+
+    [(chi2, p_value)] = ps.chi_square_goodness_of_fit_batch([observed], [expected])
 
     # This should be highly significant (p < 0.01)
     assert chi2 > 10.0  # Very large chi-square
     assert p_value < 0.01  # Highly significant
 
 
-def test_calculate_manager_chi_square_moderate_deviation() -> None:
+def test_chi_square_goodness_of_fit_batch_moderate_deviation() -> None:
     """Test chi-square GOF with moderate deviation from baseline."""
     # Moderate bias: 4 high, 5 medium, 1 low out of 10
     # Expected: 2 high, 7 medium, 1 low
@@ -83,7 +85,9 @@ def test_calculate_manager_chi_square_moderate_deviation() -> None:
     expected_pct = [20.0, 70.0, 10.0]
     team_size = 10
 
-    chi2, p_value = _calculate_manager_chi_square(observed, expected_pct, team_size)
+    expected = [team_size * pct / 100.0 for pct in expected_pct]
+
+    [(chi2, p_value)] = ps.chi_square_goodness_of_fit_batch([observed], [expected])
 
     # This should be borderline significant or not significant
     assert 2.0 < chi2 < 10.0
@@ -234,3 +238,26 @@ def test_z_score_equivalent_from_chi_square() -> None:
 
     expected_z = math.sqrt(dev["chi_square"])
     assert dev["z_score"] == pytest.approx(expected_z, abs=0.01)
+
+
+def test_manager_analysis_when_team_small_then_uses_exact_p_value() -> None:
+    """Test small teams report an exact multinomial p-value and the method used."""
+    from ninebox.utils import stats_backend as ps
+
+    employees = [create_employee_with_manager(1, "Small Team Manager", "VP", PerformanceLevel.HIGH)]
+    for i in range(2, 12):
+        perf = PerformanceLevel.HIGH if i <= 6 else PerformanceLevel.MEDIUM
+        pot = PotentialLevel.HIGH if i <= 6 else PotentialLevel.MEDIUM
+        employees.append(
+            create_employee_with_manager(i, f"Emp {i}", "Small Team Manager", perf, pot)
+        )
+
+    result = calculate_manager_analysis(employees, min_team_size=10)
+
+    dev = result["deviations"][0]
+    counts = [dev["team_size"] * dev[f"{tier}_pct"] / 100 for tier in ("high", "medium", "low")]
+    ((_, exact_p, method),) = ps.multinomial_goodness_of_fit_batch(
+        [[round(c) for c in counts]], [0.2, 0.7, 0.1]
+    )
+    assert dev["p_value_method"] == "exact" == method
+    assert dev["p_value"] == round(exact_p, 4)
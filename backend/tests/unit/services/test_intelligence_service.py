@@ -1078,3 +1078,151 @@ def test_per_level_distribution_multiple_levels_with_different_distributions() -
     max_z_mt6 = max(abs(result["levels"]["MT6"]["z_scores"][k]) for k in ["high", "medium", "low"])
     # MT5 should have smaller deviation than the more extreme MT3 and MT6
     assert max_z_mt5 < max(max_z_mt3, max_z_mt6), "MT5 should be less extreme than MT3/MT6"
+
+
+def test_iter_intelligence_when_run_then_matches_overall_intelligence() -> None:
+    """Test streamed dimensions and summary equal calculate_overall_intelligence()."""
+    from ninebox.services.intelligence_service import (
+        calculate_overall_intelligence,
+        iter_intelligence,
+    )
+
+    employees = [
+        create_employee(i, location=["USA", "UK"][i % 2], level=["MT4", "MT5"][i % 2])
+        for i in range(40)
+    ]
+
+    streamed = list(iter_intelligence(employees))
+
+    assert streamed[-1][0] == "summary"
+    assert {**streamed[-1][1], **dict(streamed[:-1])} == calculate_overall_intelligence(employees)
+
+
+def _population_with_usa_slice_bias() -> tuple[list[Employee], list[Employee]]:
+    """Population with balanced USA/UK ratings and a USA-heavy high-performer slice.
+
+    Returns:
+        Tuple of (population, slice): the slice holds 20 of USA's
+        30 high performers plus 15 of UK's 30 high performers
+    """
+    population = []
+    for i in range(180):
+        perf = [PerformanceLevel.HIGH, PerformanceLevel.MEDIUM, PerformanceLevel.LOW][i // 30 % 3]
+        population.append(create_employee(i, "USA" if i < 90 else "UK", performance=perf))
+    slice_employees = population[:20] + population[90:105]
+    return population, slice_employees
+
+
+def test_calculate_slice_dimension_when_slice_matches_population_then_green() -> None:
+    """Test a slice rated like the population is not flagged."""
+    from ninebox.services.analysis_frame import AnalysisFrame
+    from ninebox.services.intelligence_service import calculate_slice_dimension
+
+    population, _ = _population_with_usa_slice_bias()
+    # Every third employee keeps each location's 1/3 high, 1/3 medium, 1/3 low mix
+    slice_employees = population[::3]
+
+    result = calculate_slice_dimension(
+        AnalysisFrame.from_employees(slice_employees),
+        AnalysisFrame.from_employees(population),
+        "location_analysis",
+    )
+
+    assert result["chi_square"] == 0.0
+    assert result["p_value"] == 1.0
+    assert result["status"] == "green"
+    assert result["sample_size"] == 60
+    assert {d["expected_high_pct"] for d in result["deviations"]} == {33.3}
+
+
+def test_calculate_slice_dimension_when_slice_biased_then_flags_category() -> None:
+    """Test a slice whose USA employees are all high performers is flagged against USA overall."""
+    from ninebox.services.analysis_frame import AnalysisFrame
+    from ninebox.services.intelligence_service import calculate_slice_dimension
+
+    population, slice_employees = _population_with_usa_slice_bias()
+
+    result = calculate_slice_dimension(
+        AnalysisFrame.from_employees(slice_employees),
+        AnalysisFrame.from_employees(population),
+        "location_analysis",
+    )
+
+    assert result["p_value"] < 0.01
+    assert result["status"] == "red"
+    usa = next(d for d in result["deviations"] if d["category"] == "USA")
+    assert usa["observed_high_pct"] == 100.0
+    assert usa["expected_high_pct"] == 33.3
+    assert usa["is_significant"] is True
+
+
+def test_calculate_slice_dimension_when_slice_small_then_returns_empty_analysis() -> None:
+    """Test slices below the minimum sample size are not tested."""
+    from ninebox.services.analysis_frame import AnalysisFrame
+    from ninebox.services.intelligence_service import calculate_slice_dimension
+
+    population, _ = _population_with_usa_slice_bias()
+
+    result = calculate_slice_dimension(
+        AnalysisFrame.from_employees(population[:10]),
+        AnalysisFrame.from_employees(population),
+        "tenure_analysis",
+    )
+
+    assert result["sample_size"] == 0
+    assert "Sample size too small" in result["interpretation"]
+
+
+def test_calculate_slice_intelligence_when_cached_then_reuses_results() -> None:
+    """Test repeated slice requests are served from the analysis cache per filter set."""
+    from ninebox.services.analysis_frame import AnalysisFrame
+    from ninebox.services.analysis_registry import ANALYSIS_CACHE
+    from ninebox.services.intelligence_service import calculate_slice_intelligence
+
+    population, slice_employees = _population_with_usa_slice_bias()
+    frame = AnalysisFrame.from_employees(population)
+    ANALYSIS_CACHE.clear()
+
+    first = calculate_slice_intelligence(
+        slice_employees, frame, session_id="s1", revision="r1", params={"levels": ["MT6"]}
+    )
+    misses = ANALYSIS_CACHE.misses
+    second = calculate_slice_intelligence(
+        slice_employees, frame, session_id="s1", revision="r1", params={"levels": ["MT6"]}
+    )
+
+    assert second == first
+    assert ANALYSIS_CACHE.misses == misses
+    assert ANALYSIS_CACHE.hits == 5
+    assert set(first) == {
+        "quality_score",
+        "anomaly_count",
+        "location_analysis",
+        "function_analysis",
+        "level_analysis",
+        "tenure_analysis",
+        "manager_analysis",
+    }
+    ANALYSIS_CACHE.clear()
+
+
+def test_calculate_slice_manager_analysis_when_slice_given_then_counts_only_slice_members(
+    rich_sample_employees_large: list[Employee],
+) -> None:
+    """Test managers are tested on the slice members anywhere in their organization."""
+    from ninebox.services.analysis_frame import AnalysisFrame
+    from ninebox.services.intelligence_service import calculate_slice_manager_analysis
+
+    population = AnalysisFrame.from_employees(rich_sample_employees_large)
+    slice_employees = [e for e in rich_sample_employees_large if e.employee_id % 2 == 0]
+
+    result = calculate_slice_manager_analysis(
+        AnalysisFrame.from_employees(slice_employees), population, min_team_size=5
+    )
+
+    slice_ids = {e.employee_id for e in slice_employees}
+    assert result["sample_size"] == len(slice_employees)
+    assert result["deviations"]
+    for deviation in result["deviations"]:
+        assert set(deviation["employee_ids"]) <= slice_ids
+        assert deviation["team_size"] >= 5
@@ -1,7 +1,13 @@
 """Unit tests for OrgService - organizational hierarchy service."""
 
+import random
+from collections import Counter
 from datetime import date
+
+import pytest
+
 from ninebox.models.employee import Employee, PerformanceLevel, PotentialLevel
+from ninebox.models.grid_positions import PERFORMANCE_BUCKETS
 from ninebox.services.org_service import OrgService
 from ninebox.services.sample_data_generator import generate_rich_dataset, RichDatasetConfig
 
@@ -115,3 +121,267 @@ def test_sample_data_has_exactly_one_ceo() -> None:
         assert ceo.direct_manager == "None", (
             f"CEO {ceo.name} should have no manager, but has manager={ceo.direct_manager}"
         )
+
+
+def _employee(employee_id: int, name: str, direct_manager: str = "None") -> Employee:
+    """Create a minimal employee for hand-built org structures."""
+    return Employee(
+        employee_id=employee_id,
+        name=name,
+        business_title="Test Title",
+        job_title="Test Job",
+        job_profile="Engineering-USA",
+        job_level="MT2",
+        job_function="Engineering",
+        location="USA",
+        direct_manager=direct_manager,
+        hire_date=date(2020, 1, 1),
+        tenure_category="2-5 years",
+        time_in_job_profile="1-2 years",
+        performance=PerformanceLevel.MEDIUM,
+        potential=PotentialLevel.MEDIUM,
+        grid_position=5,
+        talent_indicator="Solid Performer",
+    )
+
+
+def _naive_all_reports(org_service: OrgService, manager_id: int) -> list[int]:
+    """Collect a manager's organization by recursing over direct reports."""
+    reports = []
+    for emp in org_service.get_direct_reports(manager_id):
+        reports.append(emp.employee_id)
+        reports.extend(_naive_all_reports(org_service, emp.employee_id))
+    return reports
+
+
+def test_interval_encoding_when_sample_data_then_matches_recursive_traversal() -> None:
+    """Test subtree slices, team sizes and ancestry checks agree with a plain recursion."""
+    employees = generate_rich_dataset(RichDatasetConfig(size=300, seed=42))
+    org_service = OrgService(employees)
+
+    assert len(org_service.preorder) == len(employees)
+    for emp in employees:
+        expected = _naive_all_reports(org_service, emp.employee_id)
+        reports = org_service.get_all_reports(emp.employee_id)
+        assert [e.employee_id for e in reports] == expected
+        assert org_service.get_team_size(emp.employee_id) == len(expected)
+        assert list(org_service.iter_managers(emp.employee_id)) == (
+            org_service.get_reporting_chain(emp.employee_id)
+        )
+
+    ceo = next(emp for emp in employees if emp.direct_manager == "None")
+    assert org_service.get_subtree_range(ceo.employee_id) == (0, len(employees))
+    assert all(
+        org_service.is_in_organization(emp.employee_id, ceo.employee_id)
+        for emp in employees
+        if emp is not ceo
+    )
+    assert not org_service.is_in_organization(ceo.employee_id, ceo.employee_id)
+
+
+def test_interval_encoding_when_reporting_cycle_then_every_employee_placed_once() -> None:
+    """Test a rootless reporting cycle still gets contiguous, non-overlapping intervals."""
+    employees = [
+        _employee(1, "Ann", "Bob"),
+        _employee(2, "Bob", "Ann"),
+        _employee(3, "Cat", "Bob"),
+        _employee(4, "Dan"),
+    ]
+    org_service = OrgService(employees, validate=False)
+
+    assert sorted(e.employee_id for e in org_service.preorder) == [1, 2, 3, 4]
+    assert org_service.get_team_size(4) == 0
+    assert org_service.get_team_size(1) == 2
+    assert {e.employee_id for e in org_service.get_all_reports(1)} == {2, 3}
+    assert list(org_service.iter_managers(3)) == [2, 1]
+    assert list(org_service.iter_managers(1)) == []
+    assert org_service.find_managers(min_team_size=2) == [1]
+
+
+def test_get_organization_members_when_managers_nested_then_each_member_once() -> None:
+    """Test overlapping organizations are merged and sibling organizations concatenated."""
+    employees = [
+        _employee(1, "Ceo"),
+        _employee(2, "Vp", "Ceo"),
+        _employee(3, "Dir", "Vp"),
+        _employee(4, "Ic", "Dir"),
+        _employee(5, "Vp2", "Ceo"),
+        _employee(6, "Ic2", "Vp2"),
+    ]
+    org_service = OrgService(employees)
+
+    assert [e.employee_id for e in org_service.get_organization_members([3, 2])] == [3, 4]
+    assert [e.employee_id for e in org_service.get_organization_members([5, 3, 99])] == [4, 6]
+    assert org_service.get_organization_members([4]) == []
+
+
+def test_validate_structure_when_cycles_orphans_and_self_managers_then_reports_all() -> None:
+    """Test every cycle is reported once, with its members, alongside orphans and self-managers."""
+    employees = [
+        _employee(1, "Ann", "Bob"),
+        _employee(2, "Bob", "Cat"),
+        _employee(3, "Cat", "Ann"),
+        _employee(4, "Dan", "Bob"),  # Hangs below a cycle, not part of it
+        _employee(5, "Eve", "Fay"),
+        _employee(6, "Fay", "Eve"),
+        _employee(7, "Gus", "Gus"),
+        _employee(8, "Hal", "Nobody"),
+        _employee(9, "Ivy"),
+    ]
+    org_service = OrgService(employees, validate=False)
+
+    result = org_service.validate_structure()
+
+    assert not result.is_valid
+    assert result.cycles == [[1, 2, 3], [5, 6]]
+    assert result.self_managed == [7]
+    assert result.orphaned_employees == [8]
+    assert sorted(result.circular_references) == [1, 2, 3, 5, 6, 7]
+    assert len(result.errors) == 4
+    assert org_service.validate_structure() is result
+    with pytest.raises(ValueError, match="4 errors"):
+        OrgService(employees)
+
+
+def test_validate_structure_when_chain_very_deep_then_valid_without_recursion() -> None:
+    """Test validation walks a 20,000-level chain iteratively."""
+    employees = [_employee(1, "E1")] + [
+        _employee(i, f"E{i}", f"E{i - 1}") for i in range(2, 20_001)
+    ]
+
+    result = OrgService(employees).validate_structure()
+
+    assert result.is_valid
+    assert result.cycles == []
+
+
+def test_reassign_manager_when_subtrees_moved_then_matches_rebuilt_tree() -> None:
+    """Test in-place reassignment leaves the same tree as building it from scratch."""
+    rng = random.Random(7)
+    employees = [_employee(1, "E1")] + [
+        _employee(i, f"E{i}", f"E{rng.randint(1, i - 1)}") for i in range(2, 61)
+    ]
+    org_service = OrgService(employees)
+
+    moves = 0
+    while moves < 25:
+        employee, manager = rng.sample(employees, 2)
+        if org_service.is_in_organization(manager.employee_id, employee.employee_id):
+            continue
+        previous_manager = employee.direct_manager
+        employee.direct_manager = manager.name
+        org_service.reassign_manager(employee.employee_id, manager.employee_id, previous_manager)
+        moves += 1
+
+    rebuilt = OrgService(employees)
+    for emp in employees:
+        assert org_service.get_manager_id(emp.employee_id) == rebuilt.get_manager_id(emp.employee_id)
+        assert org_service.get_team_size(emp.employee_id) == rebuilt.get_team_size(emp.employee_id)
+        assert {e.employee_id for e in org_service.get_all_reports(emp.employee_id)} == {
+            e.employee_id for e in rebuilt.get_all_reports(emp.employee_id)
+        }
+        assert list(org_service.iter_managers(emp.employee_id)) == rebuilt.get_reporting_chain(
+            emp.employee_id
+        )
+    assert org_service.rollup().bucket_counts == rebuilt.rollup().bucket_counts
+
+
+def test_reassign_manager_when_new_manager_in_own_organization_then_raises() -> None:
+    """Test a reassignment that would create a reporting cycle is rejected."""
+    employees = [_employee(1, "Ceo"), _employee(2, "Vp", "Ceo"), _employee(3, "Dir", "Vp")]
+    org_service = OrgService(employees)
+
+    with pytest.raises(ValueError, match="reporting cycle"):
+        org_service.reassign_manager(2, 3, "Ceo")
+
+    assert org_service.get_team_size(2) == 1
+
+
+def test_reassign_manager_when_names_duplicated_then_chain_columns_follow_the_move() -> None:
+    """Test chain columns of the moved organization are rewritten, so a reload resolves the same."""
+    employees = [
+        _employee(1, "Ceo"),
+        _employee(2, "Ann", "Ceo"),
+        _employee(3, "Bob", "Ceo"),
+        _employee(4, "Sam", "Ann"),
+        _employee(5, "Sam", "Bob"),
+        _employee(6, "Ian", "Sam"),
+        _employee(7, "Jo", "Sam"),
+        _employee(8, "Cat", "Ceo"),
+    ]
+    employees[4].job_level = "MT5"  # Wins the tiebreak for anyone not told apart by chain
+    # Top-down for the moved employee, nearest-first for their report
+    employees[3].management_chain_05 = "Ceo"
+    employees[3].management_chain_06 = "Ann"
+    employees[5].management_chain_01 = "Sam"
+    employees[5].management_chain_02 = "Ann"
+    employees[5].management_chain_03 = "Ceo"
+    employees[6].management_chain_01 = "Sam"
+    employees[6].management_chain_02 = "Bob"
+    org_service = OrgService(employees)
+    assert (org_service.get_manager_id(6), org_service.get_manager_id(7)) == (4, 5)
+
+    employees[3].direct_manager = "Cat"
+    org_service.reassign_manager(4, 8, "Ann")
+
+    assert (employees[3].management_chain_05, employees[3].management_chain_06) == ("Ceo", "Cat")
+    assert [
+        employees[5].management_chain_01,
+        employees[5].management_chain_02,
+        employees[5].management_chain_03,
+    ] == ["Sam", "Cat", "Ceo"]
+    assert (employees[6].management_chain_01, employees[6].management_chain_02) == ("Sam", "Bob")
+    rebuilt = OrgService(employees)
+    for emp in employees:
+        assert rebuilt.get_manager_id(emp.employee_id) == org_service.get_manager_id(
+            emp.employee_id
+        )
+    assert rebuilt.find_chain_inconsistencies() == []
+
+
+def test_find_chain_inconsistencies_when_columns_top_down_or_wrong_then_flags_only_wrong() -> None:
+    """Test chain columns are read in either orientation and checked against direct_manager."""
+    employees = [
+        _employee(1, "Ceo"),
+        _employee(2, "Vp", "Ceo"),
+        _employee(3, "Dir", "Vp"),
+        _employee(4, "Ic", "Dir"),
+        _employee(5, "Other", "Dir"),
+    ]
+    # Top-down export: level 04-06 filled, last level is the direct manager
+    employees[3].management_chain_04 = "Ceo"
+    employees[3].management_chain_05 = "Vp"
+    employees[3].management_chain_06 = "Dir"
+    # Nearest-first, but naming the wrong skip-level manager
+    employees[4].management_chain_01 = "Dir"
+    employees[4].management_chain_02 = "Ceo"
+
+    org_service = OrgService(employees, validate=False)
+
+    assert org_service.get_manager_id(4) == 3
+    assert org_service.get_manager_id(1) is None
+    assert org_service.get_reporting_chain(4) == [3, 2, 1]
+    assert org_service.find_chain_inconsistencies() == [5]
+
+
+def test_rollup_when_sample_data_then_matches_per_manager_counts() -> None:
+    """Test the one-pass rollup equals counting each manager's report list separately."""
+    employees = generate_rich_dataset(RichDatasetConfig(size=300, seed=42))
+    org_service = OrgService(employees)
+
+    rollup = org_service.rollup()
+
+    managers = org_service.find_managers(min_team_size=1)
+    assert sorted(rollup.grid_counts) == sorted(managers)
+    for manager_id in managers:
+        reports = org_service.get_all_reports(manager_id)
+        grid = [sum(1 for e in reports if e.grid_position == box) for box in range(1, 10)]
+        buckets = [
+            sum(1 for e in reports if e.grid_position in positions)
+            for positions in PERFORMANCE_BUCKETS.values()
+        ]
+        assert rollup.grid_counts[manager_id] == grid
+        assert rollup.bucket_counts[manager_id] == [*buckets, 0]
+        assert rollup.flag_counts[manager_id] == Counter(
+            flag for e in reports for flag in e.flags or []
+        )
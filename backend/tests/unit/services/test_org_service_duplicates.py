@@ -258,6 +258,20 @@ def test_get_employee_by_name_with_duplicates() -> None:
     assert leo.employee_id in [5, 6, 133]
 
 
+def test_get_employee_ids_by_name_with_duplicates() -> None:
+    """Test get_employee_ids_by_name returns every employee sharing the name."""
+    employees = [
+        create_test_employee(5, "Leo Brown", job_level="MT6"),
+        create_test_employee(6, "Ann Lee", direct_manager="Leo Brown"),
+        create_test_employee(133, "Leo Brown", job_level="MT2"),
+    ]
+
+    org_service = OrgService(employees, validate=False)
+
+    assert org_service.get_employee_ids_by_name("Leo Brown") == [5, 133]
+    assert org_service.get_employee_ids_by_name("Nobody") == []
+
+
 def test_complex_duplicate_hierarchy() -> None:
     """Test a complex org hierarchy with multiple duplicate names at different levels."""
     employees = [
@@ -338,3 +352,61 @@ def test_duplicate_resolution_consistency() -> None:
     assert result1 == result2 == result3
     # Should pick the highest job level (MT6, ID 5)
     assert result1 == 5
+
+
+def test_resolve_manager_id_when_many_duplicates_then_matches_pairwise_tiebreak() -> None:
+    """Test indexed resolution picks the same manager as comparing every candidate's reports."""
+    names = ["Sam Lee", "Kim Park", "Alex Kay"]
+    levels = ["MT2", "MT4", "MT4", "MT6", "Lead"]
+    employees = [
+        create_test_employee(
+            i,
+            names[i % 3],
+            direct_manager=names[(i * 7) % 3] if i % 5 else names[i % 3],
+            job_level=levels[(i * 3) % 5],
+        )
+        for i in range(1, 40)
+    ]
+    org_service = OrgService(employees, validate=False)
+
+    def pairwise(manager_name: str, employee: Employee) -> int | None:
+        best_key, best_id = None, None
+        for candidate in employees:
+            if candidate.name != manager_name or candidate.employee_id == employee.employee_id:
+                continue
+            has_reports = any(
+                e.direct_manager == candidate.name and e.employee_id != candidate.employee_id
+                for e in employees
+            )
+            key = (org_service._get_job_level_rank(candidate.job_level), has_reports)
+            if best_key is None or key > best_key:
+                best_key, best_id = key, candidate.employee_id
+        return best_id
+
+    for emp in employees:
+        assert org_service._resolve_manager_id(emp.direct_manager, emp) == pairwise(
+            emp.direct_manager, emp
+        )
+
+
+def test_resolve_manager_id_when_chain_names_skip_level_then_picks_matching_duplicate() -> None:
+    """Test management chain columns disambiguate duplicate managers by their own manager."""
+    employees = [
+        create_test_employee(1, "Mary Moore", job_level="MT6"),
+        create_test_employee(2, "Ann Vp", "Mary Moore", job_level="MT5"),
+        create_test_employee(3, "Ben Vp", "Mary Moore", job_level="MT5"),
+        create_test_employee(10, "Leo Brown", "Ann Vp", job_level="MT4"),
+        create_test_employee(11, "Leo Brown", "Ben Vp", job_level="MT3"),
+        create_test_employee(20, "Ivy Ic", "Leo Brown", job_level="MT1"),
+    ]
+    ivy = employees[-1]
+    ivy.management_chain_01 = "Leo Brown"
+    ivy.management_chain_02 = "Ben Vp"
+    ivy.management_chain_03 = "Mary Moore"
+
+    org_service = OrgService(employees, validate=False)
+
+    # Job level alone would pick ID 10; the chain says Ivy's Leo reports to Ben
+    assert org_service._resolve_manager_id("Leo Brown", ivy) == 11
+    assert org_service.get_reporting_chain(20) == [11, 3, 1]
+    assert org_service.find_chain_inconsistencies() == []
@@ -957,3 +957,34 @@ def test_move_employee_donut_when_invalid_employee_then_raises_error(
             new_performance=PerformanceLevel.MEDIUM,
             new_potential=PotentialLevel.MEDIUM,
         )
+
+
+def test_get_revision_tag_when_session_mutated_then_changes(
+    session_manager: SessionManager, sample_employees: list[Employee]
+) -> None:
+    """Test every mutation bumps the session revision and its tag."""
+    session_manager.create_session(
+        user_id="user1",
+        employees=sample_employees,
+        filename="test.xlsx",
+        file_path="/tmp/test.xlsx",
+        sheet_name="Employee Data",
+        sheet_index=1,
+    )
+    session = session_manager.get_session("user1")
+    assert session is not None
+    initial_revision = session.revision
+    initial_tag = session_manager.get_revision_tag(session)
+
+    employee = session.current_employees[0]
+    new_performance = (
+        PerformanceLevel.LOW if employee.performance != PerformanceLevel.LOW else PerformanceLevel.HIGH
+    )
+    session_manager.move_employee(
+        "user1", employee.employee_id, new_performance, employee.potential
+    )
+    assert session.revision == initial_revision + 1
+
+    session_manager.toggle_donut_mode("user1", True)
+    assert session.revision == initial_revision + 2
+    assert session_manager.get_revision_tag(session) != initial_tag
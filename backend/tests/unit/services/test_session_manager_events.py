@@ -4,6 +4,7 @@ This file contains tests for the new event system added to SessionManager.
 It complements the existing test_session_manager.py by focusing on:
 - FlagAddEvent and FlagRemoveEvent
 - GridMoveEvent and DonutMoveEvent
+- ReportingLineChangeEvent
 - EventManager integration
 - Net-zero event behavior
 """
@@ -18,7 +19,9 @@ from ninebox.models.events import (
     FlagAddEvent,
     FlagRemoveEvent,
     GridMoveEvent,
+    ReportingLineChangeEvent,
 )
+from ninebox.services.analysis_frame import AnalysisFrame
 from ninebox.services.session_manager import SessionManager
 
 pytestmark = pytest.mark.unit
@@ -674,3 +677,130 @@ class TestMixedEventTypes:
         assert GridMoveEvent in event_types
         assert FlagAddEvent in event_types
         assert FlagRemoveEvent in event_types
+
+
+@pytest.fixture
+def org_employees() -> list:
+    """Ceo with two VPs; Carl (with Dana under him) reports to the first VP."""
+    employees = [
+        _create_test_employee_with_flags(
+            i, name, PerformanceLevel.MEDIUM, PotentialLevel.MEDIUM, None
+        )
+        for i, name in enumerate(["Ceo", "Vic", "Val", "Carl", "Dana"], start=1)
+    ]
+    for employee, manager in zip(employees, ["None", "Ceo", "Ceo", "Vic", "Carl"], strict=True):
+        employee.direct_manager = manager
+    employees[4].grid_position = 9
+    employees[4].performance = PerformanceLevel.HIGH
+    employees[4].potential = PotentialLevel.HIGH
+    return employees
+
+
+class TestReassignManager:
+    """Tests for reporting line changes."""
+
+    def _create(self, session_manager: SessionManager, employees: list) -> None:
+        session_manager.create_session(
+            user_id="user1",
+            employees=employees,
+            filename="test.xlsx",
+            file_path="/tmp/test.xlsx",
+            sheet_name="Employee Data",
+            sheet_index=1,
+        )
+
+    def test_reassign_manager_when_called_then_tracks_event_and_updates_org_index(
+        self, session_manager: SessionManager, org_employees: list
+    ) -> None:
+        """Test the org index and manager tallies are updated in place, matching a rebuild."""
+        self._create(session_manager, org_employees)
+        org_service = session_manager.get_org_service("user1")
+        frame = session_manager.get_analysis_frame("user1")
+
+        event = session_manager.reassign_manager("user1", employee_id=4, new_manager_id=3)
+
+        assert isinstance(event, ReportingLineChangeEvent)
+        assert (event.old_manager_id, event.new_manager_id) == (2, 3)
+        assert (event.old_manager_name, event.new_manager_name) == ("Vic", "Val")
+        session = session_manager.get_session("user1")
+        assert session.events == [event]
+        assert session.current_employees[3].direct_manager == "Val"
+        assert session.current_employees[3].modified_in_session
+        assert session_manager.get_org_service("user1") is org_service
+        assert org_service.get_team_size(2) == 0
+        assert org_service.get_team_size(3) == 2
+        rebuilt = AnalysisFrame.from_employees(session.current_employees)
+        for manager_id in range(1, 6):
+            assert frame.manager_bucket_counts(manager_id) == rebuilt.manager_bucket_counts(
+                manager_id
+            )
+        index = session_manager.get_employee_index("user1")
+        assert [e.employee_id for e in index.select(index.match(managers=["Val"]))] == [4]
+
+    def test_reassign_manager_when_moved_back_then_removes_event(
+        self, session_manager: SessionManager, org_employees: list
+    ) -> None:
+        """Test returning to the original manager is net-zero."""
+        self._create(session_manager, org_employees)
+
+        session_manager.reassign_manager("user1", employee_id=4, new_manager_id=3)
+        event = session_manager.reassign_manager("user1", employee_id=4, new_manager_id=2)
+
+        assert (event.old_manager_id, event.new_manager_id) == (2, 2)
+        session = session_manager.get_session("user1")
+        assert session.events == []
+        assert not session.current_employees[3].modified_in_session
+
+    def test_reassign_managers_when_batch_creates_cycle_then_nothing_changes(
+        self, session_manager: SessionManager, org_employees: list
+    ) -> None:
+        """Test bulk assignments are validated as a whole, in order, before applying."""
+        self._create(session_manager, org_employees)
+
+        with pytest.raises(ValueError, match="reporting cycle"):
+            # Carl moves under Val, then Val under Dana, who is in Carl's team
+            session_manager.reassign_managers("user1", {4: 3, 3: 5})
+
+        session = session_manager.get_session("user1")
+        assert session.events == []
+        assert [e.direct_manager for e in session.current_employees] == [
+            "None",
+            "Ceo",
+            "Ceo",
+            "Vic",
+            "Carl",
+        ]
+
+        events = session_manager.reassign_managers("user1", {4: 3, 2: 4})
+
+        assert [e.employee_id for e in events] == [4, 2]
+        assert session_manager.get_org_service("user1").get_reporting_chain(2) == [4, 3, 1]
+
+    def test_reassign_managers_when_original_missing_then_nothing_changes(
+        self, session_manager: SessionManager, org_employees: list
+    ) -> None:
+        """Test a later assignment without an original employee rejects the whole batch."""
+        self._create(session_manager, org_employees)
+        session = session_manager.get_session("user1")
+        session.original_employees = [e for e in session.original_employees if e.employee_id != 5]
+
+        with pytest.raises(ValueError, match="Original employee 5 not found"):
+            session_manager.reassign_managers("user1", {4: 3, 5: 2})
+
+        assert session.events == []
+        assert session.current_employees[3].direct_manager == "Vic"
+        assert session_manager.get_org_service("user1").get_reporting_chain(4) == [2, 1]
+
+    def test_reassign_managers_when_new_manager_name_shared_then_nothing_changes(
+        self, session_manager: SessionManager, org_employees: list
+    ) -> None:
+        """Test a manager whose name is duplicated is rejected, since names are what is stored."""
+        org_employees[2].name = "Vic"
+        self._create(session_manager, org_employees)
+
+        with pytest.raises(ValueError, match="name 'Vic' is shared"):
+            session_manager.reassign_managers("user1", {5: 1, 4: 3})
+
+        session = session_manager.get_session("user1")
+        assert session.events == []
+        assert session.current_employees[4].direct_manager == "Carl"
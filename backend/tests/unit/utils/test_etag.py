@@ -0,0 +1,52 @@
+"""Tests for ETag helpers."""
+
+import pytest
+from starlette.requests import Request
+
+from ninebox.utils.etag import etag_matches, make_etag, not_modified_response
+
+pytestmark = pytest.mark.unit
+
+
+def _request(query: str = "", if_none_match: str | None = None) -> Request:
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/api/employees",
+            "query_string": query.encode(),
+            "headers": headers,
+        }
+    )
+
+
+def test_make_etag_when_query_order_differs_then_same_etag():
+    """Test equivalent queries share an ETag."""
+    assert make_etag("e:s:1", _request("levels=MT4&performance=High")) == make_etag(
+        "e:s:1", _request("performance=High&levels=MT4")
+    )
+
+
+def test_make_etag_when_revision_or_query_differs_then_different_etag():
+    """Test the ETag changes with the revision and with the query."""
+    etag = make_etag("e:s:1", _request("levels=MT4"))
+    assert etag != make_etag("e:s:2", _request("levels=MT4"))
+    assert etag != make_etag("e:s:1", _request("levels=MT5"))
+    assert etag.startswith('W/"')
+
+
+def test_etag_matches_when_header_lists_etag_then_true():
+    """Test If-None-Match matching uses weak comparison over a list."""
+    etag = 'W/"abc"'
+    assert etag_matches(_request(if_none_match='"xyz", "abc"'), etag)
+    assert etag_matches(_request(if_none_match="*"), etag)
+    assert not etag_matches(_request(if_none_match='W/"xyz"'), etag)
+    assert not etag_matches(_request(), etag)
+
+
+def test_not_modified_response_when_built_then_304_with_etag():
+    """Test the 304 response carries the ETag."""
+    response = not_modified_response('W/"abc"')
+    assert response.status_code == 304
+    assert response.headers["etag"] == 'W/"abc"'
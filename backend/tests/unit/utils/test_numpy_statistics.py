@@ -0,0 +1,167 @@
+"""Conformance tests: the NumPy statistics backend must match pure_statistics."""
+
+import random
+
+import pytest
+
+from ninebox.utils import pure_statistics as ps
+from ninebox.utils import stats_backend
+
+np_stats = pytest.importorskip("ninebox.utils.numpy_statistics")
+
+pytestmark = pytest.mark.unit
+
+
+def _random_table(rng: random.Random, rows: int, cols: int) -> list[list[int]]:
+    """Build a contingency table with no empty rows or columns."""
+    table = [[rng.randint(0, 40) for _ in range(cols)] for _ in range(rows)]
+    for i in range(rows):
+        table[i][i % cols] += 1
+    for j in range(cols):
+        table[j % rows][j] += 1
+    return table
+
+
+_RNG = random.Random(1234)
+TABLES = [
+    [[10, 20], [30, 40]],
+    [[1, 2], [3, 4]],  # Small 2x2, Yates applies
+    [[5, 0], [0, 5]],
+    [[12, 40, 8], [5, 18, 2], [9, 30, 11]],
+    [[100, 1, 1], [1, 100, 1]],
+    *[_random_table(_RNG, rows, cols) for rows, cols in [(2, 3), (5, 3), (8, 9), (200, 3)]],
+]
+
+
+@pytest.mark.parametrize("table", TABLES)
+@pytest.mark.parametrize("correction", [True, False])
+def test_chi_square_test_when_numpy_backend_then_identical_to_pure(
+    table: list[list[int]], correction: bool
+) -> None:
+    """Test statistic, p-value, dof and expected frequencies are identical."""
+    assert np_stats.chi_square_test(table, correction) == ps.chi_square_test(table, correction)
+
+
+@pytest.mark.parametrize("table", TABLES)
+def test_calculate_z_scores_when_numpy_backend_then_identical_to_pure(
+    table: list[list[int]],
+) -> None:
+    """Test standardized residuals are identical, including zero-expected cells."""
+    _, _, _, expected = ps.chi_square_test(table)
+    expected[0][0] = 0.0
+
+    assert np_stats.calculate_z_scores(table, expected) == ps.calculate_z_scores(table, expected)
+
+
+@pytest.mark.parametrize("table", TABLES)
+def test_table_helpers_when_numpy_backend_then_identical_to_pure(
+    table: list[list[int]],
+) -> None:
+    """Test row/column sums and predicates."""
+    assert np_stats.sum_rows(table) == ps.sum_rows(table)
+    assert np_stats.sum_cols(table) == ps.sum_cols(table)
+    assert np_stats.any_zero(table[0]) == ps.any_zero(table[0])
+    assert np_stats.all_values_ge(table, 5.0) == ps.all_values_ge(table, 5.0)
+
+
+def test_table_helpers_when_empty_then_match_pure() -> None:
+    """Test edge cases on empty input."""
+    assert np_stats.sum_rows([]) == ps.sum_rows([]) == []
+    assert np_stats.sum_cols([]) == ps.sum_cols([]) == []
+    assert np_stats.any_zero([]) == ps.any_zero([])
+    assert np_stats.all_values_ge([], 5.0) == ps.all_values_ge([], 5.0)
+    assert np_stats.calculate_z_scores([], []) == ps.calculate_z_scores([], [])
+
+
+def test_chi_square_goodness_of_fit_batch_when_many_rows_then_identical_to_pure() -> None:
+    """Test the batched test equals one pure test per row."""
+    rng = random.Random(7)
+    observed = [[rng.randint(0, 30) for _ in range(3)] for _ in range(300)]
+    expected = [[sum(row) * p / 100.0 for p in (20.0, 70.0, 10.0)] for row in observed]
+
+    results = np_stats.chi_square_goodness_of_fit_batch(observed, expected)
+
+    assert results == ps.chi_square_goodness_of_fit_batch(observed, expected)
+    assert results[0] == ps.chi_square_goodness_of_fit(observed[0], expected[0])
+    assert np_stats.chi_square_goodness_of_fit_batch([], []) == []
+
+
+@pytest.mark.parametrize(
+    "table",
+    [
+        [[3, 1], [1, 3]],
+        [[10, 2], [3, 15]],
+        [[0, 5], [5, 0]],
+        [[1, 0], [0, 0]],
+        [[40, 60], [55, 45]],
+    ],
+)
+def test_fisher_exact_test_when_numpy_backend_then_matches_pure(table: list[list[int]]) -> None:
+    """Test odds ratio is identical and p-value agrees to floating point precision."""
+    np_odds, np_p = np_stats.fisher_exact_test(table)
+    ps_odds, ps_p = ps.fisher_exact_test(table)
+
+    assert np_odds == ps_odds
+    assert np_p == pytest.approx(ps_p, rel=1e-9)
+
+
+def test_fisher_exact_test_batch_when_many_tables_then_matches_pure() -> None:
+    """Test the vectorized batch agrees with pure per-table tests, in input order."""
+    rng = random.Random(11)
+    tables = [[[rng.randint(0, 12) for _ in range(2)] for _ in range(2)] for _ in range(200)]
+    tables += [[[0, 0], [0, 0]], [[0, 7], [0, 3]], [[150, 60], [80, 140]]]
+
+    results = np_stats.fisher_exact_test_batch(tables)
+
+    assert len(results) == len(tables)
+    for (np_odds, np_p), table in zip(results, tables, strict=True):
+        ps_odds, ps_p = ps.fisher_exact_test(table)
+        assert np_odds == ps_odds
+        assert np_p == pytest.approx(ps_p, rel=1e-9, abs=1e-15)
+    assert np_stats.fisher_exact_test_batch([]) == []
+
+
+def test_multinomial_goodness_of_fit_batch_when_small_teams_then_matches_pure() -> None:
+    """Test exact p-values agree with pure_statistics, in input order."""
+    rng = random.Random(5)
+    observed = [[rng.randint(0, 8) for _ in range(3)] for _ in range(100)]
+    observed += [[0, 0, 0], [40, 100, 20]]
+
+    results = np_stats.multinomial_goodness_of_fit_batch(observed, [0.2, 0.7, 0.1])
+
+    expected = ps.multinomial_goodness_of_fit_batch(observed, [0.2, 0.7, 0.1])
+    assert len(results) == len(observed)
+    for (np_chi2, np_p, np_method), (ps_chi2, ps_p, ps_method) in zip(
+        results, expected, strict=True
+    ):
+        assert np_method == ps_method
+        assert np_chi2 == ps_chi2
+        assert np_p == pytest.approx(ps_p, rel=1e-9, abs=1e-15)
+
+
+@pytest.mark.parametrize(
+    ("call", "args"),
+    [
+        ("chi_square_test", ([],)),
+        ("chi_square_test", ([[0, 0], [0, 0]],)),
+        ("chi_square_test", ([[1, 0], [2, 0]],)),
+        ("chi_square_goodness_of_fit", ([1, 2], [1.0])),
+        ("fisher_exact_test", ([[1, 2, 3], [4, 5, 6]],)),
+        ("fisher_exact_test_batch", ([[[1, 2], [3, 4]], [[1, 2]]],)),
+        ("multinomial_goodness_of_fit_batch", ([[1, 2, 3]], [0.5, 0.5])),
+    ],
+)
+def test_invalid_input_when_numpy_backend_then_raises_like_pure(call: str, args: tuple) -> None:
+    """Test both backends reject the same invalid input with ValueError."""
+    with pytest.raises(ValueError):
+        getattr(ps, call)(*args)
+    with pytest.raises(ValueError):
+        getattr(np_stats, call)(*args)
+
+
+def test_stats_backend_when_numpy_installed_then_selects_numpy() -> None:
+    """Test automatic selection prefers the vectorized backend."""
+    if stats_backend.BACKEND == "pure":
+        pytest.skip("Pure backend forced via NINEBOX_STATS_BACKEND")
+    assert stats_backend.BACKEND == "numpy"
+    assert stats_backend.chi_square_test is np_stats.chi_square_test
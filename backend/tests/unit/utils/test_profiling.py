@@ -0,0 +1,31 @@
+"""Tests for opt-in call profiling."""
+
+import pytest
+
+from ninebox.utils.profiling import available_profilers, profile_call
+
+pytestmark = pytest.mark.unit
+
+
+def _work(n: int, scale: int = 1) -> int:
+    return sum(i * scale for i in range(n))
+
+
+def test_profile_call_when_cprofile_then_returns_result_and_report() -> None:
+    """Test the call result is passed through and the report names the function."""
+    result, report, elapsed = profile_call("cprofile", _work, 1000, scale=2)
+
+    assert result == _work(1000, scale=2)
+    assert "_work" in report
+    assert elapsed >= 0.0
+
+
+def test_profile_call_when_profiler_unknown_then_raises_value_error() -> None:
+    """Test unavailable profilers are rejected before calling the function."""
+    with pytest.raises(ValueError):
+        profile_call("perf", _work, 10)
+
+
+def test_available_profilers_when_called_then_includes_cprofile() -> None:
+    """Test cProfile is always available."""
+    assert available_profilers()[0] == "cprofile"
@@ -4,6 +4,7 @@ Tests edge cases, error conditions, and functionality without scipy dependency.
 """
 
 import math
+import time
 
 import pytest
 
@@ -200,30 +201,6 @@ class TestLogGamma:
         assert not math.isinf(result)
 
 
-class TestLogCombination:
-    """Test _log_combination function."""
-
-    def test_log_combination_when_k_greater_than_n_then_returns_neg_inf(self) -> None:
-        """Test with k > n."""
-        result = ps._log_combination(5, 10)
-        assert result == float("-inf")
-
-    def test_log_combination_when_negative_k_then_returns_neg_inf(self) -> None:
-        """Test with negative k."""
-        result = ps._log_combination(5, -1)
-        assert result == float("-inf")
-
-    def test_log_combination_when_k_zero_then_returns_zero(self) -> None:
-        """Test with k=0."""
-        result = ps._log_combination(5, 0)
-        assert result == 0.0
-
-    def test_log_combination_when_k_equals_n_then_returns_zero(self) -> None:
-        """Test with k=n."""
-        result = ps._log_combination(5, 5)
-        assert result == 0.0
-
-
 class TestCalculateZScores:
     """Test calculate_z_scores function."""
 
@@ -324,14 +301,118 @@ class TestFisherExactPValue:
         assert p_value > 0.5
 
 
-class TestHypergeometricProb:
-    """Test _hypergeometric_prob function."""
+class TestLogFactorial:
+    """Test the shared log-factorial table."""
+
+    def test_log_factorial_when_small_n_then_matches_math(self) -> None:
+        """Test values agree with math.lgamma."""
+        for n in (0, 1, 5, 20, 170):
+            assert ps.log_factorial(n) == pytest.approx(math.lgamma(n + 1), rel=1e-12, abs=1e-12)
+
+    def test_log_factorial_when_larger_n_requested_then_table_grows(self) -> None:
+        """Test the table grows lazily and keeps earlier entries."""
+        before = ps.log_factorial(10)
+        size = len(ps._LOG_FACTORIALS)
+
+        value = ps.log_factorial(size + 100)
+
+        assert len(ps._LOG_FACTORIALS) == size + 101
+        assert value == pytest.approx(math.lgamma(size + 101), rel=1e-12)
+        assert ps.log_factorial(10) == before
+
+
+class TestFisherExactTestBatch:
+    """Test fisher_exact_test_batch function."""
+
+    def test_fisher_exact_test_batch_when_many_tables_then_matches_single_tests(self) -> None:
+        """Test the batch returns one fisher_exact_test result per table."""
+        tables = [[[3, 1], [1, 3]], [[10, 2], [3, 15]], [[0, 5], [5, 0]], [[0, 0], [0, 0]]]
+
+        assert ps.fisher_exact_test_batch(tables) == [ps.fisher_exact_test(t) for t in tables]
+        assert ps.fisher_exact_test_batch([]) == []
+
+    def test_fisher_exact_test_batch_when_table_not_2x2_then_raises_value_error(self) -> None:
+        """Test invalid tables are rejected."""
+        with pytest.raises(ValueError):
+            ps.fisher_exact_test_batch([[[1, 2], [3, 4]], [[1, 2, 3], [4, 5, 6]]])
+
+
+class TestMultinomialGoodnessOfFitBatch:
+    """Test multinomial_goodness_of_fit_batch function."""
+
+    def test_multinomial_when_team_small_then_exact_p_value_sums_outcome_probabilities(
+        self,
+    ) -> None:
+        """Test the exact p-value is the probability of outcomes at least as extreme."""
+        probabilities = [0.2, 0.7, 0.1]
+        observed = [3, 1, 2]
+        total = sum(observed)
+        expected = [total * p for p in probabilities]
+
+        def statistic(counts: tuple[int, ...]) -> float:
+            return sum((o - e) ** 2 / e for o, e in zip(counts, expected, strict=True))
+
+        def probability(counts: tuple[int, ...]) -> float:
+            coefficient = math.factorial(total)
+            for count in counts:
+                coefficient //= math.factorial(count)
+            return coefficient * math.prod(p**c for p, c in zip(probabilities, counts, strict=True))
+
+        brute_force = sum(
+            probability(counts)
+            for counts in ps.multinomial_outcomes(total, 3)
+            if statistic(counts) >= statistic(tuple(observed)) - 1e-9
+        )
+
+        ((chi2, p_value, method),) = ps.multinomial_goodness_of_fit_batch([observed], probabilities)
+
+        assert method == "exact"
+        assert chi2 == pytest.approx(statistic(tuple(observed)))
+        assert p_value == pytest.approx(brute_force, rel=1e-9)
+
+    def test_multinomial_when_expected_counts_large_then_uses_chi_square(self) -> None:
+        """Test rows with every expected count >= 5 keep the asymptotic p-value."""
+        observed = [[40, 100, 20]]
+
+        ((chi2, p_value, method),) = ps.multinomial_goodness_of_fit_batch(observed, [0.2, 0.7, 0.1])
+
+        assert method == "chi_square"
+        assert (chi2, p_value) == ps.chi_square_goodness_of_fit([40, 100, 20], [32.0, 112.0, 16.0])
+
+    def test_multinomial_when_too_many_outcomes_then_monte_carlo_is_reproducible(self) -> None:
+        """Test Monte-Carlo estimates are used above the exact limit and repeat for a seed."""
+        observed = [[20, 20, 5], [9, 35, 1]]
+        kwargs = {"max_exact_outcomes": 10, "simulations": 500, "seed": 3}
+
+        first = ps.multinomial_goodness_of_fit_batch(observed, [0.2, 0.7, 0.1], **kwargs)
+        ps._multinomial_null.cache_clear()
+        second = ps.multinomial_goodness_of_fit_batch(observed, [0.2, 0.7, 0.1], **kwargs)
+
+        assert first == second
+        assert [method for _, _, method in first] == ["monte_carlo", "monte_carlo"]
+        assert 1 / 501 <= first[0][1] < 0.05  # Far more extreme than typical draws
+        assert 0.0 < first[1][1] <= 1.0
+
+    def test_multinomial_when_deadline_passed_then_falls_back_to_chi_square(self) -> None:
+        """Test an expired time budget leaves small rows on the asymptotic p-value."""
+        results = ps.multinomial_goodness_of_fit_batch(
+            [[5, 4, 1]], [0.2, 0.7, 0.1], deadline=time.monotonic() - 1
+        )
+
+        assert results == [
+            (*ps.chi_square_goodness_of_fit([5, 4, 1], [2.0, 7.0, 1.0]), "chi_square")
+        ]
 
-    def test_hypergeometric_prob_when_valid_inputs_then_returns_probability(self) -> None:
-        """Test with valid inputs."""
-        # Calculate probability for some hypergeometric scenario
-        prob = ps._hypergeometric_prob(2, 5, 4, 10)
-        assert 0 <= prob <= 1
+    @pytest.mark.parametrize(
+        ("observed", "probabilities"),
+        [([[1, 2, 3]], [0.5, 0.5]), ([[1, 2]], [0.5, 0.6]), ([[1, 2]], [1.0, 0.0])],
+    )
+    def test_multinomial_when_invalid_input_then_raises_value_error(
+        self, observed: list[list[int]], probabilities: list[float]
+    ) -> None:
+        """Test mismatched rows and invalid probabilities are rejected."""
+        with pytest.raises(ValueError):
+            ps.multinomial_goodness_of_fit_batch(observed, probabilities)
 
 
 class TestIntegrationScenarios:
@@ -3,7 +3,12 @@
 import pytest
 from fastapi import HTTPException
 
-from ninebox.utils.query_parsing import parse_id_list
+from ninebox.utils.query_parsing import (
+    decode_cursor,
+    encode_cursor,
+    parse_field_list,
+    parse_id_list,
+)
 
 
 pytestmark = pytest.mark.unit
@@ -66,3 +71,46 @@ def test_parse_id_list_when_single_id_then_returns_single_item_list():
     """Test parsing single ID."""
     result = parse_id_list("42")
     assert result == [42]
+
+
+def test_parse_field_list_when_valid_fields_then_returns_deduplicated_list():
+    """Test parsing allowed field names keeps request order."""
+    result = parse_field_list("name, grid_position,name", {"name", "grid_position"})
+    assert result == ["name", "grid_position"]
+
+
+def test_parse_field_list_when_unknown_field_then_raises_400():
+    """Test unknown fields are rejected."""
+    with pytest.raises(HTTPException) as exc_info:
+        parse_field_list("name,salary", {"name"})
+    assert exc_info.value.status_code == 400
+    assert "salary" in exc_info.value.detail
+
+
+def test_decode_cursor_when_encoded_offset_then_round_trips():
+    """Test cursors round-trip offsets and default to the first page."""
+    assert decode_cursor(encode_cursor(250)) == 250
+    assert decode_cursor(None) == 0
+
+
+def test_decode_cursor_when_malformed_then_raises_400():
+    """Test malformed cursors are rejected."""
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor("not-a-cursor")
+    assert exc_info.value.status_code == 400
+
+
+def test_decode_cursor_when_bound_then_checks_query_and_revision():
+    """Test bound cursors decode only for the same query and session revision."""
+    cursor = encode_cursor(40, "tag:s1:3", "/api/employees|[]")
+
+    assert decode_cursor(cursor, "tag:s1:3", "/api/employees|[]") == 40
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor(cursor, "tag:s1:3", "/api/employees|[('sort', '-name')]")
+    assert exc_info.value.status_code == 400
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor(cursor, "tag:s1:4", "/api/employees|[]")
+    assert exc_info.value.status_code == 410
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor(encode_cursor(40), "tag:s1:3", "/api/employees|[]")
+    assert exc_info.value.status_code == 400